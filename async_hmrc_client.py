@@ -0,0 +1,221 @@
+import asyncio
+import os
+import logging
+from datetime import datetime
+from hmrc_client import OUTPUT_FIELDNAMES, company_row, simulated_turnover, simulated_vat_info
+from output_sink import CSVSink
+from token_manager import TokenManager
+from retry_policy import RetryPolicy
+from structured_logging import log_event
+
+logger = logging.getLogger(__name__)
+
+class AsyncHMRCClient:
+    """asyncio counterpart of HMRCClient with the same public methods.
+
+    Requests share one pooled aiohttp session, and the TokenManager makes concurrent
+    callers that find the token expired wait on a single refresh instead of each calling
+    /oauth/token. Use it as an async context manager, or call open() and close() explicitly.
+    """
+
+    def __init__(self, rate_limiter=None, max_connections=100, max_in_flight=1000, token_cache_path=None,
+                 retry_policy=None, circuit_breakers=None, base_url=None, connect_timeout=5.0, read_timeout=30.0):
+        self.client_id = os.getenv('HMRC_API_KEY')
+        self.client_secret = os.getenv('HMRC_SERVER_TOKEN')
+        self.server_token = os.getenv('HMRC_SERVER_TOKEN')
+
+        if not self.client_id:
+            raise ValueError("HMRC_API_KEY not found in environment variables")
+        if not self.client_secret:
+            raise ValueError("HMRC_SERVER_TOKEN not found in environment variables")
+
+        # HMRC_BASE_URL points the client at a stand-in such as mock_upstream.py
+        self.base_url = (base_url or os.getenv('HMRC_BASE_URL') or 'https://test-api.service.hmrc.gov.uk').rstrip('/')
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = circuit_breakers.get('hmrc') if circuit_breakers else None
+        self.max_connections = max_connections
+        self.max_in_flight = max_in_flight
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.session = None
+        # One token shared by every coroutine, optionally persisted between runs
+        self.tokens = TokenManager(
+            fetch_token_async=self._request_token,
+            cache_path=token_cache_path or os.getenv('HMRC_TOKEN_CACHE'),
+            cache_key=f"{self.base_url}|{self.client_id}"
+        )
+
+    async def open(self):
+        # aiohttp is only needed by the async client
+        import aiohttp
+
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=30),
+            # Bounds each connection attempt and each wait for data, not the time spent queued for a connection
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.connect_timeout, sock_read=self.read_timeout)
+        )
+        logger.info("Initialized async HMRC client (up to %d connections)", self.max_connections)
+        # Reused from the token cache when still valid
+        await self.tokens.get_token_async()
+        return self
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def access_token(self):
+        return self.tokens.access_token
+
+    async def authenticate(self):
+        """Authenticate with the HMRC API; concurrent calls share one in-flight refresh"""
+        return await self.tokens.refresh_async()
+
+    async def _request_token(self):
+        """Request a new access token; returns (access_token, expires_in) or None"""
+        import aiohttp
+
+        logger.info("Authenticating with HMRC API...")
+        auth_url = f"{self.base_url}/oauth/token"
+        auth_data = {
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'grant_type': 'client_credentials'
+        }
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Authorization': f'Bearer {self.server_token}'
+        }
+
+        try:
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(auth_url)
+            async with self.session.post(auth_url, data=auth_data, headers=headers) as response:
+                if response.status >= 400:
+                    logger.error("Authentication failed: %s", response.status)
+                    logger.error("Response text: %s", await response.text())
+                    return None
+                token_data = await response.json()
+
+            logger.info("Successfully authenticated with HMRC API")
+            return token_data.get('access_token'), token_data.get('expires_in', 14400)  # Default 4 hours
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Authentication failed: %s", e)
+            return None
+
+    async def make_request(self, url, method='get', data=None, params=None):
+        """Make a request to the HMRC API; raises CircuitOpenError while the HMRC breaker is open"""
+        attempt = 0
+        reauthenticated = False
+
+        while True:
+            attempt += 1
+            if self.breaker:
+                self.breaker.before_call()
+            try:
+                # Refreshes the token first if it is missing or close to expiry
+                token = await self.tokens.get_token_async()
+                if not token:
+                    logger.error("Failed to authenticate with HMRC API")
+                    return None
+
+                headers = {
+                    'Authorization': f'Bearer {token}',
+                    'Accept': 'application/vnd.hmrc.1.0+json',
+                    'Content-Type': 'application/json'
+                }
+
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async(url)
+                request = self.session.get(url, headers=headers, params=params) if method.lower() == 'get' \
+                    else self.session.post(url, headers=headers, json=data)
+                async with request as response:
+                    if self.breaker:
+                        # Only server errors count against the upstream
+                        if response.status >= 500:
+                            self.breaker.record_failure()
+                        else:
+                            self.breaker.record_success()
+                    if response.status < 400:
+                        return await response.json()
+                    logger.error("HTTP Error on attempt %d: %s", attempt, response.status,
+                                 extra=log_event('http_error', status=response.status, attempt=attempt))
+                    if response.status == 401 and not reauthenticated:
+                        # Only the first caller to see the stale token drops it; later ones reuse the refresh
+                        self.tokens.invalidate(token)
+                        reauthenticated = True
+                        continue
+                    if self.retry_policy.should_retry(attempt, response.status):
+                        wait_time = self.retry_policy.delay(attempt, response.headers.get('Retry-After'))
+                        logger.warning("Status %s, retrying after %.1f seconds", response.status, wait_time,
+                                       extra=log_event('request_retry', status=response.status, attempt=attempt))
+                        await asyncio.sleep(wait_time)
+                        continue
+                    logger.error("Response text: %s", await response.text())
+                    return None
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Request failed on attempt %d: %s", attempt, e, extra=log_event('request_failed', attempt=attempt))
+                if self.breaker:
+                    self.breaker.record_failure()
+                if not self.retry_policy.should_retry(attempt):
+                    return None
+                await asyncio.sleep(self.retry_policy.delay(attempt))
+
+    async def get_vat_info(self, company_number):
+        """Get VAT information for a company"""
+        # Note: In test environment, this might not return real data
+        return simulated_vat_info(company_number)
+
+    async def get_company_turnover(self, vat_number):
+        """Get company turnover from VAT returns"""
+        # Note: In test environment, this might not return real data
+        return simulated_turnover()
+
+    async def _process_vrn(self, vrn, in_flight):
+        async with in_flight:
+            vat_info = await self.get_vat_info(vrn)
+            if not vat_info:
+                logger.warning("Could not get VAT info for VRN %s", vrn, extra=log_event('vat_info_missing', vrn=vrn))
+                return None
+            turnover = await self.get_company_turnover(vrn)
+            if turnover is None:
+                logger.warning("Could not get turnover for VRN %s", vrn, extra=log_event('turnover_missing', vrn=vrn))
+                return None
+            # Only include companies with turnover >= £1M
+            if turnover < 1000000:
+                return None
+            return company_row(vrn, vat_info, turnover)
+
+    async def process_companies(self, vrn_list):
+        """Look up every VRN concurrently and write qualifying companies in input order"""
+        logger.info("Starting to process %d companies", len(vrn_list))
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_file = f'hmrc_filtered_companies_{timestamp}.csv'
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        try:
+            rows = await asyncio.gather(*(self._process_vrn(vrn, in_flight) for vrn in vrn_list))
+            with CSVSink(output_file, OUTPUT_FIELDNAMES) as sink:
+                for row in rows:
+                    if row:
+                        sink.write(row)
+
+            logger.info("Processing complete. Processed %d companies, saved %d to CSV", len(vrn_list), sink.rows_written)
+            return output_file
+
+        except IOError as e:
+            logger.error("Error writing to CSV file: %s", e)
+            return None
@@ -0,0 +1,218 @@
+import os
+import sys
+import argparse
+import functools
+import itertools
+import json
+import logging
+import platform
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+import main as pipeline
+from pipeline_config import PipelineConfig
+from name_source import iter_company_names
+from filter_planner import FilterPlanner
+from output_sink import CSVSink
+from mock_upstream import MockUpstreamProcess, add_fault_arguments, fault_settings
+
+logger = logging.getLogger(__name__)
+
+# Credentials the mock accepts; real ones from the environment are never sent to it
+MOCK_ENV = {
+    'HMRC_API_KEY': 'mock-client-id',
+    'HMRC_SERVER_TOKEN': 'mock-server-token'
+}
+
+# Stages timed by the benchmark, as (owner, attribute) of the function wrapped.
+# filter covers the whole planner pass, so it includes the turnover and officer lookups it triggers.
+# csv_write times each batch handed to the file; CSVSink.write only appends to the buffer.
+STAGES = {
+    'search': (pipeline, 'search_company_by_name'),
+    'profile': (pipeline, 'get_company_details'),
+    'officers': (pipeline, 'get_directors_details'),
+    'turnover': (pipeline, 'get_company_turnover'),
+    'filter': (FilterPlanner, 'evaluate'),
+    'csv_write': (CSVSink, '_write_batch')
+}
+
+DEFAULT_SIZES = [100, 1000, 9000]
+
+def percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    return sorted_samples[min(len(sorted_samples) - 1, int(fraction * len(sorted_samples)))]
+
+def latency_summary(samples):
+    """Call count and latency distribution in milliseconds"""
+    samples = sorted(samples)
+    return {
+        'calls': len(samples),
+        'mean_ms': 1000 * sum(samples) / len(samples) if samples else 0.0,
+        'p50_ms': 1000 * percentile(samples, 0.50),
+        'p90_ms': 1000 * percentile(samples, 0.90),
+        'p99_ms': 1000 * percentile(samples, 0.99),
+        'max_ms': 1000 * samples[-1] if samples else 0.0
+    }
+
+class StageTimer:
+    """Wraps the stage functions for the duration of a run and records how long every call takes"""
+
+    def __init__(self, stages=None):
+        self.stages = STAGES if stages is None else stages
+        self.samples = {name: [] for name in self.stages}
+        self._originals = {}
+        self._lock = threading.Lock()
+
+    def _timed(self, name, function):
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self.samples[name].append(elapsed)
+        return timed
+
+    def __enter__(self):
+        for name, (owner, attribute) in self.stages.items():
+            original = getattr(owner, attribute)
+            self._originals[name] = original
+            setattr(owner, attribute, self._timed(name, original))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        for name, (owner, attribute) in self.stages.items():
+            setattr(owner, attribute, self._originals.pop(name))
+
+    def summary(self):
+        with self._lock:
+            return {name: latency_summary(samples) for name, samples in self.samples.items()}
+
+# Pipeline settings for a run against the mock: no response cache, bulk index or resume, so every lookup goes over HTTP
+def mock_config(upstream, output_file, workers=None):
+    config = PipelineConfig.from_env(api_key='mock-api-key', max_workers=workers, progress=False)
+    config.companies_house_url = upstream.url
+    config.hmrc_url = upstream.url
+    config.output_file = output_file
+    config.output_format = 'csv'
+    config.resume = False
+    config.cache_path = None
+    config.index_path = None
+    return config
+
+# Peak bytes allocated by Python while the pipeline runs over names
+def measure_peak_memory(names, config):
+    tracemalloc.start()
+    try:
+        pipeline.run_pipeline(names, config)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+# Run main.py's pipeline over names against a running mock upstream, timing each stage.
+# tracemalloc slows everything down, so peak memory comes from a second, untimed run.
+def run_benchmark(names, upstream, workers=None, trace_memory=True):
+    names = list(names)
+    os.environ.update(MOCK_ENV)
+    os.environ.pop('HMRC_TOKEN_CACHE', None)
+    with tempfile.TemporaryDirectory() as work_dir:
+        config = mock_config(upstream, os.path.join(work_dir, 'benchmark.csv'), workers)
+        requests_before = upstream.stats()
+        with StageTimer() as timer:
+            started = time.perf_counter()
+            result = pipeline.run_pipeline(names, config)
+            elapsed = time.perf_counter() - started
+        upstream_requests = upstream.stats()
+        peak_memory = measure_peak_memory(names, config) if trace_memory else None
+
+    return {
+        'names': len(names),
+        'workers': config.max_workers,
+        'seconds': elapsed,
+        'companies_per_second': len(names) / elapsed if elapsed else 0.0,
+        'rows_written': result['rows_written'],
+        'parked': len(result['parked']),
+        'peak_memory_bytes': peak_memory,
+        'stages': timer.summary(),
+        'upstream_requests': {
+            endpoint: {status: count - requests_before['requests'].get(endpoint, {}).get(status, 0) for status, count in counts.items()}
+            for endpoint, counts in upstream_requests['requests'].items()
+        },
+        'upstream_bytes': upstream_requests['bytes_sent'] - requests_before['bytes_sent']
+    }
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# Print how companies/sec changed against an earlier results file, per input size
+def compare_results(results, previous_path):
+    with open(previous_path, 'r', encoding='utf-8') as file:
+        previous = {run['names']: run for run in json.load(file)['runs']}
+    for run in results['runs']:
+        baseline = previous.get(run['names'])
+        if not baseline or not baseline['companies_per_second']:
+            continue
+        change = run['companies_per_second'] / baseline['companies_per_second'] - 1
+        print(f"{run['names']} names: {run['companies_per_second']:.1f} companies/sec vs "
+              f"{baseline['companies_per_second']:.1f} ({change:+.1%}).")
+
+def main(argv=None):
+    logging.basicConfig(level=logging.WARNING)
+
+    parser = argparse.ArgumentParser(description="Benchmark the main.py pipeline stages against the local mock upstream")
+    parser.add_argument('--input', default='company_names.txt', help="company names as .txt, .csv or .xlsx")
+    parser.add_argument('--column', help="header of the column holding company names in a .csv or .xlsx input (default: the first column; the header row is always skipped)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="input sizes to run (default 100 1000 9000)")
+    parser.add_argument('--workers', type=int, help="number of companies looked up concurrently")
+    parser.add_argument('--no-memory', action='store_true', help="skip the extra run per size that measures peak memory")
+    parser.add_argument('--results', help="JSON file to write (default benchmark-<revision>.json)")
+    parser.add_argument('--compare', help="earlier results file to compare companies/sec against")
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    revision = git_revision()
+    results = {
+        'revision': revision,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'upstream': fault_settings(args),
+        'runs': []
+    }
+    with MockUpstreamProcess(**fault_settings(args)) as upstream:
+        for size in args.sizes:
+            names = list(itertools.islice(iter_company_names(args.input, args.column), size))
+            print(f"Benchmarking {len(names)} names...", file=sys.stderr)
+            run = run_benchmark(names, upstream, workers=args.workers, trace_memory=not args.no_memory)
+            results['runs'].append(run)
+
+    results_path = args.results or f"benchmark-{revision or datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(results_path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+
+    for run in results['runs']:
+        memory = f", peak memory {run['peak_memory_bytes'] / 2**20:.1f} MiB" if run['peak_memory_bytes'] is not None else ""
+        print(f"{run['names']} names in {run['seconds']:.1f}s with {run['workers']} workers: "
+              f"{run['companies_per_second']:.1f} companies/sec{memory}.")
+        for stage, stats in run['stages'].items():
+            print(f"  {stage:<10} {stats['calls']:>6} calls  p50 {stats['p50_ms']:8.2f} ms  p90 {stats['p90_ms']:8.2f} ms"
+                  f"  p99 {stats['p99_ms']:8.2f} ms")
+    print(f"Results saved to {results_path}.")
+    if args.compare:
+        compare_results(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import argparse
+import csv
+import io
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zipfile
+from name_matching import LEGAL_SUFFIXES, SUFFIX_ALIASES
+
+logger = logging.getLogger(__name__)
+
+# Columns of the Companies House "Basic Company Data" CSV used by the pipeline.
+# The published header has stray leading spaces, so names are stripped before lookup.
+ADDRESS_COLUMNS = [
+    'RegAddress.AddressLine1',
+    'RegAddress.AddressLine2',
+    'RegAddress.PostTown',
+    'RegAddress.County',
+    'RegAddress.PostCode',
+    'RegAddress.Country'
+]
+SIC_COLUMNS = [f'SICCode.SicText_{i}' for i in range(1, 5)]
+
+def name_key(name):
+    """Case- and whitespace-insensitive key for exact name lookups"""
+    return " ".join(name.split()).casefold()
+
+class CompanyIndex:
+    """Local SQLite index of the Companies House bulk snapshot.
+
+    Answers name-to-number resolution and basic profile lookups (address, SIC codes,
+    status) without API calls. Each thread gets its own read connection.
+    """
+
+    def __init__(self, path='companies_index.sqlite3'):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            self._local.conn = conn
+        return conn
+
+    def ingest(self, snapshot_path, batch_size=10000):
+        """Replace the index with the companies in a bulk CSV (or the zip it is published as)"""
+        started = time.monotonic()
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript(
+            "DROP TABLE IF EXISTS companies_fts;"
+            "DROP TABLE IF EXISTS companies;"
+            "CREATE TABLE companies ("
+            " company_number TEXT PRIMARY KEY,"
+            " company_name TEXT NOT NULL,"
+            " name_key TEXT NOT NULL,"
+            " address TEXT,"
+            " sic_codes TEXT,"
+            " status TEXT);"
+        )
+
+        count = 0
+        batch = []
+        with _open_snapshot(snapshot_path) as snapshot:
+            reader = csv.reader(snapshot)
+            header = [column.strip() for column in next(reader)]
+            position = {column: index for index, column in enumerate(header)}
+            address_positions = [position[column] for column in ADDRESS_COLUMNS]
+            sic_positions = [position[column] for column in SIC_COLUMNS]
+            for row in reader:
+                name = row[position['CompanyName']].strip()
+                address = ", ".join(filter(None, (row[i].strip() for i in address_positions)))
+                # SIC entries look like "96090 - Other service activities n.e.c."
+                sic_codes = ",".join(
+                    row[i].split(" - ", 1)[0].strip() for i in sic_positions if row[i].strip() and row[i].strip() != 'None Supplied'
+                )
+                batch.append((
+                    row[position['CompanyNumber']].strip(),
+                    name,
+                    name_key(name),
+                    address,
+                    sic_codes,
+                    row[position['CompanyStatus']].strip()
+                ))
+                if len(batch) >= batch_size:
+                    conn.executemany("INSERT OR REPLACE INTO companies VALUES (?, ?, ?, ?, ?, ?)", batch)
+                    count += len(batch)
+                    batch = []
+        if batch:
+            conn.executemany("INSERT OR REPLACE INTO companies VALUES (?, ?, ?, ?, ?, ?)", batch)
+            count += len(batch)
+
+        # Build the lookup structures once, after the bulk load
+        conn.executescript(
+            "CREATE INDEX companies_name_key ON companies (name_key);"
+            "CREATE VIRTUAL TABLE companies_fts USING fts5("
+            " company_name, content='companies', content_rowid='rowid');"
+            "INSERT INTO companies_fts (companies_fts) VALUES ('rebuild');"
+        )
+        conn.commit()
+        conn.close()
+        logger.info("Indexed %d companies from %s in %.0fs", count, snapshot_path, time.monotonic() - started)
+        return count
+
+    def resolve(self, company_name, choose=None):
+        """Return the company number for a name: an exact match first, then a full-text candidate.
+
+        choose(company_name, candidates) picks among the (company_number, company_name) hits and
+        may return None to reject them all; without it the top-ranked hit is used.
+        """
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT company_number FROM companies WHERE name_key = ? LIMIT 1",
+            (name_key(company_name),)
+        ).fetchone()
+        if row:
+            return row[0]
+        candidates = self.search(company_name, limit=20 if choose else 1)
+        if choose:
+            return choose(company_name, candidates)
+        return candidates[0][0] if candidates else None
+
+    def search(self, company_name, limit=20):
+        """Return up to limit (company_number, company_name) pairs containing every distinctive word of the name"""
+        # Legal-form words are left out so "Ltd" still finds "LIMITED"
+        tokens = [
+            token for token in re.findall(r"\w+", company_name)
+            if token.casefold() not in LEGAL_SUFFIXES and token.casefold() not in SUFFIX_ALIASES
+        ] or re.findall(r"\w+", company_name)
+        if not tokens:
+            return []
+        query = " ".join(f'"{token}"' for token in tokens)
+        return self._connection().execute(
+            "SELECT c.company_number, c.company_name FROM companies_fts f"
+            " JOIN companies c ON c.rowid = f.rowid"
+            " WHERE companies_fts MATCH ? ORDER BY bm25(companies_fts) LIMIT ?",
+            (query, limit)
+        ).fetchall()
+
+    def get_profile(self, company_number):
+        """Return (name, address, sic_codes, is_active) like get_company_details, or None if unknown"""
+        row = self._connection().execute(
+            "SELECT company_name, address, sic_codes, status FROM companies WHERE company_number = ?",
+            (company_number,)
+        ).fetchone()
+        if row is None:
+            return None
+        name, address, sic_codes, status = row
+        return name, address, sic_codes.split(",") if sic_codes else [], status.lower() == "active"
+
+def _open_snapshot(path):
+    if not zipfile.is_zipfile(path):
+        return open(path, 'r', newline='', encoding='utf-8-sig')
+    archive = zipfile.ZipFile(path)
+    member = next(name for name in archive.namelist() if name.lower().endswith('.csv'))
+    return io.TextIOWrapper(archive.open(member), encoding='utf-8-sig', newline='')
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Build a local index from the Companies House basic company data snapshot")
+    parser.add_argument('snapshot', help="BasicCompanyDataAsOneFile CSV or zip from download.companieshouse.gov.uk")
+    parser.add_argument('--index', default=os.getenv('COMPANIES_HOUSE_INDEX') or 'companies_index.sqlite3', help="SQLite index to create")
+    args = parser.parse_args(argv)
+
+    count = CompanyIndex(args.index).ingest(args.snapshot)
+    print(f"Indexed {count} companies into {args.index}.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit breaker is open"""
+
+    def __init__(self, name, retry_in):
+        super().__init__(f"Circuit for {name} is open; retry in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+class CircuitBreaker:
+    """Stops calling an upstream endpoint once too many recent calls have failed.
+
+    Closed: calls go through and outcomes are kept for the last window calls. When at
+    least min_calls are recorded and the failure rate reaches failure_threshold, the
+    breaker opens and every call fails fast for reset_timeout seconds. It then goes
+    half-open and lets half_open_probes calls through: if they succeed it closes, and a
+    single failure opens it again.
+    """
+
+    def __init__(self, name, failure_threshold=0.5, window=20, min_calls=10, reset_timeout=30.0, half_open_probes=2):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.state = 'closed'
+        self.times_opened = 0
+        self.rejected = 0
+        self._outcomes = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probing_since = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raise CircuitOpenError if the call should not be made"""
+        with self._lock:
+            if self.state == 'open':
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, remaining)
+                self._start_probing()
+                logger.info("Circuit for %s is half-open; probing", self.name)
+            if self.state == 'half_open':
+                if self._probes_in_flight >= self.half_open_probes:
+                    # A probe that never reported back must not keep the breaker half-open forever
+                    if time.monotonic() - self._probing_since < self.reset_timeout:
+                        self.rejected += 1
+                        raise CircuitOpenError(self.name, self.reset_timeout)
+                    self._start_probing()
+                self._probes_in_flight += 1
+
+    def _start_probing(self):
+        self.state = 'half_open'
+        self._probing_since = time.monotonic()
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    def record_success(self):
+        with self._lock:
+            if self.state == 'half_open':
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    self.state = 'closed'
+                    self._outcomes.clear()
+                    logger.info("Circuit for %s closed", self.name)
+                return
+            self._outcomes.append(True)
+
+    def record_failure(self):
+        with self._lock:
+            if self.state == 'half_open':
+                self._open()
+                return
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.state = 'open'
+        self.times_opened += 1
+        self._opened_at = time.monotonic()
+        logger.warning("Circuit for %s opened; failing fast for %.0fs", self.name, self.reset_timeout)
+
+    def seconds_until_probe(self):
+        with self._lock:
+            if self.state != 'open':
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+class CircuitBreakerRegistry:
+    """One breaker per upstream endpoint, created on first use with shared settings"""
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            if name not in self.breakers:
+                self.breakers[name] = CircuitBreaker(name, **self.settings)
+            return self.breakers[name]
+
+    def seconds_until_probe(self):
+        """How long until every open breaker is ready to probe again"""
+        with self._lock:
+            breakers = list(self.breakers.values())
+        return max((breaker.seconds_until_probe() for breaker in breakers), default=0.0)
@@ -0,0 +1,222 @@
+import os
+import requests
+import logging
+import time
+from response_cache import CachedResponse, normalize_key
+from retry_policy import RetryPolicy
+from metrics import MetricsRegistry
+from structured_logging import log_event
+
+logger = logging.getLogger(__name__)
+
+class Director:
+    """Compact record of one officer appointment from the /officers endpoint"""
+    __slots__ = ('name', 'birth_year', 'age', 'role', 'appointed_on', 'resigned_on', 'officer_id')
+
+    def __init__(self, name, birth_year, age, role, appointed_on=None, resigned_on=None, officer_id=None):
+        self.name = name
+        self.birth_year = birth_year
+        self.age = age
+        self.role = role
+        self.appointed_on = appointed_on
+        self.resigned_on = resigned_on
+        self.officer_id = officer_id
+
+    @property
+    def is_active(self):
+        return self.resigned_on is None
+
+    def identity(self):
+        """Key shared by every appointment of the same person; falls back to name and birth year"""
+        return self.officer_id or (self.name.casefold(), self.birth_year)
+
+    @classmethod
+    def from_officer(cls, officer, current_year):
+        """Build a record from an officers item; age is None when no birth year is published"""
+        birth_year = officer.get("date_of_birth", {}).get("year")
+        birth_year = int(birth_year) if birth_year else None
+        # links.officer.appointments looks like /officers/{officer_id}/appointments
+        appointments = officer.get("links", {}).get("officer", {}).get("appointments", "")
+        return cls(
+            officer.get("name", "N/A"),
+            birth_year,
+            current_year - birth_year if birth_year else None,
+            officer.get("officer_role"),
+            officer.get("appointed_on"),
+            officer.get("resigned_on"),
+            appointments.split("/")[2] if appointments.startswith("/officers/") else None
+        )
+
+    def __repr__(self):
+        return f"Director({self.name!r}, age={self.age}, role={self.role!r})"
+
+class UpstreamError(requests.exceptions.HTTPError):
+    """Error status that outlasted the retry policy; the response is attached"""
+
+class CompaniesHouseClient:
+    def __init__(self, api_key=None, pool_connections=10, pool_maxsize=10, rate_limiter=None, response_cache=None,
+                 retry_policy=None, circuit_breakers=None, base_url=None, metrics=None, connect_timeout=5.0, read_timeout=30.0):
+        self.api_key = api_key or os.getenv('COMPANIES_API_KEY')
+
+        if not self.api_key:
+            raise ValueError("COMPANIES_API_KEY not found in environment variables")
+
+        # COMPANIES_HOUSE_URL points the client at a stand-in such as mock_upstream.py
+        self.base_url = (base_url or os.getenv('COMPANIES_HOUSE_URL') or 'https://api.company-information.service.gov.uk').rstrip('/')
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breakers = circuit_breakers
+        self.metrics = metrics or MetricsRegistry()
+        # Without a timeout a hung upstream would block a worker forever and never reach the breaker
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        self.session.auth = (self.api_key, '')
+
+        # Keep connections alive between calls; pool_maxsize should be at least the worker count
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        logger.info("Initialized Companies House client (pool size %s)", pool_maxsize)
+
+    def get(self, path, params=None):
+        """Send a GET request to the Companies House API and return the response.
+
+        Raises CircuitOpenError without sending anything while the endpoint's breaker is open,
+        and UpstreamError when an error other than 404 is still returned once the retries or the
+        run's retry budget are spent, so callers never mistake a failing or throttling upstream
+        for a company that does not exist.
+        """
+        endpoint = self._endpoint(path)
+        cached = self.response_cache and endpoint
+        if cached:
+            key = normalize_key(path, params)
+            body = self.response_cache.get(endpoint, key)
+            self.metrics.increment('cache_lookups_total', endpoint=endpoint, result='miss' if body is None else 'hit')
+            if body is not None:
+                return CachedResponse(body)
+
+        breaker = self.circuit_breakers.get(f"companies_house:{endpoint or 'other'}") if self.circuit_breakers else None
+        url = f"{self.base_url}{path}"
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker:
+                breaker.before_call()
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+            labels = {'api': 'companies_house', 'endpoint': endpoint or 'other'}
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self.metrics.increment('http_responses_total', status='error', **labels)
+                if breaker:
+                    breaker.record_failure()
+                if not self.retry_policy.should_retry(attempt):
+                    raise
+                self.metrics.increment('http_retries_total', **labels)
+                logger.warning("Request to %s failed on attempt %d: %s", path, attempt, e,
+                               extra=log_event('request_retry', path=path, attempt=attempt))
+                time.sleep(self.retry_policy.delay(attempt))
+                continue
+            self.metrics.observe('http_request_seconds', time.perf_counter() - started, **labels)
+            self.metrics.increment('http_responses_total', status=response.status_code, **labels)
+            self.metrics.increment('http_response_bytes_total', len(response.content), **labels)
+            if breaker:
+                # Only server errors count against the upstream; 404s and throttling are normal answers
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if response.status_code < 400 or not self.retry_policy.should_retry(attempt, response.status_code):
+                break
+            self.metrics.increment('http_retries_total', **labels)
+            wait_time = self.retry_policy.delay(attempt, response.headers.get('Retry-After'))
+            logger.warning("Status %s from %s, retrying after %.1f seconds", response.status_code, path, wait_time,
+                           extra=log_event('request_retry', path=path, status=response.status_code, attempt=attempt))
+            time.sleep(wait_time)
+
+        # Throttling never opens the breaker, so a spent retry budget must not turn 429s into answers either
+        if response.status_code >= 400 and response.status_code != 404:
+            raise UpstreamError(f"Status {response.status_code} from {path} after {attempt} attempts", response=response)
+        if cached and response.status_code == 200:
+            try:
+                response.json()
+                self.response_cache.set(endpoint, key, response.text)
+            except ValueError:
+                pass
+        return response
+
+    def iter_officers(self, company_number, items_per_page=100):
+        """Yield officer items page by page; stop iterating to skip the remaining pages.
+
+        The pages requested per listing are counted in the metrics, so the filter planner can
+        estimate what listing a company's officers costs.
+        """
+        path = f"/company/{company_number}/officers"
+        start_index = 0
+        pages = 0
+        try:
+            while True:
+                response = self.get(path, params={'items_per_page': items_per_page, 'start_index': start_index})
+                pages += 1
+                if response.status_code != 200:
+                    logger.warning("Failed to fetch officers for company %s. Status Code: %s", company_number, response.status_code,
+                                   extra=log_event('fetch_failed', company_number=company_number, status=response.status_code))
+                    return
+                try:
+                    data = response.json()
+                except ValueError:
+                    logger.warning("Invalid JSON response for officers of company %s. Response: %s", company_number, response.text,
+                                   extra=log_event('invalid_json', company_number=company_number))
+                    return
+
+                items = data.get("items") or []
+                yield from items
+
+                start_index += len(items)
+                if not items or start_index >= data.get("total_results", 0):
+                    return
+        finally:
+            self.metrics.increment('officer_listings_total')
+            self.metrics.increment('officer_pages_total', pages)
+
+    def officers_cached(self, company_number, items_per_page=100):
+        """True when the first page of officers is in the response cache"""
+        return bool(self.response_cache) and self.response_cache.contains(
+            'officers',
+            normalize_key(f"/company/{company_number}/officers", {'items_per_page': items_per_page, 'start_index': 0})
+        )
+
+    def _endpoint(self, path):
+        """Return the endpoint name used for caching and circuit breaking, or None for other paths"""
+        if path == '/search/companies':
+            return 'search'
+        if path.endswith('/officers'):
+            return 'officers'
+        if path.startswith('/company/'):
+            return 'profile'
+        return None
+
+    def connection_stats(self):
+        """Return how many HTTP connections were opened versus requests sent over them"""
+        adapter = self.session.get_adapter(self.base_url)
+        pools = adapter.poolmanager.pools
+        connections = 0
+        requests_sent = 0
+        for key in pools.keys():
+            pool = pools[key]
+            connections += pool.num_connections
+            requests_sent += pool.num_requests
+
+        reuse_rate = 1 - connections / requests_sent if requests_sent else 0.0
+        return {
+            'connections': connections,
+            'requests': requests_sent,
+            'reuse_rate': reuse_rate
+        }
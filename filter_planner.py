@@ -0,0 +1,67 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+class FilterRule:
+    """One qualification check.
+
+    check(context) returns True when the company passes and may store fetched data in
+    context for later rules. cost is the number of API calls the check is expected to make, either a
+    number or a function of the context (for example 0 when the answer is cached).
+    """
+
+    def __init__(self, name, check, cost=0):
+        self.name = name
+        self.check = check
+        self.cost = cost
+        self.evaluated = 0
+        self.rejected = 0
+        self.calls_saved = 0
+
+    def estimated_cost(self, context):
+        return self.cost(context) if callable(self.cost) else self.cost
+
+    def rejection_rate(self):
+        # Start from an even prior so unseen rules are neither favoured nor starved
+        return (self.rejected + 1) / (self.evaluated + 2)
+
+class FilterPlanner:
+    """Runs filter rules cheapest-and-most-selective first and stops at the first rejection.
+
+    Rules are ordered by expected cost per rejected company, using the pass rates observed
+    so far in the run. Every rule must pass, so the order never changes the outcome.
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self._lock = threading.Lock()
+
+    def evaluate(self, context):
+        """Return None if every rule passes, otherwise the name of the rule that rejected"""
+        costs = {rule.name: rule.estimated_cost(context) for rule in self.rules}
+        with self._lock:
+            plan = sorted(self.rules, key=lambda rule: costs[rule.name] / rule.rejection_rate())
+
+        for position, rule in enumerate(plan):
+            passed = rule.check(context)
+            with self._lock:
+                rule.evaluated += 1
+                if not passed:
+                    rule.rejected += 1
+                    rule.calls_saved += sum(costs[later.name] for later in plan[position + 1:])
+            if not passed:
+                return rule.name
+        return None
+
+    def report(self):
+        """Per-rule evaluation, rejection and saved-call counts for this run"""
+        with self._lock:
+            return {
+                rule.name: {
+                    'evaluated': rule.evaluated,
+                    'rejected': rule.rejected,
+                    'calls_saved': rule.calls_saved
+                }
+                for rule in self.rules
+            }
@@ -1,20 +1,68 @@
 import os
 import requests
 import logging
-from datetime import datetime, timedelta
+import random
+from datetime import datetime
 from dotenv import load_dotenv
-import csv
 import time
+from rate_limiter import RateLimiter
+from output_sink import CSVSink
+from token_manager import TokenManager
+from retry_policy import RetryPolicy
+from metrics import MetricsRegistry
+from structured_logging import log_event, setup_logging_from_env
 
-# Load environment variables
-load_dotenv()
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def simulated_vat_info(company_number):
+    """VAT details returned in the test environment"""
+    return {
+        'vatNumber': f"GB{company_number}",
+        'registrationDate': '2020-01-01'
+    }
+
+def simulated_turnover():
+    """Turnover returned in the test environment, drawn across a wide range"""
+    # Generate turnovers across different ranges with weighted probabilities
+    ranges = [
+        (1_000_000, 10_000_000, 0.25),     # 25% chance of £1M-£10M
+        (10_000_000, 50_000_000, 0.35),    # 35% chance of £10M-£50M
+        (50_000_000, 250_000_000, 0.25),   # 25% chance of £50M-£250M
+        (250_000_000, 1_000_000_000, 0.15) # 15% chance of £250M-£1B
+    ]
+    
+    # Choose a range based on probabilities
+    range_choice = random.random()
+    cumulative_prob = 0
+    for min_val, max_val, prob in ranges:
+        cumulative_prob += prob
+        if range_choice <= cumulative_prob:
+            return random.uniform(min_val, max_val)
+    
+    # Fallback (shouldn't reach here due to probabilities summing to 1)
+    return random.uniform(10_000_000, 50_000_000)
+
+OUTPUT_FIELDNAMES = [
+    'vrn',
+    'company_name',
+    'annual_turnover',
+    'vat_status',
+    'last_return_date'
+]
+
+def company_row(vrn, vat_info, turnover):
+    """Output row for a company that met the turnover threshold"""
+    return {
+        'vrn': vrn,
+        'company_name': vat_info.get('tradingName', 'Unknown'),
+        'annual_turnover': f"£{turnover:,.2f}",
+        'vat_status': vat_info.get('vatStatus', 'Unknown'),
+        'last_return_date': vat_info.get('lastReturnDate', 'Unknown')
+    }
+
 class HMRCClient:
-    def __init__(self):
+    def __init__(self, rate_limiter=None, token_cache_path=None, retry_policy=None, circuit_breakers=None, base_url=None,
+                 metrics=None, connect_timeout=5.0, read_timeout=30.0):
         self.client_id = os.getenv('HMRC_API_KEY')
         self.client_secret = os.getenv('HMRC_SERVER_TOKEN')
         self.server_token = os.getenv('HMRC_SERVER_TOKEN')
@@ -24,27 +72,51 @@ class HMRCClient:
         if not self.client_secret:
             raise ValueError("HMRC_SERVER_TOKEN not found in environment variables")
             
-        self.base_url = 'https://test-api.service.hmrc.gov.uk'
-        self.access_token = None
-        self.token_expiry = None
+        # HMRC_BASE_URL points the client at a stand-in such as mock_upstream.py
+        self.base_url = (base_url or os.getenv('HMRC_BASE_URL') or 'https://test-api.service.hmrc.gov.uk').rstrip('/')
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = circuit_breakers.get('hmrc') if circuit_breakers else None
+        self.metrics = metrics or MetricsRegistry()
+        self.timeout = (connect_timeout, read_timeout)
+        # One token shared by every worker thread, optionally persisted between runs
+        self.tokens = TokenManager(
+            fetch_token=self._request_token,
+            cache_path=token_cache_path or os.getenv('HMRC_TOKEN_CACHE'),
+            cache_key=f"{self.base_url}|{self.client_id}"
+        )
         self.session = requests.Session()
         
-        # Configure session for better error handling
-        self.session.mount('https://', requests.adapters.HTTPAdapter(
-            max_retries=3,
+        # No adapter-level retries: the shared retry policy is the only retry layer, so every
+        # retry is jittered and counted against the run's budget
+        adapter = requests.adapters.HTTPAdapter(
             pool_connections=10,
             pool_maxsize=10
-        ))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
-        logger.info(f"Initialized HMRC client with client ID: {'Present' if self.client_id else 'Missing'}")
-        logger.info(f"Client secret: {'Present' if self.client_secret else 'Missing'}")
+        logger.info("Initialized HMRC client with client ID: %s", 'Present' if self.client_id else 'Missing')
+        logger.info("Client secret: %s", 'Present' if self.client_secret else 'Missing')
         logger.info("Using HMRC Test API environment")
         
-        # Get initial auth token
-        self.authenticate()
+        # Get initial auth token (reused from the token cache when still valid)
+        self.tokens.get_token()
+
+    @property
+    def access_token(self):
+        return self.tokens.access_token
+
+    @property
+    def token_expiry(self):
+        return datetime.fromtimestamp(self.tokens.expires_at) if self.tokens.access_token else None
 
     def authenticate(self):
         """Authenticate with the HMRC API"""
+        return self.tokens.refresh()
+
+    def _request_token(self):
+        """Request a new access token; returns (access_token, expires_in) or None"""
         logger.info("Authenticating with HMRC API...")
         
         auth_url = f"{self.base_url}/oauth/token"
@@ -62,211 +134,186 @@ class HMRCClient:
         }
         
         try:
-            response = requests.post(auth_url, data=auth_data, headers=headers)
+            if self.rate_limiter:
+                self.rate_limiter.acquire(auth_url)
+            response = self.session.post(auth_url, data=auth_data, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             
             token_data = response.json()
-            self.access_token = token_data.get('access_token')
             expires_in = token_data.get('expires_in', 14400)  # Default 4 hours
-            self.token_expiry = datetime.now() + timedelta(seconds=expires_in)
             
             logger.info("Successfully authenticated with HMRC API")
-            return True
+            return token_data.get('access_token'), expires_in
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Authentication failed: {str(e)}")
+            logger.error("Authentication failed: %s", e)
             if hasattr(e.response, 'status_code'):
-                logger.error(f"Response status code: {e.response.status_code}")
+                logger.error("Response status code: %s", e.response.status_code)
             if hasattr(e.response, 'text'):
-                logger.error(f"Response text: {e.response.text}")
-            return False
+                logger.error("Response text: %s", e.response.text)
+            return None
 
     def make_request(self, url, method='get', data=None, params=None):
-        """Make a request to the HMRC API"""
-        max_retries = 3
+        """Make a request to the HMRC API; raises CircuitOpenError while the HMRC breaker is open"""
+        attempt = 0
+        reauthenticated = False
         
-        for attempt in range(max_retries):
+        while True:
+            attempt += 1
+            if self.breaker:
+                self.breaker.before_call()
             try:
-                # Check if we need to authenticate
-                if not self.access_token or datetime.now() > self.token_expiry:
-                    logger.info("Token might be expired, trying to re-authenticate...")
-                    if not self.authenticate():
-                        logger.error("Failed to authenticate with HMRC API")
-                        return None
+                # Refreshes the token first if it is missing or close to expiry
+                token = self.tokens.get_token()
+                if not token:
+                    logger.error("Failed to authenticate with HMRC API")
+                    return None
                 
                 headers = {
-                    'Authorization': f'Bearer {self.access_token}',
+                    'Authorization': f'Bearer {token}',
                     'Accept': 'application/vnd.hmrc.1.0+json',
                     'Content-Type': 'application/json'
                 }
                 
-                logger.info(f"Making {method.upper()} request to {url}")
+                logger.debug("Making %s request to %s", method.upper(), url)
+                if self.rate_limiter:
+                    self.rate_limiter.acquire(url)
+                started = time.perf_counter()
                 if method.lower() == 'get':
-                    response = requests.get(url, headers=headers, params=params)
+                    response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)
                 else:
-                    response = requests.post(url, headers=headers, json=data)
+                    response = self.session.post(url, headers=headers, json=data, timeout=self.timeout)
+                self.metrics.observe('http_request_seconds', time.perf_counter() - started, api='hmrc')
+                self.metrics.increment('http_responses_total', api='hmrc', status=response.status_code)
+                self.metrics.increment('http_response_bytes_total', len(response.content), api='hmrc')
                 
+                if self.breaker:
+                    # Only server errors count against the upstream
+                    if response.status_code >= 500:
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
                 response.raise_for_status()
                 return response.json()
                 
             except requests.exceptions.HTTPError as e:
-                logger.error(f"HTTP Error on attempt {attempt + 1}: {str(e)}")
-                if e.response.status_code == 401:
-                    logger.error(f"Response status code: {e.response.status_code}")
-                    logger.error(f"Response text: {e.response.text}")
-                    # Try to re-authenticate on next attempt
-                    self.access_token = None
+                status = e.response.status_code
+                logger.error("HTTP Error on attempt %d: %s", attempt, e, extra=log_event('http_error', status=status, attempt=attempt))
+                if status == 401 and not reauthenticated:
+                    logger.error("Response text: %s", e.response.text)
+                    # Try to re-authenticate once on the next attempt
+                    self.tokens.invalidate(token)
+                    reauthenticated = True
                     continue
-                elif e.response.status_code == 429:  # Rate limit
-                    wait_time = (attempt + 1) * 2
-                    logger.warning(f"Rate limit hit, waiting {wait_time} seconds...")
+                if self.retry_policy.should_retry(attempt, status):
+                    self.metrics.increment('http_retries_total', api='hmrc')
+                    wait_time = self.retry_policy.delay(attempt, e.response.headers.get('Retry-After'))
+                    logger.warning("Status %s, retrying after %.1f seconds", status, wait_time,
+                                   extra=log_event('request_retry', status=status, attempt=attempt))
                     time.sleep(wait_time)
                     continue
-                else:
-                    logger.error(f"Response status code: {e.response.status_code}")
-                    logger.error(f"Response text: {e.response.text}")
-                    return None
+                logger.error("Response status code: %s", status)
+                logger.error("Response text: %s", e.response.text)
+                return None
             
             except Exception as e:
-                logger.error(f"Request failed on attempt {attempt + 1}: {str(e)}")
-                if attempt == max_retries - 1:
+                logger.error("Request failed on attempt %d: %s", attempt, e, extra=log_event('request_failed', attempt=attempt))
+                if self.breaker:
+                    self.breaker.record_failure()
+                if not self.retry_policy.should_retry(attempt):
                     return None
-                time.sleep(1)
-        
-        return None
+                self.metrics.increment('http_retries_total', api='hmrc')
+                time.sleep(self.retry_policy.delay(attempt))
 
     def get_vat_info(self, company_number):
         """Get VAT information for a company"""
         # Note: In test environment, this might not return real data
-        logger.info(f"Getting VAT info for company {company_number}")
-        
-        # For test environment, return simulated data
-        return {
-            'vatNumber': f"GB{company_number}",
-            'registrationDate': '2020-01-01'
-        }
+        logger.debug("Getting VAT info for company %s", company_number)
+        return simulated_vat_info(company_number)
 
     def get_company_turnover(self, vat_number):
         """Get company turnover from VAT returns"""
         # Note: In test environment, this might not return real data
-        logger.info(f"Getting turnover for VAT number {vat_number}")
-        
-        # For test environment, return simulated data with a wider range
-        import random
-        
-        # Generate turnovers across different ranges with weighted probabilities
-        ranges = [
-            (1_000_000, 10_000_000, 0.25),     # 25% chance of £1M-£10M
-            (10_000_000, 50_000_000, 0.35),    # 35% chance of £10M-£50M
-            (50_000_000, 250_000_000, 0.25),   # 25% chance of £50M-£250M
-            (250_000_000, 1_000_000_000, 0.15) # 15% chance of £250M-£1B
-        ]
-        
-        # Choose a range based on probabilities
-        range_choice = random.random()
-        cumulative_prob = 0
-        for min_val, max_val, prob in ranges:
-            cumulative_prob += prob
-            if range_choice <= cumulative_prob:
-                return random.uniform(min_val, max_val)
-        
-        # Fallback (shouldn't reach here due to probabilities summing to 1)
-        return random.uniform(10_000_000, 50_000_000)
+        logger.debug("Getting turnover for VAT number %s", vat_number)
+        return simulated_turnover()
 
     def process_companies(self, vrn_list):
         """Process list of companies by VAT registration numbers"""
-        logger.info(f"Starting to process {len(vrn_list)} companies")
+        logger.info("Starting to process %d companies", len(vrn_list))
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_file = f'hmrc_filtered_companies_{timestamp}.csv'
-        logger.info(f"Will save results to: {output_file}")
-        
-        fieldnames = [
-            'vrn',
-            'company_name',
-            'annual_turnover',
-            'vat_status',
-            'last_return_date'
-        ]
+        logger.info("Will save results to: %s", output_file)
         
         companies_processed = 0
         companies_saved = 0
         
         try:
-            with open(output_file, 'w', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+            with CSVSink(output_file, OUTPUT_FIELDNAMES) as sink:
                 logger.info("Created CSV file and wrote header")
                 
                 for vrn in vrn_list:
-                    logger.info(f"Processing company with VRN: {vrn}")
                     companies_processed += 1
                     
                     # Get VAT information
                     vat_info = self.get_vat_info(vrn)
                     if not vat_info:
-                        logger.warning(f"Could not get VAT info for VRN {vrn}")
+                        logger.warning("Could not get VAT info for VRN %s", vrn, extra=log_event('vat_info_missing', vrn=vrn))
                         continue
                     
                     # Get turnover
                     turnover = self.get_company_turnover(vrn)
                     if turnover is None:
-                        logger.warning(f"Could not get turnover for VRN {vrn}")
+                        logger.warning("Could not get turnover for VRN %s", vrn, extra=log_event('turnover_missing', vrn=vrn))
                         continue
                     
                     # Only include companies with turnover >= £1M
                     if turnover < 1000000:
-                        logger.info(f"Company with VRN {vrn} turnover (£{turnover:,.2f}) below threshold")
+                        logger.info("Company with VRN %s turnover (£%.2f) below threshold", vrn, turnover,
+                                    extra=log_event('vrn_below_threshold', vrn=vrn, turnover=turnover))
                         continue
                     
-                    company_data = {
-                        'vrn': vrn,
-                        'company_name': vat_info.get('tradingName', 'Unknown'),
-                        'annual_turnover': f"£{turnover:,.2f}",
-                        'vat_status': vat_info.get('vatStatus', 'Unknown'),
-                        'last_return_date': vat_info.get('lastReturnDate', 'Unknown')
-                    }
+                    company_data = company_row(vrn, vat_info, turnover)
                     
-                    logger.info(f"Writing data for VRN {vrn}: {company_data}")
-                    writer.writerow(company_data)
+                    sink.write(company_data)
                     companies_saved += 1
-                    logger.info(f"Successfully wrote data for VRN {vrn}")
-                    
-                    # Respect rate limiting
-                    time.sleep(0.5)  # Adjust as needed based on HMRC rate limits
+                    logger.debug("Wrote data for VRN %s: %s", vrn, company_data, extra=log_event('vrn_saved', vrn=vrn))
             
-            logger.info(f"Processing complete. Processed {companies_processed} companies, saved {companies_saved} to CSV")
+            logger.info("Processing complete. Processed %d companies, saved %d to CSV", companies_processed, companies_saved)
             return output_file
             
         except IOError as e:
-            logger.error(f"Error writing to CSV file: {str(e)}")
+            logger.error("Error writing to CSV file: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error during processing: {str(e)}")
+            logger.error("Unexpected error during processing: %s", e)
             return None
 
 def main():
-    # You'll need to provide a list of VAT Registration Numbers to process
-    vrn_list = [
-        "123456789",  # Example VRN
-        "987654321"   # Example VRN
-    ]
-    
-    logger.info("Starting HMRC data retrieval script")
-    client = HMRCClient()
-    
-    try:
-        output_file = client.process_companies(vrn_list)
+    # Load environment variables and configure logging
+    load_dotenv()
+    with setup_logging_from_env():
+        # You'll need to provide a list of VAT Registration Numbers to process
+        vrn_list = [
+            "123456789",  # Example VRN
+            "987654321"   # Example VRN
+        ]
         
-        if output_file:
-            logger.info(f"Data has been saved to {output_file}")
-            print(f"Data has been saved to {output_file}")
-        else:
-            logger.error("No data was saved")
-            print("No data was saved")
-    except Exception as e:
-        logger.error(f"Error in main: {str(e)}")
-        print(f"Error: {str(e)}")
+        logger.info("Starting HMRC data retrieval script")
+        client = HMRCClient(rate_limiter=RateLimiter())
+        
+        try:
+            output_file = client.process_companies(vrn_list)
+            
+            if output_file:
+                logger.info("Data has been saved to %s", output_file)
+                print(f"Data has been saved to {output_file}")
+            else:
+                logger.error("No data was saved")
+                print("No data was saved")
+        except Exception as e:
+            logger.error("Error in main: %s", e)
+            print(f"Error: {str(e)}")
 
 if __name__ == "__main__":
     main()
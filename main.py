@@ -1,37 +1,194 @@
 import os
+import argparse
+import functools
+import logging
 import requests
-import csv
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from dotenv import load_dotenv
 from hmrc_client import HMRCClient  # Assuming HMRCClient is implemented correctly
+from companies_house import CompaniesHouseClient, Director
+from rate_limiter import COMPANIES_HOUSE_WINDOW, RateLimiter, window_rate
+from progress_journal import ProgressJournal
+from name_source import count_company_names, iter_company_names
+from response_cache import ResponseCache
+from pipeline_config import PipelineConfig
+from output_sink import CSVSink, ParquetSink
+from filter_planner import FilterPlanner, FilterRule
+from bulk_index import CompanyIndex
+from name_matching import DedupIndex, best_match, normalize_company_name
+from retry_policy import RetryBudget, RetryPolicy
+from circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from metrics import MetricsRegistry
+from structured_logging import log_event, setup_logging
+from progress import PipelineProgress, TqdmStream
 
-# Your Companies House API Key
-api_key = os.getenv('COMPANIES_API_KEY')
+logger = logging.getLogger(__name__)
 
-# Function to search for company registration number by company name
+# Shared clients are built on first use so importing this module has no side effects
+_config = None
+_clients = {}
+_clients_lock = threading.RLock()
+
+def configure(config):
+    """Use config for the shared clients, closing any built for a previous configuration"""
+    global _config
+    close_clients()
+    _config = config
+
+def get_config():
+    global _config
+    if _config is None:
+        _config = PipelineConfig.from_env()
+    return _config
+
+def _shared_client(name, factory):
+    with _clients_lock:
+        if name not in _clients:
+            _clients[name] = factory()
+        return _clients[name]
+
+# Counters and latency histograms for the whole run, exported to config.metrics_file at the end
+def get_metrics():
+    return _shared_client('metrics', MetricsRegistry)
+
+# Record the latency of every call to a pipeline stage in the shared metrics
+def timed_stage(stage):
+    def decorator(function):
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            with get_metrics().time('stage_seconds', stage=stage):
+                return function(*args, **kwargs)
+        return timed
+    return decorator
+
+# One limiter per API host, shared by both clients and every worker thread
+def get_rate_limiter():
+    config = get_config()
+    # Without an explicit rate, the burst plus the refill stays within the published 600 per 5 minutes
+    rate = config.companies_house_rate or window_rate(*COMPANIES_HOUSE_WINDOW, config.companies_house_burst)
+    return _shared_client('rate_limiter', lambda: RateLimiter({
+        'api.company-information.service.gov.uk': (rate, config.companies_house_burst)
+    }))
+
+# Retry policy for both APIs; its budget caps the retries spent in one run
+def get_retry_policy():
+    config = get_config()
+    return _shared_client('retry_policy', lambda: RetryPolicy(budget=RetryBudget(config.retry_budget)))
+
+# One circuit breaker per upstream endpoint, so a failing API is not called for every remaining name
+def get_circuit_breakers():
+    config = get_config()
+    return _shared_client('circuit_breakers', lambda: CircuitBreakerRegistry(
+        failure_threshold=config.circuit_failure_threshold,
+        reset_timeout=config.circuit_reset_timeout
+    ))
+
+# Persistent response cache so weekly reruns over the same names skip the network
+def get_response_cache():
+    config = get_config()
+    return _shared_client('response_cache', lambda: ResponseCache(
+        config.cache_path,
+        max_entries=config.cache_max_entries
+    ) if config.cache_path else None)
+
+# Shared keep-alive client for all Companies House calls
+def get_companies_house():
+    config = get_config()
+    return _shared_client('companies_house', lambda: CompaniesHouseClient(
+        config.api_key,
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize or config.max_workers,
+        rate_limiter=get_rate_limiter(),
+        response_cache=get_response_cache(),
+        retry_policy=get_retry_policy(),
+        circuit_breakers=get_circuit_breakers(),
+        base_url=config.companies_house_url,
+        metrics=get_metrics(),
+        connect_timeout=config.connect_timeout,
+        read_timeout=config.read_timeout
+    ))
+
+# Local bulk-snapshot index answers name and profile lookups; the live API is the fallback
+def get_company_index():
+    config = get_config()
+    return _shared_client('company_index', lambda: CompanyIndex(
+        config.index_path
+    ) if config.index_path and os.path.exists(config.index_path) else None)
+
+# HMRCClient authenticates when constructed, so it is only built once a turnover lookup needs it
+def get_hmrc_client():
+    config = get_config()
+    return _shared_client('hmrc_client', lambda: HMRCClient(
+        rate_limiter=get_rate_limiter(),
+        retry_policy=get_retry_policy(),
+        circuit_breakers=get_circuit_breakers(),
+        base_url=config.hmrc_url,
+        metrics=get_metrics(),
+        connect_timeout=config.connect_timeout,
+        read_timeout=config.read_timeout
+    ))
+
+def close_clients():
+    with _clients_lock:
+        response_cache = _clients.get('response_cache')
+        if response_cache:
+            response_cache.close()
+        _clients.clear()
+
+# Pick the bulk-index candidate whose name best matches the input, if any is close enough
+def choose_index_candidate(company_name, candidates):
+    candidate, _ = best_match(company_name, candidates, get_config().match_threshold, key=lambda c: c[1])
+    return candidate[0] if candidate else None
+
+# Function to search for company registration number by company name.
+# Every candidate is scored against the input name; only a match above the threshold is accepted.
+@timed_stage('search')
 def search_company_by_name(company_name):
-    url = f"https://api.company-information.service.gov.uk/search/companies?q={company_name}"
-    response = requests.get(url, auth=(api_key, ''))
+    threshold = get_config().match_threshold
+    company_index = get_company_index()
+    if company_index:
+        company_number = company_index.resolve(company_name, choose=choose_index_candidate)
+        if company_number:
+            return company_number
+
+    response = get_companies_house().get("/search/companies", params={'q': company_name})
     
     if response.status_code == 200:
         try:
             data = response.json()
             if "items" in data and data["items"]:
-                company = data["items"][0]
-                return company["company_number"]
+                company, score = best_match(company_name, data["items"], threshold, key=lambda item: item.get("title", ""))
+                if company:
+                    return company["company_number"]
+                logger.info("No confident match for: %s (best score %.2f)", company_name, score,
+                            extra=log_event('search_no_match', company=company_name, score=score))
+                return None
             else:
-                print(f"No company found for: {company_name}")
+                logger.info("No company found for: %s", company_name, extra=log_event('search_no_results', company=company_name))
                 return None
         except requests.exceptions.JSONDecodeError:
-            print(f"Invalid JSON response for company: {company_name}. Response: {response.text}")
+            logger.warning("Invalid JSON response for company: %s. Response: %s", company_name, response.text,
+                           extra=log_event('invalid_json', company=company_name))
             return None
     else:
-        print(f"Failed to fetch data for {company_name}. Status Code: {response.status_code}, Response: {response.text}")
+        logger.warning("Failed to fetch data for %s. Status Code: %s, Response: %s", company_name, response.status_code,
+                       response.text, extra=log_event('fetch_failed', company=company_name, status=response.status_code))
         return None
 
 # Function to get company details (name, address, SIC codes, status) from Companies House API
+@timed_stage('profile')
 def get_company_details(company_number):
-    url = f"https://api.company-information.service.gov.uk/company/{company_number}"
-    response = requests.get(url, auth=(api_key, ''))
+    company_index = get_company_index()
+    if company_index:
+        profile = company_index.get_profile(company_number)
+        if profile:
+            return profile
+
+    response = get_companies_house().get(f"/company/{company_number}")
     
     if response.status_code == 200:
         try:
@@ -50,9107 +207,367 @@ def get_company_details(company_number):
             is_active = data.get("company_status", "").lower() == "active"
             return name, formatted_address, sic_codes, is_active
         except requests.exceptions.JSONDecodeError:
-            print(f"Invalid JSON response for company: {company_number}. Response: {response.text}")
+            logger.warning("Invalid JSON response for company: %s. Response: %s", company_number, response.text,
+                           extra=log_event('invalid_json', company_number=company_number))
             return None, None, None, None
     else:
-        print(f"Failed to fetch details for company {company_number}. Status Code: {response.status_code}, Response: {response.text}")
+        logger.warning("Failed to fetch details for company %s. Status Code: %s, Response: %s", company_number,
+                       response.status_code, response.text,
+                       extra=log_event('fetch_failed', company_number=company_number, status=response.status_code))
         return None, None, None, None
 
-# Function to get all directors' details (name and age) from Companies House API
-def get_directors_details(company_number):
-    url = f"https://api.company-information.service.gov.uk/company/{company_number}/officers"
-    response = requests.get(url, auth=(api_key, ''))
+# Function to get all directors' details (name and age) from Companies House API as Director records.
+# Each person appears once even with several appointments, and resigned directors are left out
+# unless include_resigned is set. If stop_when(directors) returns True no further pages are requested.
+@timed_stage('officers')
+def get_directors_details(company_number, stop_when=None, include_resigned=None):
+    if include_resigned is None:
+        include_resigned = get_config().include_resigned_directors
     directors = []
-    if response.status_code == 200:
-        try:
-            data = response.json()
-            if "items" in data:
-                for officer in data["items"]:
-                    if officer.get("officer_role") == "director":
-                        name = officer.get("name", "N/A")
-                        birth_year = officer.get("date_of_birth", {}).get("year")
-                        if birth_year:
-                            age = datetime.now().year - int(birth_year)
-                            directors.append(f"{name} (Age: {age})")
-        except requests.exceptions.JSONDecodeError:
-            print(f"Invalid JSON response for officers. Response: {response.text}")
+    seen = set()
+    current_year = datetime.now().year
+    for officer in get_companies_house().iter_officers(company_number):
+        if officer.get("officer_role") != "director":
+            continue
+        director = Director.from_officer(officer, current_year)
+        if director.age is None or (not include_resigned and not director.is_active):
+            continue
+        identity = director.identity()
+        if identity in seen:
+            continue
+        seen.add(identity)
+        directors.append(director)
+        if stop_when and stop_when(directors):
+            break
     return directors
 
-# Function to get company turnover using HMRCClient
+# Function to get company turnover using HMRCClient, reusing turnover cached by earlier runs
+@timed_stage('turnover')
 def get_company_turnover(client, vat_number):
+    response_cache = get_response_cache()
+    if response_cache:
+        cached = response_cache.get('turnover', vat_number)
+        get_metrics().increment('cache_lookups_total', endpoint='turnover', result='miss' if cached is None else 'hit')
+        if cached is not None:
+            return float(cached)
     try:
-        return client.get_company_turnover(vat_number)
+        turnover = client.get_company_turnover(vat_number)
+    except CircuitOpenError:
+        raise
     except Exception as e:
-        print(f"Error fetching turnover for VAT number {vat_number}: {e}")
+        logger.warning("Error fetching turnover for VAT number %s: %s", vat_number, e,
+                       extra=log_event('turnover_failed', vat_number=vat_number))
         return None
+    if turnover is not None and response_cache:
+        response_cache.set('turnover', vat_number, repr(turnover))
+    return turnover
 
-# List of company names to search for (populate as needed)
-company_names = [
-    "DAILY POPPINS LIMITED",
-    "GUARDIAN HYGIENE SERVICES LIMITED",
-    "THE GREEN LADY LTD",
-    "CRYSTAL CLEAR LIMITED",
-    "INIVOS LIMITED",
-    "TEMCOUK FACILITY SERVICES LIMITED",
-    "SMART GROUP SERVICES LIMITED",
-    "MINSTER CLEANING SERVICES LIMITED",
-    "MAID MARION'S CLEANING SERVICES LIMITED",
-    "CAM SPECIALIST SUPPORT LIMITED",
-    "SAMS CLEANS LIMITED",
-    "THE OVEN CLEANERS LTD",
-    "M CLEANING SERVICES (TAUNTON) LIMITED",
-    "THE FLOORBRITE GROUP LIMITED",
-    "BOURNEMOUTH CLEANING SERVICES LTD",
-    "VERMATECH PEST CONTROL LIMITED",
-    "KENTKLEAN LIMITED",
-    "IVY CLEANING AGENCY LTD",
-    "UNIT CLEAN LIMITED",
-    "KITCHEN DIRT DEVILS LIMITED",
-    "DUSTERS SOUTH WALES LIMITED",
-    "TAREM SERVICES LIMITED",
-    "ECSA ENGINEERING CONSULTING & SERVICE FOR AUTOMATION LTD",
-    "TKM COMMERCIAL CLEANING LIMITED",
-    "CLEANING SERVICES (HOUNSLOW) LTD",
-    "PROKILL LIMITED",
-    "TOAST (SOUTHERN) LIMITED",
-    "CARPET CLEANER LONDON LTD",
-    "SIMON’S STEAM CLEANING LIMITED",
-    "OVENU FRANCHISING LIMITED",
-    "MILLY MOLLY MAIDS LTD",
-    "ELLACK CLEANING CONTRACTORS LIMITED",
-    "S J T LIMITED",
-    "VALLEY CLEANING SERVICES LIMITED",
-    "FALLOW MANAGEMENT LIMITED",
-    "CRYSTAL WINDOWS LTD",
-    "SWIFT OFFICE CLEANING SERVICES LTD",
-    "COMET CLEANING SERVICES LTD",
-    "FRIENDS OF THE PRINCESS ROYAL HOSPITAL TELFORD LIMITED",
-    "CROYDON CLEANING SERVICES LIMITED",
-    "COOPERS WINDOW CLEANING LTD",
-    "FRYER CLEANING AND MAINTENANCE LIMITED",
-    "DUBLCHECK CLEANING SERVICES LIMITED",
-    "NOTTINGHAMSHIRE INDEPENDENT DOMESTIC ABUSE SERVICES (NIDAS)",
-    "CROWN DEEPCLEAN LIMITED",
-    "CANBURY CLEANING SERVICES LTD",
-    "AAA PEST CONTROL SERVICES LIMITED",
-    "TWO COUNTIES CLEANING SERVICES LIMITED",
-    "SYNERGY ASSET MANAGEMENT LONDON LTD",
-    "MAJESTIC CLEANING LIMITED",
-    "DISCREET PEST CONTROL LIMITED",
-    "LAKETHORNE MAINTENANCE SERVICES LIMITED",
-    "ASNEW (UK) LTD",
-    "E.K.S LIVING CLEAN LTD.",
-    "CHILTERN HYGIENE SERVICES LIMITED",
-    "ADERYN LIMITED",
-    "RYAN POULTRY SERVICES LIMITED",
-    "ENTERPRISE COMPLETE SERVICES LTD.",
-    "STALEV LIMITED",
-    "CLEVELAND CLEANING LIMITED",
-    "BOROUGH PEST CONTROL LTD",
-    "SEYMOUR CLEANING SERVICES LIMITED",
-    "CLEANDAY LONDON LTD",
-    "PRIME CLEAN LIMITED",
-    "A & B CLEANING SERVICES LIMITED",
-    "HARTLEY ENVIRONMENTAL TRUST LIMITED",
-    "WLC GROUP LTD",
-    "EAST COAST PEST CONTROL LIMITED",
-    "ABBEY PEST CONTROL LTD",
-    "SALTER CLEANING SERVICES LIMITED",
-    "STEPHEN T EVANS LIMITED",
-    "VERMAWAY PEST CONTROL LIMITED",
-    "GREEN SKY LTD",
-    "AVONDALE SWEEPS LTD",
-    "INDEPENDENT INTERNATIONAL CLEANING SERVICES LTD",
-    "RELYON CLEANING SERVICES LTD",
-    "QUANTAQUA LIMITED",
-    "BLUE HAZE PROPERTY SERVICES LIMITED",
-    "O G CONSERVATORY MAINTENANCE LIMITED",
-    "ADT TRUCKS LTD",
-    "MARK CARTER LIMITED",
-    "ENVIROCURE LIMITED",
-    "PROVERT LIMITED",
-    "MINSTER CLEANING LIMITED",
-    "NATIONAL PIGEON AND PEST CONTROL LTD",
-    "THE CARDIFF WINDOW CLEANING COMPANY JR LIMITED",
-    "TIME FOR YOU LIMITED",
-    "EASY CLEAN NOTTINGHAM LTD",
-    "SCARECROW GROUP LIMITED",
-    "SUNLITE CLEANING SERVICES LTD",
-    "DEALEY ENVIRONMENTAL LTD",
-    "LOWCOST CLEANERS LTD",
-    "CHIMNEY SWEEPS LTD",
-    "D LIMITED",
-    "POLLY LIMITED",
-    "GREEN VALLEY PEST CONTROL LIMITED",
-    "THE LADY CLEANER LTD",
-    "TRUSTCLEAN LIMITED",
-    "F C S CLEANING LIMITED",
-    "RACCOON CLEANING LIMITED",
-    "N LIMITED",
-    "COIN OLDCO LIMITED",
-    "FAIRIES LIMITED",
-    "INS LIMITED",
-    "DENIS J. FROUD BUILDERS LIMITED",
-    "RICHARDSONS LIMITED",
-    "HYGIENEBUSTERS LIMITED",
-    "HAPPY MAIDS LTD",
-    "GOLD CLASS CLEANING LIMITED",
-    "PEST-AWAY TOTAL CARE SOLUTIONS LIMITED",
-    "HULLS ENVIRONMENTAL SERVICES LIMITED",
-    "KITES",
-    "ET VOILA LIMITED",
-    "INOCULAND LIMITED",
-    "PEST SOLUTIONS LIMITED",
-    "MRV SUPPORT SERVICES LIMITED",
-    "IAN JAMES WINDOW CLEANING LIMITED",
-    "PRP DECON LIMITED",
-    "CLEANBREEZE LIMITED",
-    "DYNAMIC CLEANING SERVICES LIMITED",
-    "M MOORE INDUSTRIAL CLEANERS LIMITED",
-    "WATFORD CLEANING SERVICES LTD",
-    "ECO KLEEN LIMITED",
-    "LION COMMERCIAL CLEANING LTD",
-    "PURE CLEANING LIMITED",
-    "A & B DOMESTIC CLEANERS & REMOVALS LTD",
-    "HEAVEN CLEANING LIMITED",
-    "THE CLEANOLOGISTS LTD",
-    "CLEANTEC SERVICES LIMITED",
-    "SOLO OFFICE PRODUCTS LIMITED",
-    "AG PEST MANAGEMENT LIMITED",
-    "PESTATES WEMBLEY LIMITED",
-    "LONDON CLEANER LIMITED",
-    "CLEARCUT GLASSHOUSE SERVICES LIMITED",
-    "ISOCLEANSE LTD",
-    "EXPRESS SUPER CLEANERS LIMITED",
-    "BOOK A CLEANER LTD",
-    "CREST HYGIENE SERVICES LIMITED",
-    "E C M SYSTEMS LIMITED",
-    "ESSEX OFFICE SERVICES (LONDON) LTD",
-    "BUCKINGHAM HOUSEMAIDS LIMITED",
-    "DAZZLE CLEANING SERVICES CARDIFF LIMITED",
-    "NORFOLK CLEANING GROUP LTD",
-    "BRS CLEANING CONTRACTORS LIMITED",
-    "BRIGHT HYGIENE MANAGEMENT (LONDON) LIMITED",
-    "CLEANRITE (SERVICES) LIMITED",
-    "D DAWSON LIMITED",
-    "ACE CLEANING DOMESTIC LIMITED",
-    "BAYLEAF FACILITIES MANAGEMENT LTD",
-    "COMMERCIAL CARETAKERS LIMITED",
-    "ALLPEST LIMITED",
-    "TARDIS ENVIRONMENTAL HOLDINGS LTD",
-    "ABC JUICES BAR WEST LONDON LIMITED",
-    "MR. BRIGHT'S LIMITED",
-    "FM ALLIANCE LTD",
-    "YOUR HOME CLEANERS LTD",
-    "CROWN CLEANING SERVICES LTD",
-    "MERRY MOPS LTD",
-    "HAMMONDS HYGIENE SOLUTIONS LIMITED",
-    "CITRON HYGIENE UK LIMITED",
-    "PROGUARD CENTRAL SERVICES LIMITED",
-    "CARECLEAN 2000 LIMITED",
-    "THE SPARKLE OVEN CLEANING COMPANY (UK) LTD",
-    "3 WAY CLEANING LIMITED",
-    "SUPREME CLEAN (PLYMOUTH) LTD",
-    "EVOLUTION-24 LIMITED",
-    "SODEXO LIMITED",
-    "CLEANWISE LIMITED",
-    "PINNACLE B2B HOLDINGS LIMITED",
-    "VECTAIR SYSTEMS LIMITED",
-    "LANCASHIRE HYGIENE LIMITED",
-    "BLACKBERRY CLEANING & SUPPORT SERVICES LTD",
-    "STEADFAST CLEANING COMPANY LIMITED",
-    "FELINE CLEANERS LIMITED",
-    "E LIMITED",
-    "MARVINS ELITE SERVICES LIMITED",
-    "BRIGHT LIMITED",
-    "SPA CLEANING LTD",
-    "ORIANA PROPERTY LTD",
-    "BLITZ CLEANING SERVICES (UK) LIMITED",
-    "CHESTERTON COMMERCIAL (BEACONSFIELD) LIMITED",
-    "LES FEMMES DE MENAGE LIMITED",
-    "ALBANY CLEANING SOLUTIONS LTD",
-    "R J C SOLUTIONS LIMITED",
-    "CSC FORECOURT SERVICES LIMITED",
-    "ECO CLEANING SERVICES LIMITED",
-    "ROCHELLES CLEANING AND CARETAKING LIMITED",
-    "MH CLEANING SOLUTIONS LIMITED",
-    "SUPREME CLEAN LIMITED",
-    "ENVIRONMENTAL CONTRACT CLEANERS LIMITED",
-    "WINDOW SERVICES ESSEX LIMITED",
-    "HEATSHIELD PROPERTY CARE AND MAINTENANCE SERVICES LTD",
-    "WALTHAM BLACK LIMITED",
-    "J.A. LEE WINDOW & GENERAL CLEANING CONTRACTORS LIMITED",
-    "HF PEST CONTROL LIMITED",
-    "ENTERPRISE SERVICES GROUP LIMITED",
-    "THE OVEN CLEANING MAN LIMITED",
-    "INSTAKIL LIMITED",
-    "SPINACLEAN LTD",
-    "THUNDERSLEY CLEANING SERVICES LTD",
-    "SPARKLING COBWEBS DOMESTIC AND CARPET CLEANING SERVICES LIMITED",
-    "CHALCOT HOUSE SERVICES LIMITED",
-    "BELLS SOUTHFIELDS LIMITED",
-    "AJ INTERIM & CONSULTING SERVICES LTD",
-    "ADVANCED CLEANING TECHNOLOGY LTD",
-    "3 COUNTIES CLEANING LIMITED",
-    "TCMS (MIDLANDS) LIMITED",
-    "FORDBRIDGE SERVICES LTD",
-    "INSPIRE CLEANING GROUP LTD",
-    "OPTIMUS PLUS LIMITED",
-    "NATIONWIDE HYGIENE SUPPLIES LIMITED",
-    "A BURGESS LTD",
-    "TAYBRAY LTD",
-    "STM CLEANING LTD",
-    "MAID IN ESSEX LIMITED",
-    "KAND PEST CONTROL LIMITED",
-    "HLA PEST CONTROL SERVICES LTD",
-    "AEG CLEANING SERVICES LTD",
-    "ACTION INDUSTRIAL CLEANING SERVICES (UK) LIMITED",
-    "ACME CLEANING SERVICES LIMITED",
-    "ALL ASPECTS PEST CONTROL LIMITED",
-    "AARK ENVIRONMENTAL SERVICES LIMITED",
-    "C.G. CLEANING LIMITED",
-    "CHL LEGACY LIMITED",
-    "ASCS (CORNWALL) LIMITED",
-    "AMAYA SERVICES LIMITED",
-    "MAID2CLEAN LIMITED",
-    "CLEAN LTD",
-    "HIGH SHINE LTD",
-    "CRYSTAL POOLS SERVICES LTD",
-    "PHOENIX SPECIALIST CLEANING SERVICES LIMITED",
-    "FAST CARPET CLEANERS LTD",
-    "CATERCLEANSE LIMITED",
-    "ACSUK CO LTD",
-    "PEACE OF MIND HOME HELP LIMITED",
-    "REDBOURNE CLEANING SERVICES LIMITED",
-    "LARA NICHOLS LIMITED",
-    "NVIRO CLEANTECH LIMITED",
-    "DAYLIGHT WINDOW AND INDUSTRIAL CLEANING SERVICES LIMITED",
-    "COALVILLE CLEANING SERVICES LIMITED",
-    "CIRCLE DECONTAMINATION LIMITED",
-    "BRIGHTWISE CLEANING LIMITED",
-    "HI STANDARD SERVICES LTD",
-    "SUFFOLK MAIDS LIMITED",
-    "TLC WINDOW CLEANING LIMITED",
-    "LET US LIMITED",
-    "WEST WALES PEST CONTROL LIMITED",
-    "CALAHANS CLEANING SERVICES LIMITED",
-    "C I C S (SCOTLAND) LIMITED",
-    "HIGHER PURPOSE CLEANING SERVICES LIMITED",
-    "PREMIER ENVIRONMENTAL LIMITED",
-    "HELPING HANDS CLEANING LTD",
-    "REACT SPECIALIST CLEANING LIMITED",
-    "SHIELD CLEANING SERVICES LIMITED",
-    "FAIRWAY SUPPORT SERVICES LIMITED",
-    "HEALTHGUARD LIMITED",
-    "SUPER CLEAN PLUS LTD",
-    "THE HOLIDAY MAID SERVICE LIMITED",
-    "HOME SERVICE SOLUTIONS LTD",
-    "ARKITON ROOFING SOLUTIONS LIMITED",
-    "HALL CLEANING SERVICES LIMITED",
-    "RATTUE CO. LIMITED",
-    "VERICLEAN SUPPORT SERVICES LIMITED",
-    "WHITE ELEPHANT BUSINESS SERVICES LTD",
-    "HOUSEWORK HUB LIMITED",
-    "VISION CLEAN LIMITED",
-    "INDIANA SERVICES LTD",
-    "ACTUAL SUPPORT SERVICES LIMITED",
-    "LILIANA'S CLEANING SERVICES LIMITED",
-    "MARBEN LIMITED",
-    "ABC - A BIN CLEANED LTD",
-    "AZTEC COMMERCIAL WINDOW CLEANING LIMITED",
-    "INSIDEOUT CLEANING SOLUTIONS LIMITED",
-    "HANDS (CLEANERS) LIMITED",
-    "TOTALLY FLOORLESS LTD",
-    "COVENTRY PEST CONTROL & MAINTENANCE LIMITED",
-    "EXCLUSIVE CONTRACT SERVICES LIMITED",
-    "PROSTREAM FX LTD",
-    "PROFESSIONAL PEST MANAGEMENT LIMITED",
-    "RAINBOW INTERNATIONAL LIMITED",
-    "PRESTIGE CONTRACT CLEANING LTD",
-    "DEEP CLEANING LONDON LIMITED",
-    "PRO-CLEAN SERVICES LIMITED",
-    "BEXHILL CARE HOME LIMITED",
-    "VISION HYGIENE INC LIMITED",
-    "TOP MOPS LIMITED",
-    "MAID IN THE COTSWOLDS LTD",
-    "CONTROL PEST UK LTD",
-    "GR PRO-CLEAN (THAMES) LIMITED",
-    "CENTRAL LONDON CLEANERS LTD",
-    "IMPACT CONTRACTS LIMITED",
-    "KAL CLEANING SERVICES LTD",
-    "THE NORTH SURREY CLEANING COMPANY LIMITED",
-    "PEST UK HOLDINGS LIMITED",
-    "PETE THE SWEEP LIMITED",
-    "INDUSTRIAL CLEANING CONTRACTORS LTD",
-    "SOOTY THE SWEEP LIMITED",
-    "P J M LIMITED",
-    "EAGLECLEAN SPECIALIST SERVICES LIMITED",
-    "END OF TENANCY CLEANERS LTD",
-    "XTREME CLEANING LTD",
-    "ACTIVE CLEANING LIMITED",
-    "EAGLE CLEANING SERVICES LTD",
-    "CLEANIT CLEANING SERVICES (SHROPSHIRE) LIMITED",
-    "BOB WEBSTER & SONS CLEANING SERVICES LIMITED",
-    "HOUNSLOW DRY CLEANERS LTD",
-    "D.B. CLEANERS & LAUNDERERS LIMITED",
-    "WIMBLEDON CLEANING COMPANY SERVICES LIMITED",
-    "PEE MARCH CLEANING LIMITED",
-    "BRECKLAND INDUSTRIAL LIMITED",
-    "AM SWEEPS STOVES & FIREPLACES LIMITED",
-    "MITEY LIMITED",
-    "ABC WINDOW SOLUTIONS (TRADING AS APOLLO BLINDS) LIMITED",
-    "CITY CENTRAL CLEANING LIMITED",
-    "A. A. CHEMICAL CLEANING COMPANY LIMITED",
-    "APL CLEANING LIMITED",
-    "ALL PROPERTY CARE LTD",
-    "AFRESH OFFICE CLEANING LTD",
-    "TERMINEX LIMITED",
-    "AMARCO GROUP LTD",
-    "A SURE CLEAN LIMITED",
-    "KEVS CLEANING SERVICES LIMITED",
-    "B & D PEST CONTROL LIMITED",
-    "P LIMITED",
-    "DOBBINS INDUSTRIAL CLEANING LIMITED",
-    "PLAIN JANES HOUSEKEEPING LIMITED",
-    "BRISTOL LIMITED",
-    "ASHTON CLEANING SERVICES LTD.",
-    "SEARCH UK PEST CONTROL LIMITED",
-    "ISPECLEAN LIMITED",
-    "BLISS CLEANING SERVICES (LEDBURY) LIMITED",
-    "SOUTH EASTERN TANKER SERVICES LIMITED",
-    "BOWDRAPER LIMITED",
-    "COMMERCIAL CLEANING SOMERSET LTD",
-    "MERRY MAIDS CHESHIRE LTD",
-    "C.M.A. (NEMESIS) LIMITED",
-    "MIDLAND CLEANING SERVICES LIMITED",
-    "ROKILL PEST CONTROL LIMITED",
-    "KMC CLEANING LIMITED",
-    "ABSOLUTELY GLEAMING LTD",
-    "BREANHEATH LIMITED",
-    "LINCSPEST LTD",
-    "WATERERS' SERVICES LIMITED",
-    "LONDON CLEANING HOUSE LTD",
-    "DEANS CLEANS LIMITED",
-    "NUSERVE LIMITED",
-    "SPARKLEY KLEEN LIMITED",
-    "FAST CLEANERS LIMITED",
-    "CLEANLINKS SERVICE LIMITED",
-    "HAMPSON BROTHERS CLEANING LTD",
-    "C C S SERVICES LIMITED",
-    "SAFECLEAN (WEST MIDLANDS) LIMITED",
-    "NICE LIMITED",
-    "AMBASSADOR CLEANING CONTRACTS LIMITED",
-    "QUALITY DRY CLEANERS HARROW LTD",
-    "PAINTING ADVISORY SERVICES LIMITED",
-    "SOLUTIONS CLEANING SERVICES LIMITED",
-    "PROFESSIONAL CLEANERS BRISTOL AND BATH LTD",
-    "CLEAN TEAM BEDFORDSHIRE LIMITED",
-    "CLEANSENSE LIMITED",
-    "ATLAS CLEANING LIMITED",
-    "INTOCLEANING LIMITED",
-    "ACADEMY FOR CLEANROOM TESTING LIMITED",
-    "ISOTANK SERVICES LIMITED",
-    "R LIMITED",
-    "DAISY CHAINS LIMITED",
-    "PHOENIX OFFICE CLEANING LIMITED",
-    "BEACON SUPPORT SERVICES LIMITED",
-    "FIRST CHOICE CLEANING LIMITED",
-    "C K GROUP LIMITED",
-    "A & A CLEANING AND CONSULTANCY LIMITED",
-    "EFFICIENT CLEANING SERVICES LIMITED",
-    "KITE CONTRACT CLEANING LIMITED",
-    "NEWPORT CITY CLEANING LTD",
-    "SPALLS CLEAN LIMITED",
-    "G A HELLIAR AND SON LIMITED",
-    "B P HAWKINS LIMITED",
-    "COUNTY CONTRACT CLEANING SERVICES LIMITED",
-    "B.E.E. SERVICES LIMITED",
-    "AMBASSADOR CLEANING SERVICES LIMITED",
-    "SPOTCLEAN SOLUTIONS LIMITED",
-    "MECHANICAL CLEANSING SERVICES LIMITED",
-    "HI SPEC CLEANING LTD",
-    "BIRDSNEST SUSSEX & CO LTD",
-    "REGIONAL SERVICES LTD",
-    "LOW COST CLEANING SERVICES (SURREY) LIMITED",
-    "BRILLIANT COMMERCIAL & INDUSTRIAL CLEANING GROUP LTD",
-    "JPD CLEANING SERVICES LTD",
-    "HOUSEHOLD ANGELS LIMITED",
-    "PINEWOOD CLEANING SERVICES LTD.",
-    "PROSTAR SERVICES LIMITED",
-    "WORKCONNEXIONS LIMITED",
-    "SEE CLEAN CONTRACT CLEANING SERVICES LIMITED",
-    "ABBEY CLEANING COMMERCIAL SERVICES LIMITED",
-    "SWALLOW CLEANING CONTRACTORS LIMITED",
-    "SHINE LIMITED",
-    "DUBLCHECK LIMITED",
-    "DOLLY DUSTERS CLEANING LIMITED",
-    "SIMPLY SPOTLESS LIMITED",
-    "REGENCY BLOCK CLEANING LTD",
-    "PEST CONTROL LIMITED",
-    "LONDONWIDE CLEANING SERVICES LIMITED",
-    "SALUS SUPPORT SERVICES LIMITED",
-    "PRESTIGIOUS SERVICES WOLVERHAMPTON LIMITED",
-    "HAZTANK SERVICES LIMITED",
-    "ARK CLEANING SERVICES LIMITED",
-    "SOUTHERN WINDOW & BUILDING SOLUTIONS LIMITED",
-    "CHORES LIMITED",
-    "G LIMITED",
-    "PACIFIC MARKETING LTD",
-    "ARP COMMERCIAL PROPERTY CARE LTD",
-    "ACE CROSS COUNTRY LTD",
-    "AFTERCARE SPECIALIST CLEANING LTD",
-    "CONGRATULATION QUALITY CARE LIMITED",
-    "A CHARLTON BUILDERS LIMITED",
-    "WILLCLEAN INDUSTRIAL SERVICES LIMITED",
-    "ASHINE CLEANING SERVICES LTD",
-    "EAST ANGLIA CLEANING SERVICES LIMITED",
-    "EXCEL ENVIRONMENTAL TECHNICAL SERVICES LTD",
-    "BHL BUILDING & CONSTRUCTION LTD",
-    "CLEAN 365 LIMITED",
-    "JMS CLEANING SERVICES (UK) LTD",
-    "HOME SWEEP HOME LIMITED",
-    "WRIGHT CLEAN LIMITED",
-    "TGN WINDOW CLEANING SERVICES LTD",
-    "JULIUS RUTHERFOORD & CO. LTD.",
-    "SLOANE CLEANING SERVICES LIMITED",
-    "MORE-ENERGY CARE SERVICES LTD",
-    "BEST OFFICE NOTTINGHAM LTD",
-    "ELITE RUTLAND LTD",
-    "DUSTBUSTERS (SOUTHEAST) LTD",
-    "VERTI-TECH LIMITED",
-    "BRENT DIRECT LIMITED",
-    "JM2 SUPPORT SERVICES LIMITED",
-    "J.S. CLEANING SERVICES LIMITED",
-    "PROCLEAN SUPPORT SERVICES LIMITED",
-    "NORCLEAN SERVICES LTD.",
-    "CHEW VALLEY LIMITED",
-    "BALCOMBE PEST CONTROL LIMITED",
-    "METRO INDUSTRIAL CLEANING LIMITED",
-    "NIGHTINGALE CLEANING LIMITED",
-    "PRYOR'S WINDOW CLEANING LIMITED",
-    "JUPITER SERVICES LIMITED",
-    "COMPUTACARE LTD",
-    "N H F CLEANING SERVICES LIMITED",
-    "CARA LTD",
-    "COASTAL CLEANING CO. (FELIXSTOWE) LIMITED",
-    "AZTEC CLEANING CONTRACTS LIMITED",
-    "ARGONAUT COMMUNITY ENTERPRISES C.I.C.",
-    "BERRY SUPPORT SOLUTIONS LIMITED",
-    "BUSY BEE CLEANING LIMITED",
-    "MAGIC TOUCH CLEANING LONDON LTD",
-    "SPARKLE LTD",
-    "QUALITY CLEANING SERVICES LIMITED",
-    "OZER HYGIENE LIMITED",
-    "L V SERVICES LIMITED",
-    "TREVOR ILES LIMITED",
-    "MAID2MEASURE LTD",
-    "MINI MIRACLES CLEANING SERVICES LTD",
-    "SAFETY MEASURES LIMITED",
-    "WHEELIE WASH LIMITED",
-    "L.A.C. CLEANING CONTRACTORS LIMITED",
-    "CLEAN MACHINE LIMITED",
-    "ECONOCLEAN LTD",
-    "CDM CLEANING SERVICES LIMITED",
-    "D F WILLIAMS CLEANING SERVICES LIMITED",
-    "NIC SERVICES GROUP LIMITED",
-    "PEST CONTROL SUPERMARKET.COM LTD",
-    "HADLEY ST JAMES CLEANING LIMITED",
-    "MICRO SOLVE (HYGIENE) LIMITED",
-    "CITY HYGIENE LIMITED",
-    "CRITTER SOLUTIONS LIMITED",
-    "ACCELERATE LIMITED",
-    "RITZ SERVICES LIMITED",
-    "DONE LIMITED",
-    "JET CLEANING SERVICES LIMITED",
-    "J. G. CLEANING SERVICE LTD",
-    "CITY CARE CLEANING LIMITED",
-    "TOTALLY POLISHED (BLACKPOOL) LTD",
-    "THE BELL CLEANING COMPANY LIMITED",
-    "ERADIPEST LTD",
-    "CTS CLEANING SOLUTIONS LTD",
-    "B M PEST SOLUTIONS LIMITED",
-    "J CLEAN LIMITED",
-    "FACILICOM CLEANING SERVICES LIMITED",
-    "DUN N DUSTED LIMITED",
-    "NEW ENTERPRISE PEST CONTROL (HERTS) LTD",
-    "SGS CLEAN LTD.",
-    "CELTIC PROPERTY MAINTENANCE SERVICES LIMITED",
-    "ROSE PROPERTY SERVICES LIMITED",
-    "SHINERS CLEANING SERVICES LTD",
-    "NAVIZONE LTD",
-    "MURPHY SERVICES (CLEANING) LIMITED",
-    "CHAMBERLAINE CLEANING SERVICES LIMITED",
-    "GALA CLEANERS LTD",
-    "JTSS (STOKE) LIMITED",
-    "BOWMAN INDUSTRIAL CONTROL SYSTEMS LIMITED",
-    "TOTAL PEST CONTROL LTD",
-    "EMG CLEANING LIMITED",
-    "RCB BANK LTD",
-    "REFLECTIONS CLEANING SERVICES LIMITED",
-    "EUROGUARD TECHNICAL SERVICES LIMITED",
-    "DIRT ATTACK WALES LTD",
-    "KEMSALES LIMITED",
-    "CLEANING GURUS LIMITED",
-    "BRITANNIA CLEANING LIMITED",
-    "BDS INDUSTRIAL PAINTING & WATER JETTING LIMITED",
-    "MULTI CLEAN SERVICES LTD",
-    "ADAMS CLEANING CONTRACTORS LIMITED",
-    "PROCEED SOLUTIONS LTD",
-    "SPRING CLEAN LIMITED",
-    "GOODFLO LTD",
-    "URBAN CLEANING LTD",
-    "CROWN PEST CONTROL LIMITED",
-    "SHORECLEAN LIMITED",
-    "SHEPHERDS BUSH DRY CLEANING LIMITED",
-    "CLEARWELL PEST CONTROL SERVICES LIMITED",
-    "HALLCREST SERVICES LIMITED",
-    "HARVEY ENVIRONMENTAL SERVICES LIMITED",
-    "RNNJSN MANAGED SERVICES LIMITED",
-    "THE REAL CLEANING COMPANY (UK) LIMITED",
-    "INTANK TECHNOLOGIES LIMITED",
-    "ALR CLEANING SPECIALISTS LTD",
-    "PROPERTY PRIDE CLEANING SERVICES LIMITED",
-    "EXCEL LTD",
-    "DIAMOND HOME SUPPORT LIMITED",
-    "K M CLEANING SERVICES PLC",
-    "KENNOH CLEANING AND CARE SUPPORT LTD",
-    "CAT TECH (EUROPE) LIMITED",
-    "ABSOLUTE ANGELS LIMITED",
-    "VERGO PEST MANAGEMENT LTD",
-    "TOP TD CLEANING COMPANY LTD",
-    "NEW HORIZON CLEANING LIMITED",
-    "QUALITY COMMERCIAL CLEANING LTD",
-    "INTER COUNTY SERVICE GROUP LTD",
-    "HIGH VISION UK LIMITED",
-    "MAY HARRIS MULTI SERVICES LTD",
-    "THE SPRUCE GIRLS LIMITED",
-    "CONSULTANT SERVICES GROUP LIMITED",
-    "L C SCAFFOLDING LIMITED",
-    "AQUA INDUSTRIAL LIMITED",
-    "ABBOTTS CONTRACT CLEANING SERVICES LTD",
-    "BNS ALLIED LIMITED",
-    "ONE CALL CLEANING LTD",
-    "LONDON LIDDLE PLACE CENTRE LTD",
-    "GREEN HILLS CLEANING LIMITED",
-    "BIOWISE PEST CONTROL SERVICES LTD",
-    "RODENT SERVICE (EAST ANGLIA) LIMITED",
-    "EUROCLEAN LTD",
-    "BEE CLEEN LIMITED",
-    "MIDLAND PEST CONTROL LIMITED",
-    "TRADITION PROPERTY SERVICES LTD",
-    "HUNT LIMITED",
-    "WIND SERVICES LTD",
-    "WELL-DONE GROUP LTD",
-    "THE DOMESTIC GODDESS LTD",
-    "CROWN PEST CONTROL & ENVIRONMENTAL SERVICES LIMITED",
-    "REACH PLC",
-    "ENVIRO-STRIP (GB) LTD",
-    "WADESONS LTD",
-    "ASSOCIATED STEEL WINDOW SERVICES LIMITED",
-    "CAPITAL CLEANING SERVICES LIMITED",
-    "CANADA CLEANING SERVICES LIMITED",
-    "RAMORA LIMITED",
-    "AQUAWASH LIMITED",
-    "CLEAN BUSINESS LIMITED",
-    "NDC CLEANING LIMITED",
-    "TOP TO BOTTOM LTD.",
-    "WILLIAMS TANKER SERVICES LIMITED",
-    "MYCLEAN LTD",
-    "VERMINATOR LTD",
-    "NEW AGE COMMERCIAL CLEANING AND MAINTENANCE LIMITED",
-    "MYHOME LIMITED",
-    "BUDGET CLEANERS LTD",
-    "GROVES WINDOW CLEANING LIMITED",
-    "CENTURY 21 OFFICE & WINDOW CLEANING SERVICES LIMITED",
-    "FAB CLEANERS LTD",
-    "CLEANKING LIMITED",
-    "LEADEC LIMITED",
-    "CLEAN IMAGE CARPET CLEANING LIMITED",
-    "NORTH KENT CLEANING SERVICES LIMITED",
-    "IDEAL RESPONSE LTD",
-    "STARLET CLEANING LIMITED",
-    "LOPES CLEANING SERVICES LTD",
-    "INDEPTH HYGIENE SERVICES LIMITED",
-    "VRN LOGISTICS LIMITED",
-    "T.W.O. SERVICES LIMITED",
-    "TRINITY CLEANING & FACILITIES MANAGEMENT LIMITED",
-    "STAYCLEAN CONTRACT CLEANING SERVICES LIMITED",
-    "ENVIROGUARD LIMITED",
-    "LONDON TENANTS",
-    "THINK HYGIENE LIMITED",
-    "FRESHER FINISH SERVICES LIMITED",
-    "GLOUCESTERSHIRE CLEANING COMPANY LTD",
-    "BENCHMARK CLEANING SERVICES LIMITED",
-    "VISION CLEANING LTD",
-    "RED INDUSTRIES LTD",
-    "BEDFORDSHIRE CLEANING LIMITED",
-    "DCS CLEANING SOLUTIONS LTD",
-    "VANTAGE INDUSTRIAL CLEANING LIMITED",
-    "LAZERCLEAN LIMITED",
-    "UNIVERSAL CLEANING SERVICES LTD",
-    "SANDERSONS LIMITED",
-    "WASH LTD",
-    "NEXUS HYGIENE LIMITED",
-    "FANTASTIC SERVICES GUILDFORD LTD",
-    "PREDATOR PEST SOLUTIONS LTD",
-    "KGB CLEANING SOUTH WEST LIMITED",
-    "KAYCEE CLEANING SERVICES LIMITED",
-    "KGB CLEANING LIMITED",
-    "PREMIER SUPPORT SERVICES LIMITED",
-    "CHEEKS COMMERCIAL CLEANING SERVICES LIMITED",
-    "WIPEOUT CENTRAL LIMITED",
-    "C.D.E. CLEANING SERVICES LIMITED",
-    "CLEANSERVE LIMITED",
-    "FIVE STAR CLEANS LTD",
-    "HEALTH SAFETY AND ENVIRONMENTAL LIMITED",
-    "EZEE CLEAN LTD",
-    "TC FACILITIES MANAGEMENT LIMITED",
-    "SPARKLING ANGELS LTD",
-    "SOLENIS UK LIMITED",
-    "CRYSTAL CLEANERS (WEYBRIDGE) LIMITED",
-    "BUILDINGS 2 CLEAN LTD",
-    "NATIONAL INTEGRATED SERVICES LIMITED",
-    "APC CLEANING SERVICES LIMITED",
-    "CLEARSTONE SOLUTIONS LIMITED",
-    "T LIMITED",
-    "RIBBLE TECHNOLOGY (PRESTON) LIMITED",
-    "DEALEY & ASSOCIATES LIMITED",
-    "OCS CASH MANAGEMENT SOLUTIONS LIMITED",
-    "HILO CLEANING LIMITED",
-    "FISHERS CLEANING SERVICES LIMITED",
-    "S. MURPHY LTD",
-    "CARLTON CLEANING SERVICES LIMITED",
-    "AA COMMERCIAL BIN CLEANING LTD",
-    "SQUEAKY CLEAN LTD",
-    "ACUTE PESTCONTROL LIMITED",
-    "NOTTINGHAM INDUSTRIAL CLEANERS LIMITED",
-    "CLEARVIEW CLEANING LIMITED",
-    "ATLAS CLEANS-ALL STAINLESS LIMITED",
-    "HUGHES/GARDNER CLEANING & SUPPORT SERVICES LIMITED",
-    "INTER-CLEAN (DONCASTER) LIMITED",
-    "SOLO LAUNDRY AND LINEN SERVICES LIMITED",
-    "R.E CLEANING SERVICES LIMITED",
-    "SURREY AND WOLDS PEST CONTROL LIMITED",
-    "LONDON CARPET CLEANING LIMITED",
-    "ALLIANCE CLEANING LIMITED",
-    "RESOLUTE SUPPORT SERVICES LTD",
-    "NATIONAL CLEANING SERVICES LIMITED",
-    "FEEL THE SPARKLE LTD.",
-    "PROKLEEN UK LIMITED",
-    "ENJOY BIRDS MORE LIMITED",
-    "HYGIENE FACILITIES LIMITED",
-    "A J PEST CONTROL LTD",
-    "FELIDO CLEANING SERVICES LTD",
-    "MARK LILLIMAN COMMERCIAL WINDOW CLEANERS LIMITED",
-    "KINGFISHERS CLEANING LTD",
-    "APSL REPRESENTATION SERVICES (LIVERPOOL) LIMITED",
-    "ATLANTIC CLEANING SERVICES LIMITED",
-    "DURBAN WINDOW CLEANING SERVICES LIMITED",
-    "ULTRA HOME SERVICES LTD",
-    "BLACKPOOL CLEANERS LIMITED",
-    "CLEAN GENIE GLASGOW & EDINBURGH LIMITED",
-    "THE DIVERSE CLEANING COMPANY SOUTH LTD",
-    "ACR CLEANING LIMITED",
-    "LUXURY DRY CLEANERS SHOREDITCH LIMITED",
-    "PEST EXPRESS LIMITED",
-    "CLEANOFFICE.CO.UK LTD",
-    "D M CLEANING LIMITED.",
-    "BUSH BRUSH CLEANERS LTD",
-    "SOUTHPORT LTD",
-    "BALHAM KRYSTAL DRY CLEANERS LTD",
-    "CLEANWISE COMMERCIAL SERVICES UK LIMITED",
-    "DALL CLEANING SERVICES PUBLIC LIMITED COMPANY",
-    "WESTCOUNTRY TANK REPLACEMENTS LIMITED",
-    "MARIE'S AESTHETICS LIMITED",
-    "HYONA CLEANING COMPANY LIMITED",
-    "SEEN 2B CLEAN LTD",
-    "NEW CONCEPT CLEANING LTD",
-    "CLEAN360 LTD",
-    "WHITE TIGER CLEANING LIMITED",
-    "PHILLIPS ANIMAL HEALTH LIMITED",
-    "FULLER FACILITIES MANAGEMENT LIMITED",
-    "SERVICE MASTER RESTORE UK LTD",
-    "ELITE CLEANING SERVICES LIMITED",
-    "VALE FIELD & GAME LTD",
-    "BRICK CLEANING & RESTORATION LONDON LTD",
-    "PESTCARE ENVIRONMENTAL LIMITED",
-    "LONDON CLEANERS LTD",
-    "MONICA''S MAID SERVICES LTD",
-    "MOORE'S OUTDOOR CLEANERS LTD",
-    "FLIGHTCARE LIMITED",
-    "CRYSTAL CLEANING COMPANY LIMITED",
-    "FIRST CLASS CLEANING (UK) LIMITED",
-    "ALEXANDER CLEANING SERVICES LIMITED",
-    "LADIES THAT DO LIMITED",
-    "BELL CLEANING PRODUCTS LIMITED",
-    "CONICO COMMERCIAL CLEANING LIMITED",
-    "JALECH LIMITED",
-    "ATWAL MAIDSTONE INVESTMENTS LIMITED",
-    "CLEAN LIVING SERVICES LIMITED",
-    "SMC FACILITIES GROUP LTD",
-    "THE OFFICE CLEANING COMPANY (ESSEX) LTD",
-    "HAWKSWORTH LIMITED",
-    "AJ CLEANING SERVICES (UK) LIMITED",
-    "APOLLO CLEANING LTD",
-    "CALIBRE CLEANING LTD",
-    "ABSOLUTE HOUSE LIMITED",
-    "CASNA LIMITED",
-    "DIMARK CLEANING LIMITED",
-    "CDL ENVIRONMENTAL SERVICES LTD",
-    "FIVE STAR CLEANING SERVICES LIMITED",
-    "SAPPHIRE CLEANING SERVICES LIMITED",
-    "A & B PROFESSIONAL CLEANERS LTD",
-    "DREAM CLEAN SERVICES LIMITED",
-    "STERIS LIMITED",
-    "SPOTLESS CLEAN LIMITED",
-    "GRAND CLEANING SERVICES LIMITED",
-    "CORINIUM FACILITIES LTD",
-    "COMMAND PEST CONTROL LIMITED",
-    "CRYSTAL PROPERTY CLEANING LTD",
-    "SMARTER CLEANING (GB) LIMITED",
-    "PREMIUM SUPPORT SERVICES LIMITED",
-    "MATRIX OFFICE SERVICES LIMITED",
-    "1ST CHOICE HIGH LEVEL CLEANING & MAINTENANCE LIMITED",
-    "HELLESDON HOME AND GARDEN CENTRE LTD",
-    "EXCELLERATE SERVICES HOLDINGS UK LIMITED",
-    "EARLS COURT CLEANERS LIMITED",
-    "SPOTLESS UK LIMITED",
-    "GSS SURVEYING GROUP LTD",
-    "MONTON CLEANING SERVICES LIMITED",
-    "INDEPENDENT CLEANING SERVICES LIMITED",
-    "HOMES MAID CLEAN LIMITED",
-    "HYGIENA INTERNATIONAL LIMITED",
-    "LAZAAR FACILITY MANAGEMENT LTD",
-    "MALDEN WINDOW CLEANING LTD",
-    "MRS SPARKLES LIMITED",
-    "EFENDI BRENTWOOD DRY CLEANERS LTD",
-    "DCH CLEANING & LAUNDRY SERVICES LTD",
-    "TES CLEANING SERVICES LTD",
-    "BLUE CLEANING SOLUTIONS (LIVERPOOL) LIMITED",
-    "UNIVERSAL CLEANING LIMITED",
-    "BRUCE CLEANING SERVICES LIMITED",
-    "NATURAL FIRES KENT LIMITED",
-    "LOW COST CLEANING LIMITED",
-    "MV CLEANING LIMITED",
-    "CLEANING SERVICES LIMITED",
-    "GUARANTEED SECURITY LTD.",
-    "CLEARSPRINGS SUPPORT SERVICES LTD",
-    "GAMBER LOGISTICS LIMITED",
-    "GLENN CLEANING & SUPPORT SERVICES LTD",
-    "ANDROMEDA CLEANING SERVICE LTD",
-    "MILLA G5 LIMITED",
-    "BETAPEST MIDLANDS LTD",
-    "RIVERPORT RESIDENTIAL CLEANING LIMITED",
-    "LOCALFIT DOMESTIC KITCHEN FITTING LIMITED",
-    "DAVID MORRIS WINDOW CLEANING LIMITED",
-    "WHITE ROSE DRY CLEANING LTD",
-    "ENVIROCLEANSE LIMITED",
-    "COMPASS 24 HOUR BREAKDOWN RECOVERY LTD",
-    "KIRKLEES CLEANING LTD",
-    "BETTERCLEAN (SERVICES) LIMITED",
-    "COMMERCIAL CLEANING SW LIMITED",
-    "CLEANING OPERATIONS UK LIMITED",
-    "CLEANERSWAREHOUSE LIMITED",
-    "QUICKIL PEST CONTROL SERVICES LIMITED",
-    "BAY WASH LTD",
-    "D. BRICE & CO. LIMITED",
-    "OPTIMA WORLDWIDE GROUP BUSINESS SERVICES LIMITED",
-    "WORKBUSTERS (SERVICES) LIMITED",
-    "DE-PEST LIMITED",
-    "ADVANCED STERILIZATION PRODUCTS (UK) LIMITED",
-    "MO'S MAIDS LIMITED",
-    "MARY MOPPINS LIMITED",
-    "EURO CLEANING SERVICES LTD",
-    "CRUISE CLEANING SERVICES LTD",
-    "GLEN CLEANING LIMITED",
-    "PROTOUCH GROUP LTD",
-    "JCS CLEANING SERVICES LTD",
-    "QUALITY CARE CLEANING LIMITED",
-    "PARKERS SUPPORT SERVICES LTD",
-    "MATRIX BIOHAZARD SERVICES LIMITED",
-    "ADDY LIMITED",
-    "F B S ENGINEERING AND SANITARY SUPPLIES LIMITED",
-    "BAY CLEANING SOLUTIONS LIMITED",
-    "ULTRA CLEANING SERVICE LIMITED",
-    "KAYS CLEANING SERVICES LIMITED",
-    "TOKEN CLEANING SERVICES LIMITED",
-    "PRINCIPLE CLEANING SERVICES LIMITED",
-    "NEWBUSH LTD",
-    "CITY CONTRACT CLEANING LTD",
-    "GREEN LIMITED",
-    "CENTRAL LONDON BEAUTY ROOMS LTD",
-    "RICHARD  A ALLEN CONSULTING LIMITED",
-    "PRAISE MERCY HOMECARE LIMITED",
-    "HOUSEMARTIN LIMITED",
-    "EUROCLEAN CONTRACTORS LIMITED",
-    "WA PRODUCTS (UK) LIMITED",
-    "REJUS LIMITED",
-    "TAYLOR MAIDS (UK) LIMITED",
-    "ERGO TEAM HYGIENE LTD",
-    "SP8 CLEANERS LIMITED",
-    "LITTLE MISS PERFECT LIMITED",
-    "SPARKLE CLEANING CO LIMITED",
-    "PROCLEAN CLEANING SERVICES LIMITED",
-    "JUST CLEANING LIMITED",
-    "ANDREW BOAKES ASSOCIATES LIMITED",
-    "NATIONWIDE CLEANING LIMITED",
-    "PACE FLEET CLEAN LIMITED",
-    "A R FRESHERS LIMITED",
-    "BOLTON AND DISTRICT HOSPITAL SATURDAY (SERVICES) LIMITED",
-    "GLOUCESTER ROAD DRY CLEANERS LIMITED",
-    "IMAGE CLEANING SERVICES LIMITED",
-    "A HELPING HAND LTD",
-    "METROPEST LIMITED",
-    "MARTEL CLEANING LTD",
-    "REACH N CLEAN LTD",
-    "BARRINGTON'S CLEANING LIMITED",
-    "FERGUSON CLEANING SERVICES LIMITED",
-    "MAVIS RUSSELL CLEANING LIMITED",
-    "BUSY BEES LIMITED",
-    "DEDMAN CONTRACT SERVICES LIMITED",
-    "ECOCLEEN SERVICES (REGENCY) LIMITED",
-    "BIO-GREEN CLEANERS LTD",
-    "BOWDENS CLEANING SERVICES LIMITED",
-    "MID WEST GRIME SQUAD LIMITED",
-    "DEVINE SERVICES LIMITED",
-    "DIAMOND CONTRACT CLEANERS LTD.",
-    "HOMECLEAN - NORTH LONDON LIMITED",
-    "BE CLEANING SERVICES LIMITED",
-    "BIZZY LIZZY LIMITED",
-    "WE ARE OPTIMO LIMITED",
-    "TIMBER WINDOWS OF TUNBRIDGE WELLS LIMITED",
-    "ARK PEST CONTROL LIMITED",
-    "CHATFIELD CLEANING LIMITED",
-    "ACCOMPLISHED CONTRACT SERVICES LTD.",
-    "CLEANEVENT SERVICES LIMITED",
-    "TANKSAFE SOLUTIONS LTD",
-    "MITIE LIMITED",
-    "GREENCLEAN MAINTENANCE SERVICES LIMITED",
-    "COASTAL CLEANERS LTD",
-    "EUROWASH LTD",
-    "ABSOLUTE HYGIENE SOLUTIONS LIMITED",
-    "DES BONE LIMITED",
-    "LEWIS LIMITED",
-    "SAMS STARSHINE CLEANERS LIMITED",
-    "INSITE MANAGED SERVICES LIMITED",
-    "1ENV SOLUTIONS LIMITED",
-    "GREIF DELTA CONTAINERS (MANCHESTER) LIMITED",
-    "ESSENTIAL CLEANING SERVICES LIMITED",
-    "SCHOOL'S OFFICES SERVICES LIMITED",
-    "PESTKILL LIMITED",
-    "WONJA CLEANING GROUP LTD",
-    "LOCO LOA LIMITED",
-    "PERFECT FINISH CLEANING GROUP LIMITED",
-    "TOTAL CONTRACT SERVICES LIMITED",
-    "METHLEY AND DAUGHTERS CONTRACT CLEANING SERVICES LIMITED",
-    "PROCARE CLEANING MANAGEMENT LIMITED",
-    "NRT CARPENTRY CONTRACTORS LIMITED",
-    "PEST SOLUTION LIMITED",
-    "INNOV8 CLEANING SOLUTIONS LIMITED",
-    "MUSE CLEANING SERVICES LTD",
-    "GOLDENCLEAN LTD",
-    "PLATINUM CONTRACT CLEANING LIMITED",
-    "CLEANEST CLEANERS LIMITED",
-    "HARRISON CLEANING SPECIALISTS LIMITED",
-    "ACTION PEST CONTROL LIMITED",
-    "PREMIER CLEAN GROUP LTD",
-    "AIM COMMERCIAL CLEANING LIMITED",
-    "AXIS GROUP LTD",
-    "OVENCLEAN (FARNHAM) LIMITED",
-    "GROSVENOR CLEANING LIMITED",
-    "GLEAMING FRESH CLEAN LTD",
-    "TAG SERVICES LONDON LTD",
-    "INDUSTRIAL CLEANSING SERVICES LIMITED",
-    "A STAR CLEANING SERVICES LIMITED",
-    "GROVES XTREME CLEAN LTD",
-    "AQUACLEAN LIMITED",
-    "CRESTWOOD ENVIRONMENTAL LIMITED",
-    "EG 2023 LIMITED",
-    "TEC SERVICES ENGINEERING LIMITED",
-    "PURPLE RHINO CONTRACT CLEANING LIMITED",
-    "PURGO SUPPLY SERVICES LTD",
-    "ACORN WINDOWS (NOTTINGHAM) LIMITED",
-    "LEONARD'S (YORKSHIRE) LTD",
-    "KENEALY INDUSTRIAL CLEANING SPECIALIST LIMITED",
-    "STANDARD CLEANING LIMITED",
-    "PRESTON DOMESTIC VIOLENCE SERVICES",
-    "DUST BUSTERS CLEANING SERVICES (EPSOM) LIMITED",
-    "BOOTHS CLEANING SERVICES LIMITED",
-    "PAICE CLEANING LIMITED",
-    "ORION CLEANING COMPANY LIMITED",
-    "PROVAC LIMITED",
-    "CLEANFORCE CONTRACTING LIMITED",
-    "WESTCOUNTRY CLEANING LIMITED",
-    "GTA COMMERCIAL & DOMESTIC CLEANING, HYGIENE & LANDSCAPING SERVICES LTD",
-    "ALL AROUND PROPERTY MAINTENANCE LIMITED",
-    "ST GEORGES PEST CONTROL LTD",
-    "SPARKLES CLEANING SERVICES LTD",
-    "YORKSHIRES CLEANING SERVICES LTD",
-    "R NIGHTINGALE LTD",
-    "THE DAILY MAID SERVICE LIMITED",
-    "POWERCLENE CLEANING SERVICES LTD",
-    "PEST CONTROL SERVICES LIMITED",
-    "C & C INFRASTRUCTURE SERVICES LIMITED",
-    "DIAMOND PEST CONTROL LIMITED",
-    "BIRKIN SERVICES LIMITED",
-    "PURE SWEEP CLEANING LTD",
-    "REYNOLDS CLEANING SERVICES LIMITED",
-    "ELLIOTT HYGIENE LIMITED",
-    "ALLOVER CLEANING SERVICES LIMITED",
-    "THE CAVALIERE CATERING COMPANY LTD",
-    "STP CLEANING SERVICES LIMITED",
-    "NO STONE UNTURNED LTD",
-    "THAMES TANK CLEANING SERVICES LIMITED",
-    "SAJ WINDOW CLEANERS LIMITED",
-    "PREMIER PEST CONTROL SERVICES LTD",
-    "HEIGH LA'MAIR LIMITED",
-    "COUNTRYWIDE ENVIRONMENTAL SERVICES LIMITED",
-    "DIAMOND COMMERCIAL CLEANING (NORTH EAST) LTD",
-    "ABRACADABRA SERVICES LIMITED",
-    "BENNETT BUILDING SERVICES (MINSTER LOVELL) LTD",
-    "PHS TREADSMART LIMITED",
-    "MULTIPEST LIMITED",
-    "I SHINE CLEANING LTD.",
-    "CENTRAL WINDOW CLEANING COMPANY (SCOTLAND) LIMITED",
-    "SERVICEMASTER LIMITED",
-    "EVOLUTION CLEANING SERVICES LIMITED",
-    "FK DOMESTICS LTD",
-    "GMERYCLEAN LTD",
-    "LONDON DEEP CLEANING SERVICES LTD",
-    "MRB DRAINAGE LIMITED",
-    "CLEANSCENE LTD",
-    "JKOMS CLEANING AND RECRUITMENT AGENCY LTD",
-    "A T WINDOW CLEANING LTD",
-    "A & E DOMESTIC CLEANING SERVICES LIMITED",
-    "CRN CONTRACT SERVICES LIMITED",
-    "INDUSTRIAL SITE MAINTENANCE LTD",
-    "TOP THAT CAKE LTD",
-    "ALCLINSE SERVICES LTD",
-    "KLEAN KEEPERS LTD",
-    "NIGHTSHIFT PEST CONTROL LIMITED",
-    "PROGRESS CLEANING SERVICES (WHITEPLUME) LIMITED",
-    "THE KNIGHTON GROUP LIMITED",
-    "ALLCLEAN SERVICES (NE) LTD",
-    "HERITAGE CLEANING SERVICES LTD",
-    "CLEAR WINDOWS LTD",
-    "ASHLEY CLEANING SERVICES LIMITED",
-    "COMBINED LOGICAL SOLUTIONS LTD.",
-    "ADAM JAMES LIMITED",
-    "DIRTBUSTERS LIVERPOOL LIMITED",
-    "WEYMOOR DATA SYSTEMS LTD",
-    "WESTON SUPPORT SERVICES LTD",
-    "KDT CLEANING SERVICES LIMITED",
-    "TINKERBELLES COMMERCIAL & DOMESTIC CLEANING LTD",
-    "THE SILENT UNSEEN LTD",
-    "ABACUS BIRD CONTROL LTD",
-    "R W B CLEANING CONTRACTORS LIMITED",
-    "CERTITUDE CARE SERVICES LTD",
-    "CLEANING TECHNIQUE LIMITED",
-    "SSH GROUP HOLDING COMPANY LIMITED",
-    "VAN VYNCK ENVIRONMENTAL SERVICES LIMITED",
-    "BUSY BEE NATURAL LTD",
-    "ABSOLUTELY CLEANING SERVICES LIMITED",
-    "ALEKSANDRA 11 LTD",
-    "GOCLEAN LTD",
-    "THE GALLOPING HOUSEWIFE LTD",
-    "FOCUS CLEANING CONTRACTS LIMITED",
-    "MC CLEANING SERVICES LIMITED",
-    "TRADITIONAL LOCAL CLEANING LIMITED",
-    "SINCLAIR WINDOW CLEANING SERVICES LTD",
-    "STULEE LIMITED",
-    "COMPLETE CLEANING SERVICES LIMITED",
-    "MRF WINDOW CLEANING SERVICES LIMITED",
-    "PURITY CLEANING LIMITED",
-    "ALL SERVICES IN ONE LTD",
-    "POPPIES OF STOCKPORT LTD",
-    "OFFICE CARE LIMITED",
-    "LYNK CONTRACT SERVICES LIMITED",
-    "ASSURED CLEANING SERVICES LIMITED",
-    "ATKINS HAZARDOUS SCENE RECOVERY LIMITED",
-    "CRYSTAL SERENITY COUNSELLING & PSYCHOTHERAPY SERVICES LTD",
-    "WE CARE CLEANING SERVICES LTD",
-    "LODI UK LTD",
-    "JCD CLEANING & SUPPORT SERVICES LTD",
-    "SKYE BLUE CLEANERS OF HARROGATE LTD",
-    "NITROGEN GROUP LIMITED",
-    "A CLEAN BREAK LIMITED",
-    "ADDLEY MOTORS LTD",
-    "REVOLUTION SUPPORT SERVICES LIMITED",
-    "SELCLENE LIMITED",
-    "COUNTRY MAIDS LIMITED",
-    "THE REVIVAL COMPANY (GLOUCESTER) LTD",
-    "J H PAINTING AND CLEANING CONTRACTORS LIMITED",
-    "CITY & SUBURBAN WINDOW CLEANING COMPANY LIMITED",
-    "LINCLEAN LTD",
-    "SEAVIEW CLEANING SERVICES LTD",
-    "THE RABBIT CATCHERS STABLES LTD",
-    "AG CLEANING SERVICES LTD",
-    "TOUCH OF CLASS LIMITED",
-    "GREENCLEAN LIMITED",
-    "CHURCHILL GROUP LIMITED",
-    "CLEAR SOLUTIONS LTD",
-    "SOUTHERNHAY CLEANERS (SW) LIMITED",
-    "NATURAL TOUCH LIMITED",
-    "J. C. S. LIMITED",
-    "E Z EVOLUTION LIMITED",
-    "DIRECT CLEANING SERVICES LTD",
-    "CLEAN AS A BEAN LIMITED",
-    "VALLEY PEST CONTROL LIMITED",
-    "CLIFTON CLEANING SERVICES LIMITED",
-    "B LTD.",
-    "DAILY MAIDS (STROUD) LIMITED",
-    "CHRISCO COMMERCIAL CLEANING SERVICES LTD",
-    "SAFE HANDZ DOMESTIX LIMITED",
-    "06826434 LIMITED",
-    "RODEOSECT PEST  CONTROL SERVICES LTD",
-    "CROSSCO (1466) LIMITED",
-    "FASTKLEAN LIMITED",
-    "CHARLIES ANGELS FM LIMITED",
-    "BUGBUSTERS ELECTRICAL CLEANING LIMITED",
-    "YORKSHIRE COTTAGE SERVICES LIMITED",
-    "ALFA CLEANING LTD",
-    "THOMPSON SERVICES LTD",
-    "KNIGHTSBRIDGE CLEANERS T/A PRIME DRY CLEANERS LTD",
-    "COMMERCIAL CLEANING TAMWORTH LTD",
-    "SIMPSONS CLEANING SERVICES LIMITED",
-    "HI-SPEC SERVICES LTD",
-    "ARISING CLEANING SERVICES LTD",
-    "CORWOOD'S LIMITED",
-    "GREEN CLEEN (UK) LIMITED",
-    "ABERCONWY SEPTIC TANKS LIMITED",
-    "CITY HEALTHCARE DIRECT LIMITED",
-    "WIXTED CLEANING LTD",
-    "NICK'S CLEANERS LTD",
-    "RUISLIP DRY CLEANERS LIMITED",
-    "OLD BILLS PEST CONTROL LIMITED",
-    "CLASSIC CLEANING LIMITED",
-    "THE CLEANING AGENCY LIMITED",
-    "HYGIENE DEPOT LIMITED",
-    "BEEBYS LIMITED",
-    "CRYSTAL CLEAN (SOUTHERN) LTD",
-    "THE AFICIONADOS GROUP LIMITED",
-    "VISIBLY CLEAR SERVICES LIMITED",
-    "SHINY HOUSE CLEANING LTD",
-    "SUPERMAIDS LTD",
-    "IMAGE OFFICE SUPPLIES LIMITED",
-    "R M CONTRACTORS (UK) LIMITED",
-    "MASTERGLEAM COMMERCIAL CLEANING SERVICES LTD",
-    "HOWELLS BRADFORD LIMITED",
-    "TRIANIK CLEANERS LTD",
-    "DENTERVIE CO. LIMITED",
-    "J & G PAINTING AND DECORATING LIMITED",
-    "HARRIS & JAMES LIMITED",
-    "LODGE ENVIRONMENTAL SOLUTIONS LIMITED",
-    "DESTRODENT PEST CONTROL LIMITED",
-    "DAILY MAIDS DOMESTIC CLEANING LIMITED",
-    "TERMINATOR PEST CONTROL LIMITED",
-    "CLEANSCAPES LIMITED",
-    "M.P.M. CONSUMER PRODUCTS LIMITED",
-    "SMARTER SERVICES LTD",
-    "FROM SUZIE’S LIMITED",
-    "THE AZTEC GROUP LIMITED",
-    "PARAGON SERVICES (SOUTHERN) LIMITED",
-    "INNSIGHT SERVICES LIMITED",
-    "RATCLIFFE CLEANING CONTRACTORS LIMITED",
-    "TUDOR CONTRACT CLEANERS LIMITED",
-    "REGIONAL ENVIRONMENTAL SERVICES LIMITED",
-    "ANDREWS CLEANING SERVICES LTD",
-    "THE CO-OPERATIVE ACADEMY OF STOKE ON TRENT",
-    "DEEPCLEAN HYGIENE SOLUTIONS LIMITED",
-    "BRYAN LOVEDAY SERVICES LIMITED",
-    "PROFESSIONAL CLEANING SERVICES (UK) LIMITED",
-    "SHROPSHIRE PEST PREVENTION SERVICES LTD",
-    "BOURNEMOUTH ENVIRONMENTAL CLEANING LIMITED",
-    "SMARKLE CLEANING SERVICES LTD.",
-    "TAME CLEANING AND MAINTENANCE LIMITED",
-    "ACE CLEANING COMPANY LIMITED",
-    "AUTOMOTIVE MAJIC GOODS AND SERVICES LTD",
-    "GOOCH GROUP LIMITED",
-    "ALWAYS CLEANING LIMITED",
-    "CLEAN SLATE (UK) LTD",
-    "HARPER INDUSTRIAL CLEANING SERVICES LTD.",
-    "CLEAN IMAGE (SOUTH WEST) LIMITED",
-    "LADYBIRDS AT LLANVIHANGEL LTD",
-    "STRAWSTONE LIMITED",
-    "A.A. CARPET & UPHOLSTERY CLEANERS LIMITED",
-    "A&S WINDOW CLEANING SERVICES LIMITED",
-    "INTEGRA CLEANING GROUP LIMITED",
-    "TUBE TECH INDUSTRIAL LIMITED",
-    "MAP CLEANING LIMITED",
-    "CLEANERS DIRECT LIMITED",
-    "THE CREASELINE LTD",
-    "FILTASONIX LIMITED",
-    "COLLINS CONTRACT CLEANING LTD",
-    "AMC CLEANING LIMITED",
-    "THE CLEANING SERVICES GROUP LTD",
-    "PAUL BYRNE & SON PLUMBING & HEATING LIMITED",
-    "DIAMOND ELITE LIMITED",
-    "METRO KLEEN LIMITED",
-    "TRUSTOAK SERVICES LIMITED",
-    "NATIONWIDE SILO ACCESS SERVICES LTD",
-    "SPOT ON CLEANING LTD",
-    "WESSEX PEST CONTROL LIMITED",
-    "PESTAGON PEST CONTROL LTD",
-    "PALMER PEST CONTROL LIMITED",
-    "BEVLYN LIMITED",
-    "RAINBOW BRITE CLEANING SERVICES LIMITED",
-    "SEASCAPE SERVICES LIMITED",
-    "DUDLEY CLEANING LIMITED",
-    "BIBBY HYGIENE LIMITED",
-    "AC SERVICES (ENGLAND) LIMITED",
-    "THE COMMERCIAL WORKS LTD",
-    "BRITISH ASSOCIATION OF REMOVERS (SERVICES) LIMITED",
-    "MAID 2 SHINE AYRSHIRE LIMITED",
-    "HYGIENACLAD LTD",
-    "FIRSTGUARD LTD",
-    "INTELLIGENT CLEAN ENERGY LTD",
-    "SHOREDITCH BUILDING SERVICES LIMITED",
-    "L'IMPECCABLE SERVICES SOLUTIONS LTD",
-    "ALL ENVIRONMENTAL SERVICES LIMITED",
-    "ALL ESSEX POWER FLUSHING SERVICES LTD",
-    "KENILWORTH PEST CONTROL LIMITED",
-    "GENIE CLEANING SERVICES LIMITED",
-    "SIMPLY SITE SERVICES (BRISTOL) LTD",
-    "WEBB SUPPORT SERVICES LIMITED",
-    "ACS SPECIALIST CLEANING LIMITED",
-    "WE CLEAN LIMITED",
-    "BRIGHTER DAYS CARE AT HOME LTD",
-    "JAMES STONE CLEANING AND RESTORATION SERVICES LIMITED",
-    "ASTON SERVICES GROUP LTD",
-    "HILLCREST CLEANING LIMITED",
-    "KINGSCLEAN LIMITED",
-    "BECKFORD COURT (BATH) RESIDENTS COMPANY LIMITED",
-    "MAID TO SPARKLE NORTHANTS LTD",
-    "PREMIER COMMERCIAL CLEANING LTD",
-    "THE FAIRY DUSTERS (UK) LTD",
-    "CLEANING MATTERS LIMITED",
-    "A A ABBEY ROOFING & BUILDING CONTRACTORS LTD",
-    "PRESTIGE SERVICES LONDON LIMITED",
-    "GLEAMTEAM VALETING (OXFORD) LIMITED",
-    "HI-KLEAN LIMITED",
-    "TC REPAIR CENTRE LIMITED",
-    "CLEAN MY OFFICE LIMITED",
-    "SKELDINGS LIMITED",
-    "RELIABLE CLEANING SERVICES LIMITED",
-    "HENLEAZE CLEANING SERVICES LIMITED",
-    "FLOPPY-BUDDHA LTD",
-    "MBC BIRD & PEST SOLUTIONS LIMITED",
-    "LIQUITECH LIMITED",
-    "MONITOR PEST CONTROL LIMITED",
-    "ESSITY HOLDING UK LIMITED",
-    "CLEAN FOR YOU LIMITED",
-    "PHS GROUP HOLDINGS LIMITED",
-    "ABOVE THE REST COMMERCIAL CLEANERS LTD",
-    "BISHOPS SERVICES LIMITED",
-    "VERVIA LIMITED",
-    "FLUID HYGIENE LIMITED",
-    "CLEANKILL (ENVIRONMENTAL SERVICES) LIMITED",
-    "THE CLEANING TEAM CRAWLEY LTD",
-    "CYNERGI CLEANING & SUPPORT SERVICES LTD",
-    "CLEANING ASSURANCE LTD",
-    "ANLABY MAINTENANCE & CLEANING SERVICES LIMITED",
-    "ECOCLEEN SERVICES (OPERATIONS) LIMITED",
-    "LOVE CLEANING4U LIMITED",
-    "S2C MIDLANDS LIMITED",
-    "SONNIC CLEANING SERVICES LTD",
-    "CLARKE'S WINDOW CLEANING CONTRACTORS LTD",
-    "ADAM SERVICES (SW) LTD",
-    "DIAMOND HOME SERVICES LIMITED",
-    "GLEAMCLEAN CLEANING SERVICES LIMITED",
-    "W.PARKER AND SON(CROYDON)LIMITED",
-    "POLE POSITION CLEANING LIMITED",
-    "THE CARROLL CLEANING COMPANY LIMITED",
-    "THE KLEAN TEAM LIMITED",
-    "LADDERSFREE LTD.",
-    "KC COMMERCIAL CLEANING SERVICES LTD",
-    "MAIDSAFE.NET LIMITED",
-    "SCOOBY CLEANING LTD",
-    "DAVID BRUCE LIMITED",
-    "MAID 4 U (COMMERCIAL) LIMITED",
-    "LET CLEANNESS BE LTD",
-    "MAID IN LYTHAM LTD",
-    "COMMUNAL CLEANING SERVICES LIMITED",
-    "TANK FARM SERVICES LIMITED",
-    "FASTKLEAN FRANCHISE LIMITED",
-    "METLAB INDUSTRIAL LIMITED",
-    "E P CLEANERS LIMITED",
-    "999 PEST CONTROL LIMITED",
-    "MONUMENT CLEANING LTD",
-    "SHINY FAIRIES CLEANING SERVICES LTD",
-    "LEGACY PLC",
-    "MTM ENVIRONMENT CARE LIMITED",
-    "GLEAM CLEANING SERVICES KENT LIMITED",
-    "TOPHAT CHISWICK W4 DRY CLEANERS LIMITED",
-    "CANNON CLEANING LIMITED",
-    "ALL CLEAN SERVICES LIMITED",
-    "AARDVARK NEEDS THE RELIABLE HOSTING COMPANY LIMITED",
-    "PESTPROOF LIMITED",
-    "UK DEEP CLEAN LIMITED",
-    "WOW FACILITIES MANAGEMENT LTD",
-    "PAG CLEANING SERVICES (UK) LIMITED",
-    "BESPOKE CLEANING SERVICES LIMITED",
-    "ALTERNATIVE CLEANING LTD",
-    "HYGIENE GROUP LIMITED",
-    "ACTON TOWN DRY CLEANERS LTD",
-    "JAGUAR PEST CONTROL LIMITED",
-    "RED APPLE CLEANING LIMITED",
-    "HAYWARD CLEANING SERVICES LTD",
-    "OVERCLEAN LIMITED",
-    "BLISS CLEANING LTD",
-    "TOWER SERVICES (LONDON) LIMITED",
-    "JURASSIC COAST CLEANING COMPANY LTD",
-    "RUDDING SPIRE COMMERCIAL FINANCE LTD",
-    "HILLCROFT CLEANING SERVICES LIMITED",
-    "KRAM CONTRACT CLEANING LIMITED",
-    "ALLBRIGHT LIMITED",
-    "ALL STAR CLEANING SERVICES LIMITED",
-    "BIO CLEAN JETTING LIMITED",
-    "ESSEX FIRST CLASS CLEANING LIMITED",
-    "ALPINE CLEANING SERVICES (NORFOLK) LIMITED",
-    "OVEN BLITZER (EAST ANGLIA) LTD",
-    "PRO CARE CLEANING SERVICES LTD",
-    "SOLUTIONS SERVICES LTD",
-    "BERKSHIRE PEST CONTROL LIMITED",
-    "FAMILY FIRST ENTERPRISES LIMITED",
-    "COMPASS CLEANING LTD",
-    "COOKIE'S CLEANING CREW LTD",
-    "A AND J WINDOW CLEANING LIMITED",
-    "SELECT OVEN CLEANERS LTD",
-    "DEBCLEAN LIMITED",
-    "CLEAN RITE WINDOW CLEANING LTD.",
-    "CARLTON CLEANING (UK) LIMITED",
-    "THE GOOD HOUSEKEEPING AGENCY LIMITED",
-    "VENT-CARE VENTILATION SERVICES LTD.",
-    "BIRKDALE CLEANING COMPANY LIMITED",
-    "A.V. CLEANING SERVICES LIMITED",
-    "MITCHELL PROFESSIONAL CLEANING SERVICES LTD",
-    "ALPHA UNIQUE CLEANING SERVICES LIMITED",
-    "COOPERS CONTRACT CLEANING LIMITED",
-    "P C S LIMITED",
-    "PEAK FOREST PEST CONTROL LTD",
-    "BARBICAN CLEANING SERVICES LIMITED",
-    "ACTIVE CLEANING SERVICES (MIDLANDS) LIMITED",
-    "G-NOVA LIMITED",
-    "GREEN COMMERCIAL CLEANING LIMITED",
-    "A AND L EVER READY CLEANING AND BUILDING MAINTENANCE SERVICES LTD",
-    "FIDELIS CONTRACT SERVICES LTD",
-    "GRPL LIMITED",
-    "THE HALE VILLAGE DRY CLEANING CO LIMITED",
-    "AVID PEST CONTROL LTD",
-    "360 COMMERCIAL CLEANING SERVICES LIMITED",
-    "CLEAN TILE & GROUT LAKES LIMITED",
-    "OVENKING LIMITED",
-    "DROP THE MOPPING LTD",
-    "ACORN ENVIRONMENT SERVICES LIMITED",
-    "HELP MATE SERVICES LIMITED",
-    "SOUTH WALES CARE (SUPPORTED SERVICES) LIMITED",
-    "AT HOME CLEANING LTD",
-    "DUST DEMONS LIMITED",
-    "CACHET CLEANING & ENVIRONMENTAL SERVICES LIMITED",
-    "DELTIC CLEANING COMPANY LIMITED",
-    "ELLIS CLEANING SERVICES LIMITED",
-    "ONLINE CLEANING UK LIMITED",
-    "CONSERVACLEAN UK LIMITED",
-    "ACORN CLEANING LIMITED",
-    "I.Q. CLEANING SOLUTIONS LIMITED",
-    "PARKER CONTRACT CLEANING LIMITED",
-    "ULTIMATE CLEANING SERVICES LIMITED",
-    "MANILA GROUP LTD",
-    "IMS HYGIENE SOLUTIONS LTD",
-    "IDS SERVICES LTD",
-    "RONCLEAN LIMITED",
-    "EVER BRITE CLEANING SERVICES LIMITED",
-    "SURESHINE WINDOW CLEANING LIMITED",
-    "VERMEX LIMITED",
-    "AAA OVEN CLEANING LIMITED",
-    "ACORN CLEANING SERVICES LIMITED",
-    "SIZE GROUP LONDON LTD",
-    "KINGSMAID LIMITED",
-    "THE KLEEN TEAM LIMITED",
-    "SPOTLESS COMMERCIAL CLEANING (UK) LIMITED",
-    "PCVALET LIMITED",
-    "COLLABORATIVE INTERNATIONAL PESTICIDES ANALYTICAL COUNCIL LTD (THE)",
-    "EXCELLENCE FLOORCARE LIMITED",
-    "ALPINE CLEANING SERVICES LIMITED",
-    "MANOR CLEANING SERVICES LIMITED",
-    "EVANS CLEANING SERVICES LIMITED",
-    "1ST. INDUSTRIAL & COMMERCIAL SERVICES LIMITED",
-    "IPOLISH GROUP LTD",
-    "INSIDE OUT DOMESTICS LIMITED",
-    "B R HOLLAND & SONS LIMITED",
-    "CHARLIES ANGELS CLEANING SERVICES LIMITED",
-    "TRADEBE REFINERY SERVICES LIMITED",
-    "RELIANCE.COM LIMITED",
-    "T J CLEANING SERVICES LIMITED",
-    "ELITE CLEANING CONTRACTORS LTD",
-    "FRESH SPACE CLEANING LTD",
-    "RATIONAL PEST CONTROL LIMITED",
-    "SCA (CLIMATE ALLIANCE) LTD",
-    "CLEAN GENIE LTD",
-    "LANGTONS LIMITED",
-    "BOBBY DAZZLERS DOMESTICS LIMITED",
-    "OVEN SHEEN LTD",
-    "ECOGUARD PEST SOLUTIONS LTD",
-    "MAIDS FOR YOU TOO LIMITED",
-    "TRAFFIK LIMITED",
-    "NATURES WAY PEST CONTROL LTD",
-    "I C SOLUTIONS 24/7 LIMITED",
-    "EDWARDS LIMITED",
-    "PELSIS LIMITED",
-    "ALL SEASONS GROUP SERVICES LIMITED",
-    "ERADICATE PEST CONTROL SPECIALISTS LIMITED",
-    "CC CLEANING SERVICES LTD",
-    "TRENDLEWAY CLEANERS LIMITED",
-    "ALLSEAL CLEANING SERVICES LIMITED",
-    "PEST DEFENCE LTD",
-    "INTEGRATED CLEANING SERVICES LIMITED",
-    "NEXON HYGIENE LIMITED",
-    "THE GENIE CLEANING COMPANY LTD",
-    "BORDER CLEANING LTD",
-    "HYGIENE SYSTEMS LIMITED",
-    "ILFORD DRY CLEANERS LTD",
-    "MILES CLEANING SERVICES LTD",
-    "KLEEN HOMES LIMITED",
-    "CRUSADER CLEANING & HYGIENE SOLUTIONS LIMITED",
-    "HY-KLEEN OF WARWICK LIMITED",
-    "CRYSTAL CLEANING SUPPORT SERVICES LTD",
-    "KARISPARKLE CLEANING SERVICES LTD",
-    "AARDVARK JANITORIAL SUPPLIES LTD",
-    "BLITZ HOME ENVIRONMENTAL CLEANING LIMITED",
-    "MISTER SHINE LIMITED",
-    "FIRST REFLECTIONS CLEANING CONTRACTORS LIMITED",
-    "DEEP CLEAN LONDON LTD",
-    "CLEARWATER CLEANING LTD",
-    "MC SAFEGUARDING CONSULTING LTD",
-    "BEST CLEANERS LONDON LTD",
-    "ALLCARE COMMUNITY CARE SERVICES (SOUTHPORT) LIMITED",
-    "PH SCAFFOLDING & SKIP HIRE LIMITED",
-    "LEGACY CONTRACT CLEANING LIMITED",
-    "ACQUAINT CONSOLIDATED SERVICES LIMITED",
-    "J B CLEANERS LIMITED",
-    "A PARSONS WINDOW CLEANING LIMITED",
-    "MAC ENVIRONMENTAL LTD",
-    "O'SULLIVAN & SON LTD",
-    "DOMESTIC CLEANERS OF LONDON LIMITED",
-    "END OF TENANCY CLEANING LIMITED",
-    "CLEARGROUND LIMITED",
-    "A C SERVICES (BANBURY) LTD",
-    "GRAFFITI PR & MARKETING LTD",
-    "FRESHBINS UK LIMITED",
-    "ABLAZE KLEENING SERVICES LTD",
-    "2 CLEAN LIMITED",
-    "MIDDLEWICH TANK WASH LIMITED",
-    "THE ABBEY CLEANING SERVICE LIMITED",
-    "IGNITEAMT SERVICES LTD",
-    "STEPHEN BENNETT LIMITED",
-    "INTERDUCT UK LIMITED",
-    "ALIARD ENVIRONMENTAL SERVICES LIMITED",
-    "HESSLE CLEANING SERVICES LIMITED",
-    "CORNICHE CLEANING SERVICES LIMITED",
-    "CLEANING MAINTENANCE SUPPLIES LIMITED",
-    "ALLIED LIMITED",
-    "AGS ONE GROUP LIMITED",
-    "W A WOOTTON SERVICES LIMITED",
-    "PESTPRO BIRD SOLUTIONS LIMITED",
-    "REGULAR CLEANING HOLDINGS LIMITED",
-    "ENVIROCLEAN LIMITED",
-    "ASTRAL CLEANING SERVICES LIMITED",
-    "FRESH LIMITED",
-    "EXTREME CLEANING SOLUTIONS LTD",
-    "IMAGE CLEANING CONSULTANTS LTD",
-    "A. W. CLEANING CONTRACTORS LIMITED",
-    "BUSINESS LTD",
-    "PEST WISE PEST CONTROL LIMITED",
-    "SAFEGUARD PEST CONTROL AND ENVIRONMENTAL SERVICES LIMITED",
-    "MARY'S CLEANING LTD",
-    "PINNER ROAD DRY CLEANERS LIMITED",
-    "SYNERGY (SW) LIMITED",
-    "MARINE VALETING SERVICES LIMITED",
-    "ENSERVE CORPORATION LIMITED",
-    "CLEANRITE CLEANBRITE CLEANING CO. LTD",
-    "FAST CLEANING COMPANY LTD",
-    "DELTA CLEANING SERVICES LIMITED",
-    "JCS CLEANING (NW) LIMITED",
-    "BRACNACLEAN SERVICES LIMITED",
-    "REGENCY DOMESTIC SERVICES LIMITED",
-    "DIRECT CLEANING CONTRACTORS LIMITED",
-    "THE BIN CLEANING COMPANY LIMITED",
-    "ELECTRIC SWEEP LTD",
-    "SUPREME KLEAN LTD",
-    "S G SERVICES (BOSTON) LTD",
-    "NU-KLEEN SERVICES LIMITED",
-    "BLUE LION LIMITED",
-    "SMART TANK UK LIMITED",
-    "PRISTINE CONTRACT CLEANING SERVICES LTD",
-    "LANGLEY OFFICE SERVICES LIMITED",
-    "SUPERCLEAN CLEANING SERVICES SW LTD",
-    "SALTERNS BOATYARD LIMITED",
-    "HEALTH & SAFETY SOLUTIONS AND ADVANCED FIRE PROTECTION & PEST CONTROL LIMITED",
-    "WILKINS CHIMNEY SWEEP LIMITED",
-    "ECOPHY LTD",
-    "ANGELIC COMMERCIAL SERVICES LIMITED",
-    "SOLO SERVICE GROUP LIMITED",
-    "WESSEX WINDOW CLEANING SERVICES LTD",
-    "ACE CLEANING CONTRACTS LIMITED",
-    "OUTSOURCE CLEANING LTD",
-    "HAYWARD SERVICES LIMITED",
-    "EUROCLEAN (BOURNEMOUTH) LIMITED",
-    "PUREMAISON LIMITED",
-    "MARINE OPTIONS [POOLE] LTD",
-    "ABSOLUTE CLEANING SERVICES UK LIMITED",
-    "ALLIANCE ENVIRONMENTAL CLEANING SERVICES LTD",
-    "DIRECT PEST CONTROL LIMITED",
-    "ROCHELLE CLEANING LIMITED",
-    "EZYCLEAN LIMITED",
-    "ABACUS WINDOWS AND DOORS LTD",
-    "ARTS CLEANING COMPANY LTD",
-    "ADMIRAL CLEANING SERVICES LIMITED",
-    "OLIVIA SWEENEY LIMITED",
-    "P M CONTRACT CLEANING SERVICES LIMITED",
-    "SPRINGFIELD MOBILE (LANCS) LIMITED",
-    "EXPRESS CONTRACT CLEANERS LIMITED",
-    "ANTI-GRAFFITI SERVICES LIMITED",
-    "DEMON CLEANING SERVICES LIMITED",
-    "KLEANLINE LIMITED",
-    "PREMIUM CLEANING LTD",
-    "C R M SERVICES LIMITED",
-    "BATTERSEA CLEANING SERVICES LTD",
-    "IDEAL SERVICES GROUP LIMITED",
-    "CLEANBRIGHT SERVICES LIMITED",
-    "J C CLEANING SERVICES LTD",
-    "CHESHIRE CLEANING AND FACILITIES MANAGEMENT LTD",
-    "ADVANCED PEST MANAGEMENT LIMITED",
-    "VISTA ENVIRONMENTAL SOLUTIONS LIMITED",
-    "L T CLEANING SERVICES LIMITED",
-    "GLANCE CLEANING SERVICES LTD",
-    "SECURECLEAN LIMITED",
-    "LANGLAND CLEANING SOLUTIONS LTD",
-    "TOWN LIMITED",
-    "HOUSE BUSTERS LTD",
-    "SOUTH WEST CLEANING SERVICES LIMITED",
-    "MARTY JUNIOR MADDEN LTD",
-    "ASSURED ENVIRONMENTAL SERVICES LIMITED",
-    "ACTIVEKLEEN LIMITED",
-    "BARNES DRY CLEANERS LIMITED",
-    "GREEN CLEAN DIRECT LTD",
-    "DIRECT SERVICE SOLUTIONS LIMITED",
-    "ENVIRONMENTAL LIMITED",
-    "24 CLEANING SERVICES LTD",
-    "BRISTOL COMMERCIAL CLEANING LTD",
-    "CAPSULE BOUTIQUE LTD",
-    "FOREFRONT SERVICES LIMITED",
-    "CCS JEWELTONE LIMITED",
-    "MARCH CLEANING SERVICES LIMITED",
-    "WOODHOUSE CLEANING SERVICES LTD",
-    "IHSS LIMITED",
-    "BRIGHTR LTD",
-    "HRC ENVIRONMENTAL SERVICES LTD",
-    "MOLO HOLIDAY HOUSEKEEPING SPECIALISTS LTD",
-    "P W INDUSTRIAL SUPPLIES LIMITED",
-    "NORTH WESTERN CLEANING (MANCHESTER) LIMITED",
-    "OVEN SUPPORT CENTRAL LTD",
-    "HELPING HANDS LIMITED",
-    "ELITE PEST CONTROL (UK) LTD",
-    "URBAN HYGIENE LIMITED",
-    "PESTBLITZ LIMITED",
-    "THEKAYS SUPER CLEANERS LIMITED",
-    "BPM CLEANING AND MAINTENANCE LTD",
-    "ELITE CLEANING SERVICE LIMITED",
-    "NBC BIRD AND PEST SOLUTIONS LTD",
-    "MACLEAN SERVICES (L) LIMITED",
-    "CRYSTALCARE FACILITIES SERVICES LIMITED",
-    "CLEAR CONTRACT SERVICES LTD",
-    "HELPING HANDS CLEANING CONTRACTORS LTD",
-    "NATIONAL QUARRIES INDUSTRIAL SERVICES LIMITED",
-    "WHITES CLEANING COMPANY LIMITED",
-    "MILO LIMITED",
-    "MSS FACILITIES SERVICES LTD",
-    "COMMUNITY CARELINE SERVICES (WESTWAYS) LIMITED",
-    "SKS WINDOW CLEANING LTD",
-    "CITY PLC",
-    "ACCESSIBLE TRANSPORT GROUP CONTRACT SERVICES LIMITED",
-    "RELIANCE (S.E.) CLEANING SERVICES LTD.",
-    "PRINCE LTD",
-    "A TO Z LABOUR AGENCY (HELSBY) LIMITED",
-    "PREMIER WINDOW CLEANING LIMITED",
-    "H2O ENVIRONMENTAL SERVICES LIMITED",
-    "T C SALES LIMITED",
-    "TOTAL LEISURE ENGINEERING LIMITED",
-    "PASSMORE CLEANING LIMITED",
-    "M P HIGHCLASS LIMITED",
-    "NOBISCO LIMITED",
-    "DUST FREE CLEANING COMPANY LIMITED",
-    "FELTHAM ESTATES LIMITED",
-    "ALL SEASONS WINDOW CLEANING LIMITED",
-    "ST ANNE'S GROUP (UK) LTD",
-    "UMBRELLA GLOBAL UK LTD",
-    "TEAMWORK (UK) LIMITED",
-    "THE GLEAMING CLEANING COMPANY LIMITED",
-    "LINDSAY PHILLIPS PROPERTY CARE LTD",
-    "HEAVEN HELPERS LIMITED",
-    "NINA CLEAN LIMITED",
-    "CLEAN NOTTS LIMITED",
-    "BRITANNIA CLEANING SERVICES (MIDLANDS) LTD",
-    "DIVERSEY LIMITED",
-    "A ROLING ELECTRICAL SERVICES LIMITED",
-    "RAPID COMMERCIAL CLEANING SERVICES LIMITED",
-    "G C SCAFFOLDING LTD",
-    "A QUALITY SERVICE LTD",
-    "ATLAS CONTRACTORS LIMITED",
-    "CARLTON CLEANING CONTRACTORS LIMITED",
-    "MINI MAID LIMITED",
-    "DYNO-PEST LIMITED",
-    "THE CLEANING COMPANY LIMITED",
-    "SIMPLICITY SERVICES LONDON LIMITED",
-    "CITYWIDE CLEANING SERVICES LIMITED",
-    "ACTIVE CLEANING SOLUTIONS LIMITED",
-    "WESTGATE CLEANING SERVICES LTD",
-    "IMPERIAL CLEANING SERVICES LIMITED",
-    "BERKSHIRE CLEANING SERVICES LIMITED",
-    "CSS PEST SERVICES LIMITED",
-    "ELM CLEANING SERVICES LTD",
-    "JONES CLEANING SERVICES LIMITED",
-    "ATLAS STERILE SERVICES LTD",
-    "DUSTERS SERVICES LIMITED",
-    "TINA'S CLEANERS LTD",
-    "BAXTER SUSSEX LIMITED",
-    "786 SERVICES LIMITED",
-    "VIC. CROMPTON LIMITED",
-    "S LIMITED",
-    "ABBEY WINDOW & INDUSTRIAL CLEANERS LIMITED",
-    "GENESIS COMMERCIAL & INDUSTRIAL CLEANING LTD",
-    "KENT CLEANING SOLUTIONS LTD",
-    "VISTAVIS LIMITED",
-    "THE BIG CLEAN LTD",
-    "ECO CLEAN HOME LTD",
-    "ENVIRONMENTAL PROTECTION UK",
-    "HILLBANS PEST CONTROL LIMITED",
-    "SEABREEZE CLEANING LTD",
-    "PLYMCLEAN LTD",
-    "CLEANING POWER SERVICES LIMITED",
-    "DISIFIN HYGIENE UK LTD",
-    "DOLLY CHAR LIMITED",
-    "BOOKKEEPING GENIES LTD",
-    "PINNACLE GROUP LIMITED",
-    "CRANLEIGH WINDOW CLEANERS LTD",
-    "SWISS COTTAGE DRY CLEANERS LIMITED",
-    "DIAMOND SHINE CLEANING AND OVEN CLEANING LIMITED",
-    "JAGUAR CONTRACT CLEANING SERVICES LIMITED",
-    "SIMPLY HOUSEWORK (UK) LTD",
-    "RESOLVE SPECIALIST CLEANING LTD",
-    "MAINTENANCE CLEANING SERVICES LIMITED",
-    "BEST CLEANING LONDON LTD",
-    "NOAH`S ARK ENVIRONMENTAL SERVICES LTD",
-    "JANNET HOPEWELL BECOMING GREATER MINISTRIES LIMITED",
-    "SUPPORT MAINTENANCE SERVICES LIMITED",
-    "VICTORIA CLEANING COMPANY LIMITED",
-    "PRO-CLEAN INDUSTRIAL UK LIMITED",
-    "DIRECT CLEANING (FAIR OAK) LIMITED",
-    "REGENCY CLEANING SERVICES (NATIONWIDE) LTD.",
-    "MCS CLEANING SERVICES LIMITED",
-    "REGENCY CLEANING (HALESOWEN) LTD",
-    "JUST MAID TIME LIMITED",
-    "SALAMANDER CLEANERS LIMITED",
-    "THERMOKIL LIMITED",
-    "MOPS LIMITED",
-    "DIAMOND CLEANING SERVICES LIMITED",
-    "TOTAL SUPPORT SERVICES LIMITED",
-    "H & S DRY CLEANERS OF OAKWOOD LIMITED",
-    "JL CLEANING AND MAINTENANCE LIVERPOOL LTD",
-    "EXCEL CLEANING CONTRACTORS LTD",
-    "KEY CLEANING COMPANY LIMITED",
-    "YOUR WINDOW CLEANER LTD",
-    "ACCOUNTANT SERVICES 4 U LTD",
-    "CROWN CLEANING SYSTEMS LIMITED",
-    "ICU CLEAN LTD",
-    "A & G CLEANING SERVICES LTD",
-    "IMPERIAL HYGIENE SERVICES LIMITED",
-    "SURE CLEAN SOLUTIONS LTD",
-    "THE PIED PIPER PEST CONTROL CO. LIMITED",
-    "AYLETON CLEANING LIMITED",
-    "COASTLINE CONTRACT SERVICES LIMITED",
-    "PREMISERV LTD",
-    "JPC SERVICES LIMITED",
-    "COMMERCIAL CLEANING SOLUTIONS LTD",
-    "LONDON ENVIRONMENTAL LIMITED",
-    "DOMESTIC ANGELS CHRISTCHURCH LIMITED",
-    "CELLAR SERVICES LIMITED",
-    "A&M (DONNINGTON) PARTS LIMITED",
-    "MUM LTD",
-    "JORDUNN LTD.",
-    "ENVIROCLEAN (SERVICES) LIMITED",
-    "GENTLE TOUCH STAR CLEANING SERVICES LTD",
-    "ATLAS MANAGED INTEGRATED SERVICES LTD",
-    "NBC ENVIRONMENT LTD",
-    "REDBRIDGE TOP TUITION LTD",
-    "HOME-START KERNOW",
-    "DUCTWORK ACCESS LTD",
-    "DENTISTRY ON GIPSY HILL LTD",
-    "POWER CLEANING SERVICES LIMITED",
-    "PEAKE CLEANING & HYGIENE SERVICES LIMITED",
-    "TANGERINE CLEANING SERVICES LTD",
-    "SHEFFIELD SITE SERVICES HOLDINGS LIMITED",
-    "A B C CLEANING SERVICES (MIDLANDS) LTD",
-    "EXECUTIVE CLEANING LIMITED",
-    "INNERCITY PROPERTY SERVICES LIMITED",
-    "RENTEX HYGIENE SERVICES LTD",
-    "EXCALIBUR CLEANING LIMITED",
-    "SPOTLIGHT CLEANING SERVICES LIMITED",
-    "OFFICE CARE SERVICES LIMITED",
-    "R PAYNE LIMITED",
-    "BECKY'S CLEANING SERVICES LTD",
-    "LUNA CLEANING SOLUTIONS LIMITED",
-    "TOAST LTD",
-    "SHIELD PEST CONTROL LIMITED",
-    "CHECK SERVICES LIMITED",
-    "ALPHA CLEANING SERVICES LIMITED",
-    "ALPHA PEST CONTROL LIMITED",
-    "KEY WEST PEST CONTROL LIMITED",
-    "PREMIER PEST SERVICES LTD",
-    "TOTALLYCLEAN DOMESTIC CLEANING SERVICES LTD",
-    "CLEANCARE SERVICES (UK) LTD",
-    "GREEN CLEEN LTD",
-    "STAINLESS STEEL FABRICATION LTD.",
-    "SMART CLEANINGS UK LIMITED",
-    "DINGLE DOLLIES CLEANING LIMITED",
-    "ICE (INDUSTRIAL CLEANING EXPERTS) LTD",
-    "G M SERVICE IRELAND LTD",
-    "MRS MOP CLEANING SERVICES LTD",
-    "BARKING AND DAGENHAM CHAMBER OF COMMERCE LIMITED",
-    "4TRESS SERVICES LIMITED",
-    "NEW ENTERPRISE PEST CONTROL (ESSEX) LTD",
-    "BRITANIA CARER SERVICES LTD",
-    "MAIDENHEAD PEST CONTROL LTD",
-    "ICS LIMITED",
-    "C.D.P. SERVICES (INDUSTRIAL) LIMITED",
-    "TOTALCLEAN SOLUTIONS LIMITED",
-    "EVERYTHING BUT THE GIRL BRIDAL BOUTIQUE LIMITED",
-    "A.A. DOMESTIC REPAIRS & SERVICES LTD",
-    "EQUIPMENT CLEANING SERVICES LIMITED",
-    "EXPERT CLEANING 4 U LTD",
-    "CENTRAL CLEANING SERVICES LIMITED",
-    "ROGER NEEDLE LTD",
-    "SELDRAM SUPPLIES LIMITED",
-    "NEW WAVE MARINE LIMITED",
-    "CLEANING FORCE (OFFICE CLEANERS) LIMITED",
-    "ESG BOILERCARE LIMITED",
-    "A F INTERNATIONAL LIMITED",
-    "ATH CLEANING SERVICES LTD",
-    "MINSTER COURT (FLAT NUMBERS 5-8) NOTTINGHAM LIMITED",
-    "D S CLEANING SERVICES LIMITED",
-    "CLEARVIEW WINDOW CLEANING SERVICES LIMITED",
-    "CALENDAR CLEANING LTD",
-    "VEGAN SUSY LTD",
-    "HEDERA SCREENS LIMITED",
-    "ULYETT LANDSCAPES LIMITED",
-    "COMPLETE WEED CONTROL LIMITED",
-    "PLACES FOR PEOPLE ARRANGEMENTS 1 LIMITED",
-    "MOLE COUNTRY STORES LTD",
-    "ERNEST DOE & SONS LIMITED",
-    "MIRROR HAIR DESIGN EXETER LIMITED",
-    "IDVERDE LIMITED",
-    "KEY GREEN FARM LTD",
-    "TILLERS TURF COMPANY LIMITED",
-    "CLEMENT WYATT (GARDENS) LTD",
-    "G I LANDSCAPES (UK) LTD",
-    "CHAMELEON LANDSCAPING LTD",
-    "TOPGRASS (MIDLANDS) LIMITED",
-    "DAVID HAMILTON LANDSCAPE DESIGN LIMITED",
-    "BEN NOCK LIMITED",
-    "BLAND LANDSCAPES LIMITED",
-    "THE SECRET GARDEN CANDLE COMPANY LTD",
-    "VINTAGE GARDEN BUILD LTD",
-    "EASIGRASS DISTRIBUTION LIMITED",
-    "TURTLE PRODUCTIONS LTD",
-    "WILD TO WONDERFUL GARDENS LTD",
-    "WRIGHT LANDSCAPES LIMITED",
-    "PRO-SCAPE LIMITED",
-    "JAC CLEANING LIMITED",
-    "BAWTRY GARDENS (PORTMAN COURT) LIMITED",
-    "ABBEY STORAGE OF MARKET DRAYTON LIMITED",
-    "EASYLAWNS LTD",
-    "HOMESCAPES (1990) LIMITED",
-    "MANOR LANDSCAPES LIMITED",
-    "GODFREY GROUP FACILITIES LIMITED",
-    "LLWYN LANDSCAPES LTD",
-    "CRAIG WEST TURF LIMITED",
-    "PLEVEY LTD",
-    "J K S LONDON LTD",
-    "FINETURF MACHINERY LIMITED",
-    "THE WISH WASH COMPANY LIMITED",
-    "STAY SMART LTD",
-    "ATM & CO T/A THE MICKDREYBSHIRE ACCOUNTANTS LTD",
-    "A P BROOME LANDSCAPES LIMITED",
-    "VOYCE PULLIN LIMITED",
-    "WHEELBARROW GARDENING LIMITED",
-    "LANDSCAPE SERVICES LIMITED",
-    "LAND STRUCTURE LIMITED",
-    "MALTON AND RYEDALE FARMERS LIVESTOCK MARKET LIMITED",
-    "BARTON STUD LIMITED",
-    "J.W.S FITTING & INSTALLATION LTD",
-    "BOLTON CLEANING SERVICES LIMITED",
-    "TREVOR ATKINSON & CO LIMITED",
-    "ELMERITO LTD",
-    "LANDSTRUCTION LIMITED",
-    "WYNNSTAY LIMITED",
-    "COUNTY GROUNDS MAINTENANCE LIMITED",
-    "ALEGNA SERVICES LTD",
-    "LANDSCAPE ASSOCIATES LIMITED",
-    "INNOVIS LIMITED",
-    "TMGS GROUNDS MAINTENANCE LIMITED",
-    "EVERGREEN LIMITED",
-    "TRACEY JANE CLEANING SERVICES LTD",
-    "LANDCRAFT PROJECTS LIMITED",
-    "WIMBLEDON GARDEN SERVICES LIMITED",
-    "PURPLE FLOWERS GARDENS AND MOSAICS LTD",
-    "JAMES DEAN CREATIVE LANDSCAPES LTD.",
-    "NEW CLEAN DEALERSHIP SERVICES LIMITED",
-    "D G SANDERSON GROUNDWORKS LIMITED",
-    "B. J. CONDLIFFE (CLEANING SERVICES) LIMITED",
-    "BREWOOD LANDSCAPES LIMITED",
-    "SHOOTS & LEAVES LIMITED",
-    "THE HAPPY GARDENER COMPANY LIMITED",
-    "NJL JOINERY LIMITED",
-    "NEWARK CATTLE MARKET COMPANY LIMITED",
-    "GARDEN TRANSFORMATIONS LIMITED",
-    "FOUNTAINS DIRECT LIMITED",
-    "DIXCEY LANDSCAPES LIMITED",
-    "BREEDERS REJOICE LIMITED",
-    "SOUTHDOWN LANDSCAPES LIMITED",
-    "FRANK COOPER LIMITED",
-    "GLENN HUMPHRIES LANDSCAPING LIMITED",
-    "FENWICK SPECIALIST CLEANING SERVICES LIMITED",
-    "RAMSCAPES LIMITED",
-    "BRITE START FM LIMITED",
-    "F. T. GEARING LANDSCAPE SERVICES LIMITED",
-    "FSL CONTRACTORS LIMITED",
-    "CATCH-IT PEST CONTROL LIMITED",
-    "DEEP CLEAN SERVICES LIMITED",
-    "J R TURNBULL LTD",
-    "CITIGRASS LTD",
-    "GREENTHUMB LIMITED",
-    "LANGDALE LANDSCAPES LIMITED",
-    "AGRIWASH (UK) LIMITED",
-    "CARPENTER LANDSCAPES LIMITED",
-    "AL HAYAT (PIMLICO) LIMITED",
-    "HARROWDEN TURF LIMITED",
-    "GREEN GARDENS LIMITED",
-    "GODDARDS (LANDSCAPE CONTRACTORS) LIMITED",
-    "J H LANDSCAPES LIMITED",
-    "F P CLEANING SERVICES LTD",
-    "SKYE FACILITIES LTD",
-    "FAIRWATER LIMITED",
-    "FINEVIEW LANDSCAPES LIMITED",
-    "HISLOP ADVISORY LTD",
-    "ECO CONTROL SOLUTIONS LIMITED",
-    "UK GRASS INSTALLATIONS LTD",
-    "DALEHEAD FOODS LIMITED",
-    "ESSE LANDSCAPES LTD",
-    "HASTENS CONSULTING ENGINEERS LIMITED",
-    "TAKE A BREAK LTD",
-    "BERKSHIRE GARDEN BUILDINGS LIMITED",
-    "AVON WOODLANDS LIMITED",
-    "CORNFORTH INDUSTRIAL SERVICES LIMITED",
-    "BLAKEDOWN LIMITED",
-    "BIRTWHISTLE LANDSCAPING LIMITED",
-    "CLAAS EASTERN LTD",
-    "PROPERTY CARE (EAST ANGLIA) LIMITED",
-    "JAMES BIRD LANDSCAPES LIMITED",
-    "SOUTH EAST CONTRACT CLEANING LIMITED",
-    "PETER ASHLEY LTD",
-    "NORTHALLERTON AUCTIONS LIMITED",
-    "AVENUE LANDSCAPES LIMITED",
-    "CLEAN AND SHINY HOUSE LIMITED",
-    "UK LANDSCAPES LIMITED",
-    "EVOLVE INDEPENDENT CLEANING SERVICES LTD",
-    "APRILCLEAN LIMITED",
-    "J K CLEANING SUPPLIES LIMITED",
-    "AGCO FUNDING COMPANY",
-    "SQUARE LANDSCAPING LTD",
-    "KRYSTAL CLEANING SERVICES LIMITED",
-    "FIELD SCIENCE LIMITED",
-    "EDENVALE TURF (SW) LIMITED",
-    "LONDON CONTRACT SERVICES LIMITED",
-    "ELMTREE GARDEN CONTRACTORS LIMITED",
-    "LINDSEY CLARK BROTHERS LIMITED",
-    "CREATIVE GARDENS LIMITED",
-    "MANCHESTER PEST CONTROL LIMITED",
-    "IMPACT CLEAN SOLUTIONS LTD",
-    "LEEK AUCTIONS LIMITED",
-    "PICKUP & CO LTD",
-    "THE PROUDMUTUAL TRANSPORT GROUP LIMITED",
-    "BROOKFIELD LIVESTOCK MARKETING LIMITED",
-    "THE ROYAL BATH & WEST OF ENGLAND SOCIETY",
-    "IRRIFENCE LTD",
-    "WEEDING TECHNOLOGIES LIMITED",
-    "CRESCENT LANDSCAPES LTD",
-    "BARNES OIL TANK SERVICES LIMITED",
-    "GAVIN JONES LIMITED",
-    "THE FOUNTAIN WORKSHOP LIMITED",
-    "DAISYMAID NE LIMITED",
-    "J B LANDSCAPE ASSOCIATES LIMITED",
-    "THE COURTYARD GARDEN CENTRE LTD.",
-    "INDUSTRIAL DEEP CLEANING LIMITED",
-    "LIMETREE LANDSCAPE SERVICES AND NURSERIES LIMITED",
-    "ALEX STEWART AGRICULTURE LIMITED",
-    "CRAZY LADIES CLEANING LIMITED",
-    "HIGH DEFINITION CLEANING LIMITED",
-    "ANGLIAN LAND DRAINAGE LIMITED",
-    "THE CHELSEA GARDENING COMPANY LTD.",
-    "EASYLAWN TURF SUPPLIES LIMITED",
-    "JET FRESH LIMITED",
-    "SUPER PLUS CLEANING SERVICES LIMITED",
-    "BILLOCKBY FARMS LIMITED",
-    "MILLSTONE LANDSCAPES LIMITED",
-    "AB GROUNDS MAINTENANCE LTD",
-    "SOUTH LYNCH ESTATE LIMITED",
-    "ARTIFICIAL GRASS FOR LESS LTD",
-    "JOHN O'CONNER (GROUNDS MAINTENANCE) LIMITED",
-    "LIONHEART CLEANING SERVICES LIMITED",
-    "WESTWOOD LANDSCAPE LIMITED",
-    "CITY GARDEN LIMITED",
-    "W J WILKINSON & SONS (LANDSCAPING) LTD.",
-    "SID BIBBY TURF & LANDSCAPING LIMITED",
-    "PEAKBRIDGE GLOBAL LIMITED",
-    "SULNEY NURSERY LTD",
-    "BESPOKE BUILDING LIMITED",
-    "T C L LTD",
-    "HANDLEY OFFSHORE CONTRACTING LIMITED",
-    "NORTHERN GROUNDCARE LIMITED",
-    "SCOTTS CONTRACT SERVICES LTD",
-    "COUNTRY GARDENS LIMITED",
-    "GREENSLEEVES LAWN CARE LIMITED",
-    "AFAN GROUP LTD",
-    "MID-SHIRE RUGBY LANDSCAPES LIMITED",
-    "DURANCE CLEANING SERVICES LIMITED",
-    "JULIAN WALTON LANDSCAPES LIMITED",
-    "AGRII HOLDINGS (UK) LIMITED",
-    "BONAFIDE ADVISORY SERVCIES LTD",
-    "ROWAN SOLUTIONS LIMITED",
-    "TALBOT FARM LANDSCAPES LIMITED",
-    "M.D. DRISCOLL & CO. LIMITED",
-    "MOLE VALLEY FARMERS LIMITED",
-    "SPA LANDSCAPING LIMITED",
-    "THAMES VALLEY CAMBAC LIMITED",
-    "FRONTIER AGRICULTURE LIMITED",
-    "LUCAS LANDSCAPES LTD",
-    "BOWLAND STONE LIMITED",
-    "COUNTRY LINE LANDSCAPES & ROOFING CONTRACTORS LTD",
-    "SOIL FERTILITY SERVICES LIMITED",
-    "THE GARDEN DESIGN COMPANY LIMITED",
-    "SMART CHOICE CLEANING LTD",
-    "ROYAL WELSH AGRICULTURAL SOCIETY LIMITED(THE)",
-    "MASTERGEN LTD",
-    "INSPIRED GARDENS LIMITED",
-    "KEN LINFORD GARDENCARE LIMITED",
-    "FACCOMBE ESTATES LIMITED",
-    "THE GARDEN BUILDERS LIMITED",
-    "COGENT BREEDING LIMITED",
-    "DOMESTIC DIVAS YORK LIMITED",
-    "SCOFELL LANDSCAPES LIMITED",
-    "AAA SIGNS LIMITED",
-    "CHANDLERS (FARM EQUIPMENT) LIMITED",
-    "COUNTY DESIGN AND LANDSCAPES LIMITED",
-    "ROLAWN LIMITED",
-    "BANG TIDY CLEANING SERVICES LIMITED",
-    "AGRIFACTORS (SOUTHERN) LIMITED",
-    "COUNTRY SUPPLIES LIMITED",
-    "R J WARREN LIMITED",
-    "GRACEFUL GARDENS (HEVER) LIMITED",
-    "ABSOLUTELY FABULOUS LTD",
-    "HIGHTOWN MAGIC MAIDS LTD",
-    "PREMIER PROFESSIONAL WINDOW CLEANING (PETERSFIELD CENTRAL) SERVICES LIMITED",
-    "MILLWOOD PRODUCTS LTD",
-    "A.B. NUTRITION LIMITED",
-    "COMPLETE WEED CONTROL (SOUTH AND CENTRAL WALES) LTD",
-    "COLLINS LANDSCAPES LIMITED",
-    "PHOENIX AGRICULTURAL LTD",
-    "ULTRACARE PROPERTY MANAGEMENT LIMITED",
-    "AYLE COLLIERY COMPANY LIMITED",
-    "DOLLY MOPS LIMITED",
-    "WOMEN WITH WADERS LIMITED",
-    "NMR NEW MEDIA RESEARCH LIMITED",
-    "CLEANING VENTURES LIMITED",
-    "LIVERPOOL TANKCLEANING SERVICES LIMITED",
-    "AIRE ANCIENT BATHS LONDON LTD.",
-    "RIPON FARM SERVICES LIMITED",
-    "SCRUTINY CLEANING SERVICES LIMITED",
-    "BGS LANDSCAPES & FENCING LIMITED",
-    "PLANTERIOR LANDSCAPE SERVICES LIMITED",
-    "JFH HORTICULTURAL SUPPLIES LIMITED",
-    "BRIARWOOD PRODUCTS LIMITED",
-    "SPACECARE LIMITED",
-    "BEE CATERING EQUIPMENT LTD",
-    "COUNTRYWIDE FARMERS PLC.",
-    "THE JOHNSONS GROUP LIMITED",
-    "CLEANBRITE (UK) LIMITED",
-    "SIMPLY LANDSCAPING PEMBROKESHIRE LTD",
-    "WARBURTON LANDSCAPES LIMITED",
-    "COBLANDS LANDSCAPES LIMITED",
-    "BLOOMIN GARDENS LIMITED",
-    "BEECH LANDSCAPE DEVELOPMENTS LIMITED",
-    "FIRST CLASS CLEANING LIMITED",
-    "GREENFIELDS LIMITED",
-    "CAROL'S CLEANING SERVICES LIMITED",
-    "RUSKINS TREES & SOIL BIOLOGY LTD",
-    "MAYLIM LIMITED",
-    "CROWN ESTATES & PROPERTY MANAGEMENT LTD",
-    "DISTINCTIVE GARDENS LTD",
-    "G CLARKE LANDSCAPING LIMITED",
-    "K W TIMMINS & SONS LIMITED",
-    "CHRIS SKINNER LANDSCAPES LIMITED",
-    "KEYO AGRICULTURAL SERVICES LTD",
-    "STEVE THORLEY POTATO EQUIPMENT LIMITED",
-    "C HARRISON TREES & LANDSCAPES LTD",
-    "JAMES BOWDEN PHOTOGRAPHY LTD",
-    "ELLIOT MAIDS SERVICES PVT LTD",
-    "SOUTH LAKES TREE SURGEONS & LANDSCAPES LIMITED",
-    "ASHFORD CATTLE MARKET COMPANY LIMITED(THE)",
-    "INHURST LANDSCAPES LIMITED",
-    "KIVELLS LIMITED",
-    "CLAAS MANNS LTD",
-    "FIRTREE LANDSCAPES LIMITED",
-    "OPICO LIMITED",
-    "BINESET LIMITED",
-    "ABERGWILI CONCRETE PRODUCTS LIMITED",
-    "NURTURE LANDSCAPES LIMITED",
-    "LYNDHURST LANDSCAPING & MAINTENANCE LIMITED",
-    "NORTH WALES ENVIRONMENTAL SERVICES LTD",
-    "CGS CONTRACTORS SOUTHWEST LIMITED",
-    "GLENDALE LIMITED",
-    "MIDDLEWOOD LODGE SHEFFIELD MANAGEMENT COMPANY LIMITED",
-    "ISIS FACILITY SERVICES LTD",
-    "GARDEN INSPIRATIONS SURREY LIMITED",
-    "J G H PROPERTY SERVICES LTD",
-    "LAWNTECH LIMITED",
-    "ENCOMPASS ENVIRONMENTAL LTD",
-    "GROUNDFORCE LANDSCAPE LTD",
-    "GROWING MEMORIES THERAPY GARDENS LTD.",
-    "PRISTINE CLEANING SERVICES LIMITED",
-    "WESSEX GROUNDS SERVICES LTD",
-    "MID CORNWALL LANDSCAPING LIMITED",
-    "ZENITH NURSERIES LIMITED",
-    "M A RICHARDSON LIMITED",
-    "BUCKLAND LANDSCAPES LIMITED",
-    "TIMBER BUILDINGS SOUTH WEST LTD",
-    "MARSHALLS COMMERCIAL CLEANING LTD",
-    "BRIGHSTONE LANDSCAPING LIMITED",
-    "EAST CAMBS STREET SCENE LIMITED",
-    "GREENSIDE LANDSCAPES LIMITED",
-    "OAKLEIGH MANOR LIMITED",
-    "GREEN THUMB CONSULTING LIMITED",
-    "T W LANDSCAPES & FENCING LTD",
-    "ABBEY PETS REMEMBRANCE GARDENS AND CREMATORIA LIMITED",
-    "MANTANK ENVIRONMENTAL SERVICES LIMITED",
-    "CUTTING EDGE (ABERYSTWYTH) LTD",
-    "YOUR DIRTY LITTLE SECRET LTD",
-    "A ONE GARDEN CONTRACTORS LIMITED",
-    "BRICK CLEANING LONDON LIMITED",
-    "NAMGRASS UK LIMITED",
-    "4 SEASONS GROUNDS AND LANDSCAPING SOLUTIONS LIMITED",
-    "INTERSERVE PLC",
-    "THE ALLIUM & BRASSICA CENTRE LIMITED",
-    "SHERBORNE TURF LIMITED",
-    "ARCHWAY GREEN LTD",
-    "WINDMILL CONTRACTORS LIMITED",
-    "LIVING LANDSCAPES LIMITED",
-    "GRASSTEX LTD",
-    "STARBUCKS COFFEE MCDONALD'S WAITROSE LIMITED",
-    "ALBEN LANDSCAPES LIMITED",
-    "SGS UNITED KINGDOM LIMITED",
-    "NORTHERN ESTATES SERVICES LIMITED",
-    "FELDBINDER (UK) LIMITED",
-    "MARK WALKER (GROUNDS MAINTENANCE) LIMITED",
-    "THE GRAB HIRE (UK) COMPANY LIMITED",
-    "FREEDOM CLEANING LTD",
-    "THE FOURTH ROOM LTD",
-    "TONE VALLEY SERVICES LIMITED",
-    "SPOTLESS SOLUTIONS LIMITED",
-    "CARLOWAY ESTATE TRUST (URRAS OIGHREACHD CHARLABHAIGH)",
-    "BRANDALL FACILITIES MANAGEMENT LTD",
-    "ESSEX GARDENERS LIMITED",
-    "IDVERDE UK LIMITED",
-    "TILLERY ACTION FOR YOU LIMITED",
-    "EUROFINS AGRO TESTING UK LIMITED",
-    "KIWI LANDSCAPES LIMITED",
-    "BUTLER LANDSCAPES LIMITED",
-    "GARDEN DISCOUNT CENTRE LIMITED",
-    "KILLINGLEY CONSULTING LTD",
-    "CAMERA CREW LONDON LIMITED",
-    "GROUNDCARE MANAGEMENT LIMITED",
-    "CORNTHWAITE AGRICULTURAL LIMITED",
-    "SELBY LIVESTOCK AUCTION MART LIMITED",
-    "TKE LANDSCAPING LTD",
-    "TFM COUNTRY STORE LIMITED",
-    "JAPANESE KNOTWEED CONTROL LTD",
-    "ASHWELL LANDSCAPES LIMITED",
-    "GENUS BREEDING LIMITED",
-    "TREETOPS LANDSCAPES LIMITED",
-    "SOUTHERN ARTIFICIAL GRASS LTD",
-    "PROCTOR LANDSCAPES LIMITED",
-    "THE GARDEN PROJECT COMPANY LIMITED",
-    "AAA HANDYMAN SERVICES LTD",
-    "MICHAEL TWITE LANDSCAPES LIMITED",
-    "C R SWIFT LANDSCAPING LTD",
-    "WILDFLOWER TURF LTD",
-    "GRAB A GARDENER LTD",
-    "STAMFORD AGRICULTURAL SERVICES LIMITED",
-    "START AFRESH CLEANING LIMITED",
-    "NOMOW LIMITED",
-    "URBANROOFGARDENS LTD",
-    "BRAVO TANGO CLEANING SERVICES LTD",
-    "DIAMOND DOMESTIC SERVICES LIMITED",
-    "ECOSOLVE LTD.",
-    "COUNTRY GARDEN LIMITED",
-    "TURF WORLD LIMITED",
-    "SKIDMORES OF HERTFORD LIMITED",
-    "NIAB.",
-    "CRICCIETH CLEANING LIMITED",
-    "BETTER BREATHING COMPANY LIMITED",
-    "GARDEN STYLE (NORTH WEST) LIMITED",
-    "SYNGENTA LIMITED",
-    "HARRISON LIMITED",
-    "ALLTECH E-CO2 LIMITED",
-    "ENVIRONMENTAL HUSBANDRY LIMITED",
-    "W RONALD LANDSCAPES LIMITED",
-    "GROUNDWORK LIMITED",
-    "COGENT LIMITED",
-    "BLOOMIN' MARVELLOUS LTD",
-    "ISLAND LANDSCAPES LIMITED",
-    "MANCHETT BELGIUM LTD",
-    "C B WINTER & SONS LIMITED",
-    "TONY HEYWOOD LANDSCAPES LIMITED",
-    "COTSWOLD ESTATES LIMITED",
-    "GARDEN CARE SERVICES LIMITED",
-    "CARTWRIGHT LANDSCAPES LIMITED",
-    "KIERON BEATTIE LANDSCAPING LIMITED",
-    "WILLERBY LANDSCAPES LIMITED",
-    "CLEAR VISION NATIONAL WINDOW CLEANING LTD",
-    "CAPABILITY LANDSCAPES LTD",
-    "COOL GARDENS LANDSCAPING LIMITED",
-    "COOMBE ABBEY PARK LIMITED",
-    "PHIL FRANKLIN LANDSCAPES LTD",
-    "MISSION CLEANING SERVICES LIMITED",
-    "CHESHIRE SPECIALIST CLEANING SERVICES LTD",
-    "CLEVELAND LAND SERVICES (GROUP) LIMITED",
-    "GREATWAVE CLEANING SERVICES LIMITED",
-    "CHERRY ESTATES LIMITED",
-    "TUCKWELLS BLOODSTOCK LIMITED",
-    "ALL SEASONS LANDSCAPE SPECIALISTS LIMITED",
-    "SOUTHERN COUNTIES LANDSCAPES LIMITED",
-    "MIRE SERVICES LIMITED",
-    "THORNE BEEHIVES LIMITED",
-    "YGS LANDSCAPES LIMITED",
-    "UNIQUE PROJECTS LIMITED",
-    "ROGER GLADWELL LANDSCAPING AND CONSTRUCTION LTD",
-    "LAWNMASTER LIMITED",
-    "IMPACT SUPPORT SOLUTIONS LIMITED",
-    "EDAPHOS LIMITED",
-    "BLUE IRIS LANDSCAPES LIMITED",
-    "ATLAS GREEN LIMITED",
-    "GARDENPROUD LIMITED",
-    "PEARTREE CLEANING SERVICES LIMITED",
-    "KATE EYRE GARDEN DESIGN LIMITED",
-    "ACER LANDSCAPES LIMITED",
-    "REDCLIFFE GARDENERS LTD",
-    "ED & DALE LIMITED",
-    "THE WATERSIDE (FARMOOR) CAFE LIMITED",
-    "A W WARWICK BRICKWORK LIMITED",
-    "THE OXFORDSHIRE GARDENER LTD",
-    "CITY ESCAPES LIMITED",
-    "HORTICON LIMITED",
-    "MADINGLEY MULCH LIMITED",
-    "WB DESIGN AND BUILD LIMITED",
-    "CHEEKS INDUSTRIAL CLEANING SERVICES LIMITED",
-    "TURNEY LANDSCAPES LIMITED",
-    "URBAN LANDSCAPE DESIGN LIMITED",
-    "WESTERN LIMITED",
-    "WESTCLEAN SERVICES LTD",
-    "B & M SUGAR PRODUCTS LIMITED",
-    "CLIFTON NURSERIES LIMITED",
-    "GREEN STRIPES GARDEN SERVICES LIMITED",
-    "SPA ENVIRONMENTAL CARE LIMITED",
-    "THE PALACE GARDENER LIMITED",
-    "A V M SERVICES LIMITED",
-    "KINGSTON LANDSCAPE GROUP LIMITED",
-    "MCNICOL LIMITED",
-    "BSK LANDSCAPES LIMITED",
-    "AQUAJOY WATER GARDENS LIMITED",
-    "TONY BENGER LANDSCAPING LIMITED",
-    "AAB CONVEYORS LTD",
-    "HAFREN SERVICES LIMITED",
-    "CREATIVE LANDSCAPES LTD",
-    "R-T-M LANDSCAPES LIMITED",
-    "IVINGHOE TURF LIMITED",
-    "SYLVIA NEWMAN GARDEN DESIGN LIMITED",
-    "HAMBROOK GARDEN POWER LIMITED",
-    "KELD CLEANING SERVICES LTD",
-    "BOUGHTON LOAM LIMITED",
-    "HOME COUNTIES LANDSCAPING LTD",
-    "LAWNHOPPER (CAMBS,SUFFOLK & HERTS) LTD",
-    "THRIFT LANDSCAPES LIMITED",
-    "DEEP CLEAN 24SEVEN LTD",
-    "ANGLO AQUATIC PLANT COMPANY LIMITED",
-    "TBS EAST ANGLIA LIMITED",
-    "SPICK N SPAN SERVICES LIMITED",
-    "B.C.W. (AGRICULTURE) LIMITED",
-    "EDEN LANDSCAPES LTD",
-    "R.STRIDE & CO. (WELLSHINE) LTD",
-    "UK NUTRITION GROUP LTD",
-    "PROFESSIONAL POULTRY SOLUTIONS LIMITED",
-    "FROGHEATH LIMITED",
-    "THE LAWN RANGER LIMITED",
-    "LANDMARK (YORKSHIRE) LIMITED",
-    "READING COMMUNITY WELFARE RIGHTS UNIT",
-    "DESIGNSCAPES (SOUTHWEST) LTD",
-    "ARTIFICIAL LAWNS EASTRIDING LTD",
-    "DCS MULTISERVE LIMITED",
-    "NEWLEAF LIMITED",
-    "DIAMOND CLEANING SUDBURY LTD.",
-    "HCL BUSINESS SERVICES LTD.",
-    "CLEANLIFE LIMITED",
-    "ANCORRA ENVIRONMENTAL SERVICES LTD",
-    "BOW MAINTENANCE LTD",
-    "A H CHILD AND FAMILY ASSESSMENT SERVICES LTD",
-    "MIDWEST LANDSCAPING LIMITED",
-    "SUNSHINE GARDENS LIMITED",
-    "ULVERSTON AUCTION MART PUBLIC LIMITED COMPANY(THE)",
-    "MAGIC WAND PROPERTY CLEANING COMPANY LIMITED",
-    "CREATE LANDSCAPING LIMITED",
-    "EARTHSTONE LANDSCAPES LIMITED",
-    "HYGIENE CONTRACTS LIMITED",
-    "WEEDFREE LIMITED",
-    "LADYBIRDS GARDEN SERVICES LTD",
-    "J.M.A. LANDSCAPING SERVICES LIMITED",
-    "NICHOLSONS LIMITED",
-    "BRIGHTWAY CLEANING LIMITED",
-    "THOMPSONS OF CREWS HILL LIMITED",
-    "LANDSCAPE SERVICES DIRECT LIMITED",
-    "TREE SOURCE LIMITED",
-    "A.C. GOATHAM AND SON LIMITED",
-    "STOCK GARDENS LIMITED",
-    "STEWART BULLARD & SON LIMITED",
-    "CORNISH GARDEN SERVICES (BRISTOL) LIMITED",
-    "CEDAR LANDSCAPES LIMITED",
-    "NWA CLEANING SERVICES LIMITED",
-    "THE ASSOCIATION OF HEALTHCARE CLEANING PROFESSIONALS (AHCP) LIMITED",
-    "MICROFERM LIMITED",
-    "MAISEMORE APIARIES LIMITED",
-    "ISS FACILITY SERVICES LIMITED",
-    "TRUGREEN SOLUTIONS LTD",
-    "GROUNDCARE LTD",
-    "COLLIER TURF CARE LIMITED",
-    "MATT BAYLES PROFESSIONAL TREE CARE LTD",
-    "GRAHAMS CLEANING SERVICES LTD",
-    "CELTIC TURF LIMITED",
-    "OAK VIEW LANDSCAPES LIMITED",
-    "MENAI CLEANING SERVICES LIMITED",
-    "D F CLARK CONTRACTORS LIMITED",
-    "CHELSEA GARDEN SERVICES LTD",
-    "MITIE CLEANING & ENVIRONMENTAL SERVICES LIMITED",
-    "WAYSIDE WATER GARDENS LIMITED",
-    "ORIGINAL LANDSCAPE DESIGN LTD",
-    "ANGLIA TREE CONTRACTORS LTD",
-    "FAIRWAYS LIMITED",
-    "STRAND LIMITED",
-    "OAKLANDS LIVESTOCK CENTRE LTD",
-    "FROME LIVESTOCK AUCTIONEERS LIMITED",
-    "CHEVRON COMMERCIAL CLEANING LIMITED",
-    "MCS CONTRACT SERVICES LIMITED",
-    "ALAN A. GRIFFIN ASSOCIATES UK LIMITED",
-    "GREEN SPACE CARE LIMITED",
-    "BRADSHAWS LIMITED",
-    "CREATIVE LANDSCAPE COMPANY LIMITED",
-    "LANDSCAPE ARTISAN LTD",
-    "HCSA (NUMBER ONE) LIMITED",
-    "BOVERTON NURSERIES LIMITED",
-    "AGROVISTA UK LIMITED",
-    "STONEPLAN LIMITED",
-    "SPARKLING GLASS LIMITED",
-    "PLANDSCAPE LIMITED",
-    "ENVIROCARE GROUNDS MAINTENANCE (PRESTON) LIMITED",
-    "BIOSPHERE ORGANICS LIMITED",
-    "CONTOUR LANDSCAPES LIMITED",
-    "GREAT NORTHERN  CLEANING LTD",
-    "ROBERT STRAVER LTD",
-    "AVA TURF SUPPLIES LIMITED",
-    "ABAL CYMRU CYFYNGEDIG",
-    "J.J. MORRIS LIMITED",
-    "MILHAMS (EASTBOURNE) LIMITED",
-    "C P GROUNDCARE LIMITED",
-    "FORDHAM LANDSCAPES LIMITED",
-    "GROUND FORCE LANDSCAPING (BERKSHIRE) LIMITED",
-    "BRAMBLES GARDEN SERVICES LIMITED",
-    "THOMAS FOX LANDSCAPING LTD",
-    "PROCAM LIMITED",
-    "BOURNE AMENITY LIMITED",
-    "DMW LANDSCAPES LTD",
-    "JOE'S LAWN CARE LTD",
-    "BROUGHTON PARK MANAGEMENT COMPANY LIMITED",
-    "GAIA LANDSCAPES LTD",
-    "CJ ROUND LANDSCAPES LIMITED",
-    "SUNDERLANDS LIMITED",
-    "NOMIX ENVIRO LIMITED",
-    "FOUR SEASONS LANDSCAPE LTD.",
-    "CAMERON LANDSCAPES LIMITED",
-    "CHIPPERFIELD GARDEN BUILDINGS LTD",
-    "WHITING LANDSCAPE LIMITED",
-    "TIVOLI LIMITED",
-    "TIMOTAY LANDSCAPES LIMITED",
-    "SCOTSCAPE LIMITED",
-    "VOLAC INTERNATIONAL LIMITED",
-    "LOVELL LANDSCAPES LTD",
-    "OXFORD GARDEN DESIGN LIMITED",
-    "ENVIROQUEST GPT LIMITED",
-    "S.K. LANDSCAPES & MAINTENANCE LTD",
-    "ENVIRONET UK LIMITED",
-    "LEES PREMIER CLEANING LTD",
-    "BIOGUARD SERVICES LTD",
-    "ROPETECH (LONDON) LIMITED",
-    "PROFESSIONAL LAWNS LIMITED",
-    "LONDON LANDSCAPES LIMITED",
-    "MILLENNIUM PEST CONTROL LIMITED",
-    "DOMESTIC CLEANING COMPANY (NW) LTD",
-    "COUNTRYWIDE GROUNDS MAINTENANCE LIMITED",
-    "EAST RIDING GROUP LIMITED",
-    "VISTA LANDSCAPE MANAGEMENT LIMITED",
-    "THE LEICESTERSHIRE LANDSCAPING COMPANY LIMITED",
-    "WEEDFREE LANDSCAPES LTD",
-    "JARROLD TRAINING LIMITED",
-    "SQUEAKY CLEAN (PEMBS) LTD",
-    "H P CLEANING & SUPPORT LIMITED",
-    "INCREDIBLE WINDOW CLEANING LIMITED",
-    "DELLAR THE CLEANING COMPANY LIMITED",
-    "HEYROSE GOLF CLUB LIMITED",
-    "CLEAN START CONTRACTORS LIMITED",
-    "TAILORED CONTRACT CLEANING LIMITED",
-    "GREEN COLCHESTER CLEANING LIMITED",
-    "KRH CLEANING LTD",
-    "THOROKLEEN HOLDINGS LIMITED",
-    "CELTIC CLEANING SERVICES LTD",
-    "DIRTBUSTERS NE LIMITED",
-    "EXIGE CLEAN LIMITED",
-    "VA CLEAN LIMITED",
-    "HEB GROUP CLEANING & HYGIENE LTD",
-    "FOXROYD LIMITED",
-    "SKIVVIES TORBAY HANDYMAN SERVICES LTD",
-    "PHOENIX CLEANING (MK) LTD",
-    "SOUTH WALES SCAFFOLDING SERVICES LIMITED",
-    "DPF MANAGEMENT LTD",
-    "BRUSHSTROKES ROADSWEEPERS LIMITED",
-    "POLYGON DAMAGE CONTROL LIMITED",
-    "CLEARVIEW EVENT SERVICES LIMITED",
-    "BEAVER FLOORCARE LIMITED",
-    "IN2 CLEANING SERVICES LIMITED",
-    "DUCTBUSTERS LIMITED",
-    "GMS CLEANING LTD",
-    "J W CLEANING PROFESSIONALS LIMITED",
-    "THE NULIFE GROUP LIMITED",
-    "WESTGROVE CLEANING SERVICES LTD",
-    "YOUR SPEC CLEANING LTD",
-    "A1 SELECTION PROPERTY SERVICES LIMITED",
-    "EL SPARKLE LIMITED",
-    "R C LINCOLNSHIRE LTD",
-    "N J BARBER LTD",
-    "MM COMMERCIAL SERVICES LIMITED",
-    "BD365 LTD",
-    "CLEANING SCOTLAND LTD.",
-    "TRANSFORMERS LIMITED",
-    "SPIC LIMITED",
-    "PRESTIGE CLEANING LIMITED",
-    "MD TRAUMA CLEAN LIMITED",
-    "TANKERS LIMITED",
-    "AMBER SUPPORT SOLUTIONS LTD",
-    "SANONDAF FIFE LTD",
-    "CITY CLEANING CONTRACTORS LTD",
-    "QCS (LANARK) LIMITED",
-    "DORSET WET ROOMS, PROPERTY MAINTENANCE, BATHROOMS & KITCHENS LTD",
-    "GREIG AVINOU LIMITED",
-    "SPARKLES SCOTLAND LIMITED",
-    "DYSART CLEANING & MAINTENANCE LIMITED",
-    "DIAMOND HOME SUPPORT (CENTRAL) LIMITED",
-    "FINAGHY CLEANING & SUPPORT SERVICES LIMITED",
-    "UPSTAIRS DOWNSTAIRS LIMITED",
-    "PROCLEAN LTD",
-    "ISOCON (ENGINEERING) LIMITED",
-    "GEB INDUSTRIAL CLEANING SERVICES LIMITED",
-    "MOBILE HYGIENE SERVICES LIMITED",
-    "CORONET LTD",
-    "KELAR CLEANING LTD",
-    "CARDROSS LIMITED",
-    "CCMS (1984) LTD.",
-    "TOTAL CLEANING COMPANY (UK) LIMITED",
-    "CUSTOM CHEMICALS LIMITED",
-    "CONTRACT SERVICES LIMITED",
-    "ZIRCON ENVIRONMENTAL SERVICES LIMITED",
-    "DIAL A CLEAN LIMITED",
-    "PROPERTY CLEANING SERVICES LIMITED",
-    "HOMEFRESH CLEANING SOLUTIONS LTD",
-    "SECOND TO NUNN LTD",
-    "SCOTBRITE SERVICES LTD",
-    "MANTON SALES LIMITED",
-    "REFLECTIONS CLEANING SERVICES (INVERNESS) LTD",
-    "WE CLEAN OFFICES LTD",
-    "PRESLY PEST CONTROL LIMITED",
-    "C.A.S. CONTRACT CLEANING LIMITED",
-    "DOMESTIC CLEANING EDINBURGH LIMITED",
-    "PRISTINE DOMESTIC CLEANING LIMITED",
-    "OLD MILL CHIMNEYS LIMITED",
-    "GLASGOW WINDOW CLEANING COMPANY LIMITED",
-    "PATTERSON OUTDOOR CLEANING SOLUTIONS LIMITED",
-    "SNOWDROP SERVICES SCOTLAND LIMITED",
-    "HOUSEPROUD DOMESTIC CLEANING (ABERDEEN) LIMITED",
-    "A AND D PRISTINE CLEANS LTD",
-    "HOUSE PROUD (GRAMPIAN) LIMITED",
-    "SURECLEAN GROUP LIMITED",
-    "STRUAN WINDOW CLEANING LIMITED",
-    "PROPERTY ONE LIMITED",
-    "CLEANING GEMS NBC LTD",
-    "GRAHAM HYGIENE SERVICES LTD.",
-    "SHINE CLEANING SOLUTIONS LIMITED",
-    "ANGUS CLEANING SERVICES LIMITED",
-    "TIDY GREEN CLEAN LTD",
-    "ABERDEEN ANGELS LIMITED",
-    "LANFINE ESTATE LTD",
-    "ABBEY SERVICES LIMITED",
-    "GREENLEAF LIMITED",
-    "TNT CLEANING LIMITED",
-    "MOIRS LTD",
-    "HI - SPEC LIMITED",
-    "G S ASSOCIATES LTD",
-    "H LIMITED",
-    "SHETLAND CLEANING SERVICES (LERWICK) LIMITED",
-    "ULTRAPROSERVICE LTD",
-    "SUPERIOR WINDOW CLEANING LTD",
-    "BRIDGEFIELD SERVICES LIMITED",
-    "WALSH BROTHERS INDUSTRIAL SERVICES LTD.",
-    "THE ASSOCIATION OF PROFESSIONAL INDEPENDENT CHIMNEY SWEEPS (APICS)",
-    "NO TIME TO CLEAN LIMITED",
-    "ACRE INDUSTRIAL SERVICES LTD",
-    "DBM FOOD HYGIENE SUPPLIES LTD.",
-    "EASICLEANS YORK LIMITED",
-    "TG INDUSTRIAL SERVICES LIMITED",
-    "QCS CONTRACT CLEANING LTD",
-    "PRISTINE CLEAN SERVICES LIMITED",
-    "CLEANCO LIMITED",
-    "PLATINUM WINDOW CLEANING LIMITED",
-    "MUGGINS TOTAL CLEANING LIMITED",
-    "JC PROPERTY AND MAINTENANCE SERVICES (NI) LIMITED",
-    "CLEAR BLUE CLEANING LIMITED",
-    "L LIMITED",
-    "CITY CONTRACT CLEANERS LIMITED",
-    "GLEN CONTRACT SERVICES LIMITED",
-    "ABBY CLEANING (SCOTLAND) LTD",
-    "ENVIRONMENTAL EXCELLENCE CLEANING SPECIALISTS LIMITED",
-    "DIXY GROUP HOLDINGS LIMITED",
-    "PRECISION INDUSTRIAL SERVICES LIMITED",
-    "BRIDGES CLEANING SERVICES LTD",
-    "CELTIC VACUUM LIMITED",
-    "PERFECT CLEAN EDINBURGH LTD",
-    "MACCLEAN (NI) LTD",
-    "ALBA OFFICE CLEANING LTD.",
-    "CATHKIN CLEAN SCOTLAND LIMITED",
-    "ANDERSEN CALEDONIA LIMITED",
-    "DENHOLM ENVIRONMENTAL LIMITED",
-    "FLEXI LIMITED",
-    "FCC WASTE MANAGEMENT LIMITED",
-    "RECYCLING MANAGEMENT LIMITED",
-    "NOBLE RECYCLING LTD",
-    "BREWSTER BROTHERS LIMITED",
-    "AMEY LIMITED",
-    "SAICA NATUR UK LIMITED",
-    "HAWES SKIP HIRE LIMITED",
-    "LOOP LTD",
-    "A J RECYCLING LTD",
-    "TRAFFORD SERVICES LIMITED",
-    "SMITHS AEROSPACE GLOUCESTER LIMITED",
-    "FIRE PROTECTION RECYCLING LIMITED",
-    "LEESE'S RECYCLING LIMITED",
-    "MARTINS OF YORK LIMITED",
-    "DIY AGGREGATES LIMITED",
-    "BOLTON SKIP HIRE LIMITED",
-    "CREIGIAU TYRES LIMITED",
-    "DAVIES SKIPS LIMITED",
-    "KIRKHAM LTD",
-    "REGENTHILL LIMITED",
-    "SORTERA LIMITED",
-    "DEPOTHIRE LIMITED",
-    "PERRYS RECYCLING LIMITED",
-    "SUEZ LTD",
-    "COLLIER INDUSTRIAL WASTE LIMITED",
-    "THOMAS MUIR (METALS) LIMITED",
-    "TOTAL RECYCLING SERVICES LIMITED",
-    "C&T PROSPECTS LTD",
-    "OLUS ENVIRONMENTAL LIMITED",
-    "CHUBB GROUP LIMITED",
-    "ELLGIA LIMITED",
-    "BLUE PHOENIX LIMITED",
-    "LOSTOCK SKIP HIRE LIMITED",
-    "FCC ENVIRONMENT LIMITED",
-    "BARR ENVIRONMENTAL LIMITED",
-    "SCOTWASTE RECYCLING LIMITED",
-    "PORTLAND STONE LIMITED",
-    "ROYDON RESOURCE RECOVERY LTD",
-    "THREE COUNTIES RECLAMATION LIMITED",
-    "V.C COOKE LIMITED",
-    "VIRIDOR POLYMER HOLDING LIMITED",
-    "THE WASTE GROUP SERVICES LIMITED",
-    "GEODELFT ENVIRONMENTAL LIMITED",
-    "SIMS RECYCLING SOLUTIONS LIMITED",
-    "TOM WHITE WASTE LIMITED",
-    "AUGEAN LIMITED",
-    "WOODLAND OIL LIMITED",
-    "NORPOL RECYCLING LIMITED",
-    "BJ SKIP HIRE (WIGAN) LIMITED",
-    "A1 SKIP HIRE (STOKE) LIMITED",
-    "S E RECYCLING LIMITED",
-    "A & A SKIP HIRE LTD",
-    "ENFIELD SKIPS LIMITED",
-    "A1 SKIP HIRE LTD",
-    "LONDON LIMITED",
-    "BIOGAS TECHNOLOGY LIMITED",
-    "LATHAMS OF LONDON LIMITED",
-    "MALAWI RENEWABLE ENERGY (GLASGOW) LIMITED",
-    "RENEWI PLC",
-    "COUNTRYSTYLE RECYCLING LIMITED",
-    "HOOD PLANT HIRE LIMITED",
-    "TIDESWELL TRADING LIMITED",
-    "GXO LOGISTICS SERVICES UK LIMITED",
-    "IRWELL STREET METAL CO. LIMITED",
-    "R.V. MAIDMENT LIMITED",
-    "HAZPORT LIMITED",
-    "CONSTRUCTION AND ENGINEERING DISPUTE RESOLUTION SERVICES (2020 VISION) LTD",
-    "PUDSEY PLANT HIRE LIMITED",
-    "BIFFA TREATMENT SERVICES LIMITED",
-    "AMG RESOURCES LIMITED",
-    "FORTRESS RECYCLING LTD",
-    "ZERO WASTE RECYCLING LIMITED",
-    "HURN RECYCLING LIMITED",
-    "JOHNSONS RECYCLING LIMITED",
-    "BRUNEL RECYCLING LTD",
-    "LEVENSEAT LTD.",
-    "9 CLEVELAND PLACE WEST (BATH) RESIDENTS MANAGEMENT LIMITED",
-    "FRYLITE LIMITED",
-    "INVERURIE SKIP HIRE LIMITED",
-    "ENDURMETA LTD",
-    "ICEX COMPUTERS LIMITED",
-    "PHILLIPS WASTE MANAGEMENT LTD",
-    "ABBEY PLANT LTD",
-    "PICKUP SKIPS LIMITED",
-    "NWH GROUP LIMITED",
-    "LAKESIDE ENERGY FROM WASTE LIMITED",
-    "SID DENNIS AND SONS LIMITED",
-    "BOURNE SKIP HIRE AND RECYCLING LIMITED",
-    "SALFORD SKIP HIRE LTD",
-    "MIDLOTHIAN SKIP HIRE LTD",
-    "RECYCLED PRODUCTS LIMITED",
-    "PLAY RESOURCE TRADING CO. LIMITED",
-    "WRC RECYCLING LIMITED",
-    "LURY HOMES LIMITED",
-    "NEWBERY RECYCLING LIMITED",
-    "SKIPWAY LIMITED",
-    "CAMIERS GROUP LIMITED",
-    "BOLD SKIPS, RECYCLING & RECLAMATION LIMITED",
-    "BATH RECYCLING SKIPS LIMITED",
-    "RECYCLING ENGINEERS SERVICES LIMITED",
-    "RESTON WASTE MANAGEMENT LIMITED",
-    "ELECTRICAL WASTE RECYCLING GROUP LIMITED",
-    "RECRESCO LIMITED",
-    "SHERRINGTONS WASTE MANAGEMENT LTD",
-    "SELECT A SKIP LIMITED",
-    "CARL BIRD LIMITED",
-    "BRITANIACREST RECYCLING LIMITED",
-    "GRAIG ENVIRONMENTAL RECYCLING SERVICES LIMITED",
-    "XPO IT SERVICES LIMITED",
-    "JOHN GUNNER AND COMPANY LIMITED",
-    "BOWER SKIP HIRE LIMITED",
-    "M J CHURCH (PLANT) LIMITED",
-    "VIRIDOR LIMITED",
-    "PAULSGROVE ENTERPRISE CENTRE LIMITED",
-    "A.S.A.P. SKIP & PLANT HIRE LTD.",
-    "RECORRA LTD",
-    "MORALIS GROUP LIMITED",
-    "ALLWOOD RECYCLING SOLUTIONS LIMITED",
-    "K S SERVICES (SLOUGH) LIMITED",
-    "EMS WASTE SERVICES LIMITED",
-    "BOB STABLER & SONS LIMITED",
-    "MERCIA WASTE MANAGEMENT LIMITED",
-    "MINI WASTE LIMITED",
-    "SMURFIT KAPPA CORRUGATED UK LTD",
-    "HADLEIGH SALVAGE (RECYCLING) LIMITED",
-    "MDS RECYCLING LIMITED",
-    "HENRY WASTE MANAGEMENT LIMITED",
-    "SOUTH COAST SKIPS LIMITED",
-    "J. DAVIDSON SCRAP METAL PROCESSORS LIMITED",
-    "WYE WASTE PAPER LIMITED",
-    "EGAN WASTE SERVICES LIMITED",
-    "GRACE RECYCLING (MCR) LTD",
-    "WARD RECYCLING LIMITED",
-    "ACE LIFTAWAY LIMITED",
-    "POLYMERS INTERNATIONAL LIMITED",
-    "NEW MILTON SAND AND BALLAST LIMITED",
-    "WILLIAMS RECYCLING LIMITED",
-    "ACORN TRANSPORT LIMITED",
-    "FORGE RECYCLING LIMITED",
-    "AUGEAN NORTH SEA SERVICES LIMITED",
-    "SKIP HIRE BASILDON LIMITED",
-    "OLLECO",
-    "GLAZEWING LIMITED",
-    "LSS WASTE MANAGEMENT GROUP LIMITED",
-    "PAPER SHREDDING SERVICES LTD.",
-    "MIDWEST POLYCHEM LIMITED",
-    "KEDEL LIMITED",
-    "ENVIRONCOM LIMITED",
-    "NETWORK WASTE LIMITED",
-    "LYTHAM ST ANNES SKIP HIRE LTD",
-    "BRYSON RECYCLING LIMITED",
-    "BUCKS RECYCLING LIMITED",
-    "KIELY BROS. LIMITED",
-    "SILVER SKIPS LINCOLNSHIRE LIMITED",
-    "ENVIRO KLEEN (SCOTLAND) LIMITED",
-    "BURNHAM WASTE LIMITED",
-    "WHITES SKIP HIRE LIMITED",
-    "SMURFIT KAPPA SSK LIMITED",
-    "CTR (ENVIRO) LIMITED",
-    "FERMANAGH LTD",
-    "ERITH WASTE MANAGEMENT LIMITED",
-    "CLEANSING SERVICE GROUP (RECOVERY) LIMITED",
-    "CENTRALGRANGE LIMITED",
-    "BETAPACK LIMITED",
-    "DOCUMENT LTD",
-    "JEFF SKINNER SKIP HIRE LIMITED",
-    "GLENDERMOTT ENTERPRISES LIMITED",
-    "MMS SUPPLIES LIMITED",
-    "CENTRAL WASTE (UK) LTD",
-    "REMONDIS LIMITED",
-    "PAUL RIDDEL SKIPS LIMITED",
-    "HIGHLANDER INTERNATIONAL RECYCLING LIMITED",
-    "WHITEMOSS LANDFILL LIMITED",
-    "MINI SKIPS (SOUTHERN) LIMITED",
-    "AVANTI ENVIRONMENTAL GROUP LIMITED",
-    "THE WASTE GROUP LTD",
-    "THE COVENTRY AND RUGBY HOSPITAL COMPANY PLC",
-    "LUXUS LIMITED",
-    "WASTE CONCERN LIMITED",
-    "MALARY LIMITED",
-    "HEREFORD PAPER AND ALLIED PRODUCTS LIMITED",
-    "T S LEE & SON LIMITED",
-    "MCKENZIES LIMITED",
-    "OIL RECOVERIES LIMITED",
-    "G R S BUILDING SERVICES LIMITED",
-    "ELG METALS UK LIMITED",
-    "MES ENVIRONMENTAL LIMITED",
-    "SKIPTON MANAGEMENT (HARROGATE) LIMITED",
-    "REDGATE LTD",
-    "ALL IN WASTE MANAGEMENT & SITE SERVICES LIMITED",
-    "W.N. THOMAS & SONS LIMITED",
-    "RECYCLE FIFE LIMITED",
-    "COX SKIPS LIMITED",
-    "JFC PLASTICS LIMITED",
-    "FROGSON WASTE MANAGEMENT LIMITED",
-    "YOARS LTD",
-    "H W MARTIN WASTE LIMITED",
-    "SHARPSMART LIMITED",
-    "RESTRUCTA LTD.",
-    "PLUMB POLYMERS LIMITED",
-    "CENTRAL SKIP HIRE LTD",
-    "CAMBRIDGE SKIP HIRE LIMITED",
-    "FORTH RESOURCE MANAGEMENT LIMITED",
-    "EDEN TRANSFORMER OIL LIMITED",
-    "G.D. ENVIRONMENTAL SERVICES LIMITED",
-    "GWE BIOGAS LTD",
-    "DAVE PEAT WASTE LIMITED",
-    "MOOCK ENVIRONMENTAL SOLUTIONS LIMITED",
-    "SIMPLY SHRED LIMITED",
-    "MCATEE RECYCLING LTD",
-    "DICKINSON ENVIRONMENTAL LTD",
-    "ANTUR WAUNFAWR",
-    "TES-AMM (EUROPE) LTD.",
-    "ECO-1 ELECTRICAL SOLUTIONS LTD",
-    "WESTERN SKIP HIRE LTD",
-    "GREEN WORLD RECYCLING LIMITED",
-    "DS SMITH PLC",
-    "VEOLIA UK LIMITED",
-    "BLACKPOOL SKIP HIRE LIMITED",
-    "AWD (GROUP) LTD",
-    "RUBBER & METAL FABRICATIONS (GRAYS) LIMITED",
-    "MYSHRED LIMITED",
-    "KIER LIMITED",
-    "WESSEX ASSOCIATED INDUSTRIES LIMITED",
-    "OAKBANK WASTE MANAGEMENT LIMITED",
-    "BEDFORD BUDGET SKIPS LTD",
-    "ACUMEN WASTE SERVICES LIMITED",
-    "NEW EARTH SOLUTIONS LIMITED",
-    "FRED LLOYD LIMITED",
-    "ENVA NORTHERN IRELAND LIMITED",
-    "OB SKIPS AND RECYCLING LTD",
-    "ON SITE SHREDDING LTD.",
-    "LONDON RECYCLING SERVICES LIMITED",
-    "CORY ENVIRONMENTAL LIMITED",
-    "LISTER RECYCLING & WASTE MANAGEMENT LIMITED",
-    "D.P. SKIP HIRE LIMITED",
-    "ASHCOURT GROUP LIMITED",
-    "A M SKIP HIRE LIMITED",
-    "CAERPHILLY SKIP HIRE (CWS) LTD",
-    "MEC SKIP HIRE LIMITED",
-    "CAPITAL VALLEY PLASTICS LIMITED",
-    "BETT SECURITY SHREDDING LIMITED",
-    "BLUE CASTLE LIMITED",
-    "BAKERS WASTE SERVICES LTD",
-    "TOUGHSHEET BUILDING PRODUCTS LIMITED",
-    "JACKSON SKIP & RECYCLING LIMITED",
-    "COASTAL RECYCLING LTD",
-    "EAST KENT RECYCLING LIMITED",
-    "FLINTSHIRE WASTE MANAGEMENT AND RECYCLING SERVICES LIMITED",
-    "TOONE WASTE MANAGEMENT LTD",
-    "SAFELEC LTD",
-    "BIFFA WASTE SERVICES LIMITED",
-    "SAICA LIMITED",
-    "BROCKLESBY LIMITED",
-    "HEYSIDE PLASTICS LTD",
-    "THORNCLIFFE BUILDING SUPPLIES LIMITED",
-    "BIFFA LIMITED",
-    "ELITE PAPERS LIMITED",
-    "AGRI.CYCLE LIMITED",
-    "DELIA LUNNON LIMITED",
-    "FLANNIGAN & BORDER SKIP HIRE AREA 1 LIMITED",
-    "H. COPE & SONS LIMITED",
-    "PENFOLD PLASTICS LIMITED",
-    "EAST YORKSHIRE WASTE AND SKIP HIRE LTD",
-    "PALM RECYCLING LIMITED",
-    "A1 BATES BROS. SKIP HIRE LIMITED",
-    "SOUTHWARK METALS LIMITED",
-    "DARLOW  LLOYD & SONS LIMITED",
-    "PINK SKIPS LIMITED",
-    "VERNON MALTBY JUNIOR SKIP HIRE LIMITED",
-    "MR RUBBLE LIMITED",
-    "MOULDING SOLUTIONS LIMITED",
-    "PINDEN LIMITED",
-    "R S SKIPS LIMITED",
-    "AUTO PLAS (NORTH WEST) LIMITED",
-    "ED HALL SERVICES LIMITED",
-    "RUSSELL RICHARDSON & SONS LIMITED",
-    "BARRY'S SKIP HIRE LIMITED",
-    "HENSHAWS COACHES LIMITED",
-    "BOGAN SKIP HIRE LIMITED",
-    "BRADFORD REAL ESTATE LIMITED",
-    "ALL WASTE SKIP HIRE LTD",
-    "ROY HATFIELD LIMITED",
-    "MICK GEORGE LIMITED",
-    "SSSI LIMITED",
-    "ESYNERGY RECYCLING LIMITED",
-    "VALLEY TRADING LIMITED",
-    "FLETCHERS WASTE MANAGEMENT LIMITED",
-    "GLYNNS LIMITED",
-    "RECYCLE FORCE LIMITED",
-    "ROBERT BECK AND SONS LIMITED",
-    "RONALD HULL JNR. LIMITED",
-    "EGAP RECYCLING LTD",
-    "DERWEN AGGREGATES LTD",
-    "RON SMITH (RECYCLING) LIMITED",
-    "ACS SKIP HIRE (MCR) LIMITED",
-    "ASPECTS SOLUTIONS (ENVIRONMENTAL) LIMITED",
-    "ROE ENVIRONMENTAL LTD",
-    "SAFETYKLEEN FINANCE LIMITED",
-    "PVC RECYCLING LTD",
-    "CSS RECYCLING LTD",
-    "MUKR LIMITED",
-    "ALL-CLEAR SKIP HIRE LIMITED",
-    "SWEEEP KUUSAKOSKI LIMITED",
-    "R J FARROW & SON LIMITED",
-    "RECYCLED UK LIMITED",
-    "GROUND SKIPS LIMITED",
-    "ENTERPRISE SKIP HIRE LIMITED",
-    "KILNBRIDGE CONSTRUCTION SERVICES LTD.",
-    "CALDER VALLEY SKIP HIRE LIMITED",
-    "NORTHBURN OILS LTD",
-    "AARON GRAB AND SKIP HIRE LTD",
-    "HANFORD TEST CENTRE LIMITED",
-    "B & T SKIP HIRE LIMITED",
-    "ADCL HAULAGE LIMITED",
-    "W MAW RECYCLING LIMITED",
-    "ENVA PLASTICS LIMITED",
-    "BSH BEAUFORT SECURITISATION HOLDING LTD",
-    "DARTMOUTH GLOBAL TRADING CO. LIMITED",
-    "W LIMITED",
-    "BURGESS RECYCLING LIMITED",
-    "BIFFA WASTE LIMITED",
-    "BUTLERS WASTE MANAGEMENT LTD",
-    "SKELTON LIMITED",
-    "KEENAN (RECYCLING) LIMITED",
-    "WORLD CARE (WALES) LIMITED",
-    "EASY LOAD LIMITED",
-    "NORTH WEST RECYCLING LIMITED",
-    "LATHAMS RECYCLING CENTRE LIMITED",
-    "ENERGEN BIOGAS LIMITED",
-    "BACOCOMPAK (NORFOLK) LIMITED",
-    "SEVERN TRENT GREEN POWER (ANDIGESTION) LIMITED",
-    "USKIP LTD",
-    "SIMPSON ENVIRONMENTAL SERVICES LIMITED",
-    "LELO METAL RECYCLING LTD",
-    "TIMBERPAK LIMITED",
-    "THINK 3E CONSORTIUM LTD",
-    "PORTABLE BATTERY RECYCLING LIMITED",
-    "1ST CHOICE CONCRETE LIMITED",
-    "TOPDOLLARMOBILE.COM LIMITED",
-    "4R RECYCLING LIMITED",
-    "PRM GREEN TECHNOLOGIES LIMITED",
-    "XACT SKIPS LTD",
-    "HUNSDON SKIP HIRE LTD",
-    "H M L  PLANT & SKIP HIRE LIMITED",
-    "ELIMPIC LIMITED",
-    "BATEMAN SKIPS LTD",
-    "RB RECYCLING SCARBOROUGH LIMITED",
-    "GXO LOGISTICS DRINKFLOW LIMITED",
-    "RECYCLEIT NOW LTD",
-    "CUMBRIA WASTE RECYCLING LIMITED",
-    "RPS DESANI LTD",
-    "A1 BUDGET SKIPS LTD",
-    "ADDLESEE TIMBER & HAULAGE LTD.",
-    "PLAN B MANAGEMENT SOLUTIONS LIMITED",
-    "MANCHESTER PAPER PLASTIC LTD",
-    "SEVERN WASTE SERVICES LIMITED",
-    "CELTIC RECYCLING LTD.",
-    "THAMESDOWN RECYCLING LIMITED",
-    "HAULAWAY LIMITED",
-    "ALEXANDER SCOTT OILS LTD",
-    "SB WASTE MANAGEMENT LIMITED",
-    "WOODBINE SKIPS LTD",
-    "VALGROVE LIMITED",
-    "NOLAN RECYCLING LIMITED",
-    "MERCIAN SKIP HIRE LIMITED",
-    "CLEWS RECYCLING LTD",
-    "TEWARD RECYCLING LIMITED",
-    "TAWMIX RECYCLING LIMITED",
-    "PREMIER SHREDDING LIMITED",
-    "GLASS RECYCLING (UK) LIMITED",
-    "GREENFIELD SKIPS LIMITED",
-    "RESTORE TECHNOLOGY LIMITED",
-    "BCMY LTD",
-    "M.W. WHITE LIMITED",
-    "ABBEY SKIP HIRE LTD",
-    "WASTE SOURCE LTD",
-    "JOHN STACEY LIMITED",
-    "PULSE ENVIRONMENTAL LIMITED",
-    "OVENDEN EARTHMOVING CO LTD",
-    "LOWMAC LTD",
-    "HOPKINS RECYCLING LIMITED",
-    "WILLIAM BEECH SKIP HIRE LTD",
-    "GEORGE PARISH & SONS LIMITED",
-    "LOCKHAMS RECYCLING LIMITED",
-    "M G H SCOTLAND LIMITED",
-    "WM. RUSSELL & SONS LIMITED",
-    "RECOLIGHT LIMITED",
-    "JWS WASTE & RECYCLING SERVICES LIMITED",
-    "LUCY LIMITED",
-    "J. GORDON WILLIAMSON LIMITED",
-    "A & J MOORE (METAL RECYCLING) LTD",
-    "M MCKENZIE HOLDINGS LTD.",
-    "WM. M. BRIERS & SON (TAMWORTH) LIMITED",
-    "PLASTECOWOOD LIMITED",
-    "KEMP WASTE MANAGEMENT LIMITED",
-    "FORGE WASTE LIMITED",
-    "FUTURE INDUSTRIAL SERVICES LIMITED",
-    "THOMAS SKIP AND PLANT HIRE LTD",
-    "BUDGET SKIPS LIMITED",
-    "UNIMETALS RECYCLING (UK) LIMITED",
-    "GREENSURE ENVIRONMENTAL LIMITED",
-    "THE BRAEMAR CIVIC AMENITIES TRUST",
-    "CM SKIPS LIMITED",
-    "BELMONT TRADING UK LIMITED",
-    "ENVA BATTERY RECYCLING LIMITED",
-    "CITY CENTRE CONTAINERS LIMITED",
-    "K.M.R. SKIP HIRE LIMITED",
-    "PATERSONS SKIP HIRE LIMITED",
-    "CSH ENVIRONMENTAL LIMITED",
-    "CORPORATE MOBILE RECYCLING LIMITED",
-    "C R HALES LIMITED",
-    "H.L.THORNE & CO.LIMITED",
-    "BIFA LIMITED",
-    "REGENCY OILS (WALES) LIMITED",
-    "HIRE A SKIP",
-    "WASTE ONLINE LTD",
-    "CORY RIVERSIDE ENERGY FINANCE LIMITED",
-    "COPE LTD.",
-    "AGGREGATE RECYCLING (UK) LIMITED",
-    "COLLECTFREE LTD",
-    "TEAM RECYCLING LIMITED",
-    "JONES WASTE SERVICES LIMITED",
-    "PREMIER GROUP RECYCLING LIMITED",
-    "PMK RECYCLING LIMITED",
-    "R J HARRIS CONTRACTS LIMITED",
-    "SMITHS LIMITED",
-    "ARROW LIMITED",
-    "C.L. PROSSER & CO. LIMITED",
-    "NICHOLLS LIMITED",
-    "ELLGIA RECYCLING LTD",
-    "NO. 1 SKIP HIRE LIMITED",
-    "RAPID SKIPS LTD",
-    "RTS WASTE MANAGEMENT LIMITED",
-    "P B DONOGHUE (WASTE MANAGEMENT) LIMITED",
-    "WASTEOLOGY LIMITED",
-    "FRANK BARNES (DARWEN) LIMITED",
-    "HERTSMERE BOROUGH FUNERAL & MEMORIAL SERVICES LIMITED",
-    "TEESIDE CAMPER VAN HIRE LTD",
-    "AXE SKIP HIRE LIMITED",
-    "GREENACRE COMPOSTING ENTERPRISES LTD",
-    "GLOBAL RENEWABLES LTD",
-    "SLICKER RECYCLING LIMITED",
-    "SHORE RECYCLING LIMITED",
-    "KILMARNOCK LIMITED",
-    "JOHN BROOKE (TIMBER TREATMENTS) LIMITED",
-    "REALLIANCE ECONOMY COMMUNITY INTEREST COMPANY",
-    "MCKENZIES (NI).LIMITED",
-    "CLEARAWAY RECYCLING LIMITED",
-    "SWM STEUER- UND WIRTSCHAFTSBERATUNGSGESELLSCHAFT MBH LIMITED",
-    "AHERN RUBBISH MOVEMENTS LTD",
-    "BLACKBURN SKIPS LIMITED",
-    "ADLER LIMITED",
-    "QUICK SKIP HIRE LIMITED",
-    "COLLARD GROUP LIMITED",
-    "HOPKINSON WASTE HOLDINGS LTD",
-    "GO 4 GREENER WASTE MANAGEMENT LIMITED",
-    "OCEALA LIMITED",
-    "PREMIER WASTE RECYCLING LIMITED",
-    "GO GREENER LIMITED",
-    "NORMAN WENN LTD",
-    "RETFORD WASTE LIMITED",
-    "WHEELDON BROTHERS LIMITED",
-    "WEEE SOLUTIONS LIMITED",
-    "WASTE KING RECYCLING LTD",
-    "CHANGE WASTE RECYCLING LIMITED",
-    "BASINGSTOKE SKIP HIRE & SOUTHERN WASTE MANAGEMENT LIMITED",
-    "ECOBAT RESOURCES UK LIMITED",
-    "PERDUE RECYCLING LTD",
-    "A39 SKIP HIRE LIMITED",
-    "WIDDINGTON RECYCLING LTD",
-    "JLA RECYCLING LIMITED",
-    "RECYPLAS LIMITED",
-    "GREATER LONDON WASTE DISPOSAL LIMITED",
-    "SOLOWASTE LTD",
-    "SCOTT BROS. LIMITED",
-    "TRADEBE SOLVENT RECYCLING LIMITED",
-    "BREWSTERS LIMITED",
-    "RECYCLING UK LIMITED",
-    "C. SOAR & SONS HOLDINGS LIMITED",
-    "HARPERS LIMITED",
-    "HILLS WASTE LIMITED",
-    "T.P. SKIP HIRE LIMITED",
-    "CLICK A SKIP NATIONWIDE LIMITED",
-    "ATLANTIC RECYCLING LIMITED",
-    "CIRCLE WASTE LTD",
-    "CHESHIRE WASTE SKIP HIRE LIMITED",
-    "PURE CLEAN WASTE SOLUTIONS LTD.",
-    "NATURAL WORLD PRODUCTS LIMITED",
-    "ASH SKIP HIRE LIMITED",
-    "TOTAL RECYCLING (SCOTLAND) LIMITED",
-    "MAYGLOTHLING LIMITED",
-    "LONDON SKIP HIRE LIMITED",
-    "BATESY SKIP HIRE LIMITED",
-    "ALUTRADE LIMITED",
-    "EIS WASTE SERVICES LIMITED",
-    "SITE CLEAR SOLUTIONS LTD",
-    "FRESCO ENVIRONMENTAL LTD",
-    "WASTECARE LIMITED",
-    "BIFFA WASTE MANAGEMENT LIMITED",
-    "PATERSONS WASTE MANAGEMENT LIMITED",
-    "ASHWORTH SKIPS LIMITED",
-    "AWS RECYCLING LTD",
-    "JJC HIRE LIMITED",
-    "ANSA ENVIRONMENTAL SERVICES LIMITED",
-    "MORTON SPIERT FARM LIMITED",
-    "OLDHAM BROS LTD.",
-    "NORTHAMPTONSHIRE COUNTY ASSOCIATION OF LOCAL COUNCILS LIMITED",
-    "RHAYADER SKIP HIRE LTD",
-    "NWH WASTE SERVICES (MIDDLETON) LIMITED",
-    "ABSOLUTE IT ASSET DISPOSALS LIMITED",
-    "NEWPORT RECYCLING LIMITED",
-    "TD AFRICA DISTRIBUTIONS UK LIMITED",
-    "WOLVERHAMPTON SKIP HIRE LIMITED",
-    "EAST ANGLIAN RESOURCES LIMITED",
-    "A.R. RICHARDS LIMITED",
-    "A.D.S. RECYCLING LIMITED",
-    "CLEANSING SERVICE (SOUTHERN COUNTIES) LIMITED",
-    "QUICKSKIP HEREFORD LIMITED",
-    "ALAN'S SKIP HIRE LIMITED",
-    "NICK FERRIS SKIP HIRE LIMITED",
-    "WELLINGTON WASTE SKIPS LIMITED",
-    "ALAN KINGSBURY LIMITED",
-    "BELFORD BROS SKIP HIRE LIMITED",
-    "ANYJUNK LIMITED",
-    "HUMPHREYS WASTE RECYCLING LTD",
-    "BIFFA LEICESTER LIMITED",
-    "CHEMVIRON CARBON LIMITED",
-    "I T WILLIAMS COMPANY LIMITED",
-    "RECYCLED MATERIAL SUPPLIES LIMITED",
-    "PLAS SOLUTIONS LTD",
-    "RIVER RIDGE RECYCLING LIMITED",
-    "FORWARD WASTE MANAGEMENT LIMITED",
-    "PRESTON PLASTICS LIMITED",
-    "GAMBLE PLANT (NORFOLK) LIMITED",
-    "PLASTIC ENERGY LIMITED",
-    "KCM WASTE MANAGEMENT LIMITED",
-    "AVON MATERIAL SUPPLIES LIMITED",
-    "CASTLE ENVIRONMENTAL LIMITED",
-    "POTTER GROUP LTD",
-    "MIDLAND SKIP HIRE LIMITED",
-    "URM AUDIO LIMITED",
-    "KRYSTELINE TECHNOLOGIES LIMITED",
-    "PACKCARE LIMITED",
-    "CHLOROS ENVIRONMENTAL LTD",
-    "SHREDALL LTD",
-    "SHIELDS ENVIRONMENTAL LIMITED",
-    "EDMUND PROCTOR LIMITED",
-    "WESTCOUNTRY SKIP HIRE LTD",
-    "HEH ENTERPRISES LIMITED",
-    "CLEANSING SERVICE GROUP LIMITED",
-    "AIR CONTAINERS (R & D) LIMITED",
-    "MACBACKPACKERS LIMITED",
-    "PSH ENVIRONMENTAL LTD.",
-    "CUMBRIA RECYCLING LIMITED",
-    "BLACKPOLE RECYCLING LIMITED",
-    "ABACUS LIMITED",
-    "SUN SKIPS LTD",
-    "PACKAGING REUSE & DISPOSAL SERVICES LTD",
-    "RECYCLE SOUTHERN LIMITED",
-    "BRADWELL SKIP SERVICES LIMITED",
-    "S.I.S PLASTIC REGRIND SUPPLIES LTD",
-    "B C SKIPS LIMITED",
-    "WYCOMBE RECYCLING LIMITED",
-    "CLINICAL VIROLOGY NETWORK",
-    "L.A.S. RECYCLING LIMITED",
-    "OLUS BIOMASS LIMITED",
-    "CLARITY ENVIRONMENTAL LIMITED",
-    "MARTLANDS WASTE SOLUTIONS LTD",
-    "SHRED-IT LIMITED",
-    "QUICK SKIPS LIMITED",
-    "ANGLIAN WASTE RECYCLING GROUP LIMITED",
-    "THOMAS BROS LIMITED",
-    "SHORTS GROUP LIMITED",
-    "SPACE RUBBISH LIMITED",
-    "C. FULLARD (METALS) LIMITED",
-    "BIO COLLECTORS LIMITED",
-    "STEPHEN DALTON SKIP HIRES LIMITED",
-    "RECYCLED PACKAGING LTD.",
-    "SOLWAY RECYCLING LIMITED",
-    "CENTRO WASTE LIMITED",
-    "WYE VALLEY SKIPS LIMITED",
-    "MAXI SKIPS LIMITED",
-    "CZ WASTE TRANSFER STATION LTD",
-    "99P RECYCLING LIMITED",
-    "UNISAN LIMITED",
-    "ROYDON BOTTLE RECYCLING LIMITED",
-    "GREEN BOX ASSETS LIMITED",
-    "G D GOLDING SKIP HIRE LIMITED",
-    "CITY CENTRE COMMERCIALS WASTE LIMITED",
-    "JCK KARATE LIMITED",
-    "QUICK WASTE LIMITED",
-    "ENVIRONMENTAL WASTE CONTROLS (SOUTH LONDON COMMUNITY RECYCLING SERVICES) LTD",
-    "SECURE DATA RECYCLING LTD",
-    "FLANNIGAN & BORDER SKIP HIRE AREA 4 LTD",
-    "GRINSELLS SKIP HIRE LIMITED",
-    "MY GROUP HULL LIMITED",
-    "WSR RECYCLING LIMITED",
-    "GO GREEN LIMITED",
-    "WISER RECYCLING LIMITED",
-    "CABLESHEER PROJECTS LTD",
-    "WILLSHEES WASTE & RECYCLING LIMITED",
-    "PHOENIX OILS LTD",
-    "SHIRLEY'S RECYCLING LIMITED",
-    "MYERS SKIP HIRE LTD",
-    "ZEST RECYCLE LTD",
-    "ACTION GLASS (U.K.) LIMITED",
-    "T J WASTE & RECYCLING LIMITED",
-    "LARNER RECYCLING LTD",
-    "C S RECYCLING LIMITED",
-    "SUEZ RECYCLING AND RECOVERY HOLDINGS UK LTD",
-    "WASTEGE WASTE MANAGEMENT LIMITED",
-    "SYNERGY LIMITED",
-    "B & J METALS (SKIP HIRE) LIMITED",
-    "ROBA METALS LIMITED",
-    "GXO LOGISTICS UK LIMITED",
-    "EDWARDS WASTE PAPER LIMITED",
-    "RAINBOW PLASTICS LTD",
-    "LAND POLYMERS LIMITED",
-    "SINKFALL FARM LIMITED",
-    "URM (UK) LIMITED",
-    "HAMMOND SKIP HIRE LIMITED",
-    "PARKERS SKIP HIRE (DONCASTER) LIMITED",
-    "CMI WASTE MANAGEMENT LIMITED",
-    "BELFAST CITY RECYCLING LIMITED",
-    "ACD SKIPS LIMITED",
-    "GSH WASTE RECYCLING LTD",
-    "MCQUILLAN (SKIP HIRE) LIMITED",
-    "ALLIANCE ENVIRONMENTAL SERVICES LTD",
-    "WIRRAL FIBRES AND PLASTICS LIMITED",
-    "J & O ENTERTAINMENT LIMITED",
-    "BRYAN HIRST LIMITED",
-    "A & C WASTE MANAGEMENT AND RECYCLING LTD",
-    "CITY FUEL SERVICES LIMITED",
-    "DS SMITH RECYCLING UK LIMITED",
-    "PETE BOTT SKIPS LIMITED",
-    "MICK'S SKIPS LIMITED",
-    "GO WASTE (UK) LTD",
-    "3R TECHNOLOGY UK LIMITED",
-    "REFOOD LIMITED",
-    "ISL STRATEGIC LEADERSHIP LIMITED",
-    "CHERWELL DISTRICT HOLDINGS LTD",
-    "RIVERRIDGE LTD",
-    "MAGNUM UK ENVIRONMENTAL LTD",
-    "GREENAGENDA LIMITED",
-    "ACR ENVIRONMENTAL WALES LIMITED",
-    "GAP GROUP LIMITED",
-    "WASTENOT MANAGEMENT LIMITED",
-    "CLEAN TECH U.K. LIMITED",
-    "ENVIRONMENTAL CONTRACTS LIMITED",
-    "MAINSWAY LIMITED",
-    "P J SKIPS LIMITED",
-    "VERIS SUSTAINABILITY GROUP LIMITED",
-    "ACE SKIPS LTD",
-    "WASTESAVERS LIMITED",
-    "ROSELAND HEATHFIELD LTD",
-    "AMMANFORD RECYCLING LIMITED",
-    "BETASKIPS LIMITED",
-    "AKS SKIP HIRE SERVICES LIMITED",
-    "CANVEY SKIP HIRE LIMITED",
-    "NEW WEST GYPSUM RECYCLING (UK) LIMITED",
-    "JONES SKIP HIRE (WOLVERHAMPTON) LIMITED",
-    "J BYNE HAULAGE LIMITED",
-    "DEADMAN CONFIDENTIAL LTD",
-    "SOUTHPORT SKIP HIRE LTD",
-    "NICK BROOKES RECYCLING LIMITED",
-    "WADES OF WEDNESBURY LIMITED",
-    "M60 SKIP HIRE LIMITED",
-    "R. PLEVIN & SONS LIMITED",
-    "HADLEY'S LIMITED",
-    "TBD MORRIS RECYCLING LIMITED",
-    "J DICKINSON LTD",
-    "WILSTEAD HAULAGE LIMITED",
-    "RECYCLING LIVES LIMITED",
-    "MATRIX AGGREGATES LIMITED",
-    "DERWENT RECYCLING SERVICES LIMITED",
-    "PARLE SKIP HIRE LIMITED",
-    "ENVA ENGLAND SPECIALIST WASTE LIMITED",
-    "ALLENS WASTE DISPOSAL LIMITED",
-    "ORANGE SKIP LIMITED",
-    "B A SHORTHOUSE LIMITED",
-    "BALDWINS CRANE HIRE LIMITED",
-    "SIMS LIFECYCLE SERVICES LIMITED",
-    "SHARP SKIPS LIMITED",
-    "ORMSKIRK SKIP RECYCLING LIMITED",
-    "MONOWORLD LIMITED",
-    "JRL ENVIRONMENTAL LIMITED",
-    "GREEN SKIP HIRE LTD",
-    "RAINBOW SKIPS AND RECYCLING LIMITED",
-    "STREET FUEL LIMITED",
-    "KEALEY LTD",
-    "ADVANCED WASTE SOLUTIONS LTD",
-    "DJ & JD DEVELOPMENTS LIMITED",
-    "VISY RECYCLING EUROPE LIMITED",
-    "YORWASTE LIMITED",
-    "FOREMAN RECYCLING LIMITED",
-    "RECOUP LIMITED",
-    "SHEERNESS RECYCLING LIMITED",
-    "PLASTIC TECHNOLOGY SERVICES LIMITED",
-    "BILL DYSON SKIP HIRE & WASTE MANAGEMENT LIMITED",
-    "SUNSHINE SKIPS LTD",
-    "HOLYWELL RECYCLING LIMITED",
-    "ASSOCIATION OF HACKNEY CARRIAGE DRIVERS OF THE CITY OF EDINBURGH CIC",
-    "SWIFT SKIPS LIMITED",
-    "EAST COAST WASTE LIMITED",
-    "A&G SHANKS LIMITED",
-    "CWM RHONDDA WASTE MANAGEMENT SERVICES LTD",
-    "INUTEC LIMITED",
-    "MASTERMELT REFINING SERVICES LIMITED",
-    "CRES LTD",
-    "SMARTSITE LIMITED",
-    "BURTON SKIP HIRE LIMITED",
-    "NATIONAL RESOURCE CONSORTIUM LTD",
-    "ECOPLAS LIMITED",
-    "GOWING & HUNT  LIMITED",
-    "MERCURY RECYCLING LIMITED",
-    "CENTRIFORCE PRODUCTS LIMITED",
-    "RICHARD MURDOCH DIGGER HIRE LTD",
-    "SAMS  RECYCLING LIMITED",
-    "2 G ENVIRONMENTAL LTD",
-    "VEKA RECYCLING LIMITED",
-    "KILLOUGHERY LIMITED",
-    "AB WASTE DISPOSAL LIMITED",
-    "TIDYSITE SKIP SERVICES LIMITED",
-    "J M WASTE MANAGEMENT LIMITED",
-    "HURLEYS WASTE MANAGEMENT LIMITED",
-    "DYFED ACCOUNTING SERVICES LTD",
-    "SMITH'S (GLOUCESTER) LIMITED",
-    "BRISTOL CITY TRANSFER LTD",
-    "POWYS ENVIRONMENTAL LIMITED",
-    "E NICHOLSON LIMITED",
-    "THE ACTIVE COLLECTION BUREAU LIMITED",
-    "KENNY WASTE MANAGEMENT LTD.",
-    "CTR (EUROPE) LIMITED",
-    "NEW TOWN WASTE SOLUTIONS LIMITED",
-    "WETHERBY SKIP SERVICES LIMITED",
-    "GLASS TECH RECYCLING LTD",
-    "BAILEYS SKIP HIRE AND RECYCLING LTD",
-    "PURE CLEAN ENVIRONMENTAL LIMITED",
-    "AO RECYCLING LIMITED",
-    "DTS TRADING LIMITED",
-    "MONSTER SKIPS LIMITED",
-    "D C (SKIPS) LIMITED",
-    "FRESH START WASTE SERVICES LTD",
-    "EUROKEY RECYCLING LIMITED",
-    "SITESERV RECYCLING (SW) LIMITED",
-    "GARY LODGE AB SKIPS LIMITED",
-    "RABBIT WASTE MANAGEMENT LIMITED",
-    "HAZEL LIMITED",
-    "THOMAS WASTE MANAGEMENT LIMITED",
-    "S.E.D. SERVICES LIMITED",
-    "KING BROTHERS LIMITED",
-    "ITP - INTERNATIONAL TRAVEL PARTNERSHIP LIMITED",
-    "ENOVERT LIMITED",
-    "MCCARTHY MARLAND LIMITED",
-    "ALDERMASTON RECYCLING LIMITED",
-    "RECYCLE IT 4 U LIMITED",
-    "SHREDPRO LIMITED",
-    "GIS LIFT TURN MOVE LTD",
-    "AMGEN LIMITED",
-    "RECYCLED PLASTICS (UK) LIMITED",
-    "BISHOP'S SKIP HIRE LIMITED",
-    "TB WASTE MANAGEMENT & SKIP HIRE LTD",
-    "SMITH RECYCLING HOLDINGS LIMITED",
-    "TAYLORS INDUSTRIAL SERVICES LIMITED",
-    "RECYCLING YOUR IT LTD",
-    "TBS RECYCLING CENTER WALES LTD",
-    "A. BATES SKIP HIRE LIMITED",
-    "TOULOUSE PLANT HIRE LIMITED",
-    "JESUS DIVINE SHINING LIGHT INTERNATIONAL GROWTH ORGANISATION MINISTRY LIMITED",
-    "JAYPLAS LIMITED",
-    "GNG WASTE MANAGEMENT LTD.",
-    "UNIVERSAL TANKER GROUP LIMITED",
-    "WOOD WASTE RECYCLING LIMITED",
-    "GREENACRES SKIP HIRE LTD",
-    "ADC PROPERTY SOLUTIONS LTD",
-    "BRISTOL RECLAIMED TIMBER & FURNITURE LTD",
-    "CASTLEFORD LIMITED",
-    "STANTON RECYCLING LIMITED",
-    "NORTH WEST CONTAINERS LIMITED",
-    "BRIDGE CLOSE (LENWADE) LIMITED",
-    "SHAWS WASTE RECYCLING LIMITED",
-    "SUEZ UK ENVIRONMENT LTD",
-    "CHELSON MEADOW COMMUNITY SOLAR LIMITED",
-    "EVOLUTION WASTE MANAGEMENT LIMITED",
-    "PENDRAGON WASTE & SKIP HIRE LIMITED",
-    "SWRNEWSTAR LIMITED",
-    "ALBRIGHT TRANSFER STATION LIMITED",
-    "WASTE MANAGEMENT SOLUTIONS LIMITED",
-    "ETM ELECTRICAL TEST MIDLANDS LTD",
-    "PREMIER WASTE MANAGEMENT LIMITED",
-    "POTTERS-BALLOTINI LIMITED",
-    "HAWKINS LIMITED",
-    "LONDON ENERGY LTD",
-    "SERCO LIMITED",
-    "ENVIRONCOM ENGLAND LIMITED",
-    "LIFECYCLE OILS LTD",
-    "PULP FRICTION LTD",
-    "CIRCOM LIMITED",
-    "MACNABB WASTE (BELFAST) LTD",
-    "O'DONOVAN (WASTE DISPOSAL) LIMITED",
-    "BEDALE SKIP HIRE LIMITED",
-    "COLLARD ENVIRONMENTAL LIMITED",
-    "C.F. BOOTH (DONCASTER) LIMITED",
-    "MAC SKIP HIRE LIMITED",
-    "1 ACE SKIPS LIMITED",
-    "RAIKES LANE LIMITED",
-    "NEW ERA METAL RECYCLING LIMITED",
-    "SITA WORLD TRAVEL (INDIA) PRIVATE LIMITED",
-    "NEWLINCS DEVELOPMENT LIMITED",
-    "REGROUP (RECLAIM) LIMITED",
-    "RE3 LIMITED",
-    "WICKS LIMITED",
-    "GEN 2 CARBON LIMITED",
-    "BEXLEYHEATH SKIPS LIMITED",
-    "ECOLAMP RECYCLING LIMITED",
-    "BROWNS WASTE MANAGEMENT AND RECYCLING LIMITED",
-    "DERBY CRUSHING AND SCREENING LTD",
-    "MAGFERN RECYCLING LIMITED",
-    "WILTSHIRE PLASTICS (UK) LIMITED",
-    "HUGHES WASTE LIMITED",
-    "FLEET SKIPS LTD",
-    "ADAM POTTS LTD",
-    "ENVIROCRAFT LIMITED",
-    "VIRIDOR WASTE (GREATER MANCHESTER) LIMITED",
-    "JH HAULAGE LIMITED",
-    "CARTWRIGHTS WASTE DISPOSAL SERVICES LIMITED",
-    "SHARP POLYMER SOLUTIONS LIMITED",
-    "2 RECYCLING LIMITED",
-    "THE MUNICIPAL ENERGY COMPANY LIMITED",
-    "SKIP HIRE UK LIMITED",
-    "ABC WASTE MANAGEMENT LTD.",
-    "CIRCULAR POLYMERS LIMITED",
-    "DRAGON RECYCLING SOLUTIONS LTD",
-    "DAY GROUP LIMITED",
-    "ROYDON GRANULATION LIMITED",
-    "HODGES RECYCLING LTD",
-    "HILLS GROUP ENTERPRISES LIMITED",
-    "TIER 1 LIMITED",
-    "D & P WASTE PAPER & PLASTIC RECYCLING LIMITED",
-    "A RIDDEL AND SONS SCRAP METAL AND SKIP HIRE LIMITED",
-    "POLYWASTE UK LTD",
-    "JUST SKIPS LIMITED",
-    "GREEN PLANET LTD",
-    "A. BRUNTON WASTE MANAGEMENT LIMITED",
-    "RESOURCE FOOD LTD",
-    "FORCESHIFT (CONTRACTING) LIMITED",
-    "ANDUSIA RECOVERED FUELS LTD",
-    "LONDON MINING ASSOCIATES LIMITED",
-    "EFR SKIPS LTD",
-    "CHERRY HILL WASTE LIMITED",
-    "ANDY CAMPBELL RECYCLING LIMITED",
-    "SHRED BANK LTD",
-    "BEEFY'S SKIPS LTD",
-    "MAX RECYCLE (UK) LIMITED",
-    "MTS CLEANSING SERVICES LIMITED",
-    "PORTERS METALS & SKIP HIRE LIMITED",
-    "LKM RECYCLING LIMITED",
-    "WHEELABRATOR TECHNOLOGIES (UK) LIMITED",
-    "ECO SUSTAINABLE SOLUTIONS LIMITED",
-    "AIM TO RECYCLE LIMITED",
-    "PEARCE RECYCLING COMPANY LIMITED",
-    "ANDREW COOK (CONTAINERS) LIMITED",
-    "FAST SKIPS LIMITED",
-    "LABWASTE LTD",
-    "GREEN IT DISPOSAL LIMITED",
-    "KIRKBY SKIPS LIMITED",
-    "STREET SCENE FURNITURE PAINTING LIMITED",
-    "ISLAND WASTE LOGISTICS LIMITED",
-    "WHITE RECLAMATION LTD",
-    "CHEADLE SKIP HIRE LIMITED",
-    "PARK HALL TIMBER PRODUCTS LIMITED",
-    "MCKINSTRY SKIP HIRE LIMITED",
-    "ALLEN'S SKIP HIRE LIMITED",
-    "PH HULL & SONS LIMITED",
-    "CYMRU LAN CYFYNGEDIG",
-    "MOBIUS LIMITED",
-    "City Blue Ltd",
-    "Clean Complete",
-    "Simon David Cleaning Services Ltd",
-    "A6 Car Care Ltd",
-    "Pelican Red Ltd",
-    "Platinum House Keeping Ltd",
-    "Total Solutions",
-    "Enterprise Suppport Services",
-    "Exclusive Contract Services",
-    "Timircan Cleaning Services Ltd",
-    "Broadway Brass Ltd",
-    "I S A Support Services",
-    "Scrubbers Supreme Cleaning Ltd",
-    "Tgc Group Services Ltd",
-    "Ideal Services Group",
-    "On-Site Fm Ltd",
-    "Globe Integrated Solutions Ltd",
-    "Arrow Cleaning Services Ltd",
-    "A D I Facilities Management Ltd",
-    "Ryan's Cleaning Event Specialists",
-    "Diamond Facilities Support Ltd",
-    "F M S Integrated Building Services Ltd",
-    "Buckinghams Cleaning Solutions Ltd",
-    "Premier Support Services",
-    "Ulyse and the Crew Ltd",
-    "O K Kleening Ltd",
-    "H & H Cleaning Services Ltd",
-    "Dovetail Group UK",
-    "The Statutory Support Services Group",
-    "Genies Angels",
-    "Precise Managed Services",
-    "Maid Marions Ltd",
-    "Bath Cleaning Services",
-    "Cw Auto-Wash & Detailing Supplies Ltd",
-    "Cleaning Enterprise",
-    "Traffik",
-    "Bryan Loveday Services Ltd",
-    "Heath and Wiltshire Ltd",
-    "Quest Cleaning Services Ltd",
-    "Milly Molly Mandy Domestic Cleaning Services Ltd",
-    "The Fine Cleaning Company (Western) Ltd",
-    "Just Cleaning",
-    "Revive Services",
-    "Simply Cleaned Ltd",
-    "Merry Maids",
-    "Fast Limpa",
-    "Universal Cleaning Ltd",
-    "Spotless Water",
-    "All-Clean Environmental Services Ltd",
-    "Home Minders",
-    "1st Stop Cleaning",
-    "Kora Cleaning Services Ltd",
-    "The Cleaning Crew Ltd",
-    "Burrows and Walker Ltd",
-    "Fast Class Cleaning Ltd",
-    "Vampgb Ltd",
-    "Happy Hand Car Wash Ltd",
-    "Wessex Maintenance Ltd",
-    "Dorset Commercial Cleaning Ltd",
-    "Daisy Chain Commercial Cleaning Ltd",
-    "Nova Contract Cleaners",
-    "Groves Window Cleaning Ltd",
-    "VRS - Vehicle Rejuvenation Specialists",
-    "3g Contract Cleaning Ltd",
-    "Deep Serv Group Ltd",
-    "Cronin's Cleaning Services Ltd",
-    "More Than Cleaning Ltd",
-    "Angels Cleaning Services (Worthing) Ltd",
-    "R H Smith Ltd",
-    "Avanti Cleaning Services Ltd",
-    "Pristine and Squeaky Clean Ltd",
-    "Paul Ryan (Uk) Ltd",
-    "Marina Services Ltd",
-    "Olive Cleaning Ltd",
-    "GB Ltd",
-    "Angel Cleaning Services",
-    "Five Star Cleaning Services",
-    "Denma Cleaning Services Ltd",
-    "Pure Cleaning",
-    "Detailed Ltd",
-    "Green Mop Ltd",
-    "Nviro",
-    "O'Neills of Brighton",
-    "Ladies That Do",
-    "High Class-Cleaning Ltd",
-    "The Whale Car Wash Ltd",
-    "Uniclean",
-    "Nap Office Services Ltd",
-    "Fort Products Ltd",
-    "Capital Computer Care",
-    "Greenshine Services Ltd",
-    "Dust Free Cleaning Co Ltd",
-    "Lewis Duct Clean Ltd",
-    "Gce Cleaning Services Ltd",
-    "Decon Response",
-    "Mds (Hygiene Support) Ltd",
-    "Act Cleaning Services Ltd",
-    "Alexis Cleaning Services Ltd",
-    "Marben & Co",
-    "Chatfield Cleaning Ltd",
-    "Janes Cleaning",
-    "Crystal Clean (Uk) Ltd",
-    "K M C Cleaning & Support Services Ltd",
-    "Perfect Cleaning Services (Cambridge) Ltd",
-    "Click Clean Cleaning Ltd",
-    "24 Seven Companies",
-    "Quality Care",
-    "A V M Services",
-    "Chs Cleaning Hygiene Safety Ltd",
-    "N H S Property Services",
-    "Quality Care Cleaning",
-    "T R Cleaning Ltd",
-    "Dolphin Cleaning Management Ltd",
-    "Uptown Cleaning",
-    "Care Cleaning Services Ltd",
-    "Electrical Audit Repair Test & Hire Co Ltd",
-    "Trojan Commercial Cleaning",
-    "Newclean",
-    "Advanced Cleaning Services",
-    "Magic Wand Property Cleaning",
-    "Starkey Cleaning Company Ltd",
-    "Century 21 Services",
-    "Berkeley Cleaning Services",
-    "El Sparkle Ltd",
-    "Twelve Hands Ltd",
-    "Business Cleaning Services",
-    "Bundle Services Ltd",
-    "Campbell & Law Building Services Ltd",
-    "Peartree Cleaning Services",
-    "Supremeklene Ltd",
-    "Capital Cleaning Maintenance Services Ltd",
-    "Always Spring Clean Ltd",
-    "Bee Services",
-    "Token Cleaning Services Ltd",
-    "Alba Victoria Cleaning Services",
-    "T N T Cleaning",
-    "Euroloos Ltd",
-    "Classic Cleaning Services",
-    "High Definition Cleaning Ltd",
-    "Metro Cleaning",
-    "Source F M",
-    "Plusnet",
-    "Doc Cleaning Ltd",
-    "Hallmark Cleaning Services Essex Ltd",
-    "Driscoll Cleaning",
-    "Love Clean Homes Ltd",
-    "Priority Support Services Ltd",
-    "Property Support Services UK Ltd",
-    "Msg Contracts Ltd",
-    "Cartel (London) Ltd",
-    "Ambassador Services Ltd",
-    "Abbycon Ltd",
-    "Squeeky Clean Home & Office Cleaning Ltd",
-    "Elite Commercial Ltd",
-    "Molly Maid",
-    "C C S Jeweltone Ltd",
-    "The Gleaming Cleaning Co Ltd",
-    "Girlfridays (Sudbury) Ltd",
-    "G L C Cleaning Ltd",
-    "A&E Clean Ltd",
-    "Crystal Clear Hygiene Ltd",
-    "J & J Contract Cleaning",
-    "Moores Commercial Cleaning Ltd",
-    "Kleantek Services Ltd",
-    "Kosheen Contract Cleaning Ltd",
-    "P H Contract Services Ltd",
-    "S G C Facilities Management",
-    "Cleanrite",
-    "Wilcomatic Wash Systems Ltd",
-    "Nu-look Ltd",
-    "Gateway Environmental Services Ltd",
-    "All Cleaning Ltd",
-    "F M Hand Carwash Ltd",
-    "Acorn Environmental",
-    "Opus Cleaning Ltd",
-    "The A Team Clean & Maintenance Ltd",
-    "F M Direct",
-    "A&R Brilliant Cleaning Ltd",
-    "Concord Services",
-    "Total Cleaning South Ltd",
-    "Channel Facilities Management Ltd",
-    "Dominikaannacleaners Ltd",
-    "London Road Shiny Hand Car Wash Ltd",
-    "J & K Kleen Ltd",
-    "Euro Clean Contractors Ltd",
-    "J&R Detailing Ltd",
-    "Range Cleaning Services Ltd",
-    "Ip Cleaning (Uk) Ltd",
-    "Best Time Cleaning Services Ltd",
-    "Filtasonix",
-    "L Osei Ltd",
-    "F M S UK Group",
-    "2 Clean Plus Ltd",
-    "C & P Ltd",
-    "Goldcrest Cleaning Ltd",
-    "Pro-Smart Window Cleaning Ltd",
-    "Assured",
-    "Hathaway Cleaning Services",
-    "City Cleaning Supplies Ltd",
-    "Car Wash City Ltd",
-    "New Vision1 Ltd",
-    "Jukins Commercial Enterprise Ltd",
-    "Kcls Ltd",
-    "Servicemaster",
-    "Airwaves Facilities Management Ltd",
-    "Caldan Solutions Ltd",
-    "Ab Cleaning Ltd",
-    "Kenilworth Carpet Cleaning Ltd",
-    "Exterius Facilities Management Ltd",
-    "A G M T/A Abel Group Midlands Ltd",
-    "A M D Environmental",
-    "Fab Cleaning Management Ltd",
-    "Cleaners Crayford",
-    "Juliked Ltd",
-    "J Lord's Cleaning Services Ltd",
-    "Prestige Car Valeting",
-    "S J A Group",
-    "P & L Restoration Services Ltd",
-    "Equispec Ltd",
-    "Delcom World Services Ltd",
-    "Hi-spec Services",
-    "Jones F M LLP",
-    "Lodge Cleaning Services Ltd",
-    "Kent Loos",
-    "Cradle Tech Ltd",
-    "L M N Cleaning Services",
-    "Barnehurst Carpet Cleaners",
-    "Clean for Good Ltd",
-    "Ventanas UK Cleaning Services Ltd",
-    "First Choice Cleaning & Maintenance Ltd",
-    "Clean & I Ltd",
-    "Cleanless Ltd",
-    "Mira Cleaning Ltd",
-    "Production Seven Eighth Ltd",
-    "Wharfside Car Valet Car Service",
-    "Canary Wharf Management Ltd",
-    "K C E F M Ltd",
-    "Cleaning Express",
-    "Guardian Group",
-    "Kite Contract Cleaning Ltd",
-    "Kemp Services Ltd",
-    "Paltan Services Ltd",
-    "Xtreme Professional Cleaning Ltd",
-    "Hy-Tech Contract Cleaning Services",
-    "B P Car Wash",
-    "T & T Cleaning Service Solution Ltd",
-    "The Knighton Group",
-    "R J Cleaners London",
-    "Crhermanas Services Ltd",
-    "Dr Rubbish Ltd",
-    "Bir Cleaning Ltd",
-    "Lombard Cleaning Services Ltd",
-    "S O S on the Spot Ltd",
-    "Spotless Facilities Management Ltd",
-    "S & J Cleaning",
-    "Square Mile Cleaning Ltd",
-    "Excellerate UK Services Ltd",
-    "Radiance Property Services Ltd",
-    "Go Green Cleaning Services London Ltd",
-    "Baltimore F M Ltd",
-    "Bidvest Noonan (Uk) Ltd",
-    "Integrated De-Icing Services UK Ltd",
-    "Lancaster Office Cleaning Co",
-    "Prudential Window Cleaning",
-    "Rex Cleaning and Maintenance Ltd",
-    "Julie May Ltd",
-    "B D Contract Cleaning Services",
-    "Regent Service Solutions Ltd",
-    "Atlantic Cleaning Services Ltd",
-    "Silver Mobile Car Valeting",
-    "K C Cleaning Services",
-    "Cleaner Direct UK Ltd",
-    "Tigre Services UK Ltd",
-    "C P S Cleaning Ltd",
-    "Home Hygiene (London) Ltd",
-    "Bc Cleaning Ltd",
-    "Clean Shield Professional Ltd",
-    "Envsafe Ltd",
-    "Greenthink Ltd",
-    "Elite Facilities Management Ltd",
-    "Core Facilities Group Ltd",
-    "Into Cleaning Ltd",
-    "Oasis Carwash Co",
-    "Kleen Shine",
-    "Lemon General Ltd",
-    "Big Green Cleaning Company Ltd",
-    "Simply Cleaning Ltd",
-    "Hi Lo Cleaning Ltd",
-    "Maids Cleaning Group Ltd",
-    "Dustbusters Ltd",
-    "HiLo Crystal Clear Ltd",
-    "Myclean Properties Ltd",
-    "J P N Cleaning",
-    "Point Cleaning Ltd",
-    "Cleaning Services Guildford",
-    "Glencross Contract Cleaners",
-    "K & D Complete Services Ltd",
-    "Affordable Pest Control",
-    "3 Cd Cleaning Ltd",
-    "Kcs Cleaning Solutions Ltd",
-    "Linear Home Improvements Ltd",
-    "Extreme Homecare Oven Cleaning Ltd",
-    "The Litmus Partnership",
-    "S C Johnson",
-    "Noonan Services Group UK Ltd",
-    "Admiral Cleaning Services",
-    "B A C Cleaning Services Ltd",
-    "H & S Drain Care Ltd",
-    "Tuga Support Services",
-    "B C S Services",
-    "Pool Magician Ltd",
-    "Professional Hand Car Wash",
-    "S C B Services",
-    "Lesley Anne Cleaning Services",
-    "Lesley Anne Ltd",
-    "Excalibur Cleaning Ltd",
-    "Browns Window Cleaning",
-    "Aok Commercial Cleaning Ltd",
-    "Barden F M",
-    "Farnham Office Cleaning Co Ltd",
-    "P J L Window Cleaning Services",
-    "Enhanced Skills Ltd",
-    "Arcadia Cleaning Services Ltd",
-    "Trinity Cleaning Services Ltd",
-    "The Window Cleaning Company",
-    "Regent Samsic",
-    "Cath Services Ltd",
-    "Tidyingup Services Ltd",
-    "Educational Facilities Management",
-    "Goclean1 Ltd",
-    "Lion Buildings Ltd",
-    "Temco Services",
-    "Bright Valeting Group Ltd",
-    "Calafornia Car Care",
-    "Corners Clean Ltd",
-    "Angel Cleaning and Property Maintenance Ltd",
-    "I H S S",
-    "A B M Technical Solutions",
-    "Abm Facility Services UK Ltd",
-    "Exclusive C & K Services Ltd",
-    "Modern Home Shield UK Ltd",
-    "Caring Cleaning Services",
-    "Car Wash (Edgware) Ltd",
-    "Fast Cleaners Harrow",
-    "Ultimate Care",
-    "Ryemead Commercial Group Ltd",
-    "Busy Homes",
-    "Jiewierlka Consultants",
-    "Antac Support Services Ltd",
-    "Sasse Facilities Management Ltd",
-    "Jmarie Ltd",
-    "Rider Property Services (Hw) Ltd",
-    "Momentum Facilities Management Ltd",
-    "Jaybex Ltd",
-    "Prestige Commercial Cleaning Ltd",
-    "Ever Brite Cleaning Services Ltd",
-    "Cleanforce Ltd",
-    "K C L Cleaning Services Ltd",
-    "Ashly Cleaner Ltd",
-    "Kensington Hand Car Wash Ltd",
-    "Dealership Cleaning Services Ltd",
-    "Aston Commercial Cleaning Ltd",
-    "Right Option Cleaning Ltd",
-    "The Callver Group Ltd",
-    "Cleanwell High Pressure Washers Ltd",
-    "Freshbins UK Ltd",
-    "Clean Team",
-    "Blygold (UK) Ltd",
-    "Otium Services & Facilities Ltd",
-    "Mundial Services Ltd",
-    "Power Cleaning Services",
-    "I O C Ltd",
-    "Jodt Services Ltd",
-    "Martin Saward",
-    "Greanleaf Services",
-    "K Burrett Cleaning Services Ltd",
-    "D&L Cleaning Service Ltd",
-    "Box Ltd",
-    "Sanderson Cleaning Service Ltd",
-    "Diamond View Cleaning Solutions Ltd",
-    "Rams Cleaning Ltd",
-    "Phelan Sheppard Cleaning Services Ltd",
-    "Stowmarket Car Wash & Auto Detail",
-    "Saxmundham Hand Car Wash",
-    "The Cleaning Company Suffolk Ltd",
-    "Sureclean Cleaning Services",
-    "Lynett Commercial",
-    "Lynett Commercial Facilities Ltd",
-    "Anglia Cleaning Ltd",
-    "Kedala Ltd",
-    "Willow Properties Thetford Ltd",
-    "Complete 24/7 Maintenance Ltd",
-    "E K B Cleaning Ipswich Ltd",
-    "A&T Optimus Ltd",
-    "Inside Out Auto Care",
-    "Fortay Ltd",
-    "Greenace Contract Cleaners",
-    "Shirley Shelley Contract Cleaners Ltd",
-    "Hampton Wick Car Wash",
-    "Alexander & Sons",
-    "Diamond Office Cleaning UK Ltd",
-    "I S S UK Ltd",
-    "Grays Executive Cleaning Ltd",
-    "Elmbridge Cleaning Solutions Ltd",
-    "Clean New Homes Ltd",
-    "Just Ask Estate Services",
-    "Nexgen UK 3 Ltd",
-    "Chrispy Clean",
-    "Interserve",
-    "City West Cleaning Specialists Ltd",
-    "Tompkins & May Partnership",
-    "Top Shine Ltd",
-    "G C S Facilities Management",
-    "Spotless Group Services Ltd",
-    "Rubynest Ltd",
-    "D & T Hand Car Wash",
-    "Eade Cleaning Company Ltd",
-    "Great Clean & Maintenance Ltd",
-    "L&V Hand Car Wash Ltd",
-    "J Hallam Cleaning Services Ltd",
-    "King's Window Cleaning",
-    "Emperor Cleaning Services Ltd",
-    "Revolution Support Services Ltd",
-    "1 Stop Hand Car Wash Ltd",
-    "G & S Services (E Mids) Community Interest Company",
-    "Vpj-Services Ltd",
-    "Sdm Cleaning Ltd",
-    "T & J Total Services Ltd",
-    "Precision Facilities Management",
-    "Hola Cleaning Company Ltd",
-    "Ace Cleaning Company",
-    "1st Choice 4 Cleaning Ltd",
-    "G3 Cleaning Services Ltd",
-    "Star Commercial & Domestic Cleaning Services Ltd",
-    "Waves Hand Car Wash Leicester Hamilton",
-    "Clean Easi",
-    "Solutions 2 (Contract Cleaning) Ltd",
-    "M C V Mobile Car Valeting",
-    "Max Cleaners & Maintenance Ltd",
-    "Service Master Ltd",
-    "C L B Cleanequip",
-    "All Nice and Clean Ltd",
-    "Unit Clean Ltd",
-    "Diamond Solutions",
-    "Ctdholding Ltd",
-    "Magfacilities Ltd",
-    "R C S Regions Cleaning Service",
-    "Elite Contract Cleaning Ltd",
-    "Serenity Cleaning Services Ltd",
-    "The Campa Company Ltd",
-    "Avalon Cleaning Systems",
-    "D M C Facilities Management Ltd",
-    "Blue Lemon Cleaning Services Ltd",
-    "Henderson F M Ltd",
-    "Kent Gurkha Co Ltd",
-    "Irg Ltd",
-    "Kentklean",
-    "Arvathson Holding Ltd",
-    "Steadfast Cleaning",
-    "Broomsticks Housekeeping Services Ltd",
-    "Key Enviro Solutions",
-    "North Kent Cleaning Service",
-    "C C S Kent Ltd",
-    "Jaguar Contract Cleaning Services Ltd",
-    "C&Sj Ltd",
-    "Minster Cleaning",
-    "Highway Cleaning Services Ltd",
-    "C L E A N Commercial Cleaning Services Ltd",
-    "S G T Bill's",
-    "The Office Cleaning People Ltd",
-    "M M Cleaning Services (Kent) Ltd",
-    "Tatry Group",
-    "Ynv Personal Recruitment Ltd",
-    "Supervision Assured Ltd",
-    "Commercial Cleaning Services",
-    "C S Cleaning",
-    "Bucks Cleaning Services Ltd",
-    "Support Maintenance Services Ltd",
-    "Dfva Cleaning Ltd",
-    "Rainbow Hand Car Wash",
-    "D Fleet Cleaning Services Ltd",
-    "Hertfordshire Cleaners Ltd",
-    "Prestige Valeting Services",
-    "Guardian Environmental Services Ltd",
-    "Target Maintenance GB Ltd",
-    "Roni Hand Carwash Ltd",
-    "Gleamclean",
-    "Fcs(Mk) Ltd",
-    "Facilities Company",
-    "P & A Maintenance Service Ltd",
-    "Sandersons Cleaning Services",
-    "A1 Facilities Services Ltd",
-    "Harmony House Services Ltd",
-    "Contrast Cleaning Services London Ltd",
-    "Doves Contract Cleaning Ltd",
-    "Poolfresh Ltd",
-    "Star Car Wash",
-    "Alex Cleaning Company Ltd",
-    "Cleaning Services Tottenham",
-    "Koziol Cleaning Ltd",
-    "Ajenjo Cleaning Services Ltd",
-    "Jpwest Ltd",
-    "Pitek Cleaning Ltd",
-    "Out and Proud Ltd",
-    "Fortis Green Ocean Car Valeting Service Ltd",
-    "UK Turbo Mop Ltd",
-    "Estrada Cleaning UK Ltd",
-    "Powerhome Ltd",
-    "Pcl (London) Ltd",
-    "Highbury Cleaners",
-    "Alfa & Omega Facilities Management Ltd",
-    "Super Laundry London Ltd",
-    "Hornsey Town Hall Trust",
-    "Emsi Services Ltd",
-    "Valeria 2010 Ltd",
-    "Genoveva Cleaning 96 Ltd",
-    "L Atkinson Ltd",
-    "Gulf Carwash & Valeting Centre Ltd",
-    "Fastclean",
-    "Castlecroft Cleaning Specialists Ltd",
-    "Suburban Environmental Services Ltd",
-    "Atlas Facilities Ltd",
-    "Caswell Science Park",
-    "White Clean Oxford Ltd",
-    "Interduct UK Ltd",
-    "Poplar Cleaning Services",
-    "Rothwell Cleaning Services Ltd",
-    "Cleanaway Property Services Ltd",
-    "Aura Commercial Cleaning Services",
-    "E&I Cleaning Services Ltd",
-    "Jdt Cleaning Services Ltd",
-    "Brightwise Cleaning Ltd",
-    "Tankas-Adela Ltd",
-    "Realise Clean Ltd",
-    "The Northampton Business Park Management Ltd",
-    "Clator Solutions Ltd",
-    "United Eco Services Ltd",
-    "The Genie Group Northants Ltd",
-    "Olcc Ltd",
-    "Acorn Cleaning Services Ltd",
-    "S W Askew Ltd",
-    "Variblast",
-    "Spring Clean Commercial Ltd",
-    "Household Cavalry Ltd",
-    "Mould Detectives Ltd",
-    "Hannants Cleaning Ltd",
-    "Purcell",
-    "Amethyst Gi Ltd",
-    "Aquablast",
-    "Norwich Cleaning Services Ltd",
-    "Rdnt Ltd",
-    "Mapleleaf Cleaners Ltd",
-    "Elite Cleaning Services",
-    "Norse",
-    "Ashdown Cleaning Ltd",
-    "Spire Cleaning Services",
-    "Car Wash Valeting Centre",
-    "Alfawaz Ltd",
-    "Clean Support Team Ltd",
-    "Accuro F M",
-    "Janocleaning Ltd",
-    "Miro Cleaning Ltd",
-    "My Companyy Ltd",
-    "Euro Cleaning Services",
-    "Time & Motion Services Ltd",
-    "Concorde Connections Mnh Ltd",
-    "Osraa Ltd",
-    "F Stars Ltd",
-    "Thaes Ltd",
-    "First One Cleaning Ltd",
-    "Sms Cleaning Services Ltd",
-    "P C S Group",
-    "Cleaning Services Hendon",
-    "Cleaning Services Kilburn",
-    "Home Cleaning Services Ltd",
-    "Airlinen",
-    "Enzian Services Ltd",
-    "Bi Point Ltd",
-    "Allbrite Office & Window Cleaning Ltd",
-    "Extreme Environmental Services Ltd",
-    "Reflection Cleaning Services (Didcot) Ltd",
-    "Calber Facilities Management Ltd",
-    "Alder David",
-    "C F S Cleaning Service",
-    "Proclean (Oxford) Ltd",
-    "Cleary's Industrial Cleaners",
-    "Propertcleaning Services Ltd",
-    "Oxford Fire and Flood Ltd",
-    "Carter Bros",
-    "Interduct Ltd",
-    "Group Genie",
-    "Bicester Maids Specialist Cleaning Service Ltd",
-    "Clarendon Ltd",
-    "Gentworks Ltd",
-    "Bright Cleaning Services Oxford Ltd",
-    "Parker Contract Cleaning Ltd",
-    "Premier Auto Valeting",
-    "Pareto Facilities Management Ltd",
-    "Nano Green Sustainable Facilities Management",
-    "Intank Technologies",
-    "Ceplins Carpets Ltd",
-    "Scenic Cleaning",
-    "Autospa",
-    "Totally247 Ltd",
-    "H & T Services",
-    "Green and Tidy Ltd",
-    "Tada Cleaning Services Ltd",
-    "Feldbinder UK Ltd",
-    "Qualitex Hygiene Services Ltd",
-    "Secure Valeting",
-    "Clarkes Cleaning Services Ltd",
-    "ASC (Surveys) Ltd",
-    "Eco Clean East Midlands Ltd",
-    "The Stable Guys Ltd",
-    "Norfolk Holiday Home Services Ltd",
-    "Prime Disaster Response Ltd",
-    "Everything Precious Ltd",
-    "S & R Facilities Management Ltd",
-    "Spotless Clean Ltd",
-    "Superclean Services Wothorpe Ltd",
-    "Stamford & Rutland Pressure Washing Ltd",
-    "Bycw Developments",
-    "Focus Commercial Cleaning Ltd",
-    "A W S Cleaning Services Ltd",
-    "Wings Technical Services Ltd",
-    "Green Clean (Uk) Ltd",
-    "Corniche Cleaning Services Ltd",
-    "Vertigo Aviation Detailing Ltd",
-    "Admiral Commercial Cleaning Group Ltd",
-    "Lewis (Cleaning) Services Ltd",
-    "Tip Top Domestic Builders Ltd",
-    "Astonish Cleaning Services Ltd",
-    "Aldwick Bay Exterior Cleaning and Maintenance Services Ltd",
-    "Cleaner Cars Ltd",
-    "Wight Ventilation Specialists Ltd",
-    "Deltic Cleaning Co Ltd",
-    "Helping Hands (Iow) Ltd",
-    "Hillbans Pest Control Ltd",
-    "Ah Hand Car Wash Ltd",
-    "T & H Contract Services Ltd",
-    "Equity Cleaning Services Ltd",
-    "Marine Superstore",
-    "Albion Contract Services Ltd",
-    "Time for You South",
-    "M R A Holdings (South) Ltd",
-    "Acadia Services Ltd",
-    "Paneless Services Ltd",
-    "Bellevie Care Ltd",
-    "Intelligent Workplace Solutions Ltd",
-    "Prestige4you Ltd",
-    "Newton Cleaning Services Ltd",
-    "Glitz & Blitz Cleaning Services Ltd",
-    "E C E X",
-    "Greenzest Ltd",
-    "Ergoplus Facilities Ltd",
-    "Agleam Windows Ltd",
-    "Smarter Cleaning GB Ltd",
-    "Maid in Basingstoke Ltd",
-    "Omni Support Services Ltd",
-    "Pac Commercial Ltd",
-    "Athena Commercial Cleaning Ltd",
-    "Crispclean",
-    "High Clean Building Maintenance Ltd",
-    "Renatus Services Ltd",
-    "Astramerix Ltd",
-    "C J H Cleaning Services Ltd",
-    "Kmc Cleaning Ltd",
-    "Thames Valley Cleaning",
-    "Berkshire Facilities Management Ltd",
-    "Valet Easy",
-    "Yes Yes Services Ltd",
-    "Clean UK Ltd",
-    "K G B Cleaning South West Ltd",
-    "The Office Cleaning Company",
-    "Bubbles Car Spa",
-    "Ics (Property Cleaning and Maintenance) Ltd",
-    "Blue Planet Washing Solutions Ltd",
-    "Rascal Cleaning Services Ltd",
-    "Templeton Cleaning Services Ltd",
-    "Contract Cleaning & Facilities Ltd",
-    "A M Maids Ltd",
-    "Intercleanse (Pest Control) Ltd",
-    "Vestis Cleaning Solutions Ltd",
-    "The North Surrey Cleaning Company Ltd",
-    "Zachri Cleaning Services Ltd",
-    "Express Hand Car Wash & Valet",
-    "Sparkles Cleaning (Sussex) Ltd",
-    "T C Repair & Supply",
-    "Carter & Faraday Associates",
-    "A22 Hand Car Wash",
-    "Hydro Power UK Ltd",
-    "J P Cleaning Services Ltd",
-    "Greenstar Cleaners",
-    "Access247 Care Services Ltd",
-    "Sks Cleaning Solutions Ltd",
-    "Kuzax Ltd",
-    "Branddy Ltd",
-    "Aston Group",
-    "Crystal Town Ltd",
-    "Vebego Services B V",
-    "Walker's Cs Ltd",
-    "Q B Cleaning Services Ltd",
-    "Platinum Plus Cleaning & Maintenance Ltd",
-    "Think Business Support Ltd",
-    "Thorough Services Group",
-    "R E Gore Building Services Ltd",
-    "Dacco",
-    "Doctor Domestic Plus Ltd",
-    "J&S Maintenance & Construction Ltd",
-    "Arcus F M Ltd",
-    "Ferncroft Enterprises Ltd",
-    "McDonald Brown Ltd",
-    "Mobile Fleetwash UK",
-    "Szytula Cleaning Ltd",
-    "Manchett Group Ltd",
-    "Southern Drain Services Ltd",
-    "Lighthouse Cleaning Ltd",
-    "Luna Cleaning Solutions Ltd",
-    "Nnf Ltd",
-    "J & S Facilities Management Ltd",
-    "M&D Cleaning Ltd",
-    "Purfleet Truck Wash",
-    "Havering Maid Service",
-    "Cleanco Km Ltd",
-    "Stot Quality Services Company Ltd",
-    "Kg Cleaning Services Ltd",
-    "Action Industrial Cleaning Services UK Ltd",
-    "Tiptop Projects Ltd",
-    "Servicemaster London & Essex",
-    "M A R Facilities Management",
-    "Titon Properties Ltd",
-    "A B M UK",
-    "Prada Contract Services Ltd",
-    "The Celp Ltd",
-    "Eden Worldwide Ltd",
-    "On the Spot Cleaning Ltd",
-    "Sushi Handroll Ltd",
-    "C D F Cleaning Services Ltd",
-    "Fabi Business Services Ltd",
-    "Regular Cleaning Services",
-    "Cleaners in Dulwich Ltd",
-    "Daily Fresh Cleaning Ltd",
-    "Grosvenor Contracts",
-    "Xenon Services Ltd",
-    "Cleanovation",
-    "Deep Kleen Services Ltd",
-    "Nationwide Cleaning Contractors Ltd",
-    "786 Services Ltd",
-    "Bright Cleaning Ocean Ltd",
-    "Virtuous Cleaning Services Ltd",
-    "Cleaning Estimate",
-    "Kingdom's Cleaners Ltd",
-    "Z I Technical Services Ltd",
-    "Greenspot Cleaning Services Ltd",
-    "Ultimate Cleaning Services Ltd",
-    "Tarem Services Ltd",
-    "Broken Blinds Ltd",
-    "Standard Office Cleaning (Uk) Ltd",
-    "Jubilee Contract Services Ltd",
-    "Ronnajosh Company Ltd",
-    "Alliance UK",
-    "K C H Interventional Facilities Management LLP",
-    "Clean N Care Services Limited Ltd",
-    "Fast Polish and Clean Ltd",
-    "We Got Maids Ltd",
-    "Pacific Support Services",
-    "Salus Support Services",
-    "Jardak",
-    "One Facility Ltd",
-    "Evergreen Facilities Services Ltd",
-    "Pegasus Cleaning Co",
-    "Luigi Hand Carwash Ltd",
-    "Select Cleaning Group Ltd",
-    "Es Cleaning Ltd",
-    "Green Your Space Group",
-    "Elliotts Facilities Management Ltd",
-    "Mandy-Lee Naude T/A Thomas Cleaning Hitchin Ltd",
-    "J C W",
-    "Distribution Hygiene Services",
-    "Angela Homes Clean Ltd",
-    "Tenda Cleaning Ltd",
-    "Marigold Cleaning Ltd",
-    "Elisei's Cleaners Ltd",
-    "Safetykleen",
-    "Smile Window Cleaning Ltd",
-    "Lewis & Graves Partnership Ltd",
-    "Tudor Group Ltd",
-    "Medclean Ltd",
-    "Wish Services Ltd",
-    "R & L Cleaning Solutions Ltd",
-    "D L S Contract Cleaning",
-    "Local Cleaning Services",
-    "Building Energy Services Group Ltd",
-    "Lnt Commercial Cleaning Services Ltd",
-    "Autoshine",
-    "G C C Facilities Management",
-    "U Turn 4 Car Wash Ltd",
-    "Maids",
-    "Turquoise Cleaning Co",
-    "S P Cleaning Ltd",
-    "Boiler Cover UK",
-    "Gcs England Ltd",
-    "Precise Cleaners Ltd",
-    "Agnar Ltd",
-    "Healthmatic Ltd",
-    "Little Brook Commercial Cleaning Ltd",
-    "Sparkling Diamonds Cleaning Ltd",
-    "Direct Cleaning Services",
-    "K S Cleaning Solutions Ltd",
-    "Windowpayne Ltd",
-    "Red Duster Ltd",
-    "Hunt Hospitality Services Ltd",
-    "Green Hills Cleaning Ltd",
-    "Kinglenu Developments",
-    "Ian Stephenson Supplies",
-    "Cruise & Passenger Services",
-    "C B R E",
-    "New Image Valeting",
-    "Acol Cleaning & Hygiene Solutions",
-    "C C L Cleaning Group",
-    "Lemon - Cleaning (Hampshire) Ltd",
-    "The Gleam Team Cleaning Services Hampshire Ltd",
-    "Progress Cleaning Services Ltd",
-    "Rattue & Co Ltd",
-    "Corporate Facility Services",
-    "Spick & Span Cleaning",
-    "Industrial Cleaning Contractors",
-    "Coastline Facilities Support Services Ltd",
-    "Maritime Yacht Services Ltd",
-    "A Plus Cleaning Services",
-    "Dg Cleaning Solutions Ltd",
-    "Maid2cleansouthampton-Eastleigh Ltd",
-    "1st Klas Cleaning Services Ltd",
-    "R F A Contractors Ltd",
-    "Ascend Management Services Ltd",
-    "Klassy Kleans",
-    "Acol Cleaning & Hygiene Ltd",
-    "Cherry Estates Ltd",
-    "Essential Cleaning & Maintenance Ltd",
-    "Phoenix Office Cleaning Ltd",
-    "Sandra Reid Ltd",
-    "Sychem",
-    "Moore's Cleaning Services",
-    "Pa Cleaning Services (Basingstoke) Ltd",
-    "Solstice Domestic Angels Ltd",
-    "Blissful Cleaning Services Ltd",
-    "Just the Job",
-    "All Seasons",
-    "Mayday Cleaners Ltd",
-    "Deep Clean Services",
-    "Queensway Car Wash",
-    "Alisha Property Services Ltd",
-    "Hygiene Contracts Ltd",
-    "Clean & Fresh Cleaning Services Ltd",
-    "Edialux",
-    "Aqua Green Cleaning and Facilities Ltd",
-    "Waves Hand Car Wash Basildon",
-    "Taylors Cleaning Services",
-    "Motorclean",
-    "Kranzle UK Ltd",
-    "Swiftclean Building Services",
-    "Tempus Facilities Management",
-    "City & Essex Ltd",
-    "South East Contract Cleaning Ltd",
-    "Pro Touch Car Valeting",
-    "Thundersley Cleaning Services",
-    "Matnico Ltd",
-    "J A Domestic Ltd",
-    "Manchett Facilities",
-    "Elmsleigh Services Ltd",
-    "Revive Specialised Cleaning Ltd",
-    "Clean Green Cleaning Services Ltd",
-    "Guardsman Cleaning Ltd",
-    "Dnk Cleaning Ltd",
-    "Dustbusters",
-    "Edwins Cleaning Services Ltd",
-    "E M G Cleaning Ltd",
-    "P & E Contract Services Ltd",
-    "Cscs (Contracts) Ltd",
-    "Remora Cleaning Ltd",
-    "GB & Co Cleaning Services Ltd",
-    "Vaile Office Cleaning",
-    "Flat Cleaning Services",
-    "Exp Communal Cleaning Ltd",
-    "Tascor Services Ltd",
-    "Alleycat Services",
-    "HM Cleaning Ltd",
-    "Time Cleaning Company Ltd",
-    "Go Clean Support Services Ltd",
-    "Momentum Support",
-    "Pink Planett Housekeeping Ltd",
-    "Pennybooks Ltd",
-    "Urang Cleaning & Maintenance Ltd",
-    "The Clean Space Partnership",
-    "Starplus Cleaning Services Ltd",
-    "The Mayfair Cleaning Company Ltd",
-    "Pakaf Jubilee Cleaning Services Ltd",
-    "Acet Circular Solutions Ltd",
-    "Ses Cleaning Ltd",
-    "Bizzy Lizzys",
-    "Elite Engineering Services Ltd",
-    "Wetton Cleaning Services",
-    "Vanquish Group",
-    "Advance Cleaning Services Ltd",
-    "Simple Clean Ltd",
-    "Gurkha Cleaning and Laundry Service Ltd",
-    "North Downs Cleaning & Maintenance Ltd",
-    "Ice Services Group Ltd",
-    "Gold Service Contract Cleaning Ltd",
-    "Excell Cleaning Services Ltd",
-    "E D M UK Ltd",
-    "Cm Commercial Cleaning Ltd",
-    "Kdc Cleaning Ltd",
-    "Invictus Systems",
-    "Ashford Cleaning Contractors",
-    "Carter's Valeting of Henwood Ltd",
-    "J&T Property Services Ltd",
-    "Tic-A-Dee-Boo Ltd",
-    "Mint Fresh Services Ltd",
-    "Industrial Cleaners UK",
-    "Maid in Rye Ltd",
-    "City and Suburban Services Ltd",
-    "Lodestar Cleaning Contracts Ltd",
-    "Ninfield Car Wash & Cafe",
-    "First Rate Cleaning Ltd",
-    "Bishops Services Ltd",
-    "Rusthall Cleaning Service",
-    "Clean Concepts Ltd",
-    "Enterprise Cleaning Co",
-    "Mmmarvellous",
-    "G A Cleaning Services",
-    "M L Cleaning & Maintenance Services",
-    "K B Come Clean Ltd",
-    "Sm Cleaning Ltd",
-    "AJ Procter Cleaning Contractors Co Ltd",
-    "Eden Professional Cleaning Services Ltd",
-    "Vamp Truck & Bus Wash Ltd",
-    "Industrial & Domestic Cleaning Services",
-    "Ajaw Cleaning Services Ltd",
-    "Good Taste&Wine Ltd",
-    "Star Cleanix Ltd",
-    "Rainbow Cleaning Services",
-    "Waves Hand Car Wash Osterley",
-    "Disaster Care Capital Ltd",
-    "Monster Cleaning",
-    "S P S UK & I Ltd",
-    "Interactive Facilities Ltd",
-    "Jmd Services UK Ltd",
-    "Owl Cleaning Services Ltd",
-    "Spotclean Solutions Ltd",
-    "Cleaning Services Longford",
-    "Temco UK Facility Services Ltd",
-    "Tenon F M",
-    "Active Cleaning Contractors Ltd",
-    "Interserve Construction Ltd",
-    "Catering Hygiene Specialists Ltd",
-    "Cleaning4u Ltd",
-    "Buckinghamshire Golf Club",
-    "M N Support Services Ltd",
-    "Property Management & Cleaning Services Ltd",
-    "H20 Car Valeting",
-    "A G P Cleaning Services Ltd",
-    "Hps Services Fm Ltd",
-    "Top T D Cleaning Company",
-    "K T & T",
-    "Master Cleaners",
-    "Better Call Moe Ltd",
-    "Posh Wash Car Valeting",
-    "Clean & Clear",
-    "Astor Court Hotel",
-    "R G R Facilities Ltd",
-    "Crystal Facilities Management Services",
-    "Builtain Ltd",
-    "Four Angels Cleaning Services Ltd",
-    "Euro Car Wash",
-    "Landmark Facilities Management",
-    "O & G",
-    "Omni Facilities Management Ltd",
-    "Sweepaside Ltd",
-    "Shine & Clean Ltd",
-    "Henshall & Sheehy Support Services",
-    "Time Out England Ltd",
-    "Millard's Cleaning Services Ltd",
-    "Car Park Valeting Ltd",
-    "London Corporate Cleaning Services",
-    "G W O Services",
-    "Jpm Contract Cleaners",
-    "Sudlows",
-    "Janemore Services Ltd",
-    "T T B Contracts",
-    "Brian Nixon Ltd",
-    "Daily Poppins",
-    "D B Services",
-    "Cleaning Force Office Cleaners Ltd",
-    "Serviclean",
-    "J J K Cleaning Services",
-    "Guardian Hygiene Services",
-    "Lady Green Clean",
-    "Cbcom",
-    "Fast Cleaners Sutton",
-    "Crystal Clear Ltd",
-    "C T F Pest Control Ltd",
-    "Inivos",
-    "S R P Cleaning Services",
-    "Empire Pest Control",
-    "City Cleaning Services",
-    "O'Keefes Cleaning",
-    "Jackson Cleaning Services",
-    "Paramount Pest Control",
-    "East Lancashire Services Ltd",
-    "Office Cleaner Ltd",
-    "Galaxy Commercials Services",
-    "Veolia",
-    "Hinton Pest Control Ltd",
-    "Nationwide Cleaners",
-    "City Sparkles",
-    "Vanbroc Ltd",
-    "Smart Group Services",
-    "Alpha Cleaning & Maintenance Ltd",
-    "L A Cleaning",
-    "Minster Cleaning Services",
-    "Gubwam Cleaning Services",
-    "Cleaneazy",
-    "Cleaning Services Hampstead",
-    "Klenfast Cleaning Services",
-    "Nationwide Cleaners Surrey",
-    "Maid Marion's Cleaning Services Ltd",
-    "I S S",
-    "Cam Specialist Support Ltd",
-    "Service Master Clean Contract Services",
-    "Sams Domestic Cleans",
-    "The Oven Cleaners",
-    "Heat Kill",
-    "Sue's Ace Cleaning Team Ltd",
-    "M Cleaning Services Taunton Ltd",
-    "Floorbrite Cleaning & Facilities Ltd",
-    "Bournemouth Cleaning Services",
-    "Vermatech Pest Control",
-    "The London Chimney Sweeps",
-    "Milborrow Chimney Sweeps",
-    "Step by Step Cleaning Services",
-    "Dusty Millers",
-    "S J Cleaning",
-    "Leotar",
-    "R-tac Cleaning",
-    "Pacific Pressure Washing",
-    "Finishing Touches Cleaning Group",
-    "Unit Clean",
-    "Top Kensington Cleaners",
-    "Kitchen Dirt Devils",
-    "Dusters South Wales Ltd",
-    "E C S",
-    "T K M Commercial Cleaning",
-    "Cleaning Services Hounslow",
-    "Prokill",
-    "Toast Southern Ltd",
-    "Clean Carpet London",
-    "Simon Steam Cleaning",
-    "Ovenu (Blackburn)",
-    "Molly Maids",
-    "Ellack Cleaning Contractors Ltd",
-    "S J T",
-    "Sparkling & Clean",
-    "Pest Exterminators",
-    "Valley Cleaning Services",
-    "Fallow Management Ltd",
-    "Advanced Property Care",
-    "Crystal Windows",
-    "Pure & Clean",
-    "Swift Office Cleaning",
-    "Comet Cleaning Services",
-    "Local Hillingdon Cleaners",
-    "I S S Mediclean Within the Princess Royal University Hospital",
-    "Cleaning Services Croydon",
-    "Coopers Window Cleaning",
-    "Stella's Cleaning Services Ltd",
-    "Cleaner Clapham",
-    "Glimmr",
-    "Fryer Cleaning & Maintenance Ltd",
-    "Dublcheck Cleaning Services",
-    "Wellshine Domestic Services Nottingham",
-    "Crown Deepclean",
-    "Memiada Ltd",
-    "C D C Specialists Ltd",
-    "Merry Maids of Stratford upon Avon",
-    "Sankeys Pest Control",
-    "Two Counties Cleaning Service Ltd",
-    "Synergy L M S",
-    "Professional Cleaners Maida Vale",
-    "Howards Commercial & Domestic Cleaning",
-    "Majestic Cleaning Ltd",
-    "Discreet Pest Control Ltd",
-    "Total Clean",
-    "Medirest",
-    "Roxburg Cleaning Specialists",
-    "Lakethorn Group Service",
-    "As New",
-    "Eclipse Cleaning Contractors Ltd",
-    "E K S Living Clean Ltd",
-    "Chiltern Hygiene Services Ltd",
-    "C & S Window Cleaning Service",
-    "Aderyn",
-    "Ryan Poultry Services",
-    "London Bin Cleaning",
-    "M Y Green Cleaner Ltd",
-    "Stalev Ltd",
-    "Helpful Hands",
-    "Cleveland Cleaning Ltd",
-    "Preston Borough Council - Pest Control Service",
-    "K J Crystal Cleaning Services Ltd",
-    "Seymour Cleaning Services",
-    "Cleanday London",
-    "Prime Clean Ltd",
-    "Daisy Day Cleaning",
-    "B C S Cleaning Services",
-    "R J Hartley Environmental",
-    "White Lady Cleaning Services",
-    "East Coast Pest Control Ltd",
-    "Angel Dust Housekeeping & Management",
-    "Abbey Pest Control",
-    "Oven Cleanic",
-    "Salter Cleaning",
-    "St Anne's Housekeeping",
-    "Stephen T Evans",
-    "Vermaway Pest Control Ltd",
-    "Green Sky",
-    "Avondale Sweeps",
-    "Independent International Cleaning Ltd",
-    "Relyon Cleaning Services",
-    "Quantaqua",
-    "Blue Haze Property Services Ltd",
-    "Ovenclean North Derby",
-    "Conservatory Cleaning Maintenance & Repairs",
-    "Ovenproud",
-    "Mark Carter",
-    "Bespoke Commercial Cleaning",
-    "Envirocure Ltd",
-    "Pro-vert Ltd",
-    "Coxhead Cleaning Services",
-    "1st 4 Pigeon Control",
-    "The Cardiff Window Cleaning Company",
-    "Time for You Ltd",
-    "Easy Clean Nottingham",
-    "High Spec Contract Cleaning",
-    "Scarecrow Group",
-    "Lemon General",
-    "Dealey Environmental",
-    "Lowcost Cleaners",
-    "D & M Cleaning Services",
-    "Polly & Team",
-    "Green Valley Pest Control",
-    "M & S Cleaning Service",
-    "The Lady Cleaner",
-    "Cleaners Clapham",
-    "The P R P Group Ltd",
-    "Trustclean",
-    "F C S Cleaning Ltd",
-    "Diamond Bin Cleaning Ltd",
-    "Raccoon Cleaning Services",
-    "Clean Sweep Swansea Ltd",
-    "N & P Window Cleaners",
-    "Red Support Services",
-    "Magic Carpet Cleaning",
-    "Fairies",
-    "Ins & Outs",
-    "Denis Froud",
-    "Bournemouth Maids",
-    "Richardsons",
-    "Hygienebusters",
-    "C R Window & Gutter Cleaning Ltd",
-    "Gold Class Cleaning",
-    "Moclean",
-    "Pest-away Total Care Solutions Ltd",
-    "Tidy 2 Clean Ltd",
-    "Allington Angels",
-    "Hulls Environmental Services Ltd",
-    "Voila Cleaners",
-    "Inoculand",
-    "Pest Solutions",
-    "M R V Support Services Ltd",
-    "Ian James Window Cleaning Ltd",
-    "P R P Decon Ltd",
-    "Cleanbreeze",
-    "Dynamic Cleaning Services Ltd",
-    "Top Tenancy Cleaning",
-    "Capital Cleaning North West Ltd",
-    "M Moore Industrial Cleaners Ltd",
-    "Lunar Cleaning",
-    "Cleaning Services Watford",
-    "Eco Kleen",
-    "Pure Cleaning & Maintenance",
-    "Minster Cleaning Office Cleaning in Warrington Wigan & Chester",
-    "Amanda's Domestic Cleaners",
-    "Heaven Cleaning",
-    "Chim-me-sweep & Chim-me-build",
-    "Molly Maid Farnborough",
-    "Diyclean Ltd",
-    "The Cleanologists",
-    "Merlin Environmental",
-    "Cleantec Services Ltd",
-    "Solo Office Cleaning",
-    "A G Pest Management",
-    "Clean Force",
-    "Hardman Cleaning Services",
-    "Pest Control Wembley",
-    "London Cleaner",
-    "Glasshouse Cleaning Services",
-    "Iclean Commercial Cleaning Services",
-    "Roehampton Carpet Cleaners",
-    "Super Clean Express",
-    "Book-a-cleaner",
-    "Cobthorne Cleaning & Maintenance",
-    "Crest Hygiene Services Ltd",
-    "E C M S",
-    "L P C Cleaning",
-    "UK Clean",
-    "Essex Office Services London Ltd",
-    "Buckingham Housemaids Ltd",
-    "Dazzle Cleaning Services Cardiff Ltd",
-    "The Norfolk Cleaning Group",
-    "B R S Cleaning Contractors Ltd",
-    "Bright Hygiene Management London Ltd",
-    "Cleanrite Services",
-    "Bevis Cleaning Solutions",
-    "D Dawson",
-    "Ace Cleaning Domestic Ltd",
-    "Commercial Caretakers",
-    "Allpest",
-    "Allstar Clean",
-    "R S O Cleaning",
-    "Tardis Environmental",
-    "Alpha Cleanse",
-    "Babsy Cleaning",
-    "Mr Bright's Ltd",
-    "F M Alliance Ltd",
-    "Crystal Clean",
-    "Hertfordshire Cleaning Solutions",
-    "Maid Just for You",
-    "A & R Cleaning Services",
-    "Your Home Cleaner",
-    "A Pure Clean",
-    "Merry Mops Cleaning & Ironing Services",
-    "Hammond Hygiene Solutions",
-    "Citron Hygiene",
-    "Proguard Central Services Ltd",
-    "Careclean 2000",
-    "The Sparkle Oven Cleaning Co",
-    "3 Way Cleaning",
-    "Cleaners Now",
-    "Ishine Cleaning Solutions",
-    "Supreme Clean Plymouth Ltd",
-    "Lovells House Cleaning",
-    "Hygiene Company",
-    "Sodexo",
-    "Cleanwise Ltd",
-    "A M Services Group",
-    "Vectair Systems",
-    "Lancashire Hygiene Ltd",
-    "Clean Ups",
-    "House Fairies",
-    "Feline Cleaners Ltd",
-    "E & P Cleaning Contractors",
-    "Marvins Elite Services Ltd",
-    "Bright & Beautiful",
-    "Spa Cleaning & Maintenance Ltd",
-    "Orian Property Services",
-    "Blitz Cleaning Services Ltd",
-    "Chesterton Commercial Cleaning Services",
-    "Cleaners London Ltd",
-    "Les Femmes de Menage Ltd",
-    "House So Clean",
-    "Albany Cleaning Solutions",
-    "R J C Solutions Ltd",
-    "Maid to Kleen",
-    "Global Be Ltd",
-    "Triple a Cleaning Supply Ltd",
-    "C S C Forecourt Services Ltd",
-    "Eco Cleaning Services",
-    "Rochelle's Cleaning & Caretaking Ltd",
-    "S J M Cleaning Services",
-    "R F Window Cleaning",
-    "M H Cleaning Solutions Ltd",
-    "J D K Cleaning",
-    "Easy Clean",
-    "Prime Facility Services",
-    "Time-out",
-    "Supreme Clean Ltd",
-    "Bio 65 Environmental Cleaners",
-    "Window Services Essex Ltd",
-    "C M Property Care Services",
-    "C S G UK Ltd",
-    "Waltham Black",
-    "G J Treasure Cleaning Contractors",
-    "3 G Contract Cleaning Ltd",
-    "Yorkshire Wasp Control",
-    "Deboer Cleaning Services",
-    "Proact Cleaning Ltd",
-    "Hire House Cleaners London",
-    "H F Pest Control",
-    "Enterprise Services Group Ltd",
-    "Green Man Oven Cleaning",
-    "Instakil",
-    "Cleaner Best Services",
-    "Aj's Window Cleaning",
-    "Nationwide Cleaners Buckinghamshire",
-    "A & E Domestic Cleaning Services",
-    "Sparkling Domestic Services",
-    "Customer X Ltd",
-    "Guest & Sons",
-    "Chalcot House Services Ltd",
-    "Cleaners Southfields Ltd",
-    "Terry Healy - Chimney Sweep",
-    "Interim Cleaning Services",
-    "Three Counties Chimneys",
-    "3 Counties Cleaning",
-    "T C M S Midlands Ltd",
-    "Merry Maids of Croydon",
-    "Westcountry Cleaning Services & Supplies",
-    "Inspire Cleaning Group",
-    "Cousins Contract Cleaners Ltd",
-    "Optimus Plus",
-    "Clean With Us Ltd",
-    "Nationwide Hygiene Supplies",
-    "Cleaning Tottenham Ltd",
-    "Burgess Cleaners",
-    "Window Payne",
-    "S T M Cleaning",
-    "Pro Clean Tile Restoration",
-    "Maid in Essex",
-    "Kand Pest Control",
-    "K V M Cleaning",
-    "H L A Pest Control",
-    "A E G Cleaning Services",
-    "Acme Cleaning Services",
-    "All Aspects Pest Control Bracknell Ltd",
-    "The English Cleaning Company",
-    "Aark Environmental Services Ltd",
-    "C G Cleaning",
-    "Cannon Hygiene",
-    "A S C S Cornwall Ltd",
-    "Amaya Services",
-    "Maid2clean",
-    "Clean & Tidy UK",
-    "Gaze-a-glaze Ltd",
-    "Cleaners Ealing",
-    "Crystal Pools",
-    "Phoenix Specialist Pub Cleaning",
-    "Fast Cleaners Twickenham",
-    "Catercleanse",
-    "Crystal Clear Cleaning & Home Support Ltd",
-    "A C S UK",
-    "Peace of Mind Home Help Ltd",
-    "Redbourne Cleaning Services Ltd",
-    "Amayzing Cleaning Services",
-    "L M S - Lara Nichols",
-    "Nviro Ltd",
-    "D I S Window Cleaning",
-    "Coalville Cleaning Services Ltd",
-    "B M I Hospital Decontamination",
-    "Blitz Cleaning Services",
-    "Clean As a Whistle",
-    "The Cleaning Co",
-    "Anston Pest Control Ltd",
-    "Hi Standard Services",
-    "Clean Bean Ltd",
-    "Suffolk Maids Ltd",
-    "T L C Window Cleaning Ltd & Guttering",
-    "Let Us",
-    "West Wales Pest Control Ltd",
-    "Calahans Cleaning Services",
-    "Cleaning Expectations Ltd",
-    "C I C S Ltd",
-    "Higher Purpose Cleaning Services Ltd",
-    "Premier Environmental Ltd",
-    "React Specialist Cleaning",
-    "Shield Cleaning Services Ltd",
-    "Fairway Support Services",
-    "All in Cleaning",
-    "Healthguard Ltd",
-    "Holiday Maid Service",
-    "Home Service Solution",
-    "Wright-way",
-    "Hall Cleaning Services Ltd",
-    "Uckfield Area Chimney Sweeps",
-    "T L C Cleaning",
-    "Vericlean Services Ltd",
-    "White Elephant Services",
-    "Shimmer & Shine (Jk)",
-    "The Housework Hub",
-    "Vision Clean",
-    "Soft Washing Services",
-    "Onsite Maintenance",
-    "Actual Support Services Ltd",
-    "See Thru Cleaning Ltd",
-    "S C S Contract Cleaning",
-    "Miss Green Clean",
-    "A & S Cleaning Services",
-    "Liliana Cleaning Services",
-    "A B C",
-    "Cheshire Window Cleaning Services",
-    "Aztec Commercial Cleaning",
-    "Insideout Cleaning Solutions Ltd",
-    "Proffesional House Cleaners",
-    "Servicemaster Office Cleaning",
-    "McShine Cleaning Services UK",
-    "Art Cleaning Services",
-    "Hands Cleaners Ltd",
-    "Totally Floorless",
-    "First Class Cleaners",
-    "Klean It",
-    "Coventry Pest Control",
-    "Dream Clean",
-    "P C S Professional Cleaning Services",
-    "Housekeep",
-    "K R R Prostream",
-    "Professional Pest Management Ltd",
-    "Rainbow International",
-    "The Clean Crew",
-    "N J Cleaning Services",
-    "Prestige Contract Cleaning",
-    "Deep Cleaning London",
-    "Pro-clean Services Ltd",
-    "Bex Home Care",
-    "Vision Hygiene Inc Ltd",
-    "Top Mops",
-    "Rosmart Cleaning",
-    "Maid in the Cotswolds",
-    "Control Pest UK",
-    "G R Pro-clean Thames Ltd",
-    "Central London Cleaners",
-    "Tidy Tiffany & Co",
-    "Impact Contracts Ltd",
-    "Kal Cleaning Services",
-    "North Surrey Cleaning Company",
-    "Pestuk",
-    "C J's Cleaning Services",
-    "Pete the Sweep",
-    "Apple Clean",
-    "Housewives Choice",
-    "Sooty the Sweep",
-    "P J M",
-    "Eagleclean Specialist Services Ltd",
-    "Staffordshire End of Tenancy Cleaners",
-    "Houseproud Cleaning",
-    "Reactive Group Services Ltd",
-    "Active Cleaning & Maintenance Services Ltd",
-    "Eagle Cleaning Services",
-    "Cleanit Cleaning Services",
-    "Master Merry Maids of Stratford upon Avon",
-    "Premier Pest",
-    "Cleaning Angels",
-    "Keep Clean",
-    "Bob Webster & Sons Cleaning Services Ltd",
-    "Pontypridd Domestic Cleaners",
-    "Hounslow Carpet Cleaners",
-    "D B Cleaners",
-    "Sophie Cleaning Services Wimbledon",
-    "Pee Wee's Cleaning Co",
-    "Breckland Industrial Ltd",
-    "Clean Sweep Fire & Stove",
-    "Polish Cleaning Agency",
-    "Mitey Cleaning Services",
-    "Apollo Window Cleaning",
-    "Daylight Window & Industrial Cleaning Services Ltd",
-    "Fisher & Sons Cleaning Services",
-    "City Central Cleaning & Support Services",
-    "Bournemouth Domestic Cleaning",
-    "A A Chemical Cleaning Co Ltd",
-    "Thimble Cleaning Services",
-    "Circle Cleaning Services",
-    "Perfect Clean",
-    "All Property Care",
-    "Afresh Office Cleaning",
-    "Terminex Ltd",
-    "E H Window Cleaning",
-    "Star Clean",
-    "Chestfieldcleaners",
-    "A Sure Clean Ltd",
-    "Kev's Cleaning Services Ltd",
-    "Mega Cleaning",
-    "Clean2clean Team",
-    "D Cornish Pest Control",
-    "Paul Richards Cleaning & Maintenance",
-    "P & S Cleaning Services",
-    "Maggie Cleaning Service Ltd",
-    "Dobbins Industrial & Commercial Cleaning Ltd",
-    "Tidychoice",
-    "A & S Cleaning",
-    "Plain Janes Housekeeping Service",
-    "Bristol & Avon Cleaning Services",
-    "Ashton Cleaning Services",
-    "Klean Commercial & Domestic Cleaning Services",
-    "Search UK Pest Control Ltd",
-    "Ispeclean",
-    "Schmek UK Ltd",
-    "Bliss Cleaning Service",
-    "South East Tanker Services",
-    "J G Pest Control",
-    "Bowdraper",
-    "Commercial Cleaning Somerset",
-    "Stay Clean Services",
-    "Shamrock Maids Cleaning Services",
-    "Joana-rose Services",
-    "C M A Nemesis",
-    "Blade Access Ltd",
-    "Cleaner Clacton",
-    "Midland Cleaning Services",
-    "Kensington Cleaners",
-    "Millburrow Chimney Sweep",
-    "Rokill Pest Control Services",
-    "G C & C Window Cleaning",
-    "Clean Be",
-    "N B Commercial Cleaning",
-    "K H Cleaning Services & Hygiene Supplies",
-    "Vari Tech",
-    "Breanheath",
-    "Waterers Services Ltd",
-    "London Cleaning House",
-    "Dean Cleans",
-    "Nuserve",
-    "Sparkley Kleen Window Cleaning Services",
-    "Fast Cleaners",
-    "Poppies",
-    "Cleanlinks Services",
-    "Pest UK",
-    "Clean & Tidy Ltd",
-    "Hampson Brothers",
-    "Pink Raccoon Cleaning Services",
-    "Locks Heath Maids Ltd",
-    "C C S Services",
-    "Southern Window Cleaning",
-    "Excellent Home Cleaning London",
-    "Robert Courtney & Sons",
-    "Bridger Window Cleaning",
-    "Safeclean West Midlands",
-    "Spotless Domestic Cleaning",
-    "Dr Squeegees",
-    "Nice & Clean",
-    "High Standard Cleaning Service",
-    "House Proud",
-    "Aqua-tec",
-    "Ambassador Cleaning",
-    "Reflections Environmental Ltd",
-    "Sparkling Cleaners Wandsworth",
-    "Painting & Labour Services Ltd",
-    "Solutions Cleaning Services Ltd",
-    "Professional Cleaners Bristol & Bath",
-    "Cleansense",
-    "Atlas Cleaning",
-    "Into Cleaning",
-    "Beechwood",
-    "Render Clean",
-    "Elis Cleanroom",
-    "Isotank Services Ltd",
-    "R & C Cleaning Services Ltd",
-    "A & M Industrial Cleaning Ltd",
-    "Daisy Chains",
-    "Domestic Cleaner Streatham",
-    "Beacon Support Services",
-    "Cleaning Services Slough",
-    "Midlands Cleaning Services",
-    "Cleaner Homes",
-    "First Choice Cleaning & Maintenance",
-    "C K Group",
-    "Cleaning Consultancy",
-    "Efficient Cleaning Services",
-    "M & S Partnership",
-    "M C Genesis Ltd",
-    "Laddersfree Commercial Window Cleaners York",
-    "Your Building Counts Cleaning Services",
-    "Fine London Cleaning",
-    "G W Commercial Cleaning Ltd",
-    "Surrey County Cleaners",
-    "E L W Cleaning",
-    "Spalls Clean Ltd",
-    "G A Helliar & Son Ltd",
-    "Reliant Cleaning",
-    "1st Choice Andy Sweep",
-    "B P Hawkins Ltd",
-    "County Contract Cleaning Services",
-    "Ambassador Cleaning Services",
-    "Binco",
-    "Haley Services",
-    "Mechanical Cleansing Services",
-    "Lynch Crawford Cleaning Services",
-    "Bird Control Sussex",
-    "D P Cleaning Services",
-    "Time for You Ashford",
-    "Brilliant Hygiene Services Ltd",
-    "J P D Cleaning Services",
-    "Household Angels",
-    "Pinewood Cleaning Services Ltd",
-    "Pro Star Services",
-    "Work Connexions Ltd",
-    "See Clean Contract Cleaning Services Ltd",
-    "Astrum Commercial Cleaning Services",
-    "Swallow Cleaning Contractors",
-    "Shine & Clean Merton",
-    "Dublcheck Ltd",
-    "Dolly Dusters Cleaning Ltd",
-    "Simply Spotless Ltd",
-    "Pest Control",
-    "Londonwide Cleaning Services Ltd",
-    "Prestigious Services Wolverhampton Ltd",
-    "Acton Cleaning Services",
-    "Thomas Cleaning",
-    "Haztank Services Ltd",
-    "Q F S L Group",
-    "Ark Cleaning Services Ltd",
-    "Southern Window & General Cleaning",
-    "Chores & Paws",
-    "G & P Cleaning Services Ltd",
-    "J & J Prime Cleaning Services Ltd",
-    "Wallace Window Cleaning",
-    "Retro Industrial Services Cleaning",
-    "A R P Commercial Property Care Ltd",
-    "Cross Country Cleaning",
-    "Molly Maid Thame",
-    "Aftercare Specialist Cleaning Services",
-    "Congratulation Quality Care & Cleaning Services",
-    "Cleaners Charlton",
-    "ad-cleaningservice.co.uk",
-    "Midland Cleaning & Maintenance Ltd",
-    "K S Cleaning",
-    "Willclean Industrial Services Ltd",
-    "Ashine Cleaning Services",
-    "East Anglia Cleaning Services Ltd",
-    "B H L",
-    "Henley Housekeepers",
-    "Clean365 Ltd",
-    "Green Space Facilities Maintenance",
-    "J M S Cleaning Services",
-    "Home Sweep Home",
-    "Commercial Bird Control",
-    "Happy Cleaner London",
-    "Snowhill Cleaning",
-    "R J T Services",
-    "Wright Clean Ltd",
-    "Wolds Cleaning",
-    "P & M Cleaning Specialists Ltd",
-    "Brightday Cleaning Services",
-    "T G N Window Cleaning Services Ltd",
-    "Julius Rutherfoord & Co",
-    "Sloane Cleaning",
-    "More Care Environmental Services",
-    "Office Cleaning Nottingham",
-    "J M B Professional",
-    "Elite Rutland",
-    "Dustbusters South East Ltd",
-    "Verti-tech Ltd",
-    "Brent Direct",
-    "Procleansw",
-    "J M 2 Support Services Ltd",
-    "J S Cleaning Services",
-    "Proclean Support Services",
-    "Norclean Services Ltd",
-    "greencleanoffice.com",
-    "Chew Valley Ltd",
-    "Balcombe Pest Control Ltd",
-    "Metro Industrial Cleaning",
-    "Nightingale Cleaning Ltd",
-    "Pryor's Window Cleaning",
-    "Purple Orchid Lane Cleaning & Co",
-    "Jupiter Services Ltd",
-    "Computacare",
-    "N H F Cleaning Services Ltd",
-    "Cara",
-    "Maid @ Home",
-    "Jolly Clean",
-    "Coastal Cleaning Co Felixstowe Ltd",
-    "Aztec Cleaning Contracts Ltd",
-    "We Clean for You",
-    "Argonaut Community Enterprises Ltd",
-    "Berry Support Solutions",
-    "Busy Bee Cleaning",
-    "Business Buddies",
-    "Magic Cleaning Services London",
-    "GB Valeting",
-    "Domestic Cleaners London",
-    "Sparkle & Shine",
-    "Chimney Sweeps",
-    "Quality Cleaning Services",
-    "Ozer Hygiene Ltd",
-    "L V Services",
-    "Trevor Iles",
-    "B H Cleaning Services",
-    "Maid 2 Measure",
-    "Hassle",
-    "S Q Trading Ltd",
-    "Wheelie Wash",
-    "L A C Cleaning Contractors",
-    "Delotas Cleaning Solutions",
-    "Whistle Cleaning Services Ltd",
-    "Vortex Cleaning",
-    "Clean-machine",
-    "Econo Clean",
-    "C D M Cleaning Services",
-    "Variety Cleaning",
-    "D F Williams Cleaning Services Ltd",
-    "N I C Services Group Ltd",
-    "Pest Control Supermarket Ltd",
-    "End of Tenancy Cleaning Weybridge",
-    "Clean Machine",
-    "Minster Cleaning Commercial Cleaning in Essex",
-    "Burke & Clemens",
-    "Hadley St James",
-    "Micro Solve Hygiene",
-    "Spa Services",
-    "T S D Cleaning Services",
-    "City Hygiene Ltd",
-    "Critter Solutions Ltd",
-    "Accelerate",
-    "Ritz Services",
-    "Norton Jones Group Ltd",
-    "Harvell Moore",
-    "Opkill Ltd",
-    "Done & Dusted",
-    "K B G Solutions",
-    "Cleaning Kingston Services",
-    "Jet Cleaning Services",
-    "J G Cleaning Service",
-    "The Cleaning Partnership",
-    "City Care Cleaning",
-    "Total Clean Blackpool",
-    "The Bell Cleaning Company Ltd",
-    "Eradipest",
-    "C T S Cleaning Solutions Ltd",
-    "B M Pest Solutions Ltd",
-    "J Clean Ltd",
-    "S R Window Cleaners",
-    "Facilicom Cleaning Services",
-    "Vali Engineering",
-    "Dun N Dusted",
-    "Baumot UK Ltd",
-    "New Enterprise Pest Control Herts Ltd",
-    "S G S Clean Ltd",
-    "Celtic Property Maintenance Services",
-    "J C Cleaners",
-    "Rose Property Services",
-    "Bolton Green Clean",
-    "Nu-life Cleaning Ltd",
-    "Greenzone",
-    "Murphy Services Cleaning Ltd",
-    "Chamberlaine Cleaning Services",
-    "Gala Cleaners",
-    "J T S S Stoke Ltd",
-    "Bowman Pest Control",
-    "Total Pest Control",
-    "R C B",
-    "Aspire Support Services",
-    "Reflections Cleaning Services Ltd",
-    "Euroguard Technical Services Ltd",
-    "Spotless Group Ltd",
-    "Kemsales",
-    "Cleaning Gurus",
-    "Bournedomesticltd",
-    "Britannia Cleaning Ltd",
-    "London Cleaning Services",
-    "B D S Industrial Painting & Water Jetting Ltd",
-    "Fast Class Cleaning",
-    "Adams Cleaning Contractors Ltd",
-    "Bettys Cleaning Fulham",
-    "Terminex",
-    "Spring Clean",
-    "Crown Pest Control",
-    "Shoreclean Ltd",
-    "J L D Services",
-    "Cleaning Services Shepherds Bush",
-    "Clearwell Pest Control",
-    "Hallcrest Services Ltd",
-    "Harvey Environmental Services",
-    "P Belle Care",
-    "New Line Cleaning Services",
-    "Indepth Managed Services",
-    "The Real Cleaning Company",
-    "Clean & Tidy",
-    "Roberts Cleaning Services",
-    "Pinnacle Specialist Cleaning Service",
-    "Property Pride Cleaning Services",
-    "The Clean Up",
-    "Fleur Marrigold",
-    "Excel",
-    "The Pink Cleaning Co",
-    "Complete Cleaning & Clearance",
-    "Diamond Home Support",
-    "Kennoh Cleaning & Care Support Ltd",
-    "Zamzam Cleaners",
-    "Aaron Cleaning Acton",
-    "Cat Tech",
-    "Crystal Clear Cleaning",
-    "J & Co Management Ltd",
-    "Comserve Wales Ltd",
-    "Absolute Angels",
-    "Rentokil Pest Control Crawley",
-    "A & G Jones",
-    "Fast Contract Cleaners",
-    "Silver Star Cleaning",
-    "New Horizon Cleaning Ltd",
-    "High Vision UK Ltd",
-    "May Harris Multi Service Solutions",
-    "The Spruce Girls Ltd",
-    "Consultant Services Group Ltd",
-    "L C S Ltd",
-    "Aqua Industrial",
-    "B N S Cleaning Services",
-    "One Call Cleaning & Gardening Ltd",
-    "Swansea & District Cleaning Services",
-    "Biowise Pest Control Services",
-    "Rodent Service East Anglia Ltd",
-    "Sams Cleaning & Ironing Services",
-    "Christines Pristine Clean",
-    "Innovative Cleaning Services",
-    "Clean & Green",
-    "Bee Cleen",
-    "Little Owl Cleaning Co Ltd",
-    "Streamline Leisure Ltd",
-    "U D A C C",
-    "Hydro Wash Maintenance Services",
-    "Eco Clean Sussex",
-    "Midland Pest Control Ltd",
-    "Kolev & Son UK Ltd",
-    "Outstanding Cleaning Services",
-    "Tradition Property Services",
-    "Hunt & Walters Ltd",
-    "Wind Services",
-    "Kendaclean",
-    "Well Done Group",
-    "Tailor Made",
-    "Miakah Cleaners",
-    "Concept Cleaning Services",
-    "Sparkling Clean Solutions",
-    "Domestic Goddess Services",
-    "M R Pest Control Environmental Services",
-    "Cosy Fires",
-    "Reach & Wash",
-    "Enviro - Strip GB L T D",
-    "Wadesons",
-    "Clean & Steam Co",
-    "Associated Window Cleaners",
-    "Capital Cleaning Services",
-    "Merry Maids of Southampton",
-    "Canada Cleaning",
-    "Be Dazzled Cleaners Ltd",
-    "Scrub a Dub",
-    "Ramora Ltd",
-    "Proclean Team",
-    "Cleaners Battersea",
-    "Aquawash",
-    "London Window Solutions",
-    "Clean Business",
-    "N D C Cleaning",
-    "Top To Bottom",
-    "Williams Tanker Services Ltd",
-    "Myclean",
-    "Regal",
-    "Paint Removing",
-    "New Age Commercial Cleaning",
-    "Myhome",
-    "Budget Cleaners",
-    "Chemdry Central",
-    "Best Cleaning Company",
-    "End of Tenancy Cleaners London",
-    "Cleaned & Gleaming",
-    "Cleanup Cleaners",
-    "Amanda's Concierge Cleaning",
-    "Groves Window Cleaning",
-    "O C O Window Cleaning Services",
-    "Cristal E Services",
-    "Fab Cleaners",
-    "Karla's Cleaning & Ironing Services",
-    "Cleanking",
-    "Red Dragon Group",
-    "H2o Facilities Services",
-    "Move Out Clean London Ltd",
-    "Leadec",
-    "Smart Domestics",
-    "Clean Image",
-    "Let Me Clean 4 You",
-    "Ab Jetting Ltd",
-    "Ideal Response",
-    "Sebby Domestic Cleaners",
-    "Starlet Cleaning",
-    "Lopes Cleaning Services",
-    "Indepth Hygiene Services Ltd",
-    "X P O Logistics",
-    "Quality 1st Cleaning Company",
-    "T W O Services",
-    "Sheba Cleaning Ltd",
-    "Trinity Cleaning & Facilities Management",
-    "Samsic UK",
-    "Tindle Pest Control Services",
-    "Oakley Cleaning",
-    "Stay Clean Contract Services Ltd",
-    "Enviroguard",
-    "Tenants Cleaning London",
-    "Think Hygiene Ltd",
-    "Cleanerscene",
-    "Leckhampton Cleaning Services",
-    "Fresher Finish Services",
-    "Dazzle 'n' Shine Cleaning Services",
-    "Gloucestershire Cleaning Company",
-    "Benchmark Cleaning Services",
-    "Vision Cleaning",
-    "All Done & Dusted Ltd",
-    "A C Window Cleaning & Maintenance Services",
-    "Stonehenge Cleaning Services",
-    "Ecoblitz",
-    "K M Cleaning & Maintenance Services",
-    "Red Industries",
-    "Bedfordshire Cleaning",
-    "D C S Cleaning Solutions",
-    "Gemini G R P",
-    "Vantage Industrial Cleaning",
-    "Lazerclean",
-    "Universal Cleaning Services",
-    "Waterforce Property Services Ltd",
-    "Sandersons",
-    "Wash & Clear",
-    "Nexus Hygiene",
-    "Fantastic Services",
-    "A & L Cleaning",
-    "UK Cleaning Solutions Ltd",
-    "Kaycee Cleaning Services",
-    "K G B Cleaning",
-    "Premier Cleaning Services",
-    "Bex Cleaning Ltd",
-    "Spick & Span",
-    "Cheeks Commercial Cleaning Services",
-    "Wipeout Central Ltd",
-    "Spa Clean",
-    "Keen 2 Clean",
-    "C D E Cleaning Services Ltd",
-    "Cleanserve Ltd",
-    "Five Star Cleans",
-    "Health Safety & Quality Control International",
-    "Ezee Clean",
-    "Logicare",
-    "Concept Clean",
-    "T C Cleaning Contractors Ltd",
-    "Sparklin Angels",
-    "Solenis UK Ltd",
-    "C C M",
-    "Cleaners Weybridge",
-    "Buildings 2 Clean",
-    "Pestuk Reading",
-    "National Integrated Services",
-    "Pest Right Environmental Services",
-    "Ubbergloves",
-    "Huntsman Pest Control Ltd",
-    "Urgent Detergent",
-    "A P C Cleaning Services Ltd",
-    "Clearstone Solutions Ltd",
-    "T & N Cleaning Company",
-    "Supreme Housekeeping",
-    "Ribble Technology Preston Ltd",
-    "Dealey Fumigation",
-    "Top Quality Cleaners Ltd",
-    "Contract Cleaning Services",
-    "Clearway Pest Control Services",
-    "Houseproud Home Services",
-    "First Point Cleaning & Maintenance Ltd",
-    "C P L",
-    "M & B G Ltd",
-    "O C S",
-    "Fishers Cleaning Services Ltd",
-    "S Murphy",
-    "Carlton Cleaning Services Ltd",
-    "Grime 2 Shine Window Cleaner",
-    "Diamond Cleaning Solutions Ltd",
-    "Astrum Commercial Cleaning",
-    "Squeaky Clean",
-    "Acute Pest Control",
-    "Prim Building Services Ltd",
-    "One Off Clean London",
-    "Nottingham Industrial Cleaners Ltd",
-    "Clearview Cleaning",
-    "Stainless Cleans",
-    "Hughes Gardner",
-    "Inter Clean Doncaster Ltd",
-    "Solo Cleaning Services",
-    "R E Cleaning Services Ltd",
-    "Surrey Hills Pest Control",
-    "London Carpet Cleaning",
-    "Alliance Cleaning",
-    "National Cleaning Services",
-    "Feel the Sparkle Ltd",
-    "Prokleen UK Ltd",
-    "No More Birds",
-    "Hygiene Facilities",
-    "Coastal Contract Cleaning Ltd",
-    "Servicemaster Clean",
-    "A J Morris Pest Control",
-    "Cleaning Services East Dulwich",
-    "Eco Top Clean Ltd",
-    "Spick N Span Supreme Cleaning",
-    "Laddersfree Commercial Window Cleaners Leicester",
-    "Kingfishers Cleaning",
-    "Cleaning Services Wimbledon",
-    "Neat Clean London",
-    "Lancaster City Council Pest Control Unbugged",
-    "Cleanology",
-    "A P S L",
-    "Durban Window Cleaning Contractors",
-    "Justin Cleaning Services",
-    "Ultra Home Services",
-    "Cleaners Notting Hill",
-    "Blackpool Cleaners",
-    "Olympic Cleaning Service",
-    "Clean Genie Glasgow",
-    "P & T Service Ltd",
-    "Ewfeoffkoefewf",
-    "A C R Cleaning Ltd",
-    "The Shoreditch Cleaners",
-    "Pest Express",
-    "cleanoffice.co.uk",
-    "D M Cleaning & Painting Services",
-    "Bush Brush Cleaners",
-    "Liver Window Cleaning",
-    "Southport & District Cleaning Services",
-    "R & K Specialist Cleaners",
-    "Cleaners Balham",
-    "Cleanwise Commercial Cleaning Services",
-    "Dall Cleaning Services Plc",
-    "Green Dolphin Cleaning",
-    "West Country Tank Replacements",
-    "Marie's",
-    "Hyona Cleaning Company Ltd",
-    "Seen 2 B Clean",
-    "White Tiger Cleaning",
-    "On Top Pest Control",
-    "Phillips Animal Health Ltd",
-    "Fuller Facilities Management Ltd",
-    "Elite Cleaning & Property Services Ltd",
-    "Service Master",
-    "Ecoclean Services Ltd",
-    "Vale Game",
-    "Doncaster M B C Metro Clean",
-    "Pestcare Enviromental Ltd",
-    "The End of Tenancy Cleaning Co",
-    "Cleaner Putney",
-    "London Cleaners",
-    "Monicas Maid Services Ltd",
-    "K & J Hird Ltd",
-    "Moores Contract Cleaners",
-    "Flightcare",
-    "Crystal Cleaning",
-    "Hewitt Property Solutions Ltd",
-    "Peterborough Cleaning Co",
-    "First Class Cleaning UK Ltd",
-    "Voyage W D E",
-    "Alexander Cleaning Services",
-    "Flawless Professional Cleaning",
-    "Clean Slate",
-    "Intelligent Pest Control Ltd",
-    "Trish & Maria",
-    "Bell Cleaning",
-    "London Shine",
-    "Jasperz Pest Control Services",
-    "Conico Commercial Cleaning Ltd",
-    "Dublcheck Cleaning",
-    "Maids in Wales",
-    "Islington Council Pest Control Services",
-    "Best Cleaners Stanmore",
-    "Clean Living Services Ltd",
-    "B P M Industrial Cleaning",
-    "S M C Premier Cleaning",
-    "The Box Cleaning Co",
-    "Hawksworth & Sons",
-    "West Wales Cleaners",
-    "J G Litston & Co",
-    "Fine Cleaners London",
-    "Aj Cleaning Services",
-    "Apollo Cleaning",
-    "Absolute House Ltd",
-    "North-west Mole & Rabbit Management",
-    "Casna Group Ltd",
-    "Dimark Cleaning Ltd",
-    "C D L Environmental Services Ltd",
-    "Sapphire Contract Cleaning Services",
-    "Sparkle Cleaning Services",
-    "Estate Professional Cleaners",
-    "Rose Cleaning Bexley",
-    "K S Cleaning Contractors Ltd",
-    "Dream Clean Services",
-    "Sparrow Cleaning",
-    "Steris",
-    "Spotless Clean & Shine",
-    "Grand Cleaning Services Ltd",
-    "Corinium Facilities",
-    "Command Pest Control",
-    "Keleana Cleaning",
-    "Premium Support Services",
-    "Matrix Office Services Ltd",
-    "Sankey's Pest Control",
-    "1st Choice High Level Cleaning & Maintenance Ltd",
-    "Helles Home Help",
-    "Excellerate Services",
-    "Helpful Home",
-    "Cleaner Earls Court",
-    "Carter Henc Cleaning Services Ltd",
-    "Spotless UK",
-    "Mac's Ltd",
-    "Your Home",
-    "Monton Cleaning Services Ltd",
-    "Independent Cleaning Services Ltd",
-    "Homes Maid Clean",
-    "Willm 19 Ltd",
-    "Tony W Paint Removal",
-    "Hygiena International",
-    "V S S Sani Duct Installations Ltd",
-    "B H Environmental Services",
-    "Floorbrite Cleaning Contractors Ltd",
-    "Malden Window Cleaning",
-    "Mrs Sparkles",
-    "Cleaners Brentwood Ltd",
-    "D C H Cleaning & Laundry Services",
-    "T E S Cleaning Services Ltd",
-    "Blue Solution Cleaning Services",
-    "Home Cleaning London",
-    "Elfa Cleaning Ltd",
-    "Bruce Services Cleaning & Maintenance",
-    "Natural Fires Kent",
-    "The Safe Group",
-    "S M B Cleaning Solutions",
-    "Low Cost Cleaning",
-    "M V Cleaning Ltd",
-    "Cleaning Services",
-    "End of Tenancy Clean London",
-    "Steves Cleaning",
-    "Mop & Brush Ltd",
-    "Staffordshire & Warwickshire Cleaning Services",
-    "Gamber Logistics Ltd",
-    "Glenn Cleaning & Support Services",
-    "A Cleaning Service Ltd",
-    "Milla G 5 Ltd",
-    "J M Cleaning Services",
-    "Riverport Residential Cleaning",
-    "K L F Domestic & Commercial Cleaning Services",
-    "Minster Cleaning Services in Lancashire",
-    "David Morris Window Cleaning",
-    "White Rose Home Cleaning",
-    "Envirocleanse Ltd",
-    "Compass 24",
-    "Spotless Cleaning Cleaning Maintenance",
-    "Tank Reline",
-    "Ultimate Cleaning Force",
-    "Handy Cleaners London",
-    "F S Complete Cleaning",
-    "Betterclean Services",
-    "Pearly Home",
-    "Commercial Cleaning Sw Ltd",
-    "Cleaning Operations UK Ltd",
-    "Cleaners Warehouse",
-    "Solvics Facilities Services",
-    "Quickil Services Ltd",
-    "Bay Wash",
-    "D Brice & Co Ltd",
-    "B B C S Optim Group",
-    "Lloyd Cleaning",
-    "Workbusters",
-    "Purely Clean",
-    "Minster Cleaning Office Cleaning in Derbyshire",
-    "Depest",
-    "Clearchoice Ltd",
-    "The Sterilization & Disinfection Unit",
-    "Mo's Maids",
-    "Mary Moppins Ltd",
-    "Cruise Cleaning Services",
-    "Diamond Finish Cleaning",
-    "Warrens Cleaning Services",
-    "Gogo Cleaning",
-    "Glen Cleaning",
-    "Coulsdon Chimney Sweeps",
-    "Cleaning Services New Malden",
-    "Spotless Cleaning Ltd",
-    "J C S Cleaning",
-    "Crime Scene Cleaning UK Ltd",
-    "Addy & Family Professional Cleaning Services",
-    "D J B",
-    "F B S Ltd",
-    "Bay Cleaning Solutions",
-    "Ultra Cleaning Services",
-    "Clean & Easy (UK) Ltd",
-    "Kays Cleaning Services",
-    "Stadar Innovative Cleaning",
-    "M & L Cleaning Services Ltd",
-    "1st Class Professional Cleaning",
-    "Principle Cleaning Services Ltd",
-    "Molly Maid Chichester",
-    "Squee-quay Clean",
-    "Green & Clean",
-    "Harcourt Cleaning Services",
-    "Elbow Grease Cleaners",
-    "Richard Allen Pest Control",
-    "Euroclean",
-    "Cleaners Wandsworth",
-    "Praise Mercy Homecare Ltd",
-    "Nellie Neat Cleaning",
-    "Clean Sweep Domestic Services",
-    "Housemartin Ltd",
-    "W A Products UK Ltd",
-    "Fast Cleaners Merton",
-    "Rejus",
-    "Sparkling Solutions",
-    "J T Cleaning Services",
-    "Taylor Maids UK Ltd",
-    "Premier Bin Cleaning Services",
-    "S P 8 Cleaners",
-    "Mythe Cleaning",
-    "Little Miss Perfect Ltd",
-    "Cleaning Professional Visa",
-    "Sparkle Cleaning Co Ltd",
-    "Proclean Cleaning Services Ltd",
-    "The London Window Cleaner",
-    "A B Services",
-    "Nationwide Cleaning & Support Services Ltd",
-    "Beck & Call Direct Ltd",
-    "Pace Fleet Clean Ltd",
-    "Fresher Roof",
-    "I S S Facility Services Within Bolton General Hospital",
-    "Commercial Cleaner Gloucester",
-    "Image Property Cleaning Services",
-    "Samsic",
-    "Dolarod Consulting Ltd",
-    "A Helping Hand",
-    "Metropest",
-    "Martel Cleaning",
-    "Reach N Clean",
-    "Barringtons Cleaning Ltd",
-    "Ferguson Cleaning Services Ltd",
-    "Mavis Russell Cleaning Ltd",
-    "Busy Bees Ltd",
-    "Dedman Contract Services",
-    "Your Cleaner Home",
-    "Regency Cleaning Services",
-    "V E D Services",
-    "Time Managers Ltd",
-    "Custodia Pest Control",
-    "Unitty Specialist Cleaning Ltd",
-    "Bowdens Cleaning Services",
-    "Mid West Grime Squad Ltd",
-    "Soham Cleaning Services",
-    "Devine Services Ltd",
-    "Q I Cleaning",
-    "Britannia Services UK Ltd Contract Cleaners",
-    "Home Clean North London Ltd",
-    "Be Cleaning Services",
-    "Pink Pearl Cleaning Ltd",
-    "Bizzy Lizzy",
-    "We Are Optimo",
-    "Window Cleaners Tunbridge Wells",
-    "Clean Group S W",
-    "Ark Pest Control Ltd",
-    "Home Sweet Home Cleaning Services",
-    "J G Environmental",
-    "P S K",
-    "Accomplished Contract Services Ltd",
-    "Arise 'n Shine Cleaning Services & Supplies",
-    "Clean Event Services Ltd",
-    "La Purete",
-    "Elite Cleaning Solutions Ltd",
-    "Atkinson & Roberts Ltd",
-    "First Maid Ltd",
-    "Tanks & Pipeworks Ltd",
-    "Mitie",
-    "Greenclean Maintenance Services Ltd",
-    "Best Cleaning Services",
-    "Prixtine Ltd",
-    "Bowen's Coastal Cleaners",
-    "Krystalklene Cleaning Services",
-    "Eurowash",
-    "Sampson Cleaning",
-    "Absolute Hygiene Solutions",
-    "Des Bone Ltd",
-    "All Starshine Window Cleaner",
-    "Insite Managed Services",
-    "1 E N V Solutions Ltd",
-    "Delta Containers Manchester Ltd",
-    "Essential Cleaning Services",
-    "Pampered House",
-    "Clean Flat London",
-    "Schools Offices Services Ltd",
-    "Pestkill Environmental Services",
-    "Greenheart Clean",
-    "Sarah Jane Cleaning Ltd",
-    "Perfect Finish Cleaning Group",
-    "Total Contract Services",
-    "Carpet Cleaner Hire",
-    "J P D Housemaids",
-    "Procare Cleaning Management",
-    "J 4 Cleaning Services",
-    "N R T C A",
-    "Pest Solution Ltd",
-    "Innov8 Cleaning Solutions Ltd",
-    "Muse Cleaning Services",
-    "Platinum Contract Cleaning",
-    "Ivory Rose Cleaning Services Ltd",
-    "Cleanest Cleaners",
-    "Harrison Cleaning Specialists",
-    "Action Pest Control",
-    "Ovenu Aylesbury",
-    "Premier Home Clean",
-    "Aim Commercial Cleaning",
-    "Rentokil Pest Control Uxbridge",
-    "Laddersfree Commercial Window Cleaners",
-    "Axis Group",
-    "O'Connels Cleaning",
-    "Star Pest Control Ltd",
-    "Ovenclean",
-    "Grosvenor Cleaning Ltd",
-    "A & H Associates",
-    "Gleaming Fresh Clean",
-    "Allprocleans",
-    "Tag Services London",
-    "Industrial Cleansing Services Ltd",
-    "Oscar's Cleaning Chelsea",
-    "A Star Cleaning Services",
-    "Groves Xtreme Clean",
-    "G S F",
-    "Aquaclean",
-    "Pure H20 Window Cleaning",
-    "Tile & Stone Medic",
-    "G & G Cleaning Contractors Ltd",
-    "Crestwood Environmental",
-    "Ecocleen Services Ltd",
-    "Merry Mops",
-    "Iclean Ltd",
-    "T E C Services Ltd",
-    "Purple Rhino Contract Cleaning Ltd",
-    "Lasting Impressions",
-    "Swift Domestic & Office Cleaners",
-    "Purgo Support Services",
-    "Green Cleaning Services",
-    "London House Cleaning",
-    "White Clean Ltd",
-    "Nottingham Window Cleaning",
-    "Leonard's Yorkshire Ltd",
-    "Super P C Cleaning Ltd",
-    "Kenealy Industrial Cleaning Specialists",
-    "Standard Cleaning Services",
-    "N H S Trust Domestic Services Within Royal Preston Service",
-    "Dust Busters",
-    "Booths Cleaning Services",
-    "Paice Cleaning Ltd",
-    "Orion Cleaning",
-    "The Welcome Team Ltd",
-    "Provac",
-    "Cleanforce Contracting Ltd",
-    "Westcountry Cleaning",
-    "C S A Hygiene Commercial Cleaning",
-    "All Around Property Maintenance Ltd",
-    "Consolidated Logistics Service Ltd",
-    "St Georges Pest Control",
-    "Sparkles Cleaning Services",
-    "Andover Pest Prevention",
-    "Fairy Cleaning",
-    "Expertise Cleaning Consultancy Services",
-    "The Daily Maid",
-    "Heston Cleaning",
-    "Pest Control Services Ltd",
-    "C C Infrastructure Services",
-    "Diamond Pest Control Ltd",
-    "Spring Clean Home Services",
-    "The a Y S Group",
-    "Vergo",
-    "Birkin Services",
-    "Pure Sweep",
-    "Reynolds Cleaning Services Ltd",
-    "Elliott Hygiene",
-    "Green Oaks Cleaning Services",
-    "Anya's Cleaning Services",
-    "All Over Cleaning Services Ltd",
-    "K & N Cleaning & Holiday Chalets",
-    "The Cavalier Cleaning Co",
-    "S T P Cleaning Services",
-    "No Stone Unturned",
-    "Angel Domestic Services",
-    "Thames Tank Cleaning Services Ltd",
-    "S A J Window Cleaners",
-    "Premier Pest Control Services",
-    "Lamai Cleaning & Ironing",
-    "Countrywide Environment Services",
-    "Diamond Commercial Cleaning",
-    "Abra-ca-dabra Services",
-    "Minster Franchise Services",
-    "P H S Treadsmart",
-    "Splashernet Services Ltd",
-    "Universal Pest Control South",
-    "I Shine Cleaning",
-    "Central Cleaning Company",
-    "Servicemaster Ltd",
-    "Evolution Cleaning Services",
-    "Scivvies Domestic Cleaners",
-    "Steris Ltd",
-    "F K Domestics Ltd",
-    "123 Cleaning Specialists",
-    "Fulham Cleaning Services",
-    "Gmeryclean",
-    "Elite Support Services",
-    "London Deep Cleaning Service",
-    "Oven Clean",
-    "Cleanscene",
-    "M J Cleaning Agency",
-    "Carpets Please",
-    "A T Window Cleaning",
-    "Noonan",
-    "Soul Clean Ltd",
-    "Oxford Cleantech",
-    "Donna's Domestic Cleaning Service",
-    "L C Housekeeping Services",
-    "Busy Bees",
-    "C R N Contract Services Ltd",
-    "Nice 'n' Clean",
-    "Wash Windows",
-    "Kleankeepers Plc",
-    "Nightshift Pest Control",
-    "Cleaners in Leeds",
-    "Ninja Property Services",
-    "House Buddies",
-    "Allclean Services",
-    "Heritage Cleaning Services",
-    "Clear Windows",
-    "Ashley Cleaning Services",
-    "Bolton Metro Pest Control",
-    "Logical Cleaning Solutions",
-    "Adam James",
-    "T M Cleaning Services",
-    "Northwest Cleaning Services",
-    "The Task Team",
-    "Swale Cleaning Services Ltd",
-    "Corina Cleaning Services",
-    "Servicemaster Mercia",
-    "T T C Homecare Services",
-    "Dirtbusters",
-    "Weymoor Cleaning Services",
-    "K D T Cleaning Services",
-    "Tinkerbell Cleaning Company",
-    "D & D",
-    "Skaylon Ltd",
-    "Total Bird Control",
-    "S R B Cleaning Contractors",
-    "Angelo Window Cleaning",
-    "Certitude Cleaning Services Ltd",
-    "Mitie Pest Contol Ltd",
-    "Mr Sparklean",
-    "Cleaning Technique",
-    "Northern Cleaning Services",
-    "S S H Group",
-    "Skweeky Kleen",
-    "Fast Cleaners Richmond",
-    "Van Vynck Environmental",
-    "Busy Bee Natural",
-    "Absolutely Cleaning Services Ltd",
-    "Fab Bin Cleaning",
-    "Clean Queen",
-    "Go-clean",
-    "Brighter Days Cleaning",
-    "The Retro Housewife Services",
-    "Focus Cleaning Contracts Ltd",
-    "M C Cleaning Services",
-    "Ocd Services Kirklees Ltd",
-    "Caldy Cleaning",
-    "Traditional Local Cleaning",
-    "Sinclair Cleaning Services",
-    "Stulee",
-    "Regional Pest Services",
-    "Complete Cleaning Services",
-    "M R F Window Cleaning Services Ltd",
-    "Purity Cleaning",
-    "A Star Cleaners",
-    "Isle of Wight Cleaning",
-    "All Services in One",
-    "Commercial Cleaning Maintenance Services",
-    "Office Care",
-    "Lynk Contract Services Ltd",
-    "Fromow Services",
-    "End of Tenancy Clean Up",
-    "L R Cleaning Services",
-    "Assured Cleaning Services Ltd",
-    "Atkins H S R Ltd",
-    "Serenity Domestic Services",
-    "Kartha",
-    "Wecare Cleaning Services Ltd",
-    "A Squee G Clean",
-    "Lodi UK",
-    "J C D Cleaning & Support Seervices",
-    "Cleaner Barnsbury",
-    "K Creed Cleaning",
-    "Premier Commercial Cleaners",
-    "Skye Blue Cleaners",
-    "Cleaners Fulham",
-    "Nitro Group Cleaning Services",
-    "A Clean Break Ltd",
-    "Addley Ltd",
-    "Revolution Support Services",
-    "Crystal Touch Ltd",
-    "The Cleaning Fairy",
-    "Sandwell Pest Control Services",
-    "Selclene Hampshire",
-    "Country Maids Ltd",
-    "The Revival Company",
-    "A H Cleaning Contractors",
-    "Suburban Window Cleaning Co",
-    "Higher Manor Cleaning Services",
-    "A A",
-    "Pest Dominion Ltd",
-    "Seaview Cleaning Services",
-    "The Rat Catchers",
-    "Ag Cleaning Services",
-    "Touch of Class",
-    "Clean2go",
-    "Greenclean Ltd",
-    "Aaron's Brice Chimney Sweep",
-    "Hycleanz",
-    "Churchill Group",
-    "Spring Shine Cleaners",
-    "Expert Cleaning Services",
-    "Clear Solutions",
-    "Southernhay Cleaners South West Ltd",
-    "Natural Touch",
-    "J C S",
-    "Pure Cleaning Group Ltd",
-    "A & E Services",
-    "The Daily Maid Service Ltd",
-    "Out of Hours Cleaning Services",
-    "E Z Evolution Ltd",
-    "Eco Drift",
-    "Trapline Pest Control",
-    "Gosport Borough Council Pest Control & Advice",
-    "Reemist Cleaning",
-    "Clean As a Bean",
-    "C & D Cleaning Services Ltd",
-    "Go Clean",
-    "Valley Pest Control",
-    "Tiny Sia Cleaning & Ironing",
-    "Clifton Cleaning Services",
-    "B & S Cleaning Ltd",
-    "Clean Green Living",
-    "Voila Services",
-    "1st Daily Maid's Stroud",
-    "Merry Maids of Ilkley & Skipton",
-    "Safe Handz Domestix",
-    "Merrymaids of London South",
-    "Rodeosect Pest Control Services Ltd",
-    "Clean-n-move",
-    "R T Office Cleaning",
-    "Littlebirds Home & Holiday Services Ltd",
-    "Stephens & Daughters Cleaning Services",
-    "Fastklean",
-    "Charlie's Angels Fm Ltd",
-    "Devon Cleaning South Hams",
-    "Bugbusters",
-    "C P Cleaning Services Ltd",
-    "Yorkshire Cottage Services",
-    "Thompson Services",
-    "Van-engel Cleaning",
-    "Prime Cleaners London",
-    "Haus Maids Ltd",
-    "Simpsons Cleaning Services Ltd",
-    "Cannon Hygiene Ltd",
-    "Arising Cleaning Services",
-    "Corwoods Cleaning Group",
-    "Green Cleen UK Ltd",
-    "Thistle Tanks",
-    "City Healthcare Direct Ltd",
-    "Nicks Cleaners Ltd",
-    "Repointing Brick",
-    "Squeakyclean",
-    "Cleaners Ruislip",
-    "Bickford Cleaning",
-    "D C Services & Co Ltd",
-    "J E H Cleaning Services",
-    "Old Bills Pest Control",
-    "Bubble N Shine",
-    "Myhome Dorset",
-    "Classic Cleaning",
-    "Robo Cleaning Services",
-    "Alchemy Commercial Cleaning Specialists",
-    "Cleaning Agency Ltd",
-    "Neat Services",
-    "Hygiene Depot",
-    "Beebys Ltd",
-    "Crystal Clean Southern Ltd",
-    "Hashtag Clean",
-    "Sharps Hot Line",
-    "Scrub Clean Windows",
-    "Minster Cleaning Office Cleaning in Birmingham",
-    "Visibly Clear Services Ltd",
-    "Supermaids",
-    "Image Office Cleaning",
-    "R M Contractors UK Ltd",
-    "Mastergleam Cleaning Services Ltd",
-    "Howells Bradford",
-    "Clean2spec",
-    "Trianik Cleaners",
-    "Dentervieco",
-    "Fineclean UK Ltd",
-    "C & C Cleaning Services Ltd",
-    "S B Window Cleaning",
-    "James Harris Cleaning",
-    "Lodge Environmental Solutions Ltd",
-    "Allclean Enterprises",
-    "Mop-a-lot Services",
-    "Destrodent Pest Control",
-    "Maids Daily",
-    "Terminator Pest Control Ltd",
-    "Decon Severn UK Ltd",
-    "Cleanscapes",
-    "M P M Consumer Products",
-    "Smarter Services",
-    "Cleaning Master",
-    "Lewis & Graves Ltd",
-    "Suzies Cleaning Co",
-    "Ashwood Chimneys",
-    "The Aztec Group Ltd",
-    "Paragon Services Southern Ltd",
-    "A C C",
-    "Innsight Cleaning Services",
-    "Dynamics Cleaners",
-    "Ratcliffe Cleaning Contractors Ltd",
-    "Tudor Contract Cleaners",
-    "Merry Maids of Wakefield & South Leeds",
-    "Barnet Cleaning Services",
-    "Best Cleaners Ruislip",
-    "Regional Environmental Services",
-    "Blue Spot Cleaning Services Ltd",
-    "Andrews Cleaning Services",
-    "S4 Facility Management",
-    "Merry Maids of Stoke on Trent",
-    "Deepclean Hygiene Solutions Ltd",
-    "Ab Chimney Services",
-    "M C Cleaning Co",
-    "Professional Cleaning Services UK Ltd",
-    "Beegone",
-    "South West Pest Control",
-    "Croydon Pest Control",
-    "Bournemouth Environmental Cleaning Ltd",
-    "Smarkle Cleaning Services",
-    "Cleaning Services Twickenham",
-    "Tame Cleaning & Maintenance Ltd",
-    "5 AM Contract Cleaning Ltd",
-    "4 Seasons Environmental Services",
-    "M S J Majic",
-    "Approved Cleaning Services",
-    "Gooch Group",
-    "Februus Ltd",
-    "M & B Carpet Care",
-    "Always Cleaning Ltd",
-    "Clean Slate UK Ltd",
-    "Harper Industrial Cleaning Services",
-    "Mark Harper Industrial",
-    "Clean Image South West Ltd",
-    "Ladybirds",
-    "Cleanpark UK Ltd",
-    "Strawstone",
-    "Waddon Carpet Cleaners",
-    "Jay's Window Cleaning Services",
-    "Greenbank Cleaning Services",
-    "Integra Cleaning Group Ltd",
-    "Action Pest Control Ltd",
-    "Essex Finest Cleaners Ltd",
-    "Tube Tech Industrial Ltd",
-    "Cleaning Services Camden Town",
-    "Crystal Clean South Cheshire Ltd",
-    "Elaine Cleaning Services",
-    "Airspeed Cleaning Services & Building Maintenance Ltd",
-    "Map Cleaning",
-    "Cleaners Direct",
-    "The Crease Line",
-    "A B A C",
-    "Missys Maids",
-    "Complex Cleaning",
-    "Amc Cleaning",
-    "Simply Clean",
-    "The Cleaning Services Group",
-    "U P M",
-    "Paul Byrne",
-    "Your Doorstep Cleaning Services",
-    "Diamond Elite",
-    "Metrokleen",
-    "Trustoak Services Ltd",
-    "No Stains Allowed",
-    "Excel Cleaning Services",
-    "T & M Cleaning Service",
-    "Enerchi Space Cleansing",
-    "Bird & Pest Solutions",
-    "A C S",
-    "Thorpe Industrial Cleaners",
-    "Minster Cleaning Office Cleaning in Liverpool & Wirral",
-    "Spot on Cleaning",
-    "Wessex Pest Control Ltd",
-    "Agenda Cleaning Services",
-    "Pestagon Pest Control Cambridge",
-    "Palmer Pest Control",
-    "Bevlyn Ltd",
-    "Rainbow Brite Cleaning Services Ltd",
-    "Carpet Cleaning London",
-    "M D Window Cleaning",
-    "Seascape Commercial Services",
-    "Independent Pest Control & Hygiene Services Ltd",
-    "A Plus",
-    "L B Wizard Cleaning",
-    "I & R Cleaning Services",
-    "Ark Environmental Services",
-    "Dudley Cleaning Ltd",
-    "T C Bibby & Sons",
-    "Ac Services",
-    "The Works Commercial Services",
-    "Remove Domestic Services",
-    "Key Support Services",
-    "Bright & Beautiful Warrington & Knutsford",
-    "Maid 2 Shine",
-    "Hygienaclad",
-    "Firstguard",
-    "Snow White Standard Cleaning Group",
-    "Intelligent Clean",
-    "Maid 4 Cleaning",
-    "Cleaning Services Shoreditch",
-    "Pest Solutions Ltd",
-    "All Environmental Services",
-    "Power Flush Know It All",
-    "Ace Cleaning",
-    "Dust Away",
-    "Kenilworth Pest Control Ltd",
-    "Big Bubble Cleaning",
-    "Gleem Cleaning",
-    "Kleanzite Facilities Management Ltd",
-    "Genie Cleaning Services",
-    "M P Cleaning Services",
-    "Simply Site Services Bristol",
-    "Webb Support Services Ltd",
-    "A C S Specialist Cleaning Ltd",
-    "We Clean Ltd",
-    "C P D Property Services Ltd",
-    "The Cleaner Company",
-    "A Brighter Home",
-    "Mervin J Stone Quality Cleaning Services",
-    "Jurassic Window & Gutter Cleaning Ltd",
-    "West Midlands Cleaning",
-    "Hillcrest Cleaning",
-    "Kings Clean Ltd",
-    "Dream Cleaners London",
-    "Aro Multiservices",
-    "Beckford Cleaning Company",
-    "Basusu Cleaning Services",
-    "Cleaning Fairies",
-    "W H K Services Devon Ltd",
-    "A & H Duct Cleaning Services",
-    "Premier Commercial Cleaning",
-    "The Dust Fairy",
-    "Cleaning Matters Ltd",
-    "A L Commercial Cleaning Ltd",
-    "Abbey Cleaning Contractors",
-    "Prestige Services London Ltd",
-    "J & I Grease Gone",
-    "Contract Abseiling",
-    "Gleamteam Valeting Oxford Ltd",
-    "Hi-klean Ltd",
-    "Clean My Office",
-    "The Brighton Cleaning Co",
-    "Rapid Cleaning Services",
-    "Skeldings Ltd",
-    "Reliable Cleaning Services",
-    "Henleaze Cleaning Services Ltd",
-    "Leo's Cleaners",
-    "O J Cleaners",
-    "Floppy Mops",
-    "M B C Bird & Pest Solutions Ltd",
-    "Ovenu",
-    "Liquitech",
-    "Twinkle Domestic Services Ltd",
-    "Bright & Beautiful Malvern Hills",
-    "Sparkinclean",
-    "The Fairy Dusters",
-    "Monitor Pest Control Ltd",
-    "Kingston Cleaning Services",
-    "Essity Hygiene UK Ltd",
-    "Clean for You",
-    "F K Domestics",
-    "Cleaners Carpet Cleaning",
-    "P H S Group",
-    "All Clean & Pristine",
-    "Byrons Cleaning",
-    "Vervia Ltd",
-    "Fluid Hygiene",
-    "Brush 'n' Dust",
-    "citymaids.co.uk",
-    "Cleaning Pristine Ltd",
-    "P & H",
-    "Cleankill Pest Control",
-    "Monster Cleaning Crawley",
-    "Anlaby Cleaning Services",
-    "Pestkill",
-    "Eco Cleen",
-    "K C W Platinum Cleaning Services",
-    "Love Cleaning 4 U Ltd",
-    "Grimebusters Cleaning Services",
-    "S 2 C Midlands Ltd",
-    "Sonnic Cleaning Services",
-    "Miss Mopsy",
-    "Clark Window Cleaning Ltd",
-    "Adam Services S W Ltd",
-    "Diamond Home Services",
-    "Clean As U Like",
-    "Solomon Cleaning Services",
-    "W Parker & Son Croydon Ltd",
-    "Pole Position Cleaning Ltd",
-    "Supreme Cleaning",
-    "Carroll Cleaning Company Ltd",
-    "W F Cleaning & Contract Services",
-    "The Klean Team",
-    "Laddersfree",
-    "K C Commercial Cleaning",
-    "Scoobyclean",
-    "David Bruce",
-    "Jill's Cleaning Services",
-    "Excellence Cleaning Services",
-    "B C C - W C C",
-    "Fairy Dusting of Yeovil",
-    "Maid 4 U Ltd",
-    "Maid in Lytham",
-    "The Pink Cleaning Co Ltd",
-    "Communal Cleaning Services",
-    "M C Cleaning",
-    "Tank Farm Services Ltd",
-    "Fastklean Franchise Ltd",
-    "Lilly Spotless Cleaning Ltd",
-    "Jen Cleaners",
-    "E P Cleaners",
-    "Pest Control 999",
-    "Monument Cleaning",
-    "Fairies Cleaning Services",
-    "Legacy",
-    "M T M Environment Care Ltd",
-    "G S K Cleaning Services",
-    "Domestic Nirvana",
-    "Deep Clean",
-    "Chiswick Cleaners",
-    "D M G Cleaning Services Bedfordshire Ltd",
-    "Gemini Cleaning Services",
-    "Cannon Cleaning",
-    "All Clean Services",
-    "Reliable Ladies",
-    "Pestproof Ltd",
-    "UK Deep Clean Ltd",
-    "Spring Cleaners",
-    "Safeguard",
-    "J W S Contract Cleaning Ltd",
-    "Wow Facilities Management",
-    "Shropshire Expert Cleaners",
-    "Maxi Jaye",
-    "P A G Cleaning Services",
-    "Bespoke Cleaning Services",
-    "Alternative Cleaning",
-    "Hygiene Group",
-    "Fresh Cleaners Acton",
-    "Miss Merry",
-    "Jaguar Pest Control Ltd",
-    "Superior Cleaning UK Ltd",
-    "Red Apple Cleaning Ltd",
-    "Dolly Maids",
-    "Hayward Cleaning Services",
-    "Overclean Ltd",
-    "House of Hollis",
-    "Bliss Cleaning",
-    "Sparkle Home Services",
-    "Smiths Cleaning",
-    "Henace & Co",
-    "Adg Cleaning Services",
-    "Tower Services London Ltd",
-    "Jurassic Coast Cleaning Co Ltd",
-    "Spire Commercial Cleaning",
-    "Hillcroft Cleaning Services",
-    "Kram Contract Cleaning",
-    "Allbright",
-    "All Star Cleaning Services",
-    "Clean & Simple",
-    "Bio Clean Jetting",
-    "First Class Tenancy Cleaning",
-    "Alpine Cleaning Services Norfolk Ltd",
-    "Oven Blitzer E A Ltd",
-    "Pro Care Cleaning",
-    "Done N Dusted",
-    "Pest Control Berkshire",
-    "First Direct Enterprises Ltd",
-    "Smart Clean Surrey",
-    "Compass Clean",
-    "Fast Cleaners Hounslow",
-    "Cookies Cleaning Crew",
-    "A J A W Clean & Simple",
-    "Select a Cleaner",
-    "Debclean",
-    "Cleanrite Cleaning Services",
-    "M & A Cleaning & Ventilation",
-    "Little London Cleaning",
-    "Carlton Cleaning UK Ltd",
-    "The Good Housekeeping Agency Ltd",
-    "City Cleaning",
-    "Vent-care Cleaning Services",
-    "Crystal Klean Ltd",
-    "Birkdale Cleaning Company",
-    "Prince Services",
-    "Fusion Cleaning Services Ltd",
-    "Domestic Clean London",
-    "A V Cleaning Services Ltd",
-    "Mitchell Cleaning Services",
-    "Swallow Hygiene",
-    "Ovenclear Ltd",
-    "Cleaning Unique",
-    "Cooper's Contract Cleaning Ltd",
-    "Thomson Cleaning Service",
-    "P C S",
-    "Peak Forest Pest Control",
-    "Barbican Cleaning Services",
-    "50 Shades of Clean Ltd",
-    "All Season Cleaning Solutions",
-    "Active Cleaning Services (Midlands) Ltd",
-    "G-nova",
-    "Green Commercial Cleaning",
-    "Pest Kill",
-    "M B C Cleaning",
-    "G R P L Ltd",
-    "Village Cleaning Services",
-    "Avid Pest Control",
-    "Olia Cleaning Services",
-    "360 Commercial Cleaning",
-    "Clean Tile & Grout Lakes",
-    "Oven King",
-    "Mopping Madness",
-    "C M I Health Care",
-    "Fast Oven Cleaning",
-    "Action Bee Cleaning Ltd",
-    "Acorn Environment Services Ltd",
-    "Help Mate Services",
-    "O C S Support Services Wales",
-    "At Home Cleaning",
-    "Office Cleaning Services Ltd",
-    "Dust Demons Ltd",
-    "Cachet Cleaning & Environmental Services Ltd",
-    "E & H Hartle",
-    "Ellis Cleaning Services",
-    "Toxic Respond",
-    "Home Maids Direct",
-    "Online Cleaning UK Ltd",
-    "London Offices Cleaning",
-    "Conservaclean",
-    "Aire Valley Chimney Sweeps",
-    "Fleetclean",
-    "Acorn Cleaning Ltd",
-    "I Q Cleaning Solutions Ltd",
-    "K S Cleaning Services",
-    "Fast Cleaners Uxbridge",
-    "All Clean & Tidy",
-    "Four Corners Cleaners",
-    "Ultimate Cleaning Services",
-    "Manila Group",
-    "I M S Hygiene",
-    "Southern Pest Control",
-    "I D S Services",
-    "Ron Clean Ltd",
-    "Sureshine Window Cleaning Services",
-    "Vermex",
-    "Oven Cleaning Barnet",
-    "I S S Facilities Services Ltd",
-    "Easy Clean Commercial Ltd",
-    "Acorn Cleaning Service",
-    "Cleaners Chiswick",
-    "Iclean",
-    "Active Cleaning Ltd",
-    "Cleaning Size London",
-    "Bubbles & Suds Ltd",
-    "Service Assured Ltd",
-    "Kingsmaid",
-    "Wallis B Cleaning",
-    "Hampstead Helpers",
-    "Cleaners Hounslow Group",
-    "Blitzit Ltd",
-    "The Kleen Team Ltd",
-    "Spotless Commercial Cleaning UK Ltd",
-    "Pcvalet Ltd",
-    "Why Clean Ltd",
-    "Sutton Cleaners",
-    "Cleaning Services Acton",
-    "Laddersfree Commercial Window Cleaners Oxford",
-    "Maid on a Mission Ltd",
-    "Monster Cleaning New Malden",
-    "Bolton Council Pest Services",
-    "Excellence Floorcare Ltd",
-    "Beedazzled",
-    "Alpine Cleaning Services",
-    "Manor Cleaning Services",
-    "Evans Cleaning",
-    "1st Industrial & Commercial Services",
-    "Ipolish",
-    "Inside Out Domestics Ltd",
-    "B R Holland & Sons Ltd",
-    "Excalibur Professional Cleaners",
-    "Complete House Cleaning",
-    "Charlie's Angels Cleaning Services",
-    "Merry Maids of Solihull",
-    "Willacy Oil Services",
-    "Sharons Domestic Cleaners",
-    "Reliance Com Ltd",
-    "Sparkle Fairy Maids",
-    "T J Cleaning Services",
-    "Crystal Cleaning Services",
-    "Clean As Crystal",
-    "Elite Cleaning Contractors",
-    "Jane Lingwood",
-    "Wynsdale Pest Control",
-    "Swan Cleaning",
-    "Agnesdomclean Ltd",
-    "Rational Pest Control Ltd",
-    "S C A",
-    "Cleaner Maida Vale",
-    "Clean Genie",
-    "Langtons Cleaning",
-    "Dazzle Domestics",
-    "J L Contract Cleaning",
-    "Oven Sheen",
-    "Ecoguard Pest Solutions",
-    "Maids for You Too",
-    "Bath Domestic Cleaning Services",
-    "Natures Way Pest Control",
-    "I C Solutions 247 Ltd",
-    "Edwards",
-    "Pelsis Ltd",
-    "Pristine Moments Cleaning Services",
-    "nudecleaning4u.co.uk",
-    "All Seasons Group Services Ltd",
-    "D H Complete Cleaning Contractors",
-    "Star Clean Oxford",
-    "Eradicate Pest Control Specialists Ltd",
-    "Jewel Cleaning Services Ltd",
-    "Bucks Property Care",
-    "A & K Window Cleaners",
-    "C C Cleaning Services",
-    "Trendleway Cleaners Ltd",
-    "A1 Quality Cleaning Ltd",
-    "Allseal Cleaning Services Ltd",
-    "Sofa Cleanic",
-    "M & K",
-    "M C B Cleaning",
-    "Integrated Cleaning Services Ltd",
-    "Tehilax Ltd",
-    "Nexon Hygiene",
-    "The Genie Cleaning Company",
-    "Diamond Domestic Cleaning Services Ltd",
-    "Border Cleaning",
-    "Hygiene Systems Ltd",
-    "Garlands Maintenance Ltd",
-    "Perfect Cleaners Ilford",
-    "Alex Cleaning Services Ltd",
-    "Swift Office Cleaning Services",
-    "G J Miles Cleaning Services",
-    "Window Cleaning Birmingham",
-    "Kleen Homes",
-    "Crusader Cleaning",
-    "Hy-kleen of Warwick Ltd",
-    "Karisparkle Cleaning Services",
-    "Hibberts & Hulme",
-    "Abbey Janitorial",
-    "Blitz Home Environmental Cleaning Ltd",
-    "Clean-lyn Lady",
-    "Pestokill",
-    "Pro Cleaners Cricklewood",
-    "Capital Services Group",
-    "Mister Shine",
-    "First Reflections Cleaning Contractors",
-    "Deep Clean London",
-    "M C S",
-    "Best London Cleaners",
-    "Mid Lincs Cleaning",
-    "Apollo Wales",
-    "Southport Service Co",
-    "Perfect Tenancy Cleaning London",
-    "P H S Ltd",
-    "Legacy Contract Cleaning Ltd",
-    "K K C Facilities Management Ltd",
-    "Acquaint Consolidated Services",
-    "J B Cleaners",
-    "P P C Window Cleaning",
-    "Macenviro",
-    "Sullivans",
-    "Top London Domestic Cleaners",
-    "End of Tenancy Cleaning",
-    "Park Property Service",
-    "K S Cleaning Solutions",
-    "Clearground",
-    "Marks Cleaning",
-    "A C Services",
-    "M P M Graffiti Solutions",
-    "Kitchen Cleaning London",
-    "A 2 Z Cleaning Services",
-    "K M Cleaning",
-    "Bee Kleening Services",
-    "Able Commercial Kleaners Ltd",
-    "2 Clean",
-    "Make It Shine",
-    "Middlewich Tank Wash",
-    "The Abbey Cleaning Service Ltd",
-    "J A Lee General Cleaning Contractors Ltd",
-    "Ignite Cleaning Services",
-    "Stephen Bennett & Son",
-    "Thames Cleaning & Support Services",
-    "Cleaning Services Kentish Town",
-    "Kaizen",
-    "Aliard Environmental Services",
-    "Hessle Cleaning Services",
-    "Cleaning Maintenance Supplies Ltd",
-    "P T Cleaning",
-    "M F B Partners Ltd",
-    "Allied Ltd",
-    "A G S One",
-    "Busy Hands Cleaners",
-    "Total Clean Solutions",
-    "W A Wootton",
-    "Pestpro Bird Solutions",
-    "Freelance Regular House Cleaning",
-    "Enviroclean",
-    "Astral Cleaning Services Ltd",
-    "Fresh & Clean Services",
-    "Extreme Cleaning Solutions",
-    "Nightingales Cleaning & Pest Control",
-    "New Choice Cleaning",
-    "A W Cleaning Contractors Ltd",
-    "Business & Office Cleaning Services Ltd",
-    "Core Clean",
-    "Heritage Contract Services Ltd",
-    "Pestwise Pest Control",
-    "Safeguard Pest Control",
-    "Stockport Metropolitan Borough Council Pest Control",
-    "Mary's Cleaning",
-    "General Cleaning Services",
-    "Best Cleaners Pinner",
-    "Clean Choice Ltd",
-    "Canopy Fan Cleaning",
-    "Team Group",
-    "Sutton Window Cleaning",
-    "Globe Cleaning Contractors Ltd",
-    "Synergy Sw Ltd",
-    "Merry Maids - The Weald",
-    "Cleaners Lambeth",
-    "Blue Diamond Cleaning Services",
-    "Stour Valley Cleaning",
-    "S H S Hygiene Ltd",
-    "Dorchester Domestic Cleaners",
-    "Nice & Clean Chiswick",
-    "Marine Valeting Services Ltd",
-    "Enserve Corporation",
-    "Clean Concern",
-    "Cleanrite Cleanbrite Cleaning Co Ltd",
-    "Fast Cleaning Company",
-    "Delta Cleaning Service",
-    "J C S Cleaning N W Ltd",
-    "Bracna Clean Services Ltd",
-    "Monkey Nuts Ltd",
-    "Stardust",
-    "Rentokil Pest Control East Grinstead",
-    "Regency Domestic Services",
-    "Cleaners on Call Chiswick",
-    "Direct Cleaning Contractors",
-    "The Bin Cleaning Group",
-    "Supreme Klean",
-    "S G Services",
-    "Nu Kleen Services Ltd",
-    "Blue Lion",
-    "Smart Tank UK Ltd",
-    "Dorset Cleaning Services Ltd",
-    "Supa Cleaners",
-    "Langley Office Services Ltd",
-    "Super Clean",
-    "Cazs",
-    "Salterns Boatyard",
-    "Protec Pest Control",
-    "Aladdin Cleaning Services",
-    "Mrs Mops",
-    "Wilkins Chimney Sweep",
-    "Ecophy",
-    "Angelic Commercial Services Ltd",
-    "Solo Service Group",
-    "Overbrook Group",
-    "Revive Exterior Cleaning",
-    "Asarf Ltd",
-    "Ace Cleaning Contracts Ltd",
-    "Hayward Services",
-    "Euroclean Bournemouth Ltd",
-    "Puremaison Ltd",
-    "Marine Options",
-    "Absolute Cleaning Service",
-    "Clean Enviro Services",
-    "Voyager Cleaning",
-    "Direct Pest",
-    "L S Sukh Services Ltd",
-    "Rochelle Cleaning Ltd",
-    "Ezy-clean",
-    "Abacus Windows Cleaning",
-    "Arts Cleaning",
-    "Battersea Cleaners",
-    "P M Contract Cleaning Services",
-    "Cleaners Bromley by Bow",
-    "Ilford Cleaners",
-    "Lancs Mobile Cleaning",
-    "Cleaning Services Kensington",
-    "Express Contract Cleaners",
-    "Anti Graffiti Systems Ltd",
-    "Rest Assured Pest Control",
-    "Demon Cleaning Services",
-    "Total Extract Management",
-    "Clean Shield",
-    "Eco Cleaning Service Ltd",
-    "Kleanline Ltd",
-    "L P W",
-    "C R M Services Ltd",
-    "Cleanton Ltd",
-    "G W S Cleaning Services Ltd",
-    "P & P Pest Control Ltd",
-    "L G Cleaners London",
-    "Nazure Cleaning & Property Maintanence",
-    "N I C Services Group",
-    "365 Cleaning",
-    "Cleaning Services Battersea",
-    "Cleanbright Services Ltd",
-    "J C Cleaning Services",
-    "All Done & Dusted Cleaning Services Ltd",
-    "West Cheshire Facilities Management",
-    "Cleanamotion",
-    "Advanced Pest Management Ltd",
-    "Pro Cleaners Barnes",
-    "Tidyup",
-    "Vista Environmental Solutions Ltd",
-    "L T Cleaning Services Ltd",
-    "Glan Cleaning Services",
-    "Secureclean Ltd",
-    "Langland Cleaning Solutions",
-    "Balham Carpet Cleaners",
-    "Revival",
-    "Town & County Cleaning Services",
-    "The House Busters",
-    "Flat Cleaning London",
-    "Minster Cleaning Office Cleaning in Sheffield & South Yorkshire",
-    "South West Cleaning Services Ltd",
-    "The Cleaning Agency",
-    "Kleensafe",
-    "Clean 2 Pristine",
-    "M J M Cleaning Solutions Ltd",
-    "Spick N Span",
-    "The Loveday Cleaning Group",
-    "Assured Environmental Services",
-    "City Pest Control",
-    "Activekleen",
-    "Toms Cleaning Services",
-    "J S H Deodorising",
-    "High Clean",
-    "Barnes Cleaners",
-    "Fast Cleaners Brent",
-    "Fast Cleaners Havering",
-    "Molly Maid Reading",
-    "Target Pest Control & Hygiene Ltd",
-    "Phoenix Cleaning Services",
-    "Direct Service Solutions",
-    "Environmental & Building Services Ltd",
-    "Cleaning Services Maida Vale",
-    "Tidy Plus Cleaning Services",
-    "24 Cleaning Services",
-    "Prestige Professional Cleaning Services",
-    "Stayclean Contract Cleaning Services Ltd",
-    "A Breeze Pest Control Ltd",
-    "Croydon Cleaning House",
-    "Class on Glass",
-    "Dial a Pest",
-    "Bristol Commercial Cleaning",
-    "R J Odgen",
-    "Capsule",
-    "Forefront Services",
-    "Bulloughs",
-    "Minster Cleaning Commercial Cleaning in Leeds",
-    "Glynn's Chimney Sweeps",
-    "Gurkha Cleaning",
-    "H G M Group",
-    "Histandards",
-    "March Cleaning Services",
-    "Woodhouse Cleaning Services",
-    "O C D Cleaning Services",
-    "I H S S Ltd",
-    "Monster Cleaning Horsham",
-    "H R C Environmental Services",
-    "Molo Holiday House Keepers",
-    "Top Cleaning Services",
-    "P W Industrial & Commercial Cleaning Ltd",
-    "Jem Services",
-    "Pestbusters",
-    "North Western Cleaning Manchester Ltd",
-    "Oven Support Ltd",
-    "Helping Hands",
-    "Nice & Clean Croydon",
-    "U C E M Pest Control",
-    "Urban Hygiene Ltd",
-    "Mopheads",
-    "Pestblitz",
-    "Cleaners (London)",
-    "D C",
-    "The Super Cleaners",
-    "B P M Cleaning & Maintenance Services Ltd",
-    "Elite Cleaning Service Ltd",
-    "Window Cleaning Services Ltd",
-    "N B C Bird & Pest Solutions Ltd",
-    "Maclean Services L Ltd",
-    "Cleaner Hammersmith",
-    "Crystal Services",
-    "Helping Hands Cleaning Co",
-    "National Quarries Industrial Services",
-    "Whites Cleaning Company Ltd",
-    "Milo",
-    "Kooka Kleen",
-    "J & J Cleaning Associates Ltd",
-    "M S S Facilities Services Ltd",
-    "Coastal Cleaning Services",
-    "Westway Cleaning Services",
-    "S K S Window Cleaning Ltd",
-    "City & Provincial Support Services",
-    "Clean-a-home Leeds",
-    "C T S Group Services",
-    "Herts Cleaning & Maintenance Services",
-    "Reliance S E Cleaning Services Ltd",
-    "Prince & Son",
-    "Touch of Class Cleaning Services",
-    "A Z Labour Agency",
-    "Fields Total Cleaning",
-    "Premier Window Cleaning",
-    "A K & S Property Cleaning Services Ltd",
-    "H 2 O Environmental Services Ltd",
-    "D M Cleaning Services",
-    "Merry Maids North Sussex",
-    "T C S",
-    "Total Leisure Engineering",
-    "Passmore Cleaning",
-    "Cleaning Services in Marylebone",
-    "Wandsworth Cleaners",
-    "Shine",
-    "M P Highclass Cleaning",
-    "Nobisco",
-    "Cleansweep",
-    "Bobby Dazzlers Cleaning Ltd",
-    "All Seasons Window Cleaning",
-    "St Annes Group UK Ltd",
-    "Umbrella Global Ltd",
-    "Teamwork UK Ltd",
-    "The Gleaming Oven Cleaning Co",
-    "Myproclean Services",
-    "Lindsay Phillips Property Care",
-    "Heaven Helpers",
-    "Fitz2kleen",
-    "Real Cleaners Tonbridge",
-    "Bright & Beautiful South Wales",
-    "Eco Lab Ltd",
-    "Sky High Window Cleaning Ltd",
-    "Malvern Cleaning Services",
-    "Nina Clean",
-    "Cleanteam Facilities Managment",
-    "Clean Notts",
-    "Maid2clean St Albans",
-    "Britannia Cleaning Services",
-    "Midas Touch Clean",
-    "Pestinator UK Ltd",
-    "Diversey",
-    "The Rolin Group",
-    "Rapid Commercial Cleaning Services Ltd",
-    "Pro Cleaners Acton",
-    "Allaround Cleaning Services Ltd",
-    "G C S",
-    "Performance Cleaning",
-    "Wright Window Cleaners",
-    "Matthew's Window Cleaning Service",
-    "Bowman Cleaning Services",
-    "Atlas F M Group",
-    "Carlton Cleaning Contractors Ltd",
-    "Merry Maids of Lincoln",
-    "Mini Maid Ltd",
-    "Dyno-pest",
-    "E S S Facilities Ltd",
-    "Lakeside Cleaning Services",
-    "Yireh General Cleaning Service",
-    "The Cleaning Company",
-    "System Hygienics",
-    "Simplicity Services London Ltd",
-    "Citywide Cleaning Services",
-    "Advantage Pest Control & Garden Services",
-    "M D Clean",
-    "Pro-duct Clean Ltd",
-    "Active Cleaning Solutions Ltd",
-    "Westgate Cleaning Services",
-    "Imperial Cleaning Services",
-    "Berkshire Direct Cleaning Services",
-    "The Merry Men Ltd",
-    "C S S Pest Services",
-    "Elm Cleaning Services",
-    "Jones Cleaning Services Ltd",
-    "Ramsay Sterile Services East",
-    "Dusters Services Ltd",
-    "T & T Cleaning Services",
-    "Ansell Chimneys",
-    "City Cleaning Ltd",
-    "Tina the Cleaner",
-    "T L C Window Cleaning",
-    "Sparkling Windows Ltd",
-    "Colvin Cleaning Group Ltd",
-    "Vic Crompton Ltd",
-    "Cleaning Services Camden",
-    "First Choice Cleaners Ltd",
-    "S & M Cleaning & Support Services Ltd",
-    "Dusthers",
-    "Capital Door Stripping",
-    "Williams Cleaning",
-    "Heath Pest Control Services",
-    "Kent Cleaning Solutions",
-    "Vistavis",
-    "The Big Clean",
-    "Voila Cleaners Barbican",
-    "Eco Clean Home",
-    "Merry Maids of Sutton Coldfield",
-    "Clean Society",
-    "K & S Cleaners Ltd",
-    "Sea Breeze Cleaning",
-    "Plymclean",
-    "Cleaning Power Services",
-    "Keks Window Cleaners",
-    "Capital Cleaners Ltd",
-    "Dolly Char",
-    "David Russell Chimney Sweep",
-    "Golden Serenity Cleaning",
-    "Pinnacle Group",
-    "Cranleigh Clean",
-    "Oxleys Group",
-    "Blitzit Cleaning Services",
-    "Swiss Cottage Cleaners",
-    "Youngs Oven Shine",
-    "Combat Cleaning",
-    "D J S Contract Cleaning",
-    "Simply Housework",
-    "Work Force Group",
-    "Cheerful Char",
-    "Maintenance Cleaning Services",
-    "Best House Cleaning London",
-    "Cannins",
-    "N J E Cleaning Services",
-    "Noah's Ark Environmental Services Ltd",
-    "C H S",
-    "Main Cleaners London",
-    "P G H Pest Control",
-    "J Hopewell",
-    "Verminater Pest Control",
-    "Malvern Cleaning",
-    "Phoenix Cleaning",
-    "Victoria Cleaning Co",
-    "Pro-clean Industrial UK Ltd",
-    "Chimney-works Ltd",
-    "Direct Cleaning Fair Oak Ltd",
-    "Regency Cleaning Service Nationwide Ltd",
-    "Clean for Me",
-    "M C S Cleaning Services",
-    "Regency Cleaning Halesowen Ltd",
-    "Speedy Cleaners London",
-    "Just Maid Time Ltd",
-    "Town & Country Cleaners Ltd",
-    "Enviro Solve Cleaning Services Ltd",
-    "Salamander Cleaners Ltd",
-    "Distinct Cleaning Com",
-    "Thermokil",
-    "Cheshire Window Cleaning",
-    "Done 'n' Dusted Cleaning Services",
-    "Domestic Bliss House Keeping",
-    "Mops & Brooms Cleaning",
-    "Diamond Cleaning Services",
-    "United Cleaning Services South West Ltd",
-    "Total Support Services",
-    "D O S Cleaners & Porters",
-    "J L Cleaning Ltd",
-    "Key Cleaning Co Ltd",
-    "Makdena Services 4 U",
-    "Pest Professionals",
-    "Crown Cleaning Systems Ltd",
-    "I C U Clean",
-    "G C S Cleaning Services",
-    "Imperial Hygiene Services Ltd",
-    "Sure Clean Solutions",
-    "The Pied Piper",
-    "Ayleton Cleaning Ltd",
-    "Fisher Bio Services",
-    "Coastline Contract Services Ltd",
-    "Abacus Environmental",
-    "Topcleaning GB",
-    "J P C Services",
-    "Rain Cleaning",
-    "Bourne to Clean",
-    "Godalming Chimney Sweeps",
-    "Hill Bros Window Cleaning Co",
-    "London Environmental Ltd",
-    "Domestic Angels",
-    "Cellar Services",
-    "E & C",
-    "Morstar Ltd",
-    "Donnington Clean",
-    "Decent Cleaning",
-    "Ovenu Valeting Services",
-    "Mum & Me Cleaning Services",
-    "Atlas Cleaning Ltd",
-    "I P J Commercial Solutions",
-    "Merrymaids of Coventry",
-    "Enviroclean Services Ltd",
-    "Gentle Touch Star Cleaning Services",
-    "P H S",
-    "Atlas M I S",
-    "Vistavis Ltd",
-    "N B C Environment",
-    "Top Cleaning Services Redbridge",
-    "Kernow Home Cleans",
-    "Uni-clean Services",
-    "Gipsy Hill Carpet Cleaners",
-    "Cleanedrite Pest Control Services",
-    "Homecare",
-    "Sunrise Services East Anglia Ltd",
-    "R & P Cleaning Services Ltd",
-    "Peake Cleaning & Hygiene Services Ltd",
-    "Tangerine Cleaning Services",
-    "UK Clean & Repair",
-    "Stardust Cleaning",
-    "Sheffield Site Services Holdings Ltd",
-    "A B C Cleaning",
-    "Country Maids",
-    "Coastal Chimney Sweep",
-    "Molly Maid Bridgend",
-    "Shiners Cleaning & Property Maintenance",
-    "Executive Cleaning",
-    "Inner City Cleaning Services",
-    "A C C S Ltd",
-    "Done & Dusted Domestic",
-    "Rentex Hygiene Services",
-    "Trident Cleaners",
-    "Spotlight Cleaning Services Ltd",
-    "Office Care Services Ltd",
-    "R Payne",
-    "Hans Clean Ltd",
-    "D A Pest Control",
-    "Tesco Cleaner Ltd",
-    "Vapor Clean",
-    "Becky's Cleaning Services",
-    "Supawipe Cleaning Services",
-    "Luna Clean",
-    "Toast",
-    "Shield Pest Control",
-    "B & L",
-    "Mrs Busy Bees",
-    "Clean Sweep Commercial",
-    "Monster Cleaning Service",
-    "Check Services",
-    "Alpha Cleaning Services Ltd",
-    "V I P Blast & Steam Cleaning",
-    "Alpha Pest Control",
-    "Key West Pest Control Ltd",
-    "A & S Contract Cleaning Services Ltd",
-    "Cleaning Services Barnet",
-    "Spick N Span Professional Cleaning",
-    "Lancashire Environmental Services",
-    "Your Services",
-    "D C Total Cleaning Services",
-    "Hygenie Cleaning Services",
-    "Wallis Cleaning Contractors",
-    "E C S S",
-    "Cleancare Services",
-    "Green Cleen",
-    "Sparkles Cleaning",
-    "Bright & Clean",
-    "Cleaner Flow",
-    "C W Group",
-    "Smart Cleanings UK Ltd",
-    "Sparkling Cleaners London",
-    "Sparklingclean Ltd",
-    "Dingle Dollies Cleaning Ltd",
-    "Ice Industrial Cleaning Experts Ltd",
-    "The Oven Cleaning Company",
-    "Accurate Cleaners Hounslow",
-    "G M Service",
-    "Mrs Mop Cleaning Services",
-    "Cleaning Services Forest Hill",
-    "C J S Contract Cleaning",
-    "Fast Cleaners Barking Dagenham",
-    "4Tress Services Ltd",
-    "New Enterprise Pest Contro Ltd",
-    "Britania Cleaning Services",
-    "Crystal Clear",
-    "Minster Cleaning Services in Staffordshire",
-    "Maidenhead Pest Control",
-    "Ics",
-    "The Hayling Cleaning Company",
-    "C D P Services Industrial Ltd",
-    "Totalclean Solutions",
-    "T C E Commercial Cleaning Services",
-    "Everything But the Girl",
-    "Carole's Domestic Service",
-    "Dustbunnies Cleaning Services",
-    "Equipment Cleaning Services Ltd",
-    "Tactical Environmental Services",
-    "Cleanify",
-    "Central Cleaning Services",
-    "Clear Interiors",
-    "Seldram",
-    "Big J Services Ltd",
-    "Innovate",
-    "New Wave Marine",
-    "Monthind",
-    "C F L Office Cleaning",
-    "E S G Boiler Care Ltd",
-    "Tenancy Cleaning Prices Ltd",
-    "A F International",
-    "A T H Cleaning",
-    "Minster Cleaning Nottingham",
-    "D S Cleaning Services",
-    "Clearview Window Cleaning Services Ltd",
-    "Dolly Char Domestic Cleaning Agency",
-    "Calendar Cleaning",
-    "",
-    "Augres Group",
-    "Lincs Domestic Services",
-    "Ustigate",
-    "Bibas Landscapes",
-    "Earthcare Gardens Ltd",
-    "Landscape Gardeners West London",
-    "Stewarts Garden Design & Landscaping",
-    "Hedera Screens",
-    "Ulyett Landscapes",
-    "Complete Weed Control",
-    "Places for People",
-    "Mole Country Stores",
-    "Armoured Drives Ltd",
-    "Ernest Doe & Sons Ltd",
-    "Exeter Landscaping Design & Gardening Services",
-    "Branchingout Landscapes",
-    "I D Verde",
-    "P Crawford Contracting Ltd",
-    "Artscape Garden Associates Ltd",
-    "Key Green Farm",
-    "Veronica Goodenough Garden Design",
-    "Continental Landscapes Ltd",
-    "D S B Cleaning Services",
-    "Weed Management",
-    "R G Properties",
-    "Tillers Turf",
-    "Clement Wyatt Gardens Ltd",
-    "G I Landscapes UK Ltd",
-    "Happy Homes Cleaning Company",
-    "Topgrass Midlands Ltd",
-    "David Greaves Landscape Design & Construction",
-    "Ben Nock Ltd",
-    "Tilbrooks Landscape Ltd",
-    "Bland Landscapes Ltd",
-    "Season Herbs",
-    "The Secret Garden Company",
-    "Easigrass",
-    "Turtle Productions",
-    "Easigrass Accessories",
-    "Wild to Wonderful",
-    "Wright Landscapes Ltd",
-    "Pro-scape",
-    "Servicemaster Clean North East",
-    "Portman Gardens",
-    "Acacia Gardens Ltd",
-    "Market Drayton Livestock Market",
-    "Easylawn",
-    "Homescapes 1990 Ltd",
-    "Greenthumb Lawn Treatment Services",
-    "Evergreen Landscapes",
-    "Stone Manor Landscapes",
-    "Godfrey Group Facilities Ltd",
-    "Quality & Service Ltd",
-    "UK Commercial Cleaning Solutions Ltd",
-    "Llwyn Landscapes",
-    "Admec",
-    "Craig West Turf Ltd",
-    "C & W Groundcare Ltd",
-    "Plevey & Sons Ltd",
-    "A P L Cleaning",
-    "J K S L",
-    "Fineturf",
-    "New Life",
-    "Beautiful Garden Ltd",
-    "Wish Wash Co Ltd",
-    "Stay Smart",
-    "County Turf",
-    "A T M",
-    "A P Broome Landscapes Ltd",
-    "C B Cleaning & Property Services Ltd",
-    "Voyce Pullin",
-    "Firview Contracting",
-    "Wheelbarrow Gardening",
-    "O C Cleaning Solutions",
-    "Landscape Services",
-    "Land Structure Ltd",
-    "W J G Evans & Sons",
-    "Malton Livestock Auctioneers",
-    "Greengrass Commercial Ltd",
-    "Barton Stud",
-    "J W S Fitting & Installation",
-    "Island Cleaners Ltd",
-    "Salters Landscaping & Property Maintenance",
-    "Bolton Cleaning Services",
-    "Trevor Atkinson & Company Ltd",
-    "Berrys Gardens",
-    "Landstruction Ltd",
-    "Wynnstay",
-    "County Grounds Maintenance Ltd",
-    "Clarke's Window Cleaning Contractors",
-    "Newman Landscapes Ltd",
-    "Unique Clean",
-    "Landscape Associates Ltd",
-    "Innovis Ltd",
-    "T M G S Grounds Maintenance Ltd",
-    "Cogent Breeding",
-    "Evergreen",
-    "Pest Aside",
-    "Landcraft Projects",
-    "Wimbledon Garden Services Ltd",
-    "Purple Gardens Ltd",
-    "James Dean Creative Landscapes Ltd",
-    "New Clean Dealership Specialists",
-    "D G S",
-    "B J Condliffe Cleaning Services",
-    "Lindum Turf",
-    "Gardeners World & Building Supplies Ltd",
-    "Brewood Landscapes Ltd",
-    "Shoots & Leaves",
-    "The Grounds Care Group",
-    "The Happy Gardener Company Ltd",
-    "N J L",
-    "Newark Livestock Market",
-    "U K S S Group",
-    "Garden Transformations",
-    "Fountains Direct",
-    "Dixcey Landscapes Ltd",
-    "Alta R Breeders Ltd",
-    "Southdown Landscapes & Turf Co",
-    "Frank Cooper & Son",
-    "Bartholomew Landscaping",
-    "Glenn Humphries Landscaping",
-    "Gardens by Keltie & Clark",
-    "Fenwick Specialist Cleaning Services Ltd",
-    "Gomoss",
-    "Ramscapes Landscape Contractors",
-    "Brite Start Cleaning Ltd",
-    "F T Gearing Landscape Services Ltd",
-    "F S L Contractors Ltd",
-    "Catch-it Pest Control",
-    "Greenthumb",
-    "J & F Golden Cleaning",
-    "Molly Maid Chester",
-    "Langdale Landscapes",
-    "Silo Cleaning Services UK LLP",
-    "Agriwash",
-    "Carpenter Landscapes Ltd",
-    "Harrison Property & Garden Services",
-    "All Seasons Garden Service",
-    "Little Fones Landscapes",
-    "D S V UK Ltd",
-    "Cleaners Pimlico",
-    "Harrowden Turf",
-    "Green Gardens",
-    "Goddards Landscape Contractors",
-    "J H Landscapes Ltd",
-    "Clearview Cleaning Services",
-    "Voyce Pullin Markets Ltd",
-    "Primehaven Fencing & Building",
-    "Fairwater Ltd",
-    "Fineview Landscapes",
-    "Hislop & Co Horticulture",
-    "Eco Control Solutions Ltd",
-    "Grass Etc",
-    "Commercial Cleaning Bundles",
-    "Maid Just Right",
-    "Dalehead Foods",
-    "Bernhard's Landscapes",
-    "Fairy Goddusters",
-    "Wow Grass",
-    "Esse Landscapes",
-    "E C Haste",
-    "Berkshire Garden Services",
-    "Avon Woodlands Ltd",
-    "Cornforth Industrial Services Ltd",
-    "Blakedown",
-    "Active Cleaning & Maintenance Ltd",
-    "Birtwhistle Landscaping",
-    "Claas Eastern",
-    "Property Care East Anglia Ltd",
-    "G R Grimme",
-    "James Bird Landscapes Ltd",
-    "Pollard Landscapes",
-    "South East Contract Cleaning",
-    "National Bee Supplies",
-    "Northallerton Auctions Ltd",
-    "Avenue Landscapes Ltd",
-    "W L Straughan & Son Ltd",
-    "Spring Clean Lancaster",
-    "Golden Stones Gardening",
-    "Astek Garden Design & Build",
-    "Julia's Shiny House",
-    "UK Landscapes Ltd",
-    "Dean Landscapes Ltd",
-    "April Clean",
-    "J K Cleaning Ltd",
-    "A G C O",
-    "Easigrass Yorkshire",
-    "Krystal Cleaning Services Ltd",
-    "Field Science Ltd",
-    "Edenvale Turf",
-    "Core Landscape Products",
-    "Farmers Marts Ltd",
-    "London Contract Services Ltd",
-    "Elmtree Garden Contractors Ltd",
-    "Lindsey Clark Brothers",
-    "David Ryan Landscape & Property Services",
-    "Creative Gardens & Driveways",
-    "Ab & Es",
-    "Manchester Pest Control",
-    "Leek Auctions Ltd",
-    "Pickup & Son Ltd",
-    "Bletsoes",
-    "The Proud Group Ltd",
-    "Shrewsbury Livestock Market",
-    "Weeding Technologies Ltd",
-    "Greenthumb Lawn Treatment Service",
-    "Clean Safe Services",
-    "J C F Cleaning & Allied Services",
-    "Brett Hardy Landscapes Ltd",
-    "Barnes Oiltank Services Ltd",
-    "E V G Ltd",
-    "Gavin Jones Ltd",
-    "The Fountain Workshop",
-    "Daisymaid N E Ltd",
-    "J B Landscape & Property Maintenance Ltd",
-    "Lawnhopper Ltd Within the Garden Centre",
-    "Industrial Deep Cleaning Ltd",
-    "Direct Cleaning Group",
-    "J & B Farnaby Landscapes",
-    "Limetree Landscapes",
-    "Alex Stewart Agriculture",
-    "Crazy Ladies Cleaning Services",
-    "Anglian Land Drainage",
-    "The Chelsea Gardening Company Ltd",
-    "Easy Lawn",
-    "Flex Cleaning",
-    "Jet Fresh",
-    "Superplus Cleaning Services",
-    "E Williams Landscapes",
-    "Billockby Farm",
-    "Millstone Landscapes Ltd",
-    "Ambience Grounds Maintenance",
-    "South Lynch Estate Office",
-    "Artificial Grass for Less",
-    "John O'Conner Grounds Maintenance",
-    "Lionheart Cleaning",
-    "Baylis Landscape Contractors Ltd",
-    "Westwood Landscape",
-    "Cube 1994 Design Studio & Gallery",
-    "Arch Window Company",
-    "City Garden",
-    "Green Grass Ltd",
-    "Wilkinson Landscaping",
-    "Sid Bibby Turf & Landscaping Ltd",
-    "Peakbridge Global Ltd",
-    "Clearview",
-    "Sulney Nurseries",
-    "Idverde",
-    "Bespoke Building & Landscaping Services Ltd",
-    "Greenthumb Lawn Services Ltd",
-    "T C L",
-    "Peak Commercial Cleaning",
-    "Home Clean",
-    "Teal Turf",
-    "Jobell Cleaning Services",
-    "Molly Maid Berrick",
-    "Gibbons Group",
-    "Northern Ground Care",
-    "Accurat Pest Solutions",
-    "Scott's Contract Services Ltd",
-    "Priestgate Garden Specialists",
-    "Country Gardens",
-    "Greensleeves Lawn Care",
-    "Afan Group",
-    "Midshire Rugby Landscapes",
-    "Durance Cleaning Services",
-    "Addington's",
-    "J M Walton Landscapes",
-    "Agrii",
-    "Rentokil Pest Control Wirral & Chester",
-    "A D M B Property Servcies",
-    "Rowan Solutions Ltd",
-    "Plant Style",
-    "Talbot Farm Landscapes Ltd",
-    "Horizon Landscapes East Anglia Ltd",
-    "Germs Free",
-    "Dan Pearson Studio",
-    "Inturf",
-    "M D Driscoll & Co Ltd",
-    "Mole Valley Farmers",
-    "R B F Group Ltd",
-    "Flowers Landscapes",
-    "S P A Landscaping Ltd",
-    "Thames Valley Cambac",
-    "Frontier Agriculture Ltd",
-    "Lucas Landscapes",
-    "Easi Grass",
-    "Gardeners Mates London",
-    "Bowland Stone",
-    "Panaromic Landscapes Contractors",
-    "Soil Fertility Services Ltd",
-    "The Garden Design Co",
-    "Smart Choice Cleaning",
-    "Top Mop Services",
-    "Anglesey Contract Cleaning",
-    "The Royal Welsh Agricultural Society",
-    "Bespoke Landscapes",
-    "Inspired Gardens",
-    "Ken Linford Garden Care Ltd",
-    "Faccombe Estates",
-    "The Garden Builders",
-    "Teo Landscapes Ltd",
-    "Cogent Breeding Ltd",
-    "Perennial Landscapes",
-    "Domestic Divas York Ltd",
-    "Herts Cleaning Angels",
-    "Scofell Commercial Landscapes",
-    "Clerview Signs Ltd",
-    "Chandlers Farm Equipment",
-    "Limebok Landscaping",
-    "County Landscape Development",
-    "Rolawn Ltd",
-    "Tidy Culture Window Cleaning Service",
-    "Agrifactors Ltd",
-    "Country Supplies",
-    "Hardy Landscape Management Ltd",
-    "R J Warren Ltd",
-    "Graceful Gardens Hever Ltd",
-    "Absolutely Fabulous",
-    "Hightown Magic Maids",
-    "Wilkinsons Landscapes",
-    "Peters Window Cleaning Service",
-    "Millwood Products",
-    "M D Cleaning",
-    "A B Nutrition",
-    "Fast Landscape Gardening",
-    "Complete Weed Control South & Central Wales",
-    "J & S Scapes Within Abbey Tree Nursery",
-    "Emotive Landscapes",
-    "Collins Landscapes Ltd",
-    "Urban Earth South West",
-    "J M C Landscapes",
-    "Phoenix Agricultural",
-    "Ultracare Property Management Ltd",
-    "Collier Company Ltd",
-    "Dolly Mops",
-    "Cleaners Southwark",
-    "Women With Waders Ltd",
-    "N M R",
-    "Cleaning Ventures",
-    "Liverpool Tank Cleaning Services Ltd",
-    "Aire & Calder Landscapes Ltd",
-    "Ripon Farm Services Ltd",
-    "R M B Hydroseeding",
-    "Scrutiny Cleaning",
-    "B G S Landscapes & Fencing",
-    "Planterior Landscape Services Ltd",
-    "Pure Decon",
-    "J F H Horticultural Supplies Ltd",
-    "Spot on Cleaners Ltd",
-    "Wharton Landscapes",
-    "Garden Care",
-    "Countrywide Grounds Maintenance",
-    "Briarwood Products Ltd",
-    "Space Care Ltd",
-    "Bee Equipment",
-    "Countrywide Farmers",
-    "Thrive",
-    "Johnsons the Cleaners",
-    "Heavenly Homes Cleaning",
-    "The London Landscaping Co Ltd",
-    "Cleanbrite UK Ltd",
-    "Warburton Landscapes Ltd",
-    "Firstlight Landscaping Ltd",
-    "Coblands Landscapes Ltd",
-    "Greenslade Taylor Hunt",
-    "Bloomin' Gardens & Landscapes Ltd",
-    "Beech Landscape Developments Ltd",
-    "Outdoors Creations",
-    "Sonnic Support Solutions",
-    "Oasis",
-    "First Class Cleaning",
-    "Barge Landscape Management",
-    "Greenfields",
-    "Carols Cleaning",
-    "Ruskins Trees & Landscapes",
-    "Maylim",
-    "U C C Cleaning Services",
-    "Crown Estate Management",
-    "The Chelsea Gardener",
-    "The Garden Barber",
-    "The Garden Maintenance Company",
-    "Acacia Gardens",
-    "Distinctive Gardens",
-    "G Clarke Landscaping Ltd",
-    "K W Timmins & Sons Ltd",
-    "Carrier Landscapes Ltd Within Sulney Nursery",
-    "N & P Cleaning Agency",
-    "Taylormade Landscapes",
-    "Chris Skinner Landscapes Ltd",
-    "Crown Pavilions Ltd",
-    "Marshall's Landscaping",
-    "Silva Cleaning Service",
-    "Tom Goddard & Sons Ltd",
-    "Steve Thorley Potato Equipment",
-    "T H C Landscapes",
-    "Milhams",
-    "Elliot Maid Services",
-    "South Lakes Tree Surgeons & Landscapes Ltd",
-    "The Ashford Cattle Market Co Ltd",
-    "Clarity Cleaning Services Ltd",
-    "Inhurst Landscapes Ltd",
-    "Kivells",
-    "Claas Manns",
-    "Firtree Landscapes",
-    "Opico",
-    "Bluefish Landscaping & Equestrian Development",
-    "Alfie Bines Gardens",
-    "Kebur Concrete Products",
-    "Blackwell Cleaning Services",
-    "Nurture Landscapes",
-    "Pave Drives & Landscapes Ltd",
-    "Greenscene",
-    "Lyndhurst Landscaping & Maintenance",
-    "T C E Cleaning Commercial Cleaning Services",
-    "Environment Services Wales",
-    "C G S Contractors",
-    "Glendale",
-    "Bennett Landscapes & Maintenance Ltd",
-    "Sheffield Manor Lodge",
-    "Sparkle Cleaning Services & Domestic Help",
-    "I S I S Facility Services Ltd",
-    "Garden Inspirations",
-    "J G H Property Services",
-    "Lawntech Ltd",
-    "Encompass Environmental",
-    "Rafters Cleaning",
-    "Fastrack Maintenance",
-    "Scotsscape",
-    "The Growing Together Gardens",
-    "Trulawn",
-    "King of Spades Landscaping",
-    "Hotline Electric Fencing",
-    "Town & Country Gardens",
-    "Pristine Cleaning Services",
-    "Wessex Grounds Services",
-    "Mid Cornwall Landscaping Ltd",
-    "Zenith Nurseries",
-    "Sovereign Turf Ltd",
-    "M A Richardson & Son",
-    "Jones Peckover",
-    "Buckland Landscapes",
-    "Timber Buildings South West",
-    "Marshalls Commercial Cleaning",
-    "Luxury Lawns a G S Ltd",
-    "Brighstone Landscaping",
-    "Baileys Street Scene",
-    "Robert Langrish Greenside Landscapes",
-    "Oakleigh Manor",
-    "Green Thumb",
-    "T W Landscapes Ltd",
-    "C A R Gardens",
-    "Mantank Environmental Services Ltd",
-    "Cutting Edge",
-    "Your Dirty Little Secret",
-    "A One Garden Contractors Ltd",
-    "Brick Cleaning London",
-    "North Commercials Eastern",
-    "Namgrass",
-    "Camelot Clean",
-    "4 Seasons Grounds & Landscaping Solutions Ltd",
-    "Denyers National Estate Maintenance",
-    "Smart Cleaning Group",
-    "Allium Brassica Centre Ltd",
-    "W Styles Garden Services",
-    "Sherborne Turf",
-    "Belderbos Landscapes",
-    "Yorkshire Farmers Livestock Marketing Ltd",
-    "J P Landscapes & Construction Ltd",
-    "Crown Garden Services",
-    "J M Godfrey Landscape",
-    "Envirotec Hygiene Services",
-    "Archway Green",
-    "Artisan Landscapes",
-    "Windmill Contractors Ltd",
-    "Living Landscapes",
-    "N I C Commercial Cleaning Services",
-    "Grasstex",
-    "Stags Agricultural Department",
-    "The Waitrose Farm",
-    "Alben Landscapes Ltd",
-    "Advanced Cleaning & Maintenance Ltd",
-    "S G S United Kingdom Ltd",
-    "Northern Estates Services",
-    "Mark Walker Ground Maintenance",
-    "Norfolks Little Cleaning Company",
-    "Grab Co UK",
-    "A D J",
-    "Freedom Cleaning",
-    "The Price Group",
-    "Home Garden Ltd",
-    "Tone Valley Services Ltd",
-    "Town & Country",
-    "C D F Management Group",
-    "Donks Cleaning Services",
-    "Spotless Solutions",
-    "Artificial Grass Derbyshire",
-    "Urra Estate",
-    "Pro Gardens Projects Ltd",
-    "Brandall Facilities",
-    "Boardman Gelly & Co Ltd",
-    "Essex Landscape Gardeners",
-    "Idverde UK",
-    "Great Garden",
-    "Valiant Arborist Ltd",
-    "Cheshire Clean",
-    "Tillery Action for You Ltd",
-    "Impact Cleaning Services",
-    "Eurofins Agro Testing",
-    "Kiwi Landscapes",
-    "Butler Landscapes",
-    "Garden Discount Centre Ltd",
-    "Killingley",
-    "Webster & Son Landscapes Ltd",
-    "My Kind of Clean",
-    "Albers & Russell",
-    "Groundcare Management Ltd",
-    "Cornthwaite Group",
-    "Local Gardeners",
-    "Selby Livestock Auction Mart Ltd",
-    "Pro-clean Sheffield",
-    "T K E Landscaping Ltd",
-    "T F M Country Store",
-    "Master Ground Services",
-    "Best Pest Control",
-    "Pest Exterminators Herts",
-    "Ashwell Landscapes Ltd",
-    "Bright & Beautiful Grays",
-    "Lodge Landscapes & Lawns",
-    "P G E Landscaping",
-    "Genus Breeding Ltd",
-    "Treetop Landscapes Ltd",
-    "Southern Artificial Grass",
-    "Trevor Smith Landscapes",
-    "Proctor Landscapes",
-    "Jem Cleaning Ltd",
-    "The Garden Project Co",
-    "Dublcheck",
-    "Handy Distribution",
-    "Harmer & Sons Ground Maintenance Ltd",
-    "Michael Twite Design & Landscapes",
-    "Wildflower Turf",
-    "Grab a Gardener",
-    "Stamford Agricultural Services",
-    "Start Afresh Cleaning Ltd",
-    "Nomow Ltd",
-    "Greenthumb UK",
-    "Rumsey Gardens",
-    "Urban Roof Gardens",
-    "Diamond Domestic Services Ltd",
-    "Gorilla Grass",
-    "Ecosolve Ltd",
-    "Country Garden",
-    "Rhino Turf",
-    "Turfworld",
-    "Skidmores of Hertford Ltd",
-    "Ruthin Farmers Auction Co Ltd",
-    "N I A B",
-    "Criccieth Cleaning Ltd",
-    "Cogent Breathing Ltd",
-    "Garden Style",
-    "Syngenta",
-    "Harrison & Hetherington Ltd",
-    "Harrington Porter",
-    "Extrem Kleen Ltd",
-    "Grass Barbers",
-    "Richards Cleaning & Washing Services",
-    "Alan Muxlow",
-    "Alltech E - Co2",
-    "Environmental Husbandry",
-    "Hiltingbury Garden Services Ltd",
-    "W Ronald Landscapes Ltd",
-    "Groundwork",
-    "Cogent",
-    "Kleentinz",
-    "S & L Commercial Cleaning",
-    "Bloomin Marvellous",
-    "Island Landscapes Ltd",
-    "Manchett",
-    "C B Winter & Sons Ltd",
-    "Garden Solutions",
-    "Kings Oak Landscapes",
-    "Tony Heywood Landscapes",
-    "Laniwyn Services",
-    "Cotswold Estates & Gardens Ltd",
-    "Oven Envy",
-    "Garden Care Services",
-    "Cartwright Landscapes",
-    "Kieron Beattie Landscapes Ltd",
-    "Willerby Landscapes",
-    "Hutchinsons",
-    "N Clark Window Cleaning Ltd",
-    "Call Landscape Products",
-    "Vision Technicians Window Cleaning",
-    "Refreshed Cleaning Services",
-    "Martin Bourke Landscapes Ltd",
-    "Ben Willis Landscaping",
-    "Cool Gardens Landscaping Ltd",
-    "Coombe & Sharpe Ltd",
-    "Unique Cleaning Group",
-    "Mission Cleaning Services",
-    "Cheshire Specialist Cleaning",
-    "Cleveland Land Services",
-    "Clean & Simple Cleaning Services",
-    "Great Wave Cleaning Services Ltd",
-    "Nurture Group",
-    "Tuckwells",
-    "All Seasons Landscape Specialists Ltd",
-    "Southern Counties Landscapes Ltd",
-    "The Botanical Gardener Ltd",
-    "Mire Services Ltd",
-    "E H Thorne Beehives",
-    "Y G S Landscapes Ltd",
-    "Tuda Grass Direct",
-    "York Landscapes Ltd",
-    "Unique Projects",
-    "Roger Gladwell",
-    "Lawnmaster",
-    "Advanced Deep Clean Ltd",
-    "Impact Support Solutions Ltd",
-    "Edaphos Ltd",
-    "Blue Iris Landscapes Ltd",
-    "John O' Conner Grounds Maintenance Ltd",
-    "Atlas Green Ltd",
-    "Just Limegrass Ltd",
-    "Gardenproud",
-    "Spotless Cleaning",
-    "New Lawn Artificial Grass Ltd",
-    "Global Facility Management Ltd",
-    "Kate Eyre Garden Design",
-    "Acer Landscapes",
-    "Redcliffe Landscape Gardeners",
-    "E D & F Man Liquid Products",
-    "So Fresh So Clean",
-    "Handy Gardeners",
-    "Masbo Cleaning Services",
-    "A1 Landscape & Gardening Services",
-    "Waterside House Farm & Campsite",
-    "A W Warwick & Son",
-    "The Oxfordshire Gardener",
-    "City Escapes",
-    "Horticon Ltd",
-    "Madingley Mulch",
-    "4th Corner Ltd",
-    "Xseed",
-    "W B Design & Construction",
-    "Rainbow Gardening",
-    "The Cleaning Empire",
-    "Stanley Sparkle",
-    "Henderson Fencing Supplies Dorset",
-    "Cheeks Industrial Cleaning Services Ltd",
-    "Turney Landscapes",
-    "Urban Landscape Design",
-    "The Twig Group",
-    "Western Ltd",
-    "Westclean Contract Cleaning",
-    "B M S Products",
-    "R & R Services Devon Ltd",
-    "Clifton Nurseries",
-    "Premium Clean Ltd",
-    "G Scapes",
-    "Wright Stripes Garden Services",
-    "Spa Environmental Care Plc",
-    "R & G Grounds Maintenance",
-    "The Palace Gardener",
-    "Zenscape Ltd",
-    "Sunshine Commercial Services Ltd",
-    "Kingston Landscape Group Ltd",
-    "The Callver Cleaning Co",
-    "P G S D",
-    "Howard & Turf",
-    "Easigrass Surrey",
-    "McNicol Ltd",
-    "4 Corners Cleaning Services",
-    "Merry Maids of Durham",
-    "B S K Landscapes",
-    "Redfields Landscaping & Design",
-    "Isotank Services",
-    "Aquajoy Water Gardens Ltd",
-    "Tony Benger Landscaping",
-    "Convey Bros",
-    "Community Garden Services",
-    "Hafren Services Ltd",
-    "Creative Landscapes",
-    "R T M Landscapes",
-    "Ivinghoe Turf",
-    "Sage Landscape Gardening",
-    "Sylvia Newman",
-    "Hambrooks",
-    "Edens Landscapes",
-    "Boughton Loam Ltd",
-    "Nova Gardens",
-    "Lawn Hopper",
-    "Thrift Landscapes Ltd",
-    "Greenkeepers Lawn Care Ltd",
-    "Anglo Aquatic Plant Company Ltd",
-    "Poppyland Cleaning Ltd",
-    "T B S East Anglia Ltd",
-    "Spick N Span Services",
-    "B C W Agriculture",
-    "Refined Landscapes",
-    "J A Services Ltd",
-    "Wellshine Ayrshire",
-    "UK Nutrition Ltd",
-    "Quality Cleaning Company",
-    "Professional Poultry Solutions",
-    "L D C Ltd",
-    "Frogheath Landscapes",
-    "The Lawn Ranger",
-    "Landmark Yorkshire Ltd",
-    "Right Gardeners Reading",
-    "Design Scapes South West Ltd",
-    "Lazylawn",
-    "R & T Landscapes Ltd",
-    "D C S Multiserve Ltd",
-    "Newleaf",
-    "Oven Cleaning Sudbury",
-    "H C L",
-    "Cleanlife",
-    "Walkers Cleaning",
-    "C G M",
-    "Bow Maintenance & Landscaping Ltd",
-    "F H F C Services",
-    "Midwest Landscaping",
-    "Sunshine Gardens",
-    "Clinitio Ltd",
-    "Roots Garden Nursery Ltd",
-    "Ulverston Auction Mart",
-    "M J F Facilities Management",
-    "Create Landscaping",
-    "Earthstone Landscapes Ltd",
-    "The Cleaning Company Ltd",
-    "Nordic Products & Services Ltd",
-    "Queenthorne Landscapes",
-    "W B Daw & Son",
-    "Weedfree",
-    "Ladybirds Garden Services",
-    "Marigolds Professional Cleaning Company Ltd",
-    "J M A Landscaping Services Ltd",
-    "Nicholsons",
-    "Brightway Cleaning Ltd & Home Help",
-    "Naio Environmental Ltd",
-    "Thompsons of Crews Hill Ltd",
-    "P T S Waste Solutions Ltd",
-    "Landscape Services Direct Ltd",
-    "Tree Source Co",
-    "Grasslands",
-    "A C Goatham & Son Ltd",
-    "Stock Gardens Ltd",
-    "Roger & Sarah's Gardening Services",
-    "Stewart Bullard & Son Ltd",
-    "Cornish Garden Services Bristol Ltd",
-    "Cedar Landscapes",
-    "N W A Cleaning Services",
-    "C A Frazier Group Ltd",
-    "A P M the Cleaning Professionals",
-    "A & R Landscapes",
-    "Microferm",
-    "Maisemore Apiaries Ltd",
-    "I S S Facility Services",
-    "Trugreen",
-    "Groundcare",
-    "Collier Turf Care",
-    "M P Tree Care",
-    "Graham Cleaning Services Ltd",
-    "Febas Cleaning Services",
-    "Celtic Turf",
-    "Oak View Landscapes",
-    "Conkers",
-    "Menai Cleaning Services Ltd",
-    "D F Clark Contractors Ltd",
-    "Mitie Cleaning Environmental Services Ltd",
-    "Wayside Water Gardens",
-    "House Proud Cleaners Ltd",
-    "Original Landscape Design",
-    "Fairways",
-    "Wheelie Bin Covers",
-    "Hooftrimming Ltd",
-    "Strand",
-    "Exeter Livestock Centre",
-    "Handy Gardeners Ltd",
-    "Monmouthshire Livestock Auctioneers",
-    "Acre Landscapes Ltd",
-    "Chevron Commercial Cleaning",
-    "D J Perkins & Son",
-    "M C S Contract Services Ltd",
-    "Griff UK",
-    "J Evans & S B Reid",
-    "Green Space Care Ltd",
-    "End of Tenancy",
-    "Bradshaws Direct",
-    "Creative Landscape Co Ltd",
-    "Blakewood Landscapes Ltd",
-    "H C S A",
-    "Boverton Nurseries",
-    "Agrovista",
-    "Stoneplan",
-    "Ideal Cleaning",
-    "Creative Roots",
-    "G S U Landscapes",
-    "Sparkling Glass Ltd",
-    "C & A Landscapes Ltd",
-    "Gold Cleaning Services UK",
-    "George Davies Turf Ltd",
-    "Plandscape",
-    "Neat & Stripy Ltd",
-    "Envirocare Grounds Maintenance",
-    "Biosphere Organics",
-    "Contour Landscapes Ltd",
-    "Great Northern Cleaning Industrial",
-    "Rances Turf Supplies",
-    "Alta Cymru",
-    "Wootton E F & Son",
-    "Eco Energy Cleaning Solutions Ltd",
-    "J J Morris Ltd",
-    "D T M Gardens & Landscapes Ltd",
-    "Milhams Eastbourne Ltd",
-    "Bluestone Cleaning Services",
-    "Country Gardens & Fencing",
-    "C C P Groundcare",
-    "mossoff.co.uk",
-    "Fordham Landscapes Ltd",
-    "Ground Force Landscaping Solutions",
-    "Helyers",
-    "Brambles Garden Services",
-    "Thomas Fox Landscaping",
-    "Dustin",
-    "Procam",
-    "Clean Guard Ltd",
-    "Bourne Amenity",
-    "Countryside Contractors & Gardens Ltd",
-    "Nock Deighton Agricultural LLP",
-    "D M W Landscapes",
-    "Joes Lawn Care",
-    "Broughton Park Executive Cleaning Company",
-    "Gaia Landscapes",
-    "C J Round Landscapes",
-    "Sunderlands & Thompsons",
-    "Nomix Enviro",
-    "Four Seasons Landscape",
-    "Gardening Team London",
-    "Cameron Landscapes & Gardens",
-    "Greensquareaccord",
-    "Chipperfield Garden Centre",
-    "Whiting Landscape Ltd",
-    "Tivoli",
-    "Timotay Landscapes",
-    "Scotscape",
-    "Volac International",
-    "Lovell Landscapes",
-    "Oxford Garden Design",
-    "Enviroquest G P T Ltd",
-    "Spirit Cleaning",
-    "S K Landscapes & Maintenance Ltd",
-    "Environet UK",
-    "Wheelie Bin Cleaners",
-    "Lees Premier Cleaning",
-    "Scotfield Alpacas",
-    "Newark Cattle Market Co Ltd",
-    "Ropetech London Ltd",
-    "B Z Gardens",
-    "Professional Lawns Ltd",
-    "S & S Landscapes Ltd",
-    "Easylawn Turf Supplies Ltd",
-    "A Property Service Ltd",
-    "London Landscapes Ltd",
-    "Millennium Pest Control Ltd",
-    "Domestic Cleaning Company",
-    "Urban Landscapes Cardiff",
-    "Countrywide Ground Maintenance",
-    "Kennet Landscape Solutions Ltd",
-    "East Riding Group",
-    "Green Fingers Garden Supplies & Landscaping",
-    "Vista Landscape Management",
-    "Capital Fencing",
-    "Cleaners Salford",
-    "The Leicestershire Landscaping Company Ltd",
-    "H F N Landscapes Ltd",
-    "Sitescapes Commercial Landscaping",
-    "Great Wave Cleaning Services",
-    "Jarrold Training",
-    "City Clean",
-    "Cleaning & Support Services",
-    "Squeaky Clean (Pembs)",
-    "Little Duck Cleaning Services",
-    "H P Cleaning & Support",
-    "Wharfedale Facilities Management",
-    "Incredible Window Cleaning",
-    "Dellar The Cleaning Company",
-    "Heyrose Golf Club",
-    "Molly Mop Cleaning",
-    "Clean Start Contract",
-    "Clean4Shaw",
-    "Lemon Clean",
-    "Darius Cleaning",
-    "Tailored Contract Cleaning",
-    "Ocdcds",
-    "Kleanline",
-    "Enterprize Cleaning Services",
-    "Antago",
-    "C P D Property Services",
-    "KRH Cleaning",
-    "Thorokleen",
-    "Lakeland Leisure Services",
-    "Celtic Cleaning Services",
-    "All Over Cleaning Services",
-    "VHS Cleaning Services",
-    "MJBS Network",
-    "Dirtbusters Ne",
-    "Exige Clean",
-    "Va Clean",
-    "Solutions 4 Cleaning",
-    "Foxroyd",
-    "Phoenix Cleaning (MK)",
-    "Alessia10",
-    "South Wales Scaffolding Services",
-    "Concept BN",
-    "DPF Management",
-    "Abergavenny Cleaning Company",
-    "Brushstrokes Roadsweepers",
-    "The Cleaning Company North",
-    "Accent Atlantic",
-    "Iss Damage Control",
-    "Beaver Floor Care",
-    "In2 Cleaning",
-    "Green Way Telford",
-    "LB Industrial Cleaning ltd",
-    "Service Essential Cleaning",
-    "Ductbusters",
-    "GMS Cleaning",
-    "Rincaciu Cleaning",
-    "Ipswich Window Cleaner",
-    "J W Cleaning",
-    "The Nulife Group",
-    "Westgrove Cleaning Services",
-    "Extreme Cleaning Midlands",
-    "Your Spec Cleaning",
-    "The Carroll Cleaning Company",
-    "El Sparkle",
-    "Tudor Rose Cleaning Services",
-    "D & E (York)",
-    "Megacleaners ltd",
-    "MM Domestic Services",
-    "I T Care",
-    "Cleaning Scotland",
-    "Transformers",
-    "Sodexho Ltd",
-    "Tankers",
-    "Sanondaf",
-    "M K M Cleaning Ltd",
-    "Q C S Lanark Ltd",
-    "Office Hero",
-    "K R D Property Maintenance",
-    "Kingdom Clear Ltd",
-    "Dust Fairy",
-    "Sparkles Scotland Ltd",
-    "Square Property Solutions",
-    "Diamond Home Support Central",
-    "Sparkle",
-    "Finaghy Cleaning & Support Services",
-    "Upstairs Downstairs",
-    "Proclean",
-    "Isocon Engineering",
-    "Ace Cleaning Services Ltd",
-    "G E B Industrial Cleaning Services",
-    "Maids 4 U Tayside",
-    "West Control Services Scotland",
-    "Miint Cleaning Ltd",
-    "Mobile Hygiene Services Ltd",
-    "Coronet",
-    "Cardross Cleaning Company",
-    "C C M S 1984 Ltd",
-    "Fresh Cleaning",
-    "Zircon Environmental Services",
-    "Dial a Clean Ltd",
-    "Property Cleaning Services",
-    "Lamont Cleaning & Support Services",
-    "Scotbrite Services",
-    "Reflection Cleaning Services Inverness Ltd",
-    "Pure Cleaning Scotland Ltd",
-    "We Clean Offices",
-    "Presly Pest Control",
-    "C A S Contract Cleaning",
-    "Dolly Char Edinburgh",
-    "Jaklean Ltd",
-    "C M Cleaning Services",
-    "G P Environmental Ltd",
-    "Patterson Outdoor Cleaning Solutions",
-    "Snowdrop Services Scotland Ltd",
-    "Jean's Cleans Doncaster",
-    "House Proud Grampian Ltd",
-    "Sureclean",
-    "Struan Window Cleaning",
-    "Daisy's Glasgow Cleaners",
-    "Cleaning Gems",
-    "Angus Cleaning Services Ltd",
-    "Tidy Green Clean",
-    "C S Group",
-    "Tidy Cleaner Ltd",
-    "Abbey Services",
-    "Merry Maids of Inverness & East Highland",
-    "Greenleaf",
-    "S C S Cleaning Services Ltd",
-    "Industriouscleaningservices",
-    "Hi Spec",
-    "G S Associates",
-    "H & M Cleaning",
-    "Ultra Pro Service",
-    "Superior Window Cleaning",
-    "Walsh Bros Industrial Services Ltd",
-    "Bright & Beautiful Housekeeping",
-    "No Time to Clean",
-    "G 2 Environmental Services",
-    "Easi Cleans",
-    "Q C S Contract Cleaning",
-    "Cleanco Ltd",
-    "Topside Cleaning",
-    "Muggins Cleaning Service",
-    "A Touch of Class Ltd",
-    "AM Pm Services N I Ltd",
-    "Clear Blue Cleaning",
-    "L & L Cleaning Services Ltd",
-    "Bella Dion Group Ltd",
-    "Eliminate Ltd",
-    "City Contract Cleaners",
-    "Revolution Cleaning Service N I",
-    "Glen Contract Services Ltd",
-    "Abby Cleaning Scotland Ltd",
-    "S W Enviro Group Specialist Cleaning",
-    "Goldstar",
-    "Clean 4 Me",
-    "24 7 Elite Clean Ltd",
-    "1st Choice Commercial Cleaning",
-    "Bridges Cleaning Services",
-    "Sparkle & Shine Cleaning & Housekeeping Services",
-    "Central Cleaning Solutions",
-    "Celtic Vacuum",
-    "Mac Clean Ni Ltd",
-    "Cathkin Clean",
-    "Diamond Leaning Services Ni",
-    "Denholm Environmental Ltd",
-    "Cleanwell",
-    "Flexi",
-    "Urbaser Ltd",
-    "Recycling Management",
-    "James Waste Management",
-    "Noble Recycling & Skip Hire Ltd",
-    "Brewster Brothers",
-    "Glynn's Skips",
-    "H M A",
-    "Amey Ltd",
-    "Saica Natur UK Ltd",
-    "Hawes Skip Hire Ltd",
-    "F & R Jackson Ltd",
-    "Loop",
-    "A J Recycling",
-    "Trafford Services",
-    "Smiths of Gloucester Ltd",
-    "Fire Protection Recycling",
-    "Leeses Skip Hire",
-    "Martins of York",
-    "D I Y Aggregates",
-    "Bolton Skip Hire Ltd",
-    "Creigiau Tyres",
-    "Rem Waste",
-    "Davies Skips Ltd",
-    "Kirkham & Blackpool Skip Hire",
-    "Regenthill Ltd",
-    "G B N Services",
-    "Depot Hire Ltd",
-    "Perrys Recycling",
-    "Suez",
-    "Collier Industrial Waste Ltd",
-    "Thomas Muir Metals Ltd",
-    "Total Recycling Services",
-    "Morris Recycling Ltd",
-    "I O D Skip Hire Ltd",
-    "Olus Environmental Ltd",
-    "Williams & Williams",
-    "Ellgia",
-    "Blue Phoenix",
-    "Lostock Skip Hire",
-    "F C C Environment",
-    "Barr Environmental Ltd",
-    "Scotwaste Recycling",
-    "Portland Stone Ltd",
-    "A & A Recycling Services Ltd",
-    "Three Counties Reclamation Ltd",
-    "V C Cooke Ltd",
-    "Viridor Polymer",
-    "T G Waste Services",
-    "D G Environmental Ltd",
-    "Sims Recycling Solutions",
-    "Tom White Waste",
-    "Augean Plc",
-    "Woodland Oil",
-    "Norpol Recycling Ltd",
-    "B J Skip Hire",
-    "M G Waste Management",
-    "Skip Hire Stoke",
-    "S E Recycling Ltd",
-    "Hoban Skip Hire",
-    "Enfield Skips",
-    "Dial a Bin",
-    "A1 Skip Hire",
-    "London & Metropolitan Recycling",
-    "Biogas Technology Ltd",
-    "Lathams of London Ltd",
-    "E M R Glasgow",
-    "Renewi",
-    "European Recycling Platform",
-    "Countrystyle Recycling Ltd",
-    "Hood Skip Hire",
-    "Dyfed Recycling",
-    "Enva",
-    "G X O Supply Chain UK",
-    "Irwell Street Metal Co Ltd",
-    "B & K Environmental Services Ltd",
-    "R V Maidment Ltd",
-    "Hazport Ltd",
-    "S A V R E S",
-    "B & J Parr Haulage & Packaging",
-    "Pudsey Plant Hire",
-    "Renewi UK Services Ltd",
-    "A M G Resources",
-    "Fortress Recycling",
-    "Zero Waste Recycling",
-    "Waste King Ltd",
-    "Hurn Recycling Ltd",
-    "Johnsons Recycling",
-    "Levenseat Ltd",
-    "Suez Cleveland West Management",
-    "Shred It",
-    "Frylite",
-    "Inverurie Skip Hire",
-    "Endurmeta",
-    "I C E X",
-    "Plasterboard Recycling Group Ltd",
-    "N C Recycling Ltd",
-    "Phillips Waste Management",
-    "Pickup Skips Ltd",
-    "N W H Group",
-    "Lakeside Energy From Waste Ltd",
-    "Sid Dennis & Sons Ltd",
-    "Bourne Skip Hire",
-    "Salford Skip Hire",
-    "Fowles Skip Hire",
-    "Mid Lothian Skip Hire Ltd",
-    "Recycled Products Ltd",
-    "Play Resource",
-    "W R C Recycling",
-    "Eco Waste & Recycling",
-    "Newbery Recycling",
-    "Skipway Waste Management",
-    "Camiers Group Ltd",
-    "Bold Skips",
-    "Bath Recycling Skips",
-    "Quick Skips London Recycling Ltd",
-    "Recycling Engineers Service Ltd",
-    "Reston Waste",
-    "Electrical Waste Recycling Group Ltd",
-    "Recresco Ltd",
-    "Select a Skip",
-    "Carl Bird Ltd",
-    "Britaniacrest Recycling",
-    "Graig Environmental Recycling Services Ltd",
-    "X P O I.T Services Ltd",
-    "John Gunner & Co Ltd",
-    "Bower Skip Hire Ltd",
-    "M J Church",
-    "Viridor",
-    "Paulsgrove Recycling Centre",
-    "L S P S Skip Hire",
-    "Arthur's Skip Hire",
-    "Recorra",
-    "Diamond of Doncaster",
-    "Moralis Group Ltd",
-    "Allwood Recycling Solutions",
-    "K S Services Slough Ltd",
-    "E M S Waste Services",
-    "Bob Stabler & Sons Skip Hire",
-    "E & S Environmental Services",
-    "Mercia Waste Management",
-    "Mini Waste Ltd",
-    "Smurfit Kappa Recycling Birmingham",
-    "Hadleigh Salvage",
-    "M D S Recycling Ltd",
-    "The Recycling Factory",
-    "Henry Waste Management Ltd",
-    "5 Industrial",
-    "Circle Skip Hire",
-    "Recyclo Ltd",
-    "South Coast Skips Ltd",
-    "M D J Light Bros Scrap Processors Ltd",
-    "Wye Waste Paper",
-    "Egan Waste Services",
-    "Grace Recycling M C R Ltd",
-    "Ward Recycling",
-    "Ace Liftaway Ltd",
-    "Polymers",
-    "New Milton Sand & Ballast",
-    "Williams Recycling",
-    "Acorn Transport & Plant Hire Ltd",
-    "Forge Recycling",
-    "Augean North Sea Services",
-    "Basildon Skip Hire",
-    "Carmarthen Recycling & Environmental Services",
-    "Glazewing",
-    "M P L Waste Management",
-    "L S S Waste Management",
-    "Paper Mountain Shredding & Recycling Services",
-    "Midwest Polychem",
-    "Skips 4u",
-    "Danjo's Skip Hire",
-    "Hurley's Skip Hire",
-    "Kedel Ltd",
-    "Environcom",
-    "Network Waste",
-    "Envirocraft Waste Solutions",
-    "Lytham St Annes Skip Hire",
-    "Reliable Skip Hire Camberley",
-    "Bryson Recycling",
-    "Forge Skip Hire",
-    "Bucks Recycling",
-    "Kiely Bros Ltd",
-    "Silver Skips Lincolnshire Ltd",
-    "Axion",
-    "Enviro Kleen Scotland Ltd",
-    "Burnham Waste Ltd",
-    "Whites Skip Hire",
-    "Smurfit Kappa Ssk",
-    "C T R Enviro Ltd",
-    "Saica Natur",
-    "R & B Engineering Ltd",
-    "Fermanagh & Omagh Maintenance Depot",
-    "Erith Waste Management Ltd",
-    "C S G Recovery",
-    "Centralgrange Ltd",
-    "Too Good to Go",
-    "Betapack Ltd",
-    "Document & Data Shred",
-    "Jeff Skinner Skip Hire Ltd",
-    "J Witt Waste Recycling",
-    "Glendermott Enterprises",
-    "M M S Supplies Ltd",
-    "Central Waste UK Ltd",
-    "Remondis",
-    "Paul Riddel Skips Ltd",
-    "Highlander International Recycling Ltd",
-    "Whitemoss Landfill Ltd",
-    "Mini Skips Southern Ltd",
-    "Avanti Environmental",
-    "The Waste Group",
-    "Hippo Waste Management Systems",
-    "The Coventry & Solihull Waste Disposal Company Ltd",
-    "Luxus Ltd",
-    "Waste Concern Ltd",
-    "Malary Ltd",
-    "Hereford Waste Paper",
-    "T S Lee & Son Ltd",
-    "McKenzies Ltd",
-    "Oil Recoveries Ltd",
-    "G R S",
-    "E L G Metals UK",
-    "Tradebe",
-    "Asecca",
-    "M E S Environmental Ltd",
-    "Stevenage Borough Council",
-    "Harrogate Skip Hire",
-    "K C Skip Hire & Recycling",
-    "Redgate",
-    "I Waste Management Services",
-    "W N Thomas & Sons Ltd",
-    "Recycle Fife",
-    "Cox Skips",
-    "Sonoco",
-    "J F C Plastics Ltd",
-    "Frogson Waste Management Ltd",
-    "Fowles",
-    "Borough Skip 2 Rent",
-    "H W Martin Waste",
-    "Sharpsmart",
-    "Restructa Ltd",
-    "Plumb Polymers",
-    "Central Skip Hire",
-    "Cambridge Skip Hire",
-    "Forth Resource Management Ltd",
-    "Eden Oil Ltd",
-    "G D Environmental",
-    "G W E Biogas Ltd",
-    "Dave Peat Waste Ltd",
-    "Moock Environmental Solutions Ltd",
-    "Simply Shred & Recycle",
-    "Wellington Waste Management",
-    "Tes-amm",
-    "Parry & Evans",
-    "Hills",
-    "Green World Recycling Ltd",
-    "D S Smith",
-    "J & M Murdoch & Son Ltd",
-    "Veolia UK",
-    "Elite Waste Maintenance",
-    "Blackpool Skip Hire",
-    "A W D Group",
-    "Rubber & Plastic Collection Services Ltd",
-    "Green Recycling",
-    "Myshred Ltd",
-    "Kier",
-    "Wessex Associated Industries Ltd",
-    "Ink & Toner Recycling",
-    "Mountain Skip Hire",
-    "Oakbank Waste Management",
-    "topskips.com",
-    "Bedford Skips UK",
-    "Weymouth & Sherbourne Recycling",
-    "Acumen Waste Services",
-    "New Earth Solutions",
-    "Fred Lloyd",
-    "E N V A",
-    "O B Skips & Recycling Ltd",
-    "Shred on Site",
-    "London Recycling Services",
-    "Cory Environmental",
-    "Lister Recycling & Waste Management Ltd",
-    "Mini Skip Hire",
-    "D P Skip Hire Ltd",
-    "Ashcourt Group",
-    "B & M Waste Services - Great Manchester",
-    "A M Skip & Plant Hire",
-    "Caerphilly Skip Hire",
-    "T E L's Ltd",
-    "Circle",
-    "M E C Skip Hire",
-    "Capital Valley Plastics",
-    "Crown Security Shredding",
-    "Link Recycling",
-    "Blue Castle",
-    "Baker's Waste",
-    "Toughsheet Building Products",
-    "Jackson Skip & Recycling Ltd",
-    "Able Waste Services Ltd",
-    "Coastal Recycling",
-    "East Kent Recycling Ltd",
-    "S W M Waste Recycling",
-    "Safelec",
-    "Gedling Skip Hire",
-    "Biffa Waste Services",
-    "Saica",
-    "Brocklesby",
-    "Thorncliffe Building Supplies Ltd",
-    "Biffa",
-    "Crown Waste Management",
-    "Elite Paper Solutions",
-    "Agri Cycle",
-    "W R C Skip Hire Services",
-    "Lunnon Plant & Waste Services",
-    "A 1 Skip Hire",
-    "Biffa Hazardous Waste",
-    "H Cope & Son Ltd",
-    "Penfold Plastics Ltd",
-    "Furnitrust",
-    "The Green Waste Company",
-    "A Y S Skip Hire Ltd",
-    "United Commercial Trading",
-    "Palm Recycling",
-    "Ward Bros Skip Hire Services",
-    "Southwark Metals Ltd",
-    "Darlow Lloyd & Sons",
-    "Pink Skips",
-    "Vernon Maltby Junior Skip Hire",
-    "Mr Rubble Ltd",
-    "Moulding Solutions Ltd",
-    "Pinden Ltd",
-    "R S Skips Ltd",
-    "Auto Plas North West Ltd",
-    "Ed Hall Services Ltd",
-    "Russell Richardson & Sons Ltd",
-    "Barrys Skip Hire",
-    "Smurfit Kappa Recycling Glasgow",
-    "Henshaws",
-    "Bogan Skips Hire",
-    "E M R Bradford",
-    "Roy Hatfield",
-    "The Greenhouse",
-    "Mick George Ltd",
-    "S S S I Ltd",
-    "Esynergy Recycling Ltd",
-    "Valley Trading",
-    "Mobile Buyers",
-    "Fletchers Waste",
-    "Glynns Skips",
-    "Recycle Force",
-    "Robert Beck & Sons Ltd",
-    "M R W Skip Hire",
-    "Ron Hull Junior Ltd",
-    "Egap Recycling",
-    "Derwen Aggregates",
-    "C S G",
-    "G B M",
-    "Ron Smith Recycling Ltd",
-    "A M A Skip Hire",
-    "Aspects Solutions Environmental Ltd",
-    "Safety Kleen",
-    "P V C Recycling Ltd",
-    "C S S Recycling",
-    "Mid UK Recycling Ltd",
-    "All-clear Skip Hire Ltd",
-    "Sweeep",
-    "R J Farrow Ltd",
-    "Recycled UK Ltd",
-    "Ground Skips Ltd",
-    "Enterprise Skip Hire Ltd",
-    "Kilnbridge Construction",
-    "Calder Valley Skip Hire",
-    "Berry B P I",
-    "Aaron Grab & Skip Hire",
-    "Hanford Recycling Centre",
-    "S B T Skip Hire",
-    "J A Jackson",
-    "W Maw Recycling",
-    "Enva Plastic",
-    "B S H & Recycling Ltd",
-    "West Midlands Skip Hire",
-    "Dartmouth Global Trading Co Ltd",
-    "W & S Recycling",
-    "Burgess Recycling Ltd",
-    "Biffa Waste",
-    "Butlers Waste Management",
-    "Monks Contractors",
-    "Skelton Ltd",
-    "Barr Environmental",
-    "Keenan Recycling Ltd",
-    "Worldcare Wales Ltd",
-    "Easy Load",
-    "North West Recycling",
-    "Lathams Recycling Centre",
-    "M & M Waste Solutions",
-    "Energen Biogas Ltd",
-    "Baco - Compak",
-    "Andigestion Ltd",
-    "Uskip",
-    "Simpson Environmental Services Ltd",
-    "D & E Roberts Ltd",
-    "Lelo Metal Recyling",
-    "The Skip Network Ltd",
-    "Timberpak",
-    "Think 3 E Consortium",
-    "Portable Battery Recycling Ltd",
-    "1st Choice Concrete & Skip Hire",
-    "Teesside Skip Hire & Waste Management Ltd",
-    "Emmerson Transport Ltd",
-    "Top Dollar Mobile",
-    "Future Industrial",
-    "4r Recycling Ltd",
-    "L & C Skip Hire",
-    "P R M Green Technologies Ltd",
-    "Merseyside Recycling & Waste Authority",
-    "G & C",
-    "Hunsdon Skip Hire",
-    "Weeecharity",
-    "A M P Skip Hire",
-    "Elimpic Ltd",
-    "Ramsay's Skips",
-    "Bateman Skip Hire",
-    "E M S",
-    "R B Recycling Scarborough Ltd",
-    "Martland Skips",
-    "G X O Logistics",
-    "Recycle I T",
-    "Cumbria Waste Recycling",
-    "R P S Desani Ltd",
-    "Ward Recycling Ltd",
-    "B B S Skips",
-    "Addlesee Skip Hire & Fencing",
-    "Plan B Management Solutions",
-    "Severn Waste Services",
-    "Celtic Recycling",
-    "Thamesdown Recycling",
-    "Haulaway Ltd",
-    "Multiwaste Recycling Ltd",
-    "Blackburns",
-    "Hintons Waste",
-    "Alexander Scott Oils",
-    "S B Waste Management",
-    "Ballymena Woodbine Skips",
-    "GB Macks Skips",
-    "Valgrove Ltd",
-    "A Skip 4 U",
-    "Nolan Recycling",
-    "Mercian Skip Hire",
-    "Clews Recycling",
-    "Teward Recycling",
-    "Tawmix Recycling Ltd",
-    "Premier Shredding",
-    "Glass Recycling UK Ltd",
-    "Greenfield Skips Ltd",
-    "Restore Technology",
-    "Bay Skips",
-    "G X O",
-    "Cycleval UK Ltd",
-    "Sita",
-    "M & M Services",
-    "B C M Y Ltd",
-    "M W White Ltd",
-    "Viridor Waste Management",
-    "Perry's Recycling",
-    "Waste Source",
-    "John Stacey & Sons Ltd",
-    "Pulse Environmental",
-    "S E L C H P",
-    "City Recycling",
-    "White Skip Hire",
-    "Ovenden Earthmoving Company Ltd",
-    "Lowmac",
-    "Hopkins Recycling Ltd",
-    "George Parish & Sons Ltd",
-    "Lockhams Recycling",
-    "Syrus Waste Management Solutions",
-    "M G H Scotland Ltd",
-    "W M Russell & Sons Ltd",
-    "Llantrisant Recycling Centre Ltd",
-    "Barnes Skip & Recycling",
-    "Recolight",
-    "J W S Waste & Recycling Services Ltd",
-    "Lucy & Martin Recycling Ltd",
-    "Dunmow",
-    "Emr Nottingham",
-    "B C L",
-    "J Gordon Williamson Ltd",
-    "Pugh Metal Recycling",
-    "M McKenzie",
-    "W M Briers & Son",
-    "Plasteco Wood Ltd",
-    "Kemp Waste Management Ltd",
-    "Forge Waste & Recycling",
-    "Shanks Waste Management Ltd",
-    "Future Industrial Services",
-    "Thomas Skip & Plant Hire Ltd",
-    "Budget Skips",
-    "Sims Group UK Ltd",
-    "Greensure Environmental",
-    "O B G",
-    "Harefield Civic Amenities Site",
-    "C M Skips Ltd",
-    "C R Skips",
-    "Belmont Trading UK Ltd",
-    "Kent Skips",
-    "Enva Batteries",
-    "City Centre Containers Ltd",
-    "L & S Waste Management",
-    "K M R Skip Hire",
-    "Hurleys Skip Hire & Waste Management",
-    "Patersons Skip Hire",
-    "C S H Environmental Ltd",
-    "Smurfit Kappa",
-    "Corporate Mobile Recycling",
-    "C R Hales Ltd",
-    "H L Thorne",
-    "Bifa",
-    "R W Oils",
-    "A J Skip Hire",
-    "Wasteonline",
-    "Cory Riverside Energy",
-    "Cope Ltd",
-    "Aggregate Recycling UK Ltd",
-    "Collect Free",
-    "Team Recycling",
-    "Jones Waste Services Ltd",
-    "A M I Waste",
-    "Premier Group Recycling",
-    "P M K Recycling Ltd",
-    "R J Harris Contracts Ltd",
-    "Collins Skip Hire",
-    "Smiths",
-    "Arrow",
-    "C L Prosser Ltd",
-    "Nicholls & Pearce Waste Paper Ltd",
-    "Printwaste Recycling & Shredding",
-    "No 1 Skip Hire Ltd",
-    "Rapid Skips",
-    "Pegasus Utilities Ltd",
-    "R T S Waste Management",
-    "P B Donoghue Waste Management",
-    "Wasteology Ltd",
-    "Frank Barnes Darwen Ltd",
-    "Hertsmere Borough Council - Waste Service",
-    "Teeside Skip Hire & Waste Management Ltd",
-    "Emr Southampton",
-    "Depot Hire",
-    "Axe Skip Hire Ltd",
-    "Holywell Skip Hire & Metro Skip Hire",
-    "Greenacre Composting",
-    "Global Renewables",
-    "Reliable Skip",
-    "Slicker Recycling",
-    "Shore Recycling",
-    "Kilmarnock & District Can Recycle",
-    "John Brooke Timber Treatments Ltd",
-    "Reconomy",
-    "McKenzies N I Ltd",
-    "Clearaway Recycling Ltd",
-    "S W M & Waste Recycling Ltd",
-    "Blackburn Skips",
-    "Adler & Allan",
-    "Quick Skip Ltd",
-    "Collard Group Ltd",
-    "J & A Young Ltd",
-    "Hopkinson Waste",
-    "J & M Kennie",
-    "Go 4 Greener",
-    "Casepak Ltd Oceala",
-    "Premier Waste Recycling",
-    "Go Greener",
-    "Norman Wenn Skip Hire",
-    "Retford Waste Ltd",
-    "Wheeldon Brothers",
-    "Weee Solutions Ltd",
-    "Waste King Skip Hire Ltd",
-    "Change Waste Recycling",
-    "Basingstoke Skip Hire",
-    "Eco Bat Resources UK",
-    "A39 Skip Hire",
-    "J L A Recycling Ltd",
-    "Recyplas Ltd",
-    "Greater London Waste",
-    "Scott Bros",
-    "Tradebe Solvent Recycling Ltd",
-    "Pindens Skip Hire",
-    "Brewsters",
-    "Recycling UK Ltd",
-    "C Soar & Sons UK Ltd",
-    "Harpers",
-    "Hills Waste",
-    "Biffa Waste Services Ltd",
-    "Springburn Skips",
-    "Avanti Waste Management",
-    "T P Skip Hire Ltd",
-    "Click a Skip",
-    "Atlantic Recycling Ltd",
-    "Circle Waste",
-    "Cheshire Waste Skip Hire Ltd",
-    "Pure Clean Waste Solutions Ltd",
-    "L B Waste London",
-    "Natural World Products",
-    "Cwik Skip Waste Management",
-    "Ash Skip Hire Ltd",
-    "Skip Hire Belfast",
-    "Caerphilly Skips",
-    "Total Recycling Scotland",
-    "Mayglothling",
-    "London Skip Hire Ltd",
-    "Batesy Skip Hire",
-    "Alutrade",
-    "E I S Waste Services",
-    "Site Clear Solutions",
-    "Migrama Plastics",
-    "Wastecare",
-    "Biffa Waste Management",
-    "Patersons Waste Management",
-    "T Melrose Ltd",
-    "E M R Metal Recycling",
-    "Ash Alans Skips",
-    "A W S Recycling Ltd",
-    "J J C Hire Ltd",
-    "Ansa Environmental Services Ltd",
-    "Worcester Community Recycling",
-    "Crow Skip Hire",
-    "City Depot & Recycling Park",
-    "Oldham Bros",
-    "South Northamptonshire Council Recycling Services",
-    "Rhayader Skip Hire",
-    "N W H Waste Services",
-    "Waste Spectrum",
-    "Absolute I T Asset Disposals Ltd",
-    "Newport Recycling",
-    "T D & A M Bugg Ltd",
-    "Glynn's Skip Hire",
-    "Crucial Recycling",
-    "Wolverhampton Skip Hire Ltd",
-    "1st Place Grab & Skip Hire Ltd",
-    "East Anglian Resources Ltd",
-    "A 2 B Skip Hire",
-    "A & R Skip Hire",
-    "A R Richards",
-    "Recon Waste Management Ltd",
-    "Gwynedd Skip & Plant Hire Ltd",
-    "A D S Recycling",
-    "Cleansing Services",
-    "Quick Skip Hereford Ltd",
-    "Alans Skip Hire",
-    "Nick Ferris Skip Hire",
-    "Envirocraft Waste Solutions Ltd",
-    "Wellington Waste Skip Hire",
-    "Emr Kingsbury",
-    "S W M & Waste Recycling",
-    "Belford Brothers Skip Hire Ltd",
-    "Any Junk",
-    "Kevin Humphreys Waste Recycling",
-    "Biffa Leicester Ltd",
-    "Chemviron Carbon",
-    "I T Williams",
-    "Recycled Material Supplies Ltd",
-    "Collard",
-    "River Ridge Recycling",
-    "Sheridan Skips",
-    "Install Integrated Skips Ltd",
-    "The Oil Collection Company",
-    "Black Skip",
-    "Forward Waste Management",
-    "Preston Plastics Ltd",
-    "Celtic Recycling Ltd",
-    "Gamble Plant Norfolk Ltd",
-    "Plastic Energy",
-    "K C M Waste Management Ltd",
-    "Avon Material Supplies Ltd",
-    "Castle Environmental",
-    "Potter Group",
-    "Midland Skip Hire Ltd",
-    "U R M",
-    "Collins",
-    "Krysteline Technologies",
-    "Pack Care Ltd",
-    "Chloros Environmental",
-    "Shredall S D S Group Nottingham",
-    "Shields Environmental Plc",
-    "Edmund Proctor Ltd",
-    "West Country Skip Hire Ltd",
-    "H E H Enterprises Ltd",
-    "Cleansing Service Group",
-    "A R D S Containers & Skip Hire",
-    "Macback",
-    "P S H Environmental",
-    "Cumbria Recycling Ltd",
-    "Blackpole Recycling Ltd",
-    "Abacus",
-    "R D C",
-    "Sun Skips",
-    "North Devon Council Works Recycling Services",
-    "Packaging Reuse Recycle Disposal",
-    "Recycle Southern Ltd",
-    "Bradwell Skip Services Ltd",
-    "S I S Plastic Regrind Supplies Ltd",
-    "C B Skips",
-    "Wycombe Recycling Ltd",
-    "N Viro Cycle",
-    "L A S Recycling",
-    "Olus Biomass Ltd",
-    "Clarity Environmental Ltd",
-    "Martlands",
-    "Shred-it",
-    "Quick Skips",
-    "Anglian Waste Recycling",
-    "Thomas Bros",
-    "Paper Shredding Services",
-    "Shorts Group Ltd",
-    "Space Rubbish Ltd",
-    "C O'Donovan & Sons Ltd",
-    "C Fullard Metals Ltd",
-    "Bio Collectors",
-    "Skip Hires",
-    "Recycled Packaging Ltd",
-    "Solway Recycling",
-    "Bill & Ben Skip Hire",
-    "Centro Waste",
-    "Direct Special Metals Ltd",
-    "Wye Valley Skips",
-    "Maxi Skips",
-    "Powderhall Waste Transfer Station",
-    "99p Recycling Ltd",
-    "Unisan UK",
-    "Bill & Ben Skip Hire Ltd",
-    "Roydon Bottle Recycling",
-    "Waste Care",
-    "G & L Transport Ltd",
-    "Skip It",
-    "G D Golding Skip Hire",
-    "Commercial Waste Services - Southampton City Council",
-    "All Waste Berkshire Ltd",
-    "J C K Ltd",
-    "Quick Waste Ltd",
-    "A P R",
-    "F C C Environment Waste Services",
-    "Frank Flannigan Skip Hire Selkirk Ltd",
-    "Grinsell's Skip Hire Ltd",
-    "Augean",
-    "Mytum & Selby Waste Recycling",
-    "Fakenham Skips",
-    "W S R Recycling",
-    "Go Green",
-    "Wiser Recycling",
-    "G B N Services Ltd",
-    "London Waste",
-    "Willshee's Waste & Recycling",
-    "Weee Recycle It",
-    "Phoenix Oils",
-    "Shirley's Recycling Ltd",
-    "Myers Skip Hire",
-    "Zest Recycle",
-    "Raybell & Sons Skip Hire & Recycling Ltd",
-    "Re-used Glass UK Ltd",
-    "T J Waste & Recycling",
-    "C S Recycling",
-    "Arrow Recycling",
-    "Suez Recycling & Recovery UK Ltd",
-    "Wastege Waste Management Ltd",
-    "Skip Hire (York)",
-    "Synergy",
-    "M B Skip Hire",
-    "Roba Metals Ltd",
-    "The All Clear Company",
-    "Xpo Supply Chain UK Ltd",
-    "Edwards Waste Paper Ltd",
-    "Land Polymers",
-    "Sinkfall Recycling",
-    "U R M UK Ltd",
-    "Electrical Waste Recycling Group",
-    "Hammond Skip Hire",
-    "D W Parker Skip Hire",
-    "C M I Demolition Ltd",
-    "Belfast City Recycling Ltd",
-    "A1 Truck & Plant",
-    "Wareham & Purbeck Skip Hire",
-    "A C D Skips Ltd",
-    "G S H Waste",
-    "McQuillan Skip Hire Ltd",
-    "Alliance Environmental Services",
-    "Wirral Fibres & Plastics",
-    "Froom",
-    "Bryan Hirst Ltd",
-    "A C M Waste Management Plc",
-    "Enviro Skip Hire",
-    "Lathams of London",
-    "City Fuel Services Ltd",
-    "D S Smith Recycling UK Ltd",
-    "Pete Bott Skips Ltd",
-    "Aim Services",
-    "Mick's Skips Ltd",
-    "Go Waste UK Ltd",
-    "F C M Skip Hire Ltd",
-    "3r Technology UK Ltd",
-    "Refood",
-    "I S L Ltd",
-    "Northern Waste Group",
-    "Cherwell District Council Environmental Services",
-    "Riverridge",
-    "Greenagenda",
-    "Baguley's Skip Hire",
-    "Olivers Skip Hire",
-    "Enviro Wales",
-    "E M R",
-    "Gap Group",
-    "Wastenot",
-    "Clean Tech UK",
-    "Environmental Contracts Ltd",
-    "Mainsway Ltd",
-    "Gypsum Supplies Group",
-    "P J Skips",
-    "Wastesolve Ltd",
-    "Ace Skips",
-    "Wastesavers",
-    "A B C Siddalls Skip Hire",
-    "Ammanford Recycling Ltd",
-    "Beta Skips",
-    "A K S Skip Hire Services Ltd",
-    "Canvey Skip Hire & Recycling Ltd",
-    "New West Gypsum Recycling UK Ltd",
-    "Jones Skip Hire Wolverhampton Ltd",
-    "Britannia Skips Ltd",
-    "Enviro Ltd",
-    "J Byne Haulage",
-    "Deadman Confidential",
-    "Holywell Skips",
-    "Southport Skip Hire",
-    "Nick Brookes Recycling Ltd",
-    "Wades of Wednesbury",
-    "Barraclough's of Pudsey",
-    "M60 Skip Hire Ltd",
-    "R Plevin",
-    "Hadley's",
-    "T B D Morris",
-    "C M R Export",
-    "J Dickinson & Sons",
-    "Wilstead Haulage Ltd",
-    "A & T",
-    "Recycling Lives",
-    "Matrix Aggregates Ltd",
-    "Derwent Recycling Services",
-    "Parle Skip Hire",
-    "B & B Skip",
-    "Enva England Specialist Waste",
-    "Allen's Waste Disposal Ltd",
-    "The Orange Skip Company",
-    "B A Shorthouse Ltd",
-    "Baldwins Skip Hire",
-    "Eco Bat Resourcing",
-    "Sims Lifecycle Services",
-    "B & E Transport Witney Ltd",
-    "Sensa Waste Solutions Ltd",
-    "Mytum & Selby Hull",
-    "Sharp Skips",
-    "Ormskirk Skip Recycling Ltd",
-    "Monoworld Ltd",
-    "J R L Environmental Ltd",
-    "Zero Waste Western Isles",
-    "Green Skip Hire",
-    "Rainbow Skips & Recycling",
-    "Recycling Live",
-    "Crown Waste",
-    "Street Fuel Ltd",
-    "R & S Skips Ltd",
-    "Cwik Skip",
-    "D J & S J Recycling",
-    "Visy Recycling",
-    "Yor Waste Ltd",
-    "Foreman Recycling Ltd",
-    "Recoup",
-    "Sheerness Recycling",
-    "Plastic Technology Services Ltd",
-    "Bill Dyson Skip Hire & Waste Management Ltd",
-    "3b Recycling Ltd",
-    "Sunshine Skips",
-    "M R W Waste Recycling",
-    "Holywell Recycling",
-    "The City of Edinburgh Council - Waste Department",
-    "Swift Skips",
-    "East Coast Waste",
-    "Shanks East London",
-    "C W M Rhondda Waste",
-    "Tradebe Inutec",
-    "Mastermelts Refining Services Ltd",
-    "J & J Franks Ltd",
-    "Smartsite",
-    "Burton Skip Hire Ltd",
-    "National Resource Consortium",
-    "Ecoplas",
-    "Gowing & Pursey",
-    "Mercury Recycling",
-    "Centriforce Products Ltd",
-    "Murdoch Skip Hire",
-    "Sams Recycling Ltd",
-    "Aber Skip Hire",
-    "Veka Recycling",
-    "Aireborough Skip Hire",
-    "J Maclachlan Ltd",
-    "Killoughery",
-    "A B Waste Disposal Ltd",
-    "Tidysite Skip Services",
-    "J M Waste Management",
-    "Impetus",
-    "Hurley Waste Management Ltd",
-    "Dyfed Recycling Services",
-    "Smiths Gloucester Ltd",
-    "Bristol City Council Avonmouth Refuse Transfer Station",
-    "J & G Environmental",
-    "Powys Environmental Ltd",
-    "E Nicholson & Sons",
-    "The Active Collection Bureau",
-    "J & B Recycling Ltd",
-    "Kenny Waste Management",
-    "C T R Europe",
-    "Newtown Waste Solutions",
-    "Wetherby Skip Services Ltd",
-    "Quick Skip Hire",
-    "Bailey's Skip Hire",
-    "Pure Clean Environmental",
-    "A O Recycling",
-    "D T S Trading",
-    "Monster Skips Ltd",
-    "D C Skips",
-    "Repro Plastics Ltd",
-    "Fresh Start Waste Services",
-    "Eurokey Recycling Group",
-    "Midlothian Skip Hire",
-    "S B Waste Management & Recycling Ltd",
-    "Siteserv Recycling Ltd",
-    "Siteserv Recycling",
-    "G K L Skips",
-    "D & M Recycling",
-    "Rabbit Waste Management Ltd",
-    "Hazel & Jefferies",
-    "B S H Recycling",
-    "Thomas Waste Management Ltd",
-    "Leicestershire Wood Recycling Ltd",
-    "Bolsover District Council - Waste Department",
-    "S E D Services Ltd",
-    "A & M Smith",
-    "King Brothers Ltd",
-    "I T P Ltd",
-    "enva.com",
-    "Enovert",
-    "McCarthy Marland",
-    "Aldermaston Recycling",
-    "Ecobat Solutions",
-    "Recycle I T 4 U",
-    "K J Millard Ltd",
-    "Shredpro",
-    "Lift & Shift",
-    "Amgen Cymru",
-    "Quick Skip",
-    "Recycled Plastics UK Ltd",
-    "Bishops Skip Hire Ltd",
-    "D S Smith Recycling",
-    "Priority Waste",
-    "W T Skip Hire",
-    "Smith Recycling",
-    "Atlas Commodities Ltd",
-    "Taylors Industrial Services",
-    "Recycling Your I T",
-    "A & A Recycling",
-    "T B S Recycling & Skip Hire",
-    "S B Skip Hire",
-    "Hardings Valley Skips",
-    "Toulouse Plant Hire Ltd",
-    "Holroyds Skip Hire",
-    "Light M D J Bros S P Ltd",
-    "Jayplas",
-    "Grab N Go Skip Hire North East Ltd",
-    "Universal Tanker Group Ltd",
-    "Wood Waste Recycling Ltd",
-    "Smurfit Kappa Recycling Tamworth",
-    "J & M Kennie Ltd",
-    "Greenacres Skip Hire",
-    "Proskips - Skip Hire Croydon",
-    "A D C Property Solutions Ltd",
-    "Crest Furniture Reclaim",
-    "Stevenage Skip Hire Ltd",
-    "Ecogen Recycling Ltd",
-    "Bowman Skip Hire",
-    "Castleford & Fryston Skip Services",
-    "Killermarsh Skip Hire",
-    "Unisan Ltd",
-    "Stanton Recycling",
-    "Lanz Group",
-    "North West Containers Ltd",
-    "Courtlands Skips & Waste Management",
-    "J & B Skip Services Ltd",
-    "Digaway & Clearaway Recycling Ltd",
-    "White's Skip Hire",
-    "Emr Lenwade",
-    "Shaws Waste Recycling Ltd",
-    "Suez UK",
-    "Chelson Meadow Recycling Centre",
-    "Evolution Waste Management",
-    "Pendragon Waste & Skip Hire Ltd",
-    "S W R Newstar",
-    "UK Aggregates & Plant Ltd",
-    "The Transfer Station",
-    "Coventry City Council Commercial Waste",
-    "Waste Management Solutions Ltd",
-    "E T M",
-    "Premier Waste",
-    "North London Waste Authority",
-    "Potters-ballotini Ltd",
-    "Hawkins & Scott Recycling & Waste Management",
-    "London Energy",
-    "Serco",
-    "Viridor Waste Management Ltd",
-    "Environcom England Ltd",
-    "Circom Ltd",
-    "Morden Council Waste Services",
-    "V Y T A",
-    "Macnabb Waste",
-    "O'Donovan Waste Disposal Ltd",
-    "Bedale Skip Hire",
-    "Collard Environmental",
-    "C F Booth Doncaster",
-    "Ward",
-    "M A C Skip Hire Ltd",
-    "1 Ace Skips",
-    "Raikes Lane Incinerator",
-    "New Era Metal Recycling",
-    "S I T A",
-    "Newlincs Development Ltd",
-    "Retech",
-    "Regroup Reclaim Ltd",
-    "R E 3",
-    "Wicks",
-    "Highland Waste Services",
-    "Gen 2 Carbon",
-    "Bexleyheath Skips",
-    "M B A Polymers UK Ltd",
-    "Eco Lamp Recycling Ltd",
-    "Brown Waste Management & Recycling",
-    "Derby Crushing & Screening Ltd",
-    "Magfern Recycling",
-    "Wiltshire Plastics UK Ltd",
-    "Hughes Waste",
-    "Fleet Skips",
-    "Potts Dem",
-    "Envirocraft",
-    "Cleansing Service Group Ltd",
-    "R E M Waste",
-    "Viridor Greater Manchester Waste Ltd",
-    "J H Haulage Ltd",
-    "Cartwrights Waste Disposal Services Ltd",
-    "Sharp Polymer Solutions",
-    "2 Recycling",
-    "Altech",
-    "The Municipal",
-    "Skip Hire UK",
-    "H R Skip Hire",
-    "Sheridan Skips Lancashire",
-    "Berry Circular Polymers",
-    "Wetherby Skip Hire",
-    "Day Group Ltd",
-    "Roydon Granulation",
-    "Hills Group",
-    "Tier 1",
-    "S D Waste Paper Recycling Centre",
-    "R M S Skip Hire",
-    "Just Skips",
-    "Westridge Skip Hire",
-    "Green Planet",
-    "A Brunton Waste",
-    "Resource Food",
-    "Forceshift",
-    "Vanden Recycling Ltd",
-    "London Mining Associates Ltd",
-    "E F R Skips",
-    "Smurfit Kappa Recycling Snodland",
-    "Cherry Hill Waste",
-    "Andy Campbell Recycling Ltd",
-    "W E E E Scotland Ltd",
-    "Shredbank",
-    "Beefy's Skips",
-    "Max Recycle",
-    "M T S Cleansing Services Ltd",
-    "Wakefield Skip Hire",
-    "Recresco",
-    "Porters Metals & Skip Hire Ltd",
-    "L K M Recycling",
-    "Wheelabrator Technologies",
-    "Eco Sustainable Solutions Ltd",
-    "Swindon Metal Recycling",
-    "Aim to Recycle",
-    "Shredall S D S Group Edinburgh",
-    "Smurfit Kappa Recycling Blackburn",
-    "Pearce Recycling",
-    "Andrew Cook Containers Ltd",
-    "Excel Waste Management Hornchurch",
-    "Fast Skips",
-    "Labwaste",
-    "Green I T Disposal",
-    "S W M",
-    "Kirkby Skips",
-    "Street Scene",
-    "Island Waste",
-    "White Reclamation",
-    "Cheadle Skip Hire",
-    "Timber Park Ltd",
-    "McKinstry Skip Hire Ltd",
-    "Allen's Skip Hire Ltd",
-    "Waste King Skip Hire",
-    "The Cory Group",
-    "P H Hull & Sons Ltd",
-    "Cymru Lan Ltd",
-    "Ecohub Skip Hire",
-    "Mobius",
-    "Trojan Skip Hire",
-]
+# Qualification checks run by the filter planner once the company profile is known.
+# Each check stores what it fetched in the context so process_company can build the record.
+def build_filter_rules(config):
+    def is_active(context):
+        return context['is_active']
 
-# Initialize the HMRC client
-hmrc_client = HMRCClient()
+    def has_wanted_sic_code(context):
+        return any(code in config.sic_codes for code in context['sic_codes'])
 
-# Prepare to write data to CSV
-output_file = 'directors_age_and_company_data.csv'
-with open(output_file, 'w', newline='') as csvfile:
-    fieldnames = ['Company Number', 'Company Name', 'Address', 'SIC Codes', 'Directors (Name and Age)', 'Annual Turnover']
-    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-    writer.writeheader()
+    def has_min_turnover(context):
+        context['turnover'] = get_company_turnover(context['client'], context['vat_number'])
+        return bool(context['turnover']) and context['turnover'] >= config.min_turnover
 
-    for name in company_names:
-        company_number = search_company_by_name(name)
-        if company_number:
-            company_name, address, sic_codes, is_active = get_company_details(company_number)
-            if not is_active:
-                print(f"Skipping company {company_name} ({company_number}) as it is not active.")
+    def has_qualifying_director(context):
+        directors = get_directors_details(context['company_number'])
+        context['directors'] = [d for d in directors if d.age > config.min_director_age]
+        return bool(context['directors'])
+
+    def officer_calls(context):
+        # Nothing is sent when the first page is cached; otherwise expect the pages per listing seen so far
+        if get_companies_house().officers_cached(context['company_number']):
+            return 0
+        metrics = get_metrics()
+        listings = metrics.counter_value('officer_listings_total')
+        return metrics.counter_value('officer_pages_total') / listings if listings else 1
+
+    rules = [FilterRule('status', is_active)]
+    if config.sic_codes:
+        rules.append(FilterRule('sic_code', has_wanted_sic_code))
+    # HMRCClient.get_company_turnover is simulated and sends no request, so the turnover check is free
+    rules.append(FilterRule('turnover', has_min_turnover))
+    rules.append(FilterRule('director_age', has_qualifying_director, cost=officer_calls))
+    return rules
+
+def get_filter_planner():
+    return _shared_client('filter_planner', lambda: FilterPlanner(build_filter_rules(get_config())))
+
+# Run the full lookup for one company name and return its typed record, or None if it does not qualify
+def process_company(name, client=None):
+    company_number = search_company_by_name(name)
+    if not company_number:
+        logger.info("Company %s not found.", name, extra=log_event('company_not_found', company=name))
+        return None
+    company_name, address, sic_codes, is_active = get_company_details(company_number)
+    context = {
+        'client': client or get_hmrc_client(),
+        'company_number': company_number,
+        'vat_number': f"GB{company_number}",
+        'sic_codes': sic_codes or [],
+        'is_active': is_active
+    }
+    rejected_by = get_filter_planner().evaluate(context)
+    if rejected_by:
+        logger.info("Skipping company %s (%s): %s check failed.", company_name, company_number, rejected_by,
+                    extra=log_event('company_skipped', company_number=company_number, rule=rejected_by))
+        return None
+    logger.info("Company %s processed successfully.", company_name,
+                extra=log_event('company_processed', company_number=company_number))
+    return {
+        'company_number': company_number,
+        'company_name': company_name,
+        'address': address,
+        'sic_codes': sic_codes,
+        'directors': context['directors'],
+        'annual_turnover': context['turnover']
+    }
+
+# Returned instead of a record when the lookup hit an open circuit breaker or a failing upstream
+PARKED = object()
+
+# Run process_company, parking the name instead of failing the run while an upstream is unavailable
+def lookup_company(name):
+    try:
+        return process_company(name)
+    except CircuitOpenError as e:
+        logger.warning("Parking %s: %s", name, e, extra=log_event('company_parked', company=name, circuit=e.name))
+        return PARKED
+    except requests.RequestException as e:
+        # Network errors, timeouts and error statuses (UpstreamError) that outlasted the retry policy
+        logger.warning("Parking %s: %s", name, e, extra=log_event('company_parked', company=name, error=type(e).__name__))
+        return PARKED
+
+# Look up one (input position, name) pair from run_pipeline
+def lookup_entry(entry):
+    return lookup_company(entry[1])
+
+# Like executor.map, but only keeps a bounded window of names in flight so large inputs stream.
+# With a DedupIndex, names that canonicalize to the same key share one lookup.
+def ordered_map(executor, fn, items, window, dedup=None):
+    futures = deque()
+    for item in items:
+        future = dedup.submit(executor, fn, item) if dedup else executor.submit(fn, item)
+        futures.append((item, future))
+        if len(futures) >= window:
+            pending_item, future = futures.popleft()
+            yield pending_item, future.result()
+    while futures:
+        pending_item, future = futures.popleft()
+        yield pending_item, future.result()
+
+# Estimate the Companies House requests deduplication avoided from the average per unique lookup
+def report_saved_requests(dedup):
+    if 'companies_house' not in _clients or not dedup.unique_lookups():
+        return ""
+    requests_sent = _clients['companies_house'].connection_stats()['requests']
+    saved = dedup.duplicates * requests_sent / dedup.unique_lookups()
+    return f", saving about {saved:.0f} Companies House requests"
+
+OUTPUT_FIELDNAMES = ['Company Number', 'Company Name', 'Address', 'SIC Codes', 'Directors (Name and Age)', 'Annual Turnover']
+
+# Format a company record as a row of the CSV output
+def format_csv_row(record):
+    return {
+        'Company Number': record['company_number'],
+        'Company Name': record['company_name'],
+        'Address': record['address'],
+        'SIC Codes': ", ".join(record['sic_codes']),
+        'Directors (Name and Age)': "; ".join(f"{d.name} (Age: {d.age})" for d in record['directors']),
+        'Annual Turnover': f"£{record['annual_turnover']:,.2f}"
+    }
+
+# Format a company record as a row of the Parquet output
+def format_parquet_row(record):
+    row = dict(record)
+    row['directors'] = [
+        {'name': d.name, 'birth_year': d.birth_year, 'age': d.age, 'role': d.role, 'appointed_on': d.appointed_on}
+        for d in record['directors']
+    ]
+    return row
+
+# Column types for Parquet output, so downstream reads need no string parsing
+def company_parquet_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ('company_number', pa.string()),
+        ('company_name', pa.string()),
+        ('address', pa.string()),
+        ('sic_codes', pa.list_(pa.string())),
+        ('directors', pa.list_(pa.struct([
+            ('name', pa.string()),
+            ('birth_year', pa.int16()),
+            ('age', pa.int16()),
+            ('role', pa.string()),
+            ('appointed_on', pa.string())
+        ]))),
+        ('annual_turnover', pa.float64())
+    ])
+
+# Build the output sink for config.output_format
+def create_sink(config):
+    if config.output_format == 'parquet':
+        return ParquetSink(config.output_file, company_parquet_schema(), batch_size=config.write_batch_size,
+                           metrics=get_metrics())
+    if config.output_format == 'csv':
+        return CSVSink(config.output_file, OUTPUT_FIELDNAMES, batch_size=config.write_batch_size, metrics=get_metrics())
+    raise ValueError(f"Unsupported output format: {config.output_format}")
+
+# Run the pipeline over an iterable of company names and write qualifying companies to config.output_file.
+# total is the number of input names, used for the progress bar's ETA when names has no len().
+def run_pipeline(names, config=None, total=None):
+    config = config or PipelineConfig.from_env()
+    configure(config)
+    output_file = config.output_file
+
+    journal = ProgressJournal(f"{output_file}.journal")
+    sink = create_sink(config)
+    if config.resume and not sink.supports_append:
+        raise ValueError(f"--resume is not supported for {config.output_format} output")
+    if config.resume:
+        journal.load()
+    resume = config.resume and journal.output_offset > 0 and os.path.exists(sink.temp_path)
+    if resume:
+        # Drop any rows written after the last commit; their input positions are processed again
+        os.truncate(sink.temp_path, journal.output_offset)
+        print(f"Resuming: {len(journal.completed)} names already processed.")
+    journal.open(resume=resume)
+    sink.append = resume
+
+    processed = 0
+    rows = 0
+    dedup = DedupIndex(key=lambda entry: normalize_company_name(entry[1]))
+    parked = []
+    if total is None and hasattr(names, '__len__'):
+        total = len(names)
+    progress = PipelineProgress(total, initial=len(journal.completed) if resume else 0, enabled=config.progress)
+
+    def write_results(results):
+        nonlocal processed, rows
+        response_cache = get_response_cache()
+        for (position, name), record in results:
+            if record is PARKED:
+                # Not journaled, so an interrupted run looks the name up again on --resume
+                parked.append((position, name))
                 continue
-            directors = get_directors_details(company_number)
-            vat_number = f"GB{company_number}"
-            turnover = get_company_turnover(hmrc_client, vat_number)
-            if turnover and turnover >= 1000000 and directors:
-                qualifying_directors = [d for d in directors if "Age:" in d and int(d.split("Age:")[1].strip(")")) > 50]
-                if qualifying_directors:
-                    writer.writerow({
-                        'Company Number': company_number,
-                        'Company Name': company_name,
-                        'Address': address,
-                        'SIC Codes': ", ".join(sic_codes),
-                        'Directors (Name and Age)': "; ".join(qualifying_directors),
-                        'Annual Turnover': f"£{turnover:,.2f}"
-                    })
-                    print(f"Company {company_name} processed successfully.")
-                else:
-                    print(f"No qualifying directors for {company_name}.")
-            else:
-                print(f"Insufficient data or turnover for {company_name}.")
-        else:
-            print(f"Company {name} not found.")
+            processed += 1
+            if record:
+                sink.write(format_csv_row(record) if config.output_format == 'csv' else format_parquet_row(record))
+                rows += 1
+            # Positions rather than names, so a name repeated later in the input still gets its own row
+            journal.record(position)
+            if processed % config.checkpoint_interval == 0:
+                journal.commit(sink.sync())
+            progress.update(rows, response_cache.hit_ratio() if response_cache else None, len(parked))
+
+    try:
+        with sink:
+            # The journal holds input positions, so --resume must be given the same input
+            completed = frozenset(journal.completed)
+            pending_entries = ((position, name) for position, name in enumerate(names) if position not in completed)
+            window = config.max_workers * 4
+            with progress, ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+                write_results(ordered_map(executor, lookup_entry, pending_entries, window, dedup=dedup))
+                # Parked names are retried once the open breakers are ready to probe again; their rows follow the rest
+                breakers = get_circuit_breakers()
+                for retry_round in range(1, config.parked_retry_rounds + 1):
+                    if not parked:
+                        break
+                    retry_entries = list(parked)
+                    parked.clear()
+                    wait_time = breakers.seconds_until_probe()
+                    progress.write(f"Retrying {len(retry_entries)} parked names in {wait_time:.0f}s (round {retry_round} of {config.parked_retry_rounds}).")
+                    time.sleep(wait_time)
+                    write_results(ordered_map(executor, lookup_entry, retry_entries, window))
+            journal.commit(sink.sync())
+        journal.remove()
+        if parked:
+            parked_file = f"{output_file}.parked.txt"
+            with open(parked_file, 'w', encoding='utf-8') as file:
+                file.writelines(f"{name}\n" for position, name in parked)
+            print(f"{len(parked)} names could not be looked up while an upstream was failing; saved to {parked_file} for a follow-up run.")
+
+        print(f"Data successfully written to {output_file} ({sink.rows_written} rows, {sink.rows_per_second():.1f} rows/sec).")
+        if 'companies_house' in _clients:
+            stats = _clients['companies_house'].connection_stats()
+            print(f"Companies House: {stats['requests']} requests over {stats['connections']} connections (reuse rate {stats['reuse_rate']:.1%}).")
+        if dedup.duplicates:
+            print(f"Deduplication: {dedup.duplicates} duplicate names reused {dedup.unique_lookups()} unique lookups"
+                  f"{report_saved_requests(dedup)}.")
+        if 'filter_planner' in _clients:
+            for rule_name, stats in _clients['filter_planner'].report().items():
+                print(f"Filter {rule_name}: rejected {stats['rejected']} of {stats['evaluated']}, saved about {stats['calls_saved']:.0f} API calls.")
+        if 'circuit_breakers' in _clients:
+            for breaker in _clients['circuit_breakers'].breakers.values():
+                if breaker.times_opened:
+                    print(f"Circuit breaker {breaker.name}: opened {breaker.times_opened} times, failed fast on {breaker.rejected} calls.")
+        if 'retry_policy' in _clients and _clients['retry_policy'].retries:
+            print(f"Retries: {_clients['retry_policy'].retries} (budget {config.retry_budget}).")
+        response_cache = _clients.get('response_cache')
+        if response_cache:
+            print(f"Response cache: {response_cache.hits} hits, {response_cache.misses} misses (hit ratio {response_cache.hit_ratio():.1%}).")
+    finally:
+        journal.close()
+        if config.metrics_file:
+            export_metrics(config.metrics_file)
+        close_clients()
+
+    return {'output_file': output_file, 'processed': processed, 'rows_written': sink.rows_written, 'duplicates': dedup.duplicates,
+            'parked': [name for position, name in parked]}
+
+# Add run-level figures held by the shared clients to the metrics and write them to path
+def export_metrics(path):
+    metrics = get_metrics()
+    response_cache = _clients.get('response_cache')
+    if response_cache:
+        metrics.set_gauge('response_cache_hit_ratio', response_cache.hit_ratio())
+    if 'retry_policy' in _clients:
+        metrics.set_gauge('retry_policy_retries', _clients['retry_policy'].retries)
+    if 'companies_house' in _clients:
+        metrics.set_gauge('connection_reuse_ratio', _clients['companies_house'].connection_stats()['reuse_rate'])
+    if 'circuit_breakers' in _clients:
+        for breaker in _clients['circuit_breakers'].breakers.values():
+            metrics.set_gauge('circuit_breaker_opened', breaker.times_opened, endpoint=breaker.name)
+    print(f"Metrics written to {metrics.write(path)}.")
+
+def main(argv=None):
+    load_dotenv()
+
+    # --resume skips names recorded in the progress journal and appends to the existing output
+    parser = argparse.ArgumentParser(description="Look up company, director and turnover data for a list of company names")
+    parser.add_argument('--input', default='company_names.txt', help="company names as .txt (one per line), .csv or .xlsx")
+    parser.add_argument('--column', help="header of the column holding company names in a .csv or .xlsx input (default: the first column; the header row is always skipped)")
+    parser.add_argument('--output', help="output file (default directors_age_and_company_data.csv, or .parquet with --format parquet)")
+    parser.add_argument('--format', choices=['csv', 'parquet'], help="output format (default csv)")
+    parser.add_argument('--workers', type=int, help="number of companies looked up concurrently")
+    parser.add_argument('--resume', action='store_true', help="continue an interrupted run instead of starting again")
+    parser.add_argument('--metrics', help="write run metrics here: Prometheus text for .prom or .txt, otherwise a JSON summary")
+    parser.add_argument('--log-format', choices=['text', 'json'], help="log lines as plain text (default) or JSON objects")
+    parser.add_argument('--log-summary-only', action='store_true', default=None,
+                        help="only log warnings, errors and per-event counts instead of a line per company")
+    parser.add_argument('--no-progress', dest='progress', action='store_false', default=None, help="hide the progress bar")
+    args = parser.parse_args(argv)
+
+    config = PipelineConfig.from_env(output_format=args.format, max_workers=args.workers, resume=args.resume,
+                                     metrics_file=args.metrics, log_format=args.log_format,
+                                     log_summary_only=args.log_summary_only, progress=args.progress)
+    if args.output:
+        config.output_file = args.output
+    elif config.output_format == 'parquet':
+        config.output_file = f"{os.path.splitext(config.output_file)[0]}.parquet"
+    # Log records are formatted and written on a background thread, away from the workers,
+    # and printed above the progress bar while it is shown
+    total = count_company_names(args.input, args.column) if config.progress else None
+    with setup_logging(config.log_level, config.log_format, config.log_sample_rates, config.log_summary_only,
+                       stream=TqdmStream() if config.progress else None):
+        run_pipeline(iter_company_names(args.input, args.column), config, total=total)
 
-print(f"Data successfully written to {output_file}.")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the latency histogram buckets, as used by Prometheus clients
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_PREFIX = 'company_pipeline_'
+
+# Help text for the Prometheus export; metrics not listed here are exported without it
+METRIC_HELP = {
+    'stage_seconds': "Latency of one call to a pipeline stage",
+    'http_request_seconds': "Latency of one HTTP request to an upstream API",
+    'http_responses_total': "HTTP responses received, by status code",
+    'http_response_bytes_total': "Response body bytes received from an upstream API",
+    'http_retries_total': "Requests retried after a throttled, failed or unreachable attempt",
+    'cache_lookups_total': "Response cache lookups, by result",
+    'officer_listings_total': "Companies whose officers were listed",
+    'officer_pages_total': "Officer pages requested, cached or not",
+    'output_write_seconds': "Latency of writing one batch of rows to the output file",
+    'output_rows_total': "Rows written to the output file",
+    'response_cache_hit_ratio': "Share of response cache lookups answered from the cache",
+    'retry_policy_retries': "Retries spent from the run's retry budget",
+    'connection_reuse_ratio': "Share of Companies House requests sent over an already open connection",
+    'circuit_breaker_opened': "Times an endpoint's circuit breaker opened"
+}
+
+def _label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _format_labels(label_key, extra=()):
+    pairs = list(label_key) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (
+        f'{name}="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for name, value in pairs
+    )
+    return '{' + ','.join(escaped) + '}'
+
+class Histogram:
+    """Cumulative bucket counts, sum and count of observed values"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[position] += 1
+                break
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield bound, total
+
+    def quantile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of observations, or None above the last bucket"""
+        if not self.count:
+            return 0.0
+        for bound, total in self.cumulative():
+            if total >= fraction * self.count:
+                return bound
+        return None
+
+class MetricsRegistry:
+    """Thread-safe counters and latency histograms, exported as Prometheus text or JSON.
+
+    Every metric is identified by a name and optional labels, e.g.
+    metrics.increment('http_responses_total', api='hmrc', status=200).
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        with self._lock:
+            self.gauges[(name, _label_key(labels))] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def time(self, name, **labels):
+        """Observe how long the with block takes, whether or not it raises"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def counter_value(self, name, **labels):
+        with self._lock:
+            return self.counters.get((name, _label_key(labels)), 0)
+
+    def to_prometheus(self):
+        """Metrics in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            families = {}
+            for (name, label_key), value in self.counters.items():
+                families.setdefault((name, 'counter'), []).append((label_key, value))
+            for (name, label_key), value in self.gauges.items():
+                families.setdefault((name, 'gauge'), []).append((label_key, value))
+            for (name, label_key), histogram in self.histograms.items():
+                families.setdefault((name, 'histogram'), []).append((label_key, histogram))
+
+            for (name, kind), series in sorted(families.items()):
+                metric = f"{METRIC_PREFIX}{name}"
+                if name in METRIC_HELP:
+                    lines.append(f"# HELP {metric} {METRIC_HELP[name]}")
+                lines.append(f"# TYPE {metric} {kind}")
+                for label_key, value in sorted(series, key=lambda item: item[0]):
+                    if kind != 'histogram':
+                        lines.append(f"{metric}{_format_labels(label_key)} {value}")
+                        continue
+                    for bound, total in value.cumulative():
+                        lines.append(f"{metric}_bucket{_format_labels(label_key, [('le', repr(bound))])} {total}")
+                    lines.append(f"{metric}_bucket{_format_labels(label_key, [('le', '+Inf')])} {value.count}")
+                    lines.append(f"{metric}_sum{_format_labels(label_key)} {value.sum}")
+                    lines.append(f"{metric}_count{_format_labels(label_key)} {value.count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """Metrics as a JSON-serializable dict; histograms are reduced to count, mean and bucket quantiles"""
+        def labelled(name, label_key):
+            return name + _format_labels(label_key)
+
+        with self._lock:
+            return {
+                'counters': {labelled(name, key): value for (name, key), value in sorted(self.counters.items())},
+                'gauges': {labelled(name, key): value for (name, key), value in sorted(self.gauges.items())},
+                'histograms': {
+                    labelled(name, key): {
+                        'count': histogram.count,
+                        'mean_seconds': histogram.sum / histogram.count if histogram.count else 0.0,
+                        'p50_seconds': histogram.quantile(0.50),
+                        'p90_seconds': histogram.quantile(0.90),
+                        'p99_seconds': histogram.quantile(0.99)
+                    }
+                    for (name, key), histogram in sorted(self.histograms.items())
+                }
+            }
+
+    def write(self, path):
+        """Write Prometheus text to a .prom or .txt path and a JSON summary to anything else"""
+        if os.path.splitext(path)[1] in ('.prom', '.txt'):
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.summary(), indent=2)
+        # Written under a temporary name so a scraper never reads a half-written file
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        os.replace(temp_path, path)
+        logger.info("Wrote metrics to %s", path)
+        return path
@@ -0,0 +1,335 @@
+import os
+import re
+import sys
+import argparse
+import json
+import logging
+import random
+import sqlite3
+import subprocess
+import threading
+import time
+import zlib
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+from name_matching import normalize_company_name
+from response_cache import normalize_key
+
+logger = logging.getLogger(__name__)
+
+FIRST_NAMES = ['JOHN', 'SARAH', 'DAVID', 'EMMA', 'JAMES', 'HELEN', 'PETER', 'CLAIRE', 'ROBERT', 'AMINA']
+SURNAMES = ['SMITH', 'JONES', 'TAYLOR', 'BROWN', 'WILLIAMS', 'WILSON', 'PATEL', 'EVANS', 'THOMAS', 'KHAN']
+SIC_CODES = ['62020', '70229', '81210', '47110', '41100', '56101', '86900', '68209']
+
+def synthetic_company_number(name):
+    """Stable eight-digit company number for a name, so every run sees the same companies"""
+    return f"{zlib.crc32(normalize_company_name(name).encode()) % 100000000:08d}"
+
+def synthetic_search(query):
+    company_number = synthetic_company_number(query)
+    return {
+        'items': [
+            {'title': query.upper(), 'company_number': company_number},
+            {'title': f"{query.upper()} HOLDINGS", 'company_number': synthetic_company_number(f"{query} holdings")}
+        ],
+        'total_results': 2
+    }
+
+def synthetic_profile(company_number):
+    rng = random.Random(company_number)
+    return {
+        'company_number': company_number,
+        'company_name': f"COMPANY {company_number} LIMITED",
+        'company_status': 'active' if rng.random() < 0.85 else 'dissolved',
+        'registered_office_address': {
+            'address_line_1': f"{rng.randint(1, 200)} High Street",
+            'locality': 'London',
+            'postal_code': f"EC{rng.randint(1, 4)}A {rng.randint(1, 9)}BB",
+            'country': 'United Kingdom'
+        },
+        'sic_codes': rng.sample(SIC_CODES, rng.randint(1, 2))
+    }
+
+def synthetic_officers(company_number, start_index=0, items_per_page=35):
+    rng = random.Random(f"officers-{company_number}")
+    officers = []
+    for position in range(rng.randint(1, 12)):
+        officer_id = f"{company_number}{position:04d}"
+        officers.append({
+            'name': f"{rng.choice(SURNAMES)}, {rng.choice(FIRST_NAMES)}",
+            'officer_role': 'director' if rng.random() < 0.8 else 'secretary',
+            'date_of_birth': {'month': rng.randint(1, 12), 'year': rng.randint(1940, 1998)},
+            'appointed_on': f"{rng.randint(1995, 2023)}-{rng.randint(1, 12):02d}-01",
+            'resigned_on': '2024-01-01' if rng.random() < 0.15 else None,
+            'links': {'officer': {'appointments': f"/officers/{officer_id}/appointments"}}
+        })
+    return {
+        'items': officers[start_index:start_index + items_per_page],
+        'start_index': start_index,
+        'items_per_page': items_per_page,
+        'total_results': len(officers)
+    }
+
+class MockUpstream:
+    """Local stand-in for the Companies House and HMRC APIs.
+
+    Serves search, profile, officers and /oauth/token over HTTP on 127.0.0.1, and its own
+    request counts at /_mock/stats. Bodies come
+    from a response cache file written by main.py (replay) and fall back to synthetic data.
+    Every request waits latency plus up to latency_jitter seconds; error_rate of them fail
+    with 503, and for the first burst_length seconds of every burst_every seconds all of
+    them get 429 with Retry-After.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, latency_jitter=0.0, error_rate=0.0, burst_every=0.0,
+                 burst_length=0.0, retry_after=1, replay_path=None, seed=None):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.retry_after = retry_after
+        self.replay_path = replay_path
+        self.requests = {}
+        self.bytes_sent = 0
+        self._random = random.Random(seed)
+        self._replay = threading.local()
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._started = 0.0
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1 keeps connections alive, like the real APIs; without TCP_NODELAY every
+            # response would stall on delayed ACKs because headers and body are written separately
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                self._respond()
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                self._respond()
+
+            def _respond(self):
+                status, body, headers = upstream.handle(self.command, self.path)
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("Mock upstream listening on %s", self.url)
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def handle(self, method, raw_path):
+        """Return (status, body, headers) for one request"""
+        parts = urlsplit(raw_path)
+        path = parts.path
+        if path == '/_mock/stats':
+            return 200, self.stats(), {}
+        params = dict(parse_qsl(parts.query))
+        endpoint = self._endpoint(method, path)
+
+        delay = self.latency + (self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        status, body, headers = self._fault()
+        if status is None:
+            status, body = self._body(endpoint, path, params)
+
+        with self._lock:
+            key = (endpoint, str(status))
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.bytes_sent += len(json.dumps(body))
+        return status, body, headers
+
+    def _endpoint(self, method, path):
+        if method == 'POST' and path == '/oauth/token':
+            return 'token'
+        if path == '/search/companies':
+            return 'search'
+        if path.startswith('/company/') and path.endswith('/officers'):
+            return 'officers'
+        if path.startswith('/company/'):
+            return 'profile'
+        return 'other'
+
+    def _fault(self):
+        if self.burst_every and (time.monotonic() - self._started) % self.burst_every < self.burst_length:
+            return 429, {'error': 'Too Many Requests'}, {'Retry-After': str(self.retry_after)}
+        if self.error_rate and self._random.random() < self.error_rate:
+            return 503, {'error': 'Service Unavailable'}, {}
+        return None, None, {}
+
+    def _body(self, endpoint, path, params):
+        if endpoint == 'token':
+            return 200, {'access_token': 'mock-access-token', 'token_type': 'bearer', 'expires_in': 14400}
+        recorded = self._recorded(endpoint, path, params)
+        if recorded is not None:
+            return 200, recorded
+        if endpoint == 'search':
+            return 200, synthetic_search(params.get('q', ''))
+        company_number = path.split('/')[2] if endpoint in ('profile', 'officers') else None
+        if endpoint == 'officers':
+            return 200, synthetic_officers(
+                company_number,
+                int(params.get('start_index', 0)),
+                int(params.get('items_per_page', 35))
+            )
+        if endpoint == 'profile':
+            return 200, synthetic_profile(company_number)
+        return 404, {'errors': [{'error': 'not-found'}]}
+
+    def _recorded(self, endpoint, path, params):
+        """Body stored for this request in the replay cache file, regardless of its age"""
+        if not self.replay_path:
+            return None
+        # sqlite connections cannot be shared between the server's request threads
+        conn = getattr(self._replay, 'conn', None)
+        if conn is None:
+            conn = self._replay.conn = sqlite3.connect(f"file:{self.replay_path}?mode=ro", uri=True)
+        row = conn.execute(
+            "SELECT body FROM responses WHERE endpoint = ? AND key = ?",
+            (endpoint, normalize_key(path, params))
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def stats(self):
+        """Requests served per endpoint and status, plus the response bytes sent"""
+        with self._lock:
+            served = {}
+            for (endpoint, status), count in self.requests.items():
+                served.setdefault(endpoint, {})[status] = count
+            return {'requests': served, 'bytes_sent': self.bytes_sent}
+
+class MockUpstreamProcess:
+    """MockUpstream served from a child process, so its request handling neither competes with
+    the code being measured for the GIL nor shows up in that process's memory.
+
+    settings are the command-line options of mock_upstream.py, e.g. latency=0.05.
+    """
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self.url = None
+        self._process = None
+
+    def start(self):
+        command = [sys.executable, os.path.abspath(__file__), '--port', '0']
+        for name, value in self.settings.items():
+            if value is not None:
+                command += [f"--{name.replace('_', '-')}", str(value)]
+        self._process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+        line = self._process.stdout.readline()
+        match = re.search(r"http://[\w.]+:\d+", line)
+        if not match:
+            self.stop()
+            raise RuntimeError(f"Mock upstream did not start: {line.strip()}")
+        self.url = match.group(0)
+        return self
+
+    def stop(self):
+        if self._process:
+            self._process.terminate()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def stats(self):
+        return requests.get(f"{self.url}/_mock/stats").json()
+
+FAULT_OPTIONS = ('latency', 'latency_jitter', 'error_rate', 'burst_every', 'burst_length', 'retry_after', 'replay', 'seed')
+
+def add_fault_arguments(parser):
+    """Command-line options for MockUpstream's latency and fault injection"""
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help="up to this many extra seconds per response")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument('--burst-every', type=float, default=0.0, help="seconds between 429 bursts (0 disables them)")
+    parser.add_argument('--burst-length', type=float, default=0.0, help="seconds each 429 burst lasts")
+    parser.add_argument('--retry-after', type=int, default=1, help="Retry-After sent with 429 responses")
+    parser.add_argument('--replay', help="response cache file written by main.py to serve recorded bodies from")
+    parser.add_argument('--seed', type=int, help="seed for latency jitter and injected errors")
+
+def fault_settings(args):
+    """The parsed fault options as a dict keyed by option name"""
+    return {name: getattr(args, name) for name in FAULT_OPTIONS}
+
+def upstream_from_args(args, port=0):
+    return MockUpstream(
+        port=port,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        retry_after=args.retry_after,
+        replay_path=args.replay,
+        seed=args.seed
+    )
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO)
+
+    # Serve until interrupted; point COMPANIES_HOUSE_URL and HMRC_BASE_URL at the printed URL
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the Companies House and HMRC APIs")
+    parser.add_argument('--port', type=int, default=8080)
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    upstream = upstream_from_args(args, port=args.port).start()
+    print(f"Mock upstream listening on {upstream.url}; press Ctrl+C to stop.", flush=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        upstream.stop()
+        print(json.dumps(upstream.stats(), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import re
+import unicodedata
+from difflib import SequenceMatcher
+
+# Spellings of the same legal form, and the forms dropped when comparing names
+SUFFIX_ALIASES = {'limited': 'ltd', 'company': 'co'}
+LEGAL_SUFFIXES = {'ltd', 'plc', 'llp', 'lp', 'cic', 'cio', 'co'}
+
+# Dropped rather than read as word breaks, so SIMON’S is simons and P.L.C. is plc
+_DROPPED = dict.fromkeys(map(ord, "'‘’‛`´."), None)
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+
+def normalize_company_name(name):
+    """Canonical form of a company name for comparison.
+
+    Folds case and unicode forms, drops apostrophes and dots (so SIMON’S and Simons match
+    and P.L.C. is plc), reads "&" as "and", strips punctuation, unifies LTD/LIMITED style
+    suffixes and then drops trailing legal-form words and a leading "the".
+    """
+    name = unicodedata.normalize('NFKC', name).translate(_DROPPED).casefold()
+    name = name.replace('&', ' and ')
+    tokens = [SUFFIX_ALIASES.get(token, token) for token in _PUNCTUATION.sub(' ', name).split()]
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    if len(tokens) > 1 and tokens[0] == 'the':
+        tokens.pop(0)
+    return " ".join(tokens)
+
+def name_similarity(a, b, cutoff=0.0):
+    """Similarity of two normalized names between 0 and 1.
+
+    Takes the better of a character-level ratio and a ratio over sorted tokens, so word
+    order does not matter. Cheap upper bounds reject hopeless pairs before the full ratio.
+    """
+    if a == b:
+        return 1.0
+    best = 0.0
+    for left, right in ((a, b), (" ".join(sorted(a.split())), " ".join(sorted(b.split())))):
+        matcher = SequenceMatcher(None, left, right, autojunk=False)
+        if matcher.real_quick_ratio() < max(cutoff, best) or matcher.quick_ratio() < max(cutoff, best):
+            continue
+        best = max(best, matcher.ratio())
+    return best
+
+def best_match(name, candidates, threshold=0.85, key=lambda candidate: candidate):
+    """Return (candidate, score) for the highest-scoring candidate at or above threshold.
+
+    When nothing reaches the threshold the candidate is None and score is the best seen.
+    """
+    target = normalize_company_name(name)
+    best_candidate = None
+    best_score = 0.0
+    for candidate in candidates:
+        score = name_similarity(target, normalize_company_name(key(candidate)), cutoff=best_score)
+        if score > best_score:
+            best_candidate, best_score = candidate, score
+            if score == 1.0:
+                break
+    if best_score < threshold:
+        return None, best_score
+    return best_candidate, best_score
+
+class DedupIndex:
+    """Collapses input names with the same canonical form onto a single lookup.
+
+    The first occurrence is submitted to the executor; later duplicates share its future,
+    so every input row still receives the result.
+    """
+
+    def __init__(self, key=normalize_company_name):
+        self.key = key
+        self.duplicates = 0
+        self._futures = {}
+
+    def submit(self, executor, fn, name):
+        canonical = self.key(name)
+        future = self._futures.get(canonical)
+        if future is None:
+            future = executor.submit(fn, name)
+            self._futures[canonical] = future
+        else:
+            self.duplicates += 1
+        return future
+
+    def unique_lookups(self):
+        return len(self._futures)
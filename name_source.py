@@ -0,0 +1,58 @@
+import csv
+import os
+
+# Stream company names from a .txt, .csv or .xlsx file one at a time
+def iter_company_names(path, column=None):
+    """Yield non-blank company names from path.
+
+    Text files hold one name per line. CSV and XLSX files must start with a header row,
+    which is never yielded; the names are read from the named header column, or from the
+    first column when no column is given.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        rows = _iter_csv_rows(path)
+    elif extension in ('.xlsx', '.xlsm'):
+        rows = _iter_xlsx_rows(path)
+    else:
+        rows = _iter_text_rows(path)
+
+    index = 0
+    if extension in ('.csv', '.xlsx', '.xlsm') or column is not None:
+        header = next(rows, None)
+        if header is None:
+            return
+        if column is not None:
+            try:
+                index = [str(cell).strip() if cell is not None else '' for cell in header].index(column)
+            except ValueError:
+                raise ValueError(f"Column '{column}' not found in {path}")
+
+    for row in rows:
+        if index < len(row) and row[index] is not None:
+            name = str(row[index]).strip()
+            if name:
+                yield name
+
+def count_company_names(path, column=None):
+    """Number of names iter_company_names would yield, for progress totals"""
+    return sum(1 for _ in iter_company_names(path, column))
+
+def _iter_text_rows(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            yield [line]
+
+def _iter_csv_rows(path):
+    with open(path, 'r', newline='', encoding='utf-8-sig') as file:
+        yield from csv.reader(file)
+
+def _iter_xlsx_rows(path):
+    # openpyxl is only needed for spreadsheet input
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
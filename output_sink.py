@@ -0,0 +1,142 @@
+import csv
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+class OutputSink:
+    """Buffered writer that builds the output under a temporary name.
+
+    Rows are written in batches of batch_size. The file only appears under its final
+    name once finalize() renames it, so a crashed run never leaves a partial file there.
+    Subclasses implement _open_file, _write_batch and _close_file. With a MetricsRegistry
+    the latency of every batch write and the rows written are recorded.
+    """
+    supports_append = False
+    format_name = None
+
+    def __init__(self, path, batch_size=500, append=False, metrics=None):
+        self.path = path
+        self.temp_path = f"{path}.part"
+        self.batch_size = batch_size
+        self.append = append
+        self.metrics = metrics
+        self.rows_written = 0
+        self._buffer = []
+        self._started = None
+
+    def open(self):
+        if self.append and not self.supports_append:
+            raise ValueError(f"{type(self).__name__} cannot append to an existing file")
+        self._open_file()
+        self._started = time.monotonic()
+        return self
+
+    def write(self, row):
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Hand buffered rows to the file"""
+        if self._buffer:
+            started = time.perf_counter()
+            self._write_batch(self._buffer)
+            if self.metrics:
+                self.metrics.observe('output_write_seconds', time.perf_counter() - started, format=self.format_name)
+                self.metrics.increment('output_rows_total', len(self._buffer), format=self.format_name)
+            self.rows_written += len(self._buffer)
+            self._buffer = []
+
+    def sync(self):
+        """Flush buffered rows to disk and return the durable size of the temporary file"""
+        self.flush()
+        return self._sync_file()
+
+    def finalize(self):
+        """Write remaining rows and atomically move the file to its final name"""
+        self.flush()
+        self._close_file()
+        os.replace(self.temp_path, self.path)
+        logger.info("Wrote %d rows to %s (%.1f rows/sec)", self.rows_written, self.path, self.rows_per_second())
+        return self.path
+
+    def abort(self):
+        """Close without finalizing; the temporary file is kept so the run can be resumed"""
+        self.flush()
+        self._close_file()
+
+    def rows_per_second(self):
+        elapsed = time.monotonic() - self._started if self._started else 0
+        return self.rows_written / elapsed if elapsed > 0 else 0.0
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.finalize()
+        else:
+            self.abort()
+
+class CSVSink(OutputSink):
+    supports_append = True
+    format_name = 'csv'
+
+    def __init__(self, path, fieldnames, batch_size=500, append=False, metrics=None):
+        super().__init__(path, batch_size=batch_size, append=append, metrics=metrics)
+        self.fieldnames = fieldnames
+        self._file = None
+        self._writer = None
+
+    def _open_file(self):
+        self._file = open(self.temp_path, 'a' if self.append else 'w', newline='', encoding='utf-8', buffering=1 << 20)
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+        if not self.append:
+            self._writer.writeheader()
+
+    def _write_batch(self, rows):
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def _sync_file(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def _close_file(self):
+        if self._file:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+class ParquetSink(OutputSink):
+    """Typed columnar output; each flushed batch becomes one Parquet row group"""
+    format_name = 'parquet'
+
+    def __init__(self, path, schema, batch_size=500, metrics=None):
+        super().__init__(path, batch_size=batch_size, metrics=metrics)
+        self.schema = schema
+        self._writer = None
+
+    def _open_file(self):
+        # pyarrow is only needed for Parquet output
+        import pyarrow.parquet as pq
+
+        self._writer = pq.ParquetWriter(self.temp_path, self.schema, compression='zstd')
+
+    def _write_batch(self, rows):
+        import pyarrow as pa
+
+        self._writer.write_table(pa.Table.from_pylist(rows, schema=self.schema))
+
+    def _sync_file(self):
+        # Row groups are only readable once the footer is written, so there is no partial size to report
+        return self.rows_written
+
+    def _close_file(self):
+        if self._writer:
+            self._writer.close()
+            self._writer = None
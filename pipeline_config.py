@@ -0,0 +1,81 @@
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from structured_logging import parse_sample_rates
+
+@dataclass
+class PipelineConfig:
+    """Settings for a main.py pipeline run; from_env() reads the documented environment variables"""
+    api_key: Optional[str] = None
+    output_file: str = 'directors_age_and_company_data.csv'
+    output_format: str = 'csv'
+    max_workers: int = 8
+    resume: bool = False
+    checkpoint_interval: int = 50
+    metrics_file: Optional[str] = None
+    log_level: str = 'INFO'
+    log_format: str = 'text'
+    log_sample_rates: Tuple[Tuple[str, int], ...] = ()
+    log_summary_only: bool = False
+    progress: bool = True
+    write_batch_size: int = 500
+    cache_path: Optional[str] = 'companies_house_cache.sqlite3'
+    cache_max_entries: int = 100000
+    index_path: Optional[str] = 'companies_index.sqlite3'
+    companies_house_url: Optional[str] = None
+    hmrc_url: Optional[str] = None
+    companies_house_rate: Optional[float] = None
+    companies_house_burst: int = 20
+    pool_connections: int = 10
+    pool_maxsize: Optional[int] = None
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    retry_budget: Optional[int] = 500
+    circuit_failure_threshold: float = 0.5
+    circuit_reset_timeout: float = 30.0
+    parked_retry_rounds: int = 3
+    match_threshold: float = 0.85
+    min_turnover: float = 1000000
+    min_director_age: int = 50
+    include_resigned_directors: bool = False
+    sic_codes: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_env(cls, **overrides):
+        config = cls(
+            api_key=os.getenv('COMPANIES_API_KEY'),
+            output_format=os.getenv('OUTPUT_FORMAT', 'csv'),
+            max_workers=int(os.getenv('PIPELINE_WORKERS', '8')),
+            checkpoint_interval=int(os.getenv('CHECKPOINT_INTERVAL', '50')),
+            metrics_file=os.getenv('METRICS_FILE') or None,
+            log_level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+            log_format=os.getenv('LOG_FORMAT', 'text'),
+            log_sample_rates=parse_sample_rates(os.getenv('LOG_SAMPLE', '')),
+            log_summary_only=os.getenv('LOG_SUMMARY_ONLY', '').lower() in ('1', 'true', 'yes'),
+            progress=os.getenv('PROGRESS', 'true').lower() not in ('0', 'false', 'no'),
+            write_batch_size=int(os.getenv('OUTPUT_BATCH_SIZE', '500')),
+            cache_path=os.getenv('COMPANIES_HOUSE_CACHE', 'companies_house_cache.sqlite3') or None,
+            cache_max_entries=int(os.getenv('COMPANIES_HOUSE_CACHE_MAX_ENTRIES', '100000')),
+            index_path=os.getenv('COMPANIES_HOUSE_INDEX', 'companies_index.sqlite3') or None,
+            companies_house_url=os.getenv('COMPANIES_HOUSE_URL') or None,
+            hmrc_url=os.getenv('HMRC_BASE_URL') or None,
+            companies_house_rate=float(os.environ['COMPANIES_HOUSE_RATE']) if os.getenv('COMPANIES_HOUSE_RATE') else None,
+            companies_house_burst=int(os.getenv('COMPANIES_HOUSE_BURST', '20')),
+            pool_connections=int(os.getenv('COMPANIES_HOUSE_POOL_CONNECTIONS', '10')),
+            pool_maxsize=int(os.environ['COMPANIES_HOUSE_POOL_MAXSIZE']) if os.getenv('COMPANIES_HOUSE_POOL_MAXSIZE') else None,
+            connect_timeout=float(os.getenv('HTTP_CONNECT_TIMEOUT', '5')),
+            read_timeout=float(os.getenv('HTTP_READ_TIMEOUT', '30')),
+            match_threshold=float(os.getenv('NAME_MATCH_THRESHOLD', '0.85')),
+            retry_budget=int(os.getenv('RETRY_BUDGET', '500')),
+            circuit_failure_threshold=float(os.getenv('CIRCUIT_BREAKER_THRESHOLD', '0.5')),
+            circuit_reset_timeout=float(os.getenv('CIRCUIT_BREAKER_RESET', '30')),
+            parked_retry_rounds=int(os.getenv('PARKED_RETRY_ROUNDS', '3')),
+            min_turnover=float(os.getenv('MIN_TURNOVER', '1000000')),
+            min_director_age=int(os.getenv('MIN_DIRECTOR_AGE', '50')),
+            include_resigned_directors=os.getenv('INCLUDE_RESIGNED_DIRECTORS', '').lower() in ('1', 'true', 'yes'),
+            sic_codes=tuple(code.strip() for code in os.getenv('SIC_CODES', '').split(',') if code.strip())
+        )
+        for name, value in overrides.items():
+            if value is not None:
+                setattr(config, name, value)
+        return config
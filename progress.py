@@ -0,0 +1,74 @@
+import sys
+
+class TqdmStream:
+    """File-like stream that writes above an active progress bar instead of through it.
+
+    Pass it to setup_logging() so log lines from worker threads do not break the bar.
+    """
+
+    def __init__(self, file=None):
+        self.file = file or sys.stderr
+
+    def write(self, text):
+        from tqdm import tqdm
+
+        tqdm.write(text, file=self.file, end='')
+
+    def flush(self):
+        self.file.flush()
+
+class PipelineProgress:
+    """Progress bar for run_pipeline showing names resolved, companies/sec, ETA, rows written and cache hit rate.
+
+    Only the thread consuming the results updates it, so it needs no locking however many
+    workers run. The bar is skipped when disabled or when stderr is not a terminal.
+    """
+
+    def __init__(self, total=None, initial=0, enabled=True, file=None):
+        self.file = file or sys.stderr
+        self._bar = None
+        if enabled:
+            # tqdm is only needed for the progress bar
+            from tqdm import tqdm
+
+            self._bar = tqdm(
+                total=total,
+                initial=initial,
+                unit='company',
+                desc='Names resolved',
+                dynamic_ncols=True,
+                mininterval=0.5,
+                disable=None,
+                file=self.file
+            )
+
+    def update(self, rows_written, cache_hit_ratio=None, parked=0):
+        """Count one more resolved name and refresh the figures shown next to the bar"""
+        if not self._bar:
+            return
+        postfix = {'rows': rows_written}
+        if cache_hit_ratio is not None:
+            postfix['cache hits'] = f"{cache_hit_ratio:.0%}"
+        if parked:
+            postfix['parked'] = parked
+        # The bar redraws at most every mininterval, so setting the postfix on every name is cheap
+        self._bar.set_postfix(postfix, refresh=False)
+        self._bar.update(1)
+
+    def write(self, message):
+        """Print a message without breaking the bar"""
+        if self._bar:
+            self._bar.write(message, file=sys.stdout)
+        else:
+            print(message)
+
+    def close(self):
+        if self._bar:
+            self._bar.close()
+            self._bar = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,72 @@
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+class ProgressJournal:
+    """Append-only record of the inputs whose output is safely on disk.
+
+    Inputs are identified by their position in the input, so a name that appears twice is
+    tracked twice. Each line is one committed batch: the positions finished since the last
+    commit and the synced byte size of the output file at that point. On resume the output
+    file is cut back to the last committed size, so rows written after the final commit are
+    not duplicated.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.completed = set()
+        self.output_offset = 0
+        self._pending = []
+        self._file = None
+
+    def load(self):
+        """Read earlier commits; a torn final line from a crash is ignored"""
+        if not os.path.exists(self.path):
+            return self
+        with open(self.path, 'r', encoding='utf-8') as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Ignoring incomplete journal entry in %s", self.path)
+                    break
+                self.completed.update(entry['positions'])
+                self.output_offset = entry['offset']
+        logger.info("Loaded %d completed inputs from %s", len(self.completed), self.path)
+        return self
+
+    def open(self, resume=False):
+        """Start a fresh journal, or keep appending to the existing one when resuming"""
+        if not resume:
+            self.completed.clear()
+            self.output_offset = 0
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+        return self
+
+    def record(self, position):
+        """Mark the input at position as finished; it becomes durable at the next commit"""
+        self._pending.append(position)
+
+    def commit(self, offset):
+        """Durably record every pending position against the synced size of the output file"""
+        if not self._pending:
+            return
+        self._file.write(json.dumps({'offset': offset, 'positions': self._pending}) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.completed.update(self._pending)
+        self.output_offset = offset
+        self._pending = []
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        """Delete the journal once its run has finished"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Companies House allows 600 requests per 5 minutes; HMRC allows 3 requests per second
+COMPANIES_HOUSE_WINDOW = (600, 300)
+
+def window_rate(limit, period, burst):
+    """Refill rate that keeps a full bucket of burst plus its refill within limit requests per period"""
+    if burst >= limit:
+        raise ValueError(f"Burst of {burst} does not fit a limit of {limit} requests per {period}s")
+    return (limit - burst) / period
+
+# Published limits per API host as (requests per second, burst capacity).
+# Buckets start full, so the refill rate leaves room for the initial burst.
+DEFAULT_LIMITS = {
+    'api.company-information.service.gov.uk': (window_rate(*COMPANIES_HOUSE_WINDOW, 20), 20),
+    'test-api.service.hmrc.gov.uk': (3.0, 3),
+    'api.service.hmrc.gov.uk': (3.0, 3)
+}
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a fixed rate up to its capacity"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """Block until the requested number of tokens is available, then take them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_time = (tokens - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+    async def acquire_async(self, tokens=1):
+        """Like acquire, but waits with asyncio.sleep so the event loop keeps running"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_time = (tokens - self._tokens) / self.rate
+            await asyncio.sleep(wait_time)
+
+class RateLimiter:
+    """One token bucket per API host, shared by every client and worker thread"""
+
+    def __init__(self, limits=None):
+        self.buckets = {
+            host: TokenBucket(rate, capacity)
+            for host, (rate, capacity) in dict(DEFAULT_LIMITS, **(limits or {})).items()
+        }
+
+    def acquire(self, url):
+        """Wait for a request slot on the host of url; hosts without a limit pass straight through"""
+        bucket = self.buckets.get(urlsplit(url).hostname)
+        if bucket:
+            bucket.acquire()
+
+    async def acquire_async(self, url):
+        bucket = self.buckets.get(urlsplit(url).hostname)
+        if bucket:
+            await bucket.acquire_async()
@@ -0,0 +1,123 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Default time-to-live per endpoint, in seconds
+DEFAULT_TTLS = {
+    'search': 30 * 24 * 3600,
+    'profile': 14 * 24 * 3600,
+    'officers': 14 * 24 * 3600,
+    'turnover': 30 * 24 * 3600
+}
+
+class CachedResponse:
+    """Stand-in for requests.Response when a payload is served from the cache"""
+    status_code = 200
+
+    def __init__(self, text):
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+def normalize_key(path, params=None):
+    """Build a cache key from a request path and its query parameters"""
+    query = []
+    for name, value in sorted((params or {}).items()):
+        if isinstance(value, str):
+            value = " ".join(value.split()).casefold()
+        query.append(f"{name}={value}")
+    return f"{path}?{'&'.join(query)}" if query else path
+
+class ResponseCache:
+    """SQLite-backed store of API response bodies with per-endpoint TTLs and LRU eviction"""
+
+    def __init__(self, path='companies_house_cache.sqlite3', ttls=None, max_entries=100000):
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes_since_eviction = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " endpoint TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " body TEXT NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " PRIMARY KEY (endpoint, key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self._conn.commit()
+
+    def get(self, endpoint, key):
+        """Return the cached body for key, or None if it is missing or expired"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM responses WHERE endpoint = ? AND key = ?",
+                (endpoint, key)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttls.get(endpoint, 0):
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE endpoint = ? AND key = ?",
+                (now, endpoint, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def contains(self, endpoint, key):
+        """Return True if a fresh entry exists, without counting a hit or miss"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at FROM responses WHERE endpoint = ? AND key = ?",
+                (endpoint, key)
+            ).fetchone()
+        return row is not None and time.time() - row[0] <= self.ttls.get(endpoint, 0)
+
+    def set(self, endpoint, key, body):
+        """Store a response body, evicting the least recently used entries when full"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (endpoint, key, body, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (endpoint, key, body, now, now)
+            )
+            self._writes_since_eviction += 1
+            # Counting rows is not free, so only check the bound every few hundred writes
+            if self._writes_since_eviction >= 500:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        self._writes_since_eviction = 0
+        count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE rowid IN"
+                " (SELECT rowid FROM responses ORDER BY accessed_at LIMIT ?)",
+                (excess,)
+            )
+            logger.info("Evicted %d cached responses", excess)
+
+    def hit_ratio(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def close(self):
+        with self._lock:
+            self._evict()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,85 @@
+import logging
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+# Maximum attempts per status code; statuses not listed are never retried
+DEFAULT_STATUS_RULES = {
+    429: 6,  # throttled: wait as long as Retry-After asks
+    500: 3,
+    502: 4,
+    503: 4,
+    504: 4
+}
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class RetryBudget:
+    """Caps the total number of retries in a run so a failing upstream cannot stall it indefinitely"""
+
+    def __init__(self, max_retries):
+        self.max_retries = max_retries
+        self.spent = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self):
+        with self._lock:
+            if self.max_retries is not None and self.spent >= self.max_retries:
+                return False
+            self.spent += 1
+            return True
+
+class RetryPolicy:
+    """Decides whether a failed request is retried and how long to wait first.
+
+    Delays grow exponentially from base_delay with full jitter (a uniform draw between zero
+    and the exponential cap), unless the server sent Retry-After, which is honoured up to
+    max_retry_after. Network errors use the exception_attempts limit. Every retry spends
+    one unit of the shared budget.
+    """
+
+    def __init__(self, base_delay=0.5, max_delay=30.0, max_retry_after=300.0, status_rules=None,
+                 exception_attempts=3, budget=None):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.status_rules = dict(DEFAULT_STATUS_RULES if status_rules is None else status_rules)
+        self.exception_attempts = exception_attempts
+        self.budget = budget
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def should_retry(self, attempt, status=None):
+        """attempt is the number of attempts already made; status is None for a network error"""
+        max_attempts = self.exception_attempts if status is None else self.status_rules.get(status, 1)
+        if attempt >= max_attempts:
+            return False
+        if self.budget and not self.budget.try_spend():
+            logger.warning("Retry budget exhausted; not retrying")
+            return False
+        with self._lock:
+            self.retries += 1
+        return True
+
+    def delay(self, attempt, retry_after=None):
+        """Seconds to wait before the next attempt"""
+        wait = parse_retry_after(retry_after)
+        if wait is not None:
+            return min(wait, self.max_retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
@@ -0,0 +1,164 @@
+import os
+import sys
+import json
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+logger = logging.getLogger(__name__)
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+def log_event(name, **fields):
+    """extra= argument naming a record's event and its structured fields.
+
+    logger.info("Skipping %s: %s check failed", name, rule, extra=log_event('company_skipped', rule=rule))
+    """
+    return {'event': name, 'fields': fields}
+
+def parse_sample_rates(value):
+    """Parse "event=N,event=N" (with * for every other event) into ((event, N), ...)"""
+    rates = []
+    for item in value.split(','):
+        if not item.strip():
+            continue
+        event, _, every = item.partition('=')
+        if not every.strip().isdigit() or int(every) < 1:
+            raise ValueError(f"Invalid log sample rate: {item.strip()!r} (expected event=N with N >= 1)")
+        rates.append((event.strip(), int(every)))
+    return tuple(rates)
+
+class EventFormatter(logging.Formatter):
+    """Formats records as plain text or as one JSON object per line.
+
+    Message arguments are only merged into the message here, so with a QueueListener the
+    formatting cost is paid on the listener thread. JSON lines carry the record's event
+    name and fields from log_event().
+    """
+
+    def __init__(self, log_format='text'):
+        super().__init__(TEXT_FORMAT)
+        if log_format not in ('text', 'json'):
+            raise ValueError(f"Unsupported log format: {log_format}")
+        self.log_format = log_format
+
+    def format(self, record):
+        if self.log_format == 'text':
+            return super().format(record)
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        event = getattr(record, 'event', None)
+        if event:
+            entry['event'] = event
+            entry.update(getattr(record, 'fields', None) or {})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class EventSampler(logging.Filter):
+    """Passes one in every N records of each event and counts all of them.
+
+    sample_rates maps event names to N; '*' applies to events not listed. Errors are never
+    sampled. With summary_only, event records below WARNING are only counted, so a run
+    logs its warnings, errors and the final per-event summary. Records without an event
+    always pass.
+    """
+
+    def __init__(self, sample_rates=None, summary_only=False):
+        super().__init__()
+        self.sample_rates = dict(sample_rates or {})
+        self.summary_only = summary_only
+        self.seen = {}
+        self.logged = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        event = getattr(record, 'event', None)
+        if event is None:
+            return True
+        with self._lock:
+            seen = self.seen[event] = self.seen.get(event, 0) + 1
+            if record.levelno >= logging.ERROR:
+                passed = True
+            elif self.summary_only and record.levelno < logging.WARNING:
+                passed = False
+            else:
+                passed = (seen - 1) % self.sample_rates.get(event, self.sample_rates.get('*', 1)) == 0
+            if passed:
+                self.logged[event] = self.logged.get(event, 0) + 1
+        return passed
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats every record in the thread that logged it. Records here
+    never leave the process, so they are queued as they are; arguments passed to a
+    logging call must not be mutated afterwards.
+    """
+
+    def prepare(self, record):
+        return record
+
+class LogSession:
+    """Queue-backed logging set up by setup_logging(); stop() flushes it and logs the event summary"""
+
+    def __init__(self, handler, listener, sampler):
+        self.handler = handler
+        self.listener = listener
+        self.sampler = sampler
+
+    def summary(self):
+        with self.sampler._lock:
+            return {event: {'seen': seen, 'logged': self.sampler.logged.get(event, 0)} for event, seen in self.sampler.seen.items()}
+
+    def stop(self):
+        for event, counts in sorted(self.summary().items()):
+            if counts['seen'] != counts['logged']:
+                logger.info("%s: %d records, %d logged", event, counts['seen'], counts['logged'])
+        self.listener.stop()
+        logging.getLogger().removeHandler(self.handler)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+def setup_logging(level=logging.INFO, log_format='text', sample_rates=None, summary_only=False, stream=None):
+    """Route the root logger through a queue to a stream handler on a background thread.
+
+    Replaces the root logger's handlers, so call it once at program start instead of
+    logging.basicConfig(). Returns a LogSession; stop it before exiting to drain the queue.
+    """
+    log_queue = queue.SimpleQueue()
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(EventFormatter(log_format))
+    listener = QueueListener(log_queue, output)
+
+    sampler = EventSampler(sample_rates, summary_only)
+    handler = DeferredQueueHandler(log_queue)
+    handler.addFilter(sampler)
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level)
+    listener.start()
+    return LogSession(handler, listener, sampler)
+
+def setup_logging_from_env(**overrides):
+    """setup_logging() configured by LOG_LEVEL, LOG_FORMAT, LOG_SAMPLE and LOG_SUMMARY_ONLY"""
+    settings = {
+        'level': os.getenv('LOG_LEVEL', 'INFO').upper(),
+        'log_format': os.getenv('LOG_FORMAT', 'text'),
+        'sample_rates': parse_sample_rates(os.getenv('LOG_SAMPLE', '')),
+        'summary_only': os.getenv('LOG_SUMMARY_ONLY', '').lower() in ('1', 'true', 'yes')
+    }
+    settings.update((name, value) for name, value in overrides.items() if value is not None)
+    return setup_logging(**settings)
@@ -0,0 +1,95 @@
+import unittest
+from unittest import mock
+from circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('circuit_breaker.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker('search', failure_threshold=0.5, window=10, min_calls=4, reset_timeout=30.0,
+                                      half_open_probes=2)
+
+    def call(self, succeeded):
+        self.breaker.before_call()
+        if succeeded:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    def trip(self):
+        for succeeded in (True, False, True, False):
+            self.call(succeeded)
+        self.assertEqual(self.breaker.state, 'open')
+
+    def test_stays_closed_below_min_calls(self):
+        for _ in range(3):
+            self.call(False)
+        self.assertEqual(self.breaker.state, 'closed')
+
+    def test_stays_closed_below_threshold(self):
+        for succeeded in (True, True, False, True, True, False):
+            self.call(succeeded)
+        self.assertEqual(self.breaker.state, 'closed')
+
+    def test_opens_at_threshold_and_fails_fast(self):
+        self.trip()
+        self.clock.now += 10
+        with self.assertRaises(CircuitOpenError) as raised:
+            self.breaker.before_call()
+        self.assertEqual(raised.exception.name, 'search')
+        self.assertAlmostEqual(self.breaker.seconds_until_probe(), 20.0)
+        self.assertEqual((self.breaker.times_opened, self.breaker.rejected), (1, 1))
+
+    def test_closes_after_successful_probes(self):
+        self.trip()
+        self.clock.now += 30
+        self.breaker.before_call()
+        self.breaker.before_call()
+        self.assertEqual(self.breaker.state, 'half_open')
+        # Only half_open_probes calls go through while probing
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()
+        self.breaker.record_success()
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, 'closed')
+        # Outcomes from before the outage no longer count
+        for _ in range(3):
+            self.call(False)
+        self.assertEqual(self.breaker.state, 'closed')
+
+    def test_failed_probe_reopens(self):
+        self.trip()
+        self.clock.now += 30
+        self.call(False)
+        self.assertEqual(self.breaker.state, 'open')
+        self.assertEqual(self.breaker.times_opened, 2)
+        self.assertAlmostEqual(self.breaker.seconds_until_probe(), 30.0)
+
+    def test_lost_probes_are_replaced_after_reset_timeout(self):
+        self.trip()
+        self.clock.now += 30
+        self.breaker.before_call()
+        self.breaker.before_call()
+        self.clock.now += 30
+        self.breaker.before_call()
+        self.assertEqual(self.breaker.state, 'half_open')
+
+class CircuitBreakerRegistryTest(unittest.TestCase):
+    def test_one_breaker_per_name_with_shared_settings(self):
+        registry = CircuitBreakerRegistry(min_calls=2, reset_timeout=5.0)
+        self.assertIs(registry.get('hmrc'), registry.get('hmrc'))
+        self.assertIsNot(registry.get('hmrc'), registry.get('companies_house:search'))
+        self.assertEqual(registry.get('hmrc').reset_timeout, 5.0)
+        self.assertEqual(registry.seconds_until_probe(), 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
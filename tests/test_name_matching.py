@@ -0,0 +1,143 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import main
+from name_matching import DedupIndex, best_match, name_similarity, normalize_company_name
+
+class NormalizeCompanyNameTest(unittest.TestCase):
+    # (input, canonical form)
+    CASES = [
+        ("SIMON’S BAKERY LTD", "simons bakery"),
+        ("Simons Bakery Limited", "simons bakery"),
+        ("Simon's Bakery", "simons bakery"),
+        ("MARKS & SPENCER PLC", "marks and spencer"),
+        ("Marks and Spencer p.l.c.", "marks and spencer"),
+        ("DAILY POPPINS LIMITED", "daily poppins"),
+        ("Daily Poppins Ltd.", "daily poppins"),
+        ("  daily   poppins  ltd  ", "daily poppins"),
+        ("THE HILLS GROUP LIMITED", "hills group"),
+        ("J.D. Wetherspoon P.L.C.", "jd wetherspoon"),
+        ("SKIP HIRE UK CO LTD", "skip hire uk"),
+        ("Café Nero Limited", "café nero"),
+        ("ＡＣＭＥ LIMITED", "acme"),
+        ("LIMITED", "ltd"),
+        ("The", "the")
+    ]
+
+    def test_canonical_forms(self):
+        for name, expected in self.CASES:
+            with self.subTest(name=name):
+                self.assertEqual(normalize_company_name(name), expected)
+
+    def test_spellings_of_one_company_share_a_form(self):
+        groups = [
+            ["SIMON’S BAKERY LTD", "Simons Bakery Limited", "simon`s bakery"],
+            ["A & B Logistics Ltd", "A and B Logistics Limited", "A&B LOGISTICS"],
+            ["The Hills Group Limited", "HILLS GROUP LTD", "Hills Group"]
+        ]
+        for names in groups:
+            with self.subTest(names=names):
+                self.assertEqual(len({normalize_company_name(name) for name in names}), 1)
+
+class BestMatchTest(unittest.TestCase):
+    # (input name, candidate titles, expected title or None)
+    CASES = [
+        ("SIMON’S BAKERY LTD", ["SIMONS BAKERY HOLDINGS LIMITED", "SIMONS BAKERY LIMITED"], "SIMONS BAKERY LIMITED"),
+        ("Marks and Spencer", ["MARKS & SPENCER GROUP P.L.C.", "MARKS & SPENCER PLC"], "MARKS & SPENCER PLC"),
+        ("The Hills Group", ["HILLS GROUP LIMITED"], "HILLS GROUP LIMITED"),
+        ("Daily Poppins Ltd", ["POPPINS DAILY LIMITED"], "POPPINS DAILY LIMITED"),
+        # items[0] used to be taken whatever it was; a weak candidate must now be rejected
+        ("Skip Hire UK", ["UK SKIPS AND HIRE SERVICES LIMITED", "HIRE UK LIMITED"], None),
+        ("Hills Group", ["HILLSIDE GARDEN CENTRE LIMITED"], None),
+        ("Anything", [], None)
+    ]
+
+    def test_cases(self):
+        for name, titles, expected in self.CASES:
+            with self.subTest(name=name):
+                candidates = [{'title': title} for title in titles]
+                match, score = best_match(name, candidates, 0.85, key=lambda item: item['title'])
+                self.assertEqual(match and match['title'], expected)
+                if expected is None:
+                    self.assertLess(score, 0.85)
+                else:
+                    self.assertGreaterEqual(score, 0.85)
+
+    def test_below_threshold_returns_best_score(self):
+        match, score = best_match("Hills Group", ["HILLS GROVE LIMITED"], threshold=0.99)
+        self.assertIsNone(match)
+        self.assertEqual(score, name_similarity("hills group", "hills grove"))
+        self.assertGreater(score, 0.5)
+
+    def test_threshold_is_inclusive(self):
+        score = name_similarity("hills group", "hills grove")
+        match, _ = best_match("Hills Group", ["HILLS GROVE LIMITED"], threshold=score)
+        self.assertEqual(match, "HILLS GROVE LIMITED")
+
+    def test_similarity_ignores_word_order(self):
+        self.assertEqual(name_similarity("daily poppins", "poppins daily"), 1.0)
+        self.assertEqual(name_similarity("abc", "xyz"), 0.0)
+
+class CountingLookup:
+    """Lookup function that records each name it is called with"""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, name):
+        with self._lock:
+            self.calls.append(name)
+        return normalize_company_name(name).upper()
+
+class DedupIndexTest(unittest.TestCase):
+    NAMES = [
+        "Daily Poppins Ltd",
+        "SIMON’S BAKERY LTD",
+        "DAILY POPPINS LIMITED",
+        "Tesco PLC",
+        "Simons Bakery Limited",
+        "daily poppins",
+        "Simon's Bakery"
+    ]
+
+    def test_duplicates_share_one_future(self):
+        lookup = CountingLookup()
+        dedup = DedupIndex()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [dedup.submit(executor, lookup, name) for name in self.NAMES]
+
+        self.assertIs(futures[0], futures[2])
+        self.assertIs(futures[0], futures[5])
+        self.assertIs(futures[1], futures[4])
+        self.assertIs(futures[1], futures[6])
+        self.assertIsNot(futures[0], futures[1])
+        # Only the first spelling of each company is looked up
+        self.assertEqual(sorted(lookup.calls), sorted(["Daily Poppins Ltd", "SIMON’S BAKERY LTD", "Tesco PLC"]))
+        self.assertEqual(dedup.unique_lookups(), 3)
+        self.assertEqual(dedup.duplicates, 4)
+
+    def test_ordered_map_answers_every_input_in_order(self):
+        lookup = CountingLookup()
+        dedup = DedupIndex()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(main.ordered_map(executor, lookup, self.NAMES, window=2, dedup=dedup))
+
+        self.assertEqual([name for name, _ in results], self.NAMES)
+        self.assertEqual([result for _, result in results], [normalize_company_name(name).upper() for name in self.NAMES])
+        self.assertEqual(len(lookup.calls), 3)
+
+    def test_key_picks_the_name_out_of_journal_entries(self):
+        # run_pipeline submits (position, name) entries so repeated names keep their own positions
+        entries = list(enumerate(self.NAMES))
+        dedup = DedupIndex(key=lambda entry: normalize_company_name(entry[1]))
+        calls = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(main.ordered_map(executor, lambda entry: calls.append(entry) or entry[1], entries, window=3, dedup=dedup))
+
+        self.assertEqual([entry for entry, _ in results], entries)
+        self.assertEqual(sorted(position for position, _ in calls), [0, 1, 3])
+        self.assertEqual([result for _, result in results][5], "Daily Poppins Ltd")
+
+if __name__ == '__main__':
+    unittest.main()
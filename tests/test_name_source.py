@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from name_source import count_company_names, iter_company_names
+
+class IterCompanyNamesTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.work_dir.cleanup()
+
+    def write(self, file_name, content):
+        path = os.path.join(self.work_dir.name, file_name)
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            file.write(content)
+        return path
+
+    def test_text_file_has_no_header(self):
+        path = self.write('names.txt', "DAILY POPPINS LIMITED\n\n  TESCO PLC  \n")
+        self.assertEqual(list(iter_company_names(path)), ['DAILY POPPINS LIMITED', 'TESCO PLC'])
+
+    def test_csv_header_is_skipped_without_column(self):
+        path = self.write('names.csv', "Company Name,Town\nDAILY POPPINS LIMITED,London\nTESCO PLC,Welwyn\n")
+        self.assertEqual(list(iter_company_names(path)), ['DAILY POPPINS LIMITED', 'TESCO PLC'])
+        self.assertEqual(count_company_names(path), 2)
+
+    def test_csv_named_column(self):
+        path = self.write('names.csv', "Town,Company Name\nLondon,DAILY POPPINS LIMITED\nWelwyn,\n")
+        self.assertEqual(list(iter_company_names(path, 'Company Name')), ['DAILY POPPINS LIMITED'])
+        with self.assertRaises(ValueError):
+            list(iter_company_names(path, 'Name'))
+
+    def test_xlsx_header_is_skipped_without_column(self):
+        from openpyxl import Workbook
+
+        path = os.path.join(self.work_dir.name, 'names.xlsx')
+        workbook = Workbook()
+        for row in (['Company Name', 'Town'], ['DAILY POPPINS LIMITED', 'London'], [None, 'Leeds'], ['TESCO PLC', 'Welwyn']):
+            workbook.active.append(row)
+        workbook.save(path)
+        self.assertEqual(list(iter_company_names(path)), ['DAILY POPPINS LIMITED', 'TESCO PLC'])
+        self.assertEqual(list(iter_company_names(path, 'Town')), ['London', 'Leeds', 'Welwyn'])
+
+if __name__ == '__main__':
+    unittest.main()
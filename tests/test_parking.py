@@ -0,0 +1,94 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+import main
+from mock_upstream import MockUpstream
+from pipeline_config import PipelineConfig
+from progress_journal import ProgressJournal
+
+NAMES = [f"Parking Test {number} Limited" for number in range(8)] + ['DAILY POPPINS LIMITED']
+
+class FailingSearchUpstream(MockUpstream):
+    """MockUpstream whose search for one name always fails with 503"""
+
+    def __init__(self, failing_query, **settings):
+        super().__init__(**settings)
+        self.failing_query = failing_query
+
+    def handle(self, method, raw_path):
+        if raw_path.startswith('/search/companies') and f"q={self.failing_query}" in raw_path:
+            return 503, {'error': 'Service Unavailable'}, {}
+        return super().handle(method, raw_path)
+
+class ParkingTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.dict(os.environ, {'HMRC_API_KEY': 'mock-client-id', 'HMRC_SERVER_TOKEN': 'mock-server-token'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop('HMRC_TOKEN_CACHE', None)
+        # No backoff, so the retries against the failing endpoint take no time
+        delay = mock.patch('retry_policy.RetryPolicy.delay', return_value=0.0)
+        delay.start()
+        self.addCleanup(delay.stop)
+
+    def tearDown(self):
+        main.configure(PipelineConfig())
+        self.work_dir.cleanup()
+
+    def config(self, upstream, **settings):
+        return PipelineConfig(
+            api_key='mock-api-key',
+            output_file=os.path.join(self.work_dir.name, 'output.csv'),
+            max_workers=1,
+            cache_path=None,
+            index_path=None,
+            companies_house_url=upstream.url,
+            hmrc_url=upstream.url,
+            parked_retry_rounds=0,
+            progress=False,
+            **settings
+        )
+
+    def run_pipeline(self, names, config):
+        with redirect_stdout(io.StringIO()), self.assertLogs(level='INFO') as logs:
+            result = main.run_pipeline(names, config)
+        return result, logs.output
+
+    def test_persistently_failing_search_parks_the_name(self):
+        with FailingSearchUpstream('DAILY', seed=1) as upstream:
+            config = self.config(upstream)
+            result, logs = self.run_pipeline(NAMES, config)
+
+        self.assertEqual(result['parked'], ['DAILY POPPINS LIMITED'])
+        self.assertEqual(result['processed'], len(NAMES) - 1)
+        # The breaker stayed closed, so the name was parked because its own lookup failed
+        self.assertFalse(any('opened' in line for line in logs))
+        self.assertFalse(any('DAILY POPPINS LIMITED not found' in line for line in logs))
+        with open(f"{config.output_file}.parked.txt", 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read(), "DAILY POPPINS LIMITED\n")
+
+    def test_parked_name_is_not_journaled(self):
+        with FailingSearchUpstream('DAILY', seed=1) as upstream:
+            config = self.config(upstream, checkpoint_interval=1)
+            journal = ProgressJournal(f"{config.output_file}.journal")
+            with mock.patch.object(ProgressJournal, 'remove'):
+                self.run_pipeline(NAMES, config)
+
+        journal.load()
+        self.assertEqual(journal.completed, set(range(len(NAMES))) - {NAMES.index('DAILY POPPINS LIMITED')})
+
+    def test_throttling_after_the_retry_budget_is_spent_parks_every_name(self):
+        names = [f"Throttled {number} Limited" for number in range(60)]
+        with MockUpstream(burst_every=1000, burst_length=1000, retry_after=0) as upstream:
+            result, logs = self.run_pipeline(names, self.config(upstream, retry_budget=5))
+
+        self.assertEqual(result['parked'], names)
+        self.assertEqual(result['processed'], 0)
+        self.assertTrue(any('Retry budget exhausted' in line for line in logs))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+import main
+from pipeline_config import PipelineConfig
+from progress_journal import ProgressJournal
+
+NAMES = [f"Company {number}" for number in range(100)]
+
+def company_record(name):
+    number = name.split()[-1]
+    return {
+        'company_number': number.zfill(8),
+        'company_name': name.upper(),
+        'address': f"{number} High Street, London",
+        'sic_codes': ['62020'],
+        'directors': [],
+        'annual_turnover': 1000000.0 + int(number)
+    }
+
+def lookup(name):
+    # Every third company does not qualify, so some names are journaled without a row
+    return None if int(name.split()[-1]) % 3 == 0 else company_record(name)
+
+class Interrupted(Exception):
+    pass
+
+class ProgressJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.work_dir.name, 'output.csv.journal')
+
+    def tearDown(self):
+        self.work_dir.cleanup()
+
+    def test_load_returns_committed_names_and_offset(self):
+        journal = ProgressJournal(self.path).open()
+        journal.record(0)
+        journal.record(1)
+        journal.commit(120)
+        journal.record(2)
+        journal.commit(180)
+        journal.record(3)
+        journal.close()
+
+        loaded = ProgressJournal(self.path).load()
+        self.assertEqual(loaded.completed, {0, 1, 2})
+        self.assertEqual(loaded.output_offset, 180)
+
+    def test_load_ignores_torn_last_line(self):
+        journal = ProgressJournal(self.path).open()
+        journal.record(0)
+        journal.commit(120)
+        journal.record(1)
+        journal.commit(180)
+        journal.close()
+        # A crash in the middle of a commit leaves half a line behind
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write('{"offset": 240, "positions": [2, 3')
+
+        with self.assertLogs('progress_journal', 'WARNING'):
+            loaded = ProgressJournal(self.path).load()
+        self.assertEqual(loaded.completed, {0, 1})
+        self.assertEqual(loaded.output_offset, 180)
+
+    def test_commit_without_pending_names_writes_nothing(self):
+        journal = ProgressJournal(self.path).open()
+        journal.commit(50)
+        journal.close()
+
+        self.assertEqual(os.path.getsize(self.path), 0)
+        self.assertEqual(ProgressJournal(self.path).load().output_offset, 0)
+
+    def test_open_without_resume_starts_over(self):
+        journal = ProgressJournal(self.path).open()
+        journal.record(0)
+        journal.commit(120)
+        journal.close()
+
+        journal = ProgressJournal(self.path).load().open(resume=False)
+        journal.close()
+        self.assertEqual(journal.completed, set())
+        self.assertEqual(ProgressJournal(self.path).load().completed, set())
+
+class ResumeTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        main.configure(PipelineConfig())
+        self.work_dir.cleanup()
+
+    def config(self, output_name, resume=False):
+        return PipelineConfig(
+            output_file=os.path.join(self.work_dir.name, output_name),
+            max_workers=1,
+            resume=resume,
+            checkpoint_interval=10,
+            write_batch_size=5,
+            cache_path=None,
+            index_path=None,
+            progress=False
+        )
+
+    def run_pipeline(self, names, config, lookup_company):
+        with mock.patch.object(main, 'lookup_company', lookup_company), redirect_stdout(io.StringIO()):
+            return main.run_pipeline(names, config)
+
+    def read(self, path):
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read()
+
+    def test_resumed_run_matches_clean_run(self):
+        clean = self.config('clean.csv')
+        self.run_pipeline(NAMES, clean, lookup)
+
+        def interrupted_lookup(name):
+            if name == 'Company 73':
+                raise Interrupted(name)
+            return lookup(name)
+
+        config = self.config('resumed.csv')
+        with self.assertRaises(Interrupted):
+            self.run_pipeline(NAMES, config, interrupted_lookup)
+        # Rows for Company 70-72 reached the file after the last commit at Company 69
+        journal = ProgressJournal(f"{config.output_file}.journal").load()
+        self.assertEqual(len(journal.completed), 70)
+        self.assertGreater(os.path.getsize(f"{config.output_file}.part"), journal.output_offset)
+
+        looked_up = []
+
+        def resumed_lookup(name):
+            looked_up.append(name)
+            return lookup(name)
+
+        result = self.run_pipeline(NAMES, self.config('resumed.csv', resume=True), resumed_lookup)
+        self.assertEqual(looked_up, NAMES[70:])
+        self.assertEqual(self.read(config.output_file), self.read(clean.output_file))
+        self.assertFalse(os.path.exists(f"{config.output_file}.journal"))
+        self.assertEqual(result['processed'], 30)
+
+    def test_resume_after_torn_commit_uses_previous_offset(self):
+        config = self.config('torn.csv')
+
+        def interrupted_lookup(name):
+            if name == 'Company 45':
+                raise Interrupted(name)
+            return lookup(name)
+
+        with self.assertRaises(Interrupted):
+            self.run_pipeline(NAMES, config, interrupted_lookup)
+        with open(f"{config.output_file}.journal", 'a', encoding='utf-8') as file:
+            file.write('{"offset": 999999, "positions": [40, 4')
+
+        with self.assertLogs('progress_journal', 'WARNING'):
+            self.run_pipeline(NAMES, self.config('torn.csv', resume=True), lookup)
+        clean = self.config('clean.csv')
+        self.run_pipeline(NAMES, clean, lookup)
+        self.assertEqual(self.read(config.output_file), self.read(clean.output_file))
+
+    def test_repeated_name_after_a_commit_is_written_again(self):
+        names = NAMES[:25] + ['Company 1']
+        config = self.config('repeated.csv')
+        result = self.run_pipeline(names, config, lookup)
+
+        self.assertEqual(result['processed'], 26)
+        self.assertEqual(self.read(config.output_file).count('COMPANY 1,'), 2)
+
+    def test_repeated_name_after_a_commit_survives_resume(self):
+        names = NAMES[:25] + ['Company 1']
+        clean = self.config('clean.csv')
+        self.run_pipeline(names, clean, lookup)
+
+        def interrupted_lookup(name):
+            if name == 'Company 22':
+                raise Interrupted(name)
+            return lookup(name)
+
+        config = self.config('resumed.csv')
+        with self.assertRaises(Interrupted):
+            self.run_pipeline(names, config, interrupted_lookup)
+        self.run_pipeline(names, self.config('resumed.csv', resume=True), lookup)
+
+        self.assertEqual(self.read(config.output_file).count('COMPANY 1,'), 2)
+        self.assertEqual(self.read(config.output_file), self.read(clean.output_file))
+
+if __name__ == '__main__':
+    unittest.main()
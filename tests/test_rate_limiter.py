@@ -0,0 +1,78 @@
+import bisect
+import unittest
+from unittest import mock
+from rate_limiter import COMPANIES_HOUSE_WINDOW, DEFAULT_LIMITS, RateLimiter, TokenBucket, window_rate
+
+class FakeClock:
+    """monotonic() and sleep() replacements; sleeping just moves the clock on"""
+
+    def __init__(self):
+        self.now = 5000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        # A real clock always moves on; a wait lost to float rounding must not stall the fake one
+        self.now += max(seconds, 1e-9)
+
+def most_in_any_window(timestamps, period):
+    """Largest number of timestamps inside any period-second window"""
+    return max(bisect.bisect_left(timestamps, start + period) - position for position, start in enumerate(timestamps))
+
+class TokenBucketTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        for name in ('monotonic', 'sleep'):
+            patcher = mock.patch(f'rate_limiter.time.{name}', getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def acquire_for(self, bucket, seconds):
+        """Acquire as fast as the bucket allows for seconds and return when each call got through"""
+        timestamps = []
+        end = self.clock.now + seconds
+        while self.clock.now < end:
+            bucket.acquire()
+            timestamps.append(self.clock.now)
+        return timestamps
+
+    def test_companies_house_default_stays_within_600_per_5_minutes(self):
+        limit, period = COMPANIES_HOUSE_WINDOW
+        rate, capacity = DEFAULT_LIMITS['api.company-information.service.gov.uk']
+        timestamps = self.acquire_for(TokenBucket(rate, capacity), 3 * period)
+
+        self.assertLessEqual(most_in_any_window(timestamps, period), limit)
+        # The limit is used, not just respected
+        self.assertGreaterEqual(most_in_any_window(timestamps, period), limit - 1)
+
+    def test_any_burst_stays_within_the_window(self):
+        limit, period = COMPANIES_HOUSE_WINDOW
+        for burst in (1, 20, 100, 599):
+            self.clock.now = 5000.0
+            timestamps = self.acquire_for(TokenBucket(window_rate(limit, period, burst), burst), 2 * period)
+            self.assertLessEqual(most_in_any_window(timestamps, period), limit, burst)
+
+    def test_starts_with_a_full_burst(self):
+        bucket = TokenBucket(1.0, 5)
+        for _ in range(5):
+            bucket.acquire()
+        self.assertEqual(self.clock.now, 5000.0)
+        bucket.acquire()
+        self.assertAlmostEqual(self.clock.now, 5001.0)
+
+    def test_burst_must_fit_the_limit(self):
+        with self.assertRaises(ValueError):
+            window_rate(600, 300, 600)
+
+class RateLimiterTest(unittest.TestCase):
+    def test_hosts_without_a_limit_pass_straight_through(self):
+        limiter = RateLimiter({'api.company-information.service.gov.uk': (1.0, 1)})
+        with mock.patch('rate_limiter.time.sleep') as sleep:
+            for _ in range(5):
+                limiter.acquire('http://127.0.0.1:8080/search/companies')
+        sleep.assert_not_called()
+        self.assertEqual(limiter.buckets['api.company-information.service.gov.uk'].rate, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+from retry_policy import RetryBudget, RetryPolicy, parse_retry_after
+
+class ParseRetryAfterTest(unittest.TestCase):
+    def test_delta_seconds(self):
+        self.assertEqual(parse_retry_after('120'), 120.0)
+        self.assertEqual(parse_retry_after(' 5 '), 5.0)
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        self.assertAlmostEqual(parse_retry_after(format_datetime(retry_at, usegmt=True)), 60, delta=2)
+
+    def test_date_in_the_past_means_no_wait(self):
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0.0)
+
+    def test_missing_or_invalid(self):
+        for value in (None, '', 'soon', '-5', '1.5'):
+            self.assertIsNone(parse_retry_after(value), value)
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_attempts_per_status(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.should_retry(5, 429))
+        self.assertFalse(policy.should_retry(6, 429))
+        self.assertTrue(policy.should_retry(2, 500))
+        self.assertFalse(policy.should_retry(3, 500))
+        self.assertFalse(policy.should_retry(1, 404))
+        self.assertEqual(policy.retries, 2)
+
+    def test_network_errors_use_exception_attempts(self):
+        policy = RetryPolicy(exception_attempts=2)
+        self.assertTrue(policy.should_retry(1))
+        self.assertFalse(policy.should_retry(2))
+
+    def test_budget_is_shared_and_capped(self):
+        budget = RetryBudget(2)
+        first, second = RetryPolicy(budget=budget), RetryPolicy(budget=budget)
+        self.assertTrue(first.should_retry(1, 503))
+        self.assertTrue(second.should_retry(1, 503))
+        with self.assertLogs('retry_policy', 'WARNING'):
+            self.assertFalse(first.should_retry(1, 503))
+        self.assertEqual(budget.spent, 2)
+        # Attempts past a status's limit do not spend the budget
+        self.assertFalse(RetryPolicy(budget=RetryBudget(0)).should_retry(4, 503))
+
+    def test_delay_honours_retry_after_up_to_the_cap(self):
+        policy = RetryPolicy(max_retry_after=60.0)
+        self.assertEqual(policy.delay(1, '10'), 10.0)
+        self.assertEqual(policy.delay(1, '600'), 60.0)
+
+    def test_delay_uses_full_jitter_under_the_exponential_cap(self):
+        policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+        with mock.patch('retry_policy.random.uniform', side_effect=lambda low, high: high) as uniform:
+            self.assertEqual([policy.delay(attempt) for attempt in range(1, 6)], [0.5, 1.0, 2.0, 4.0, 4.0])
+        self.assertTrue(all(call.args[0] == 0 for call in uniform.call_args_list))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from token_manager import TokenManager
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1700000000.0
+
+    def __call__(self):
+        return self.now
+
+class TokenSource:
+    """fetch_token that hands out numbered tokens and counts the calls"""
+
+    def __init__(self, expires_in=3600):
+        self.expires_in = expires_in
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            return f"token-{self.calls}", self.expires_in
+
+class TokenManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('token_manager.time.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_token_is_reused_until_the_refresh_margin(self):
+        source = TokenSource(expires_in=3600)
+        tokens = TokenManager(fetch_token=source, refresh_margin=300)
+        self.assertEqual(tokens.get_token(), 'token-1')
+        self.clock.now += 3299
+        self.assertEqual(tokens.get_token(), 'token-1')
+        self.clock.now += 1
+        self.assertEqual(tokens.get_token(), 'token-2')
+        self.assertEqual(source.calls, 2)
+
+    def test_margin_is_clamped_for_short_lived_tokens(self):
+        for expires_in in (300, 120, 10):
+            source = TokenSource(expires_in=expires_in)
+            tokens = TokenManager(fetch_token=source, refresh_margin=300)
+            for _ in range(10):
+                tokens.get_token()
+            self.assertEqual(source.calls, 1, expires_in)
+            # Refreshed halfway through the lifetime instead
+            self.clock.now += expires_in / 2
+            tokens.get_token()
+            self.assertEqual(source.calls, 2, expires_in)
+
+    def test_concurrent_callers_share_one_refresh(self):
+        entered = threading.Event()
+        release = threading.Event()
+        source = TokenSource()
+
+        def slow_fetch():
+            entered.set()
+            release.wait(5)
+            return source()
+
+        tokens = TokenManager(fetch_token=slow_fetch)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(tokens.get_token())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(entered.wait(5))
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(source.calls, 1)
+        self.assertEqual(results, ['token-1'] * 8)
+
+    def test_failed_refresh_keeps_the_valid_token(self):
+        results = iter([('token-1', 600), None])
+        tokens = TokenManager(fetch_token=lambda: next(results), refresh_margin=300)
+        tokens.get_token()
+        self.clock.now += 400
+        self.assertEqual(tokens.get_token(), 'token-1')
+        self.clock.now += 200
+        with mock.patch.object(tokens, 'fetch_token', return_value=None):
+            self.assertIsNone(tokens.get_token())
+
+    def test_invalidate_leaves_a_newer_token_alone(self):
+        source = TokenSource()
+        tokens = TokenManager(fetch_token=source)
+        stale = tokens.get_token()
+        tokens.invalidate(stale)
+        self.assertEqual(tokens.get_token(), 'token-2')
+        # A second caller that also saw the stale token must not drop the refreshed one
+        tokens.invalidate(stale)
+        self.assertEqual(tokens.get_token(), 'token-2')
+        self.assertEqual(source.calls, 2)
+
+    def test_cached_token_is_reused_by_the_next_process(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            cache_path = os.path.join(work_dir, 'tokens.json')
+            source = TokenSource(expires_in=3600)
+            TokenManager(fetch_token=source, cache_path=cache_path, cache_key='client-a').get_token()
+            with open(cache_path, 'r', encoding='utf-8') as cache:
+                self.assertNotIn('client-a', json.load(cache))
+            self.assertEqual(os.stat(cache_path).st_mode & 0o777, 0o600)
+
+            self.clock.now += 1000
+            reused = TokenManager(fetch_token=source, cache_path=cache_path, cache_key='client-a')
+            self.assertEqual(reused.get_token(), 'token-1')
+            other = TokenManager(fetch_token=source, cache_path=cache_path, cache_key='client-b')
+            self.assertEqual(other.get_token(), 'token-2')
+            self.assertEqual(source.calls, 2)
+
+            # An expired entry is ignored
+            self.clock.now += 3600
+            self.assertEqual(TokenManager(fetch_token=source, cache_path=cache_path, cache_key='client-a').get_token(), 'token-3')
+
+    def test_cached_short_lived_token_keeps_its_clamped_margin(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            cache_path = os.path.join(work_dir, 'tokens.json')
+            source = TokenSource(expires_in=200)
+            TokenManager(fetch_token=source, cache_path=cache_path, refresh_margin=300).get_token()
+            reused = TokenManager(fetch_token=source, cache_path=cache_path, refresh_margin=300)
+            for _ in range(5):
+                self.assertEqual(reused.get_token(), 'token-1')
+            self.assertEqual(source.calls, 1)
+
+if __name__ == '__main__':
+    unittest.main()
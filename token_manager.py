@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class TokenManager:
+    """OAuth access token shared by every thread or coroutine of a client.
+
+    The token is refreshed refresh_margin seconds before it expires (at most halfway through
+    the lifetime of a short-lived token), and only one refresh
+    runs at a time: other callers wait for it and reuse its result. If a refresh fails
+    while the old token is still valid, the old token keeps being used. With cache_path
+    set, the token is stored on disk so the next short-lived process can skip
+    authentication.
+
+    fetch_token (sync) or fetch_token_async (coroutine) returns (access_token, expires_in),
+    or None when authentication fails.
+    """
+
+    def __init__(self, fetch_token=None, fetch_token_async=None, refresh_margin=300, cache_path=None, cache_key=''):
+        self.fetch_token = fetch_token
+        self.fetch_token_async = fetch_token_async
+        self.refresh_margin = refresh_margin
+        self.cache_path = cache_path
+        # Only a hash of the client identity is written to the cache file
+        self.cache_key = hashlib.sha256(cache_key.encode()).hexdigest()
+        self.access_token = None
+        self.expires_at = 0.0
+        self.refresh_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_task = None
+        self._load()
+
+    def _valid(self, now=None):
+        return self.access_token is not None and (now or time.time()) < self.expires_at
+
+    def _fresh(self):
+        return self.access_token is not None and time.time() < self.refresh_at
+
+    def get_token(self):
+        """Return a usable token, refreshing it first if it is missing or about to expire"""
+        if self._fresh():
+            return self.access_token
+        with self._lock:
+            # Another thread may have refreshed while this one waited for the lock
+            if not self._fresh():
+                self._store(self.fetch_token())
+            return self.access_token if self._valid() else None
+
+    async def get_token_async(self):
+        """Coroutine version of get_token; concurrent callers await one shared refresh"""
+        if self._fresh():
+            return self.access_token
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh_async())
+        await asyncio.shield(self._refresh_task)
+        return self.access_token if self._valid() else None
+
+    async def _refresh_async(self):
+        self._store(await self.fetch_token_async())
+
+    def refresh(self):
+        """Force a refresh now; returns True if a new token was obtained"""
+        with self._lock:
+            return self._store(self.fetch_token())
+
+    async def refresh_async(self):
+        self.invalidate(self.access_token)
+        return await self.get_token_async() is not None
+
+    def invalidate(self, token):
+        """Drop token after the API rejected it, unless another caller already replaced it"""
+        with self._lock:
+            if token is not None and token == self.access_token:
+                self.access_token = None
+                self.expires_at = 0.0
+                self.refresh_at = 0.0
+
+    def _store(self, result):
+        if not result:
+            return False
+        self.access_token, expires_in = result
+        self.expires_at = time.time() + expires_in
+        # A margin as long as the token's lifetime would make every call fetch a new token
+        self.refresh_at = self.expires_at - min(self.refresh_margin, expires_in / 2)
+        self._save()
+        return True
+
+    def _load(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as cache:
+                entry = json.load(cache).get(self.cache_key)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable token cache %s: %s", self.cache_path, e)
+            return
+        if entry and entry['expires_at'] > time.time():
+            self.access_token = entry['access_token']
+            self.expires_at = entry['expires_at']
+            self.refresh_at = entry.get('refresh_at', self.expires_at - self.refresh_margin)
+            logger.info("Reusing cached HMRC access token")
+
+    def _save(self):
+        if not self.cache_path:
+            return
+        entries = {}
+        if os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as cache:
+                    entries = json.load(cache)
+            except (OSError, ValueError):
+                entries = {}
+        entries[self.cache_key] = {'access_token': self.access_token, 'expires_at': self.expires_at, 'refresh_at': self.refresh_at}
+        temp_path = f"{self.cache_path}.tmp"
+        # The token is a credential, so the file is only readable by its owner
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as cache:
+            json.dump(entries, cache)
+        os.replace(temp_path, self.cache_path)